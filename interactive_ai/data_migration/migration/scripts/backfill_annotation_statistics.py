@@ -0,0 +1,182 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+import hashlib
+import logging
+from collections.abc import Iterator
+from uuid import UUID
+
+from bson import ObjectId
+from pymongo.collection import Collection
+
+from migration.utils import IMigrationScript, MongoDBConnection
+
+logger = logging.getLogger(__name__)
+
+# Must match iai_core.entities.annotation_statistics.OBJECT_SIZE_SIGNIFICANT_BITS
+OBJECT_SIZE_SIGNIFICANT_BITS = 5
+BATCH_SIZE = 100
+
+
+class BackfillAnnotationStatisticsMigration(IMigrationScript):
+    """
+    Script to build the per-label annotation statistics of the existing dataset storages.
+
+    For each media, the contribution of its latest user annotation scene is stored in "media_annotation_statistics",
+    and the totals per label in "label_annotation_statistics". A marker document without label_id records that the
+    totals of the dataset storage have been built; until then, the statistics are computed from the annotation scenes.
+    The computation mirrors MediaAnnotationStatistics.from_annotation_scene in iai_core.
+    """
+
+    @classmethod
+    def upgrade_project(cls, organization_id: str, workspace_id: str, project_id: str) -> None:
+        db = MongoDBConnection().geti_db
+        annotation_scene_collection = db.get_collection("annotation_scene")
+        media_statistics_collection = db.get_collection("media_annotation_statistics")
+        label_statistics_collection = db.get_collection("label_annotation_statistics")
+        project_filter = cls._preliminary_project_query_filter(
+            organization_id=UUID(organization_id), workspace_id=UUID(workspace_id), project_id=ObjectId(project_id)
+        )
+
+        # Start from scratch, so that the script is idempotent
+        media_statistics_collection.delete_many(project_filter)
+        label_statistics_collection.delete_many(project_filter)
+
+        totals_per_dataset_storage: dict[ObjectId, dict[ObjectId, dict]] = {}
+        for annotation_scene in cls._get_latest_user_annotation_scenes(annotation_scene_collection, project_filter):
+            dataset_storage_id = annotation_scene["dataset_storage_id"]
+            counts_per_label = cls._count_annotation_scene(annotation_scene)
+            media_statistics_collection.insert_one(
+                {
+                    **project_filter,
+                    "dataset_storage_id": dataset_storage_id,
+                    "_id": cls._media_identifier_as_id(annotation_scene["media_identifier"]),
+                    "media_identifier": annotation_scene["media_identifier"],
+                    "annotation_scene_id": annotation_scene["_id"],
+                    "annotation_scene_creation_date": annotation_scene["creation_date"],
+                    "counts_per_label": [
+                        {"label_id": label_id, **counts} for label_id, counts in counts_per_label.items()
+                    ],
+                }
+            )
+            totals_per_label = totals_per_dataset_storage.setdefault(dataset_storage_id, {})
+            for label_id, counts in counts_per_label.items():
+                totals = totals_per_label.setdefault(
+                    label_id, {"annotation_scene_count": 0, "shape_count": 0, "object_size_histogram": {}}
+                )
+                totals["annotation_scene_count"] += counts["annotation_scene_count"]
+                totals["shape_count"] += counts["shape_count"]
+                for bucket, count in counts["object_size_histogram"].items():
+                    totals["object_size_histogram"][bucket] = totals["object_size_histogram"].get(bucket, 0) + count
+
+        dataset_storage_ids = db.get_collection("dataset_storage").distinct("_id", project_filter)
+        for dataset_storage_id in set(dataset_storage_ids) | set(totals_per_dataset_storage):
+            dataset_storage_filter = {**project_filter, "dataset_storage_id": dataset_storage_id}
+            label_docs = [
+                {**dataset_storage_filter, "label_id": label_id, **totals}
+                for label_id, totals in totals_per_dataset_storage.get(dataset_storage_id, {}).items()
+            ]
+            label_docs.append({**dataset_storage_filter, "label_id": None})  # marks the totals as built
+            label_statistics_collection.insert_many(label_docs)
+        logger.info(f"Built the annotation statistics of {len(dataset_storage_ids)} dataset storages")
+
+    @classmethod
+    def downgrade_project(cls, organization_id: str, workspace_id: str, project_id: str) -> None:
+        db = MongoDBConnection().geti_db
+        project_filter = cls._preliminary_project_query_filter(
+            organization_id=UUID(organization_id), workspace_id=UUID(workspace_id), project_id=ObjectId(project_id)
+        )
+        db.get_collection("media_annotation_statistics").delete_many(project_filter)
+        db.get_collection("label_annotation_statistics").delete_many(project_filter)
+
+    @classmethod
+    def upgrade_non_project_data(cls) -> None:
+        """This script only deals with project data"""
+
+    @classmethod
+    def downgrade_non_project_data(cls) -> None:
+        """This script only deals with project data"""
+
+    @classmethod
+    def _get_latest_user_annotation_scenes(cls, collection: Collection, project_filter: dict) -> Iterator[dict]:
+        """Get the latest user annotation scene of each media in the project"""
+        pipeline = [
+            {"$match": {**project_filter, "kind": "ANNOTATION"}},
+            {"$sort": {"creation_date": -1}},
+            {
+                "$group": {
+                    "_id": {"dataset_storage_id": "$dataset_storage_id", "media_identifier": "$media_identifier"},
+                    "annotation_scene_id": {"$first": "$_id"},
+                },
+            },
+        ]
+        annotation_scene_ids = [doc["annotation_scene_id"] for doc in collection.aggregate(pipeline, allowDiskUse=True)]
+        for batch in range(0, len(annotation_scene_ids), BATCH_SIZE):
+            yield from collection.find(
+                {**project_filter, "_id": {"$in": annotation_scene_ids[batch : batch + BATCH_SIZE]}},
+                projection=[
+                    "dataset_storage_id",
+                    "media_identifier",
+                    "creation_date",
+                    "media_width",
+                    "media_height",
+                    "annotations",
+                ],
+            )
+
+    @classmethod
+    def _count_annotation_scene(cls, annotation_scene: dict) -> dict[ObjectId, dict]:
+        """Count the labels and the object sizes in an annotation scene. Shapes that are not visible are ignored."""
+        counts_per_label: dict[ObjectId, dict] = {}
+        for annotation in annotation_scene["annotations"]:
+            shape = annotation["shape"]
+            if not shape.get("is_visible", True):
+                continue
+            width, height = cls._get_object_size(
+                shape=shape, media_width=annotation_scene["media_width"], media_height=annotation_scene["media_height"]
+            )
+            bucket = f"{cls._quantize_object_size(width)}_{cls._quantize_object_size(height)}"
+            for label in annotation.get("labels", []):
+                counts = counts_per_label.setdefault(
+                    label["label_id"], {"annotation_scene_count": 1, "shape_count": 0, "object_size_histogram": {}}
+                )
+                counts["shape_count"] += 1
+                counts["object_size_histogram"][bucket] = counts["object_size_histogram"].get(bucket, 0) + 1
+        return counts_per_label
+
+    @staticmethod
+    def _get_object_size(shape: dict, media_width: int, media_height: int) -> tuple[int, int]:
+        """Compute the size in pixels of the bounding box of a shape"""
+        if shape["type"] == "KEYPOINT":
+            return 1, 1
+        if shape["type"] == "POLYGON" and "points" in shape:
+            xs = [point["x"] for point in shape["points"]]
+            ys = [point["y"] for point in shape["points"]]
+            return int((max(xs) - min(xs)) * media_width), int((max(ys) - min(ys)) * media_height)
+        # Rectangles, ellipses and polygons with packed points store their bounding box
+        return int((shape["x2"] - shape["x1"]) * media_width), int((shape["y2"] - shape["y1"]) * media_height)
+
+    @staticmethod
+    def _quantize_object_size(size: int) -> int:
+        """Round an object dimension to OBJECT_SIZE_SIGNIFICANT_BITS significant bits"""
+        shift = size.bit_length() - OBJECT_SIZE_SIGNIFICANT_BITS
+        if shift <= 0:
+            return size
+        return ((size + (1 << (shift - 1))) >> shift) << shift
+
+    @staticmethod
+    def _media_identifier_as_id(media_identifier: dict) -> ObjectId:
+        """Hash a media identifier into an ID, like MediaIdentifierEntity.as_id"""
+        identifier_tuple: tuple = (media_identifier["type"], media_identifier["media_id"])
+        if media_identifier["type"] == "video_frame":
+            identifier_tuple += (media_identifier.get("frame_index", media_identifier.get("frame_number")),)
+        identifier_str = "".join(str(x) for x in identifier_tuple)
+        return ObjectId(hashlib.sha256(identifier_str.encode("utf-8")).hexdigest()[:24])
+
+    @staticmethod
+    def _preliminary_project_query_filter(organization_id: UUID, workspace_id: UUID, project_id: ObjectId) -> dict:
+        return {
+            "organization_id": organization_id,
+            "workspace_id": workspace_id,
+            "project_id": project_id,
+        }
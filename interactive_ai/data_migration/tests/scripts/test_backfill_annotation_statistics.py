@@ -0,0 +1,125 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+import datetime
+import hashlib
+from unittest.mock import patch
+from uuid import UUID
+
+import mongomock
+import pytest
+from bson import ObjectId
+from bson.binary import UUID_SUBTYPE, Binary, UuidRepresentation
+from pymongo import MongoClient
+
+from migration.scripts.backfill_annotation_statistics import BackfillAnnotationStatisticsMigration
+
+ORGANIZATION_ID = UUID("11fdb5ad-8e0d-4301-b22b-06589beef658")
+WORKSPACE_ID = UUID("11fdb5ad-8e0d-4301-b22b-06589beef658")
+PROJECT_ID = ObjectId("60d31793d5f1fb7e6e3c1a50")
+DATASET_STORAGE_ID = ObjectId("665ebe4de7ad59929fa37f92")
+LABEL_ID = ObjectId("60d31793d5f1fb7e6e3c1a51")
+
+
+def side_effect_mongo_mock_from_uuid(uuid: UUID, uuid_representation=UuidRepresentation.STANDARD):
+    """Override (Mock) the bson.binary.Binary.from_uuid function to work for mongomock"""
+    if not isinstance(uuid, UUID):
+        raise TypeError("uuid must be an instance of uuid.UUID")
+    return Binary(uuid.bytes, UUID_SUBTYPE)
+
+
+@pytest.fixture()
+def fxt_mongo_uuid():
+    with patch.object(Binary, "from_uuid", side_effect=side_effect_mongo_mock_from_uuid):
+        yield
+
+
+def get_annotation_scene(id_: ObjectId, media_identifier: dict, annotations: list, age_days: int = 0) -> dict:
+    return {
+        "_id": id_,
+        "dataset_storage_id": DATASET_STORAGE_ID,
+        "annotations": annotations,
+        "creation_date": datetime.datetime(2025, 1, 10) - datetime.timedelta(days=age_days),
+        "kind": "ANNOTATION",
+        "media_height": 100,
+        "media_identifier": media_identifier,
+        "media_width": 200,
+        "organization_id": ORGANIZATION_ID,
+        "project_id": PROJECT_ID,
+        "workspace_id": WORKSPACE_ID,
+    }
+
+
+def get_rectangle_annotation(width: float, height: float) -> dict:
+    return {
+        "_id": ObjectId(),
+        "shape": {"type": "RECTANGLE", "x1": 0.0, "y1": 0.0, "x2": width, "y2": height},
+        "labels": [{"label_id": LABEL_ID, "is_empty": False}],
+    }
+
+
+class TestBackfillAnnotationStatistics:
+    def test_upgrade_project(self, fxt_mongo_uuid) -> None:
+        # Arrange
+        mock_db = mongomock.MongoClient().db
+        mock_db.get_collection("dataset_storage").insert_one(
+            {
+                "_id": DATASET_STORAGE_ID,
+                "organization_id": ORGANIZATION_ID,
+                "workspace_id": WORKSPACE_ID,
+                "project_id": PROJECT_ID,
+            }
+        )
+        image_identifier = {"media_id": ObjectId("60d31793d5f1fb7e6e3c1a60"), "type": "image"}
+        frame_identifier = {"media_id": ObjectId("60d31793d5f1fb7e6e3c1a61"), "type": "video_frame", "frame_index": 3}
+        latest_image_scene = get_annotation_scene(
+            id_=ObjectId("60d31793d5f1fb7e6e3c1a70"),
+            media_identifier=image_identifier,
+            annotations=[get_rectangle_annotation(0.5, 0.5), get_rectangle_annotation(0.5, 0.5)],
+        )
+        mock_db.get_collection("annotation_scene").insert_many(
+            [
+                latest_image_scene,
+                # Older annotation scene of the same image, not counted
+                get_annotation_scene(
+                    id_=ObjectId("60d31793d5f1fb7e6e3c1a71"),
+                    media_identifier=image_identifier,
+                    annotations=[get_rectangle_annotation(0.1, 0.1)],
+                    age_days=1,
+                ),
+                get_annotation_scene(
+                    id_=ObjectId("60d31793d5f1fb7e6e3c1a72"),
+                    media_identifier=frame_identifier,
+                    annotations=[get_rectangle_annotation(1.0, 1.0)],
+                ),
+            ]
+        )
+
+        # Act
+        with patch.object(MongoClient, "get_database", return_value=mock_db):
+            for _ in range(2):  # the script is idempotent
+                BackfillAnnotationStatisticsMigration.upgrade_project(
+                    organization_id=str(ORGANIZATION_ID),
+                    workspace_id=str(WORKSPACE_ID),
+                    project_id=str(PROJECT_ID),
+                )
+
+        # Assert
+        media_docs = {doc["_id"]: doc for doc in mock_db.get_collection("media_annotation_statistics").find()}
+        image_statistics_id = ObjectId(hashlib.sha256(f"image{image_identifier['media_id']}".encode()).hexdigest()[:24])
+        assert len(media_docs) == 2
+        assert media_docs[image_statistics_id]["annotation_scene_id"] == latest_image_scene["_id"]
+        assert media_docs[image_statistics_id]["counts_per_label"] == [
+            {
+                "label_id": LABEL_ID,
+                "annotation_scene_count": 1,
+                "shape_count": 2,
+                "object_size_histogram": {"100_50": 2},
+            }
+        ]
+        label_docs = {doc["label_id"]: doc for doc in mock_db.get_collection("label_annotation_statistics").find()}
+        assert set(label_docs) == {LABEL_ID, None}  # the document without label_id marks the totals as built
+        assert label_docs[None]["dataset_storage_id"] == DATASET_STORAGE_ID
+        assert label_docs[LABEL_ID]["dataset_storage_id"] == DATASET_STORAGE_ID
+        assert label_docs[LABEL_ID]["annotation_scene_count"] == 2
+        assert label_docs[LABEL_ID]["shape_count"] == 3
+        assert label_docs[LABEL_ID]["object_size_histogram"] == {"100_50": 2, "200_100": 1}
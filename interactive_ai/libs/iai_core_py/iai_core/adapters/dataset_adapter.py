@@ -3,14 +3,23 @@
 
 """This module contains the implementation of the DatasetAdapter"""
 
-from collections.abc import Callable
-from typing import cast
+import os
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING, cast
 
 import numpy as np
 
 from iai_core.entities.dataset_item import DatasetItem
 from iai_core.entities.interfaces.dataset_adapter_interface import DatasetAdapterInterface
 
+from geti_types import ID
+
+if TYPE_CHECKING:
+    from iai_core.repos.dataset_repo import _DatasetItemRepo
+
+# Number of dataset items fetched from the database at once by the streaming datasets
+DATASET_STREAMING_BATCH_SIZE = int(os.environ.get("DATASET_STREAMING_BATCH_SIZE", "256"))
+
 
 class DatasetAdapter(DatasetAdapterInterface):
     """
@@ -76,3 +85,97 @@ class DatasetAdapter(DatasetAdapterInterface):
     def delete_at_index(self, index: int) -> None:
         del self.dataset_items_docs[index]
         del self.__items[index]
+
+
+class StreamingDatasetAdapter(DatasetAdapterInterface):
+    """
+    The StreamingDatasetAdapter class provides an adapter to stream the dataset items from the database.
+
+    Unlike DatasetAdapter, it does not keep the dataset items (nor their documents) in memory, so the memory
+    usage does not grow with the size of the dataset:
+     - iterating over the dataset consumes a database cursor in batches;
+     - the length is obtained with a count query;
+     - random access by index loads the sorted list of item IDs once, then fetches the requested items
+       together with the next ones in a single query, so that sequential access is also batched.
+
+    Items are ordered by ID, consistently with DatasetAdapter.
+
+    The adapter is read-only: every access deserializes the items anew, so any change made to them would be lost.
+    Datasets backed by this adapter can therefore neither be modified nor saved.
+
+    :param dataset_item_repo: Repo of the items of the dataset
+    :param batch_size: Number of dataset items to fetch from the database at once
+    """
+
+    def __init__(
+        self,
+        dataset_item_repo: "_DatasetItemRepo",
+        batch_size: int = DATASET_STREAMING_BATCH_SIZE,
+    ) -> None:
+        self.dataset_item_repo = dataset_item_repo
+        self.batch_size = batch_size
+        self._length: int | None = None
+        # IDs of the items in the dataset, loaded on the first random access
+        self._item_ids: list[ID] | None = None
+        # window of items fetched by the last random access, as (start index, items)
+        self._window: tuple[int, list[DatasetItem]] = (0, [])
+
+    def _get_item_ids(self) -> list[ID]:
+        if self._item_ids is None:
+            self._item_ids = self.dataset_item_repo.get_all_sorted_ids()
+            self._length = len(self._item_ids)
+        return self._item_ids
+
+    def _fetch_at_index(self, index: int) -> DatasetItem:
+        window_start, window_items = self._window
+        if not window_start <= index < window_start + len(window_items):
+            window_ids = self._get_item_ids()[index : index + self.batch_size]
+            if not window_ids:
+                raise IndexError(f"Index ({index}) is out of range for dataset")
+            items_by_id = {item.id_: item for item in self.dataset_item_repo.get_by_ids(window_ids)}
+            if window_ids[0] not in items_by_id:
+                raise IndexError(f"Dataset item at index ({index}) is no longer in the dataset")
+            # stop the window at the first item that is no longer in the dataset
+            window_items = []
+            for item_id in window_ids:
+                if item_id not in items_by_id:
+                    break
+                window_items.append(items_by_id[item_id])
+            window_start = index
+            self._window = (window_start, window_items)
+        return window_items[index - window_start]
+
+    def fetch(self, key: int | slice | list) -> DatasetItem | list[DatasetItem]:
+        if isinstance(key, list):
+            return [cast("DatasetItem", self.fetch(ii)) for ii in key]
+        if isinstance(key, slice):
+            return [cast("DatasetItem", self.fetch(ii)) for ii in range(*key.indices(self.get_length()))]
+        if isinstance(key, int | np.int32 | np.int64):
+            length = self.get_length()
+            if key < 0:  # Handle negative indices
+                key += length
+            if key < 0 or key >= length:
+                raise IndexError(f"Index ({key}) is out of range for dataset")
+            return self._fetch_at_index(int(key))
+        raise TypeError(
+            f"Instance of type `{type(key).__name__}` cannot be used to fetch Dataset Items. "
+            f"Only slice and int are supported"
+        )
+
+    def get_length(self) -> int:
+        if self._length is None:
+            self._length = self.dataset_item_repo.count()
+        return self._length
+
+    @property
+    def read_only(self) -> bool:
+        return True
+
+    def get_items(self) -> list[DatasetItem]:
+        return list(self.iterate())
+
+    def iterate(self) -> Iterator[DatasetItem]:
+        yield from self.dataset_item_repo.get_all_sorted(batch_size=self.batch_size)
+
+    def delete_at_index(self, index: int) -> None:  # noqa: ARG002
+        raise ValueError("Cannot delete items from a streaming dataset")
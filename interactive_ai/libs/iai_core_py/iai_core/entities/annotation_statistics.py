@@ -0,0 +1,180 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""This module defines the entities holding the incrementally maintained annotation statistics"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from iai_core.entities.annotation import AnnotationScene
+from iai_core.entities.shapes import Ellipse, Keypoint, Polygon, Rectangle, Shape
+
+from geti_types import ID, MediaIdentifierEntity, NullMediaIdentifier, PersistentEntity
+
+# Object sizes are rounded to this number of significant bits (~3% relative error) in the histograms,
+# to bound the number of distinct buckets per label
+OBJECT_SIZE_SIGNIFICANT_BITS = 5
+
+
+def quantize_object_size(size: int) -> int:
+    """
+    Round an object dimension (in pixels) to OBJECT_SIZE_SIGNIFICANT_BITS significant bits.
+
+    :param size: width or height of the object in pixels
+    :return: rounded size
+    """
+    shift = size.bit_length() - OBJECT_SIZE_SIGNIFICANT_BITS
+    if shift <= 0:
+        return size
+    return ((size + (1 << (shift - 1))) >> shift) << shift
+
+
+def get_object_size(shape: Shape, media_width: int, media_height: int) -> tuple[int, int]:
+    """
+    Compute the size of an object in pixels, as (width, height) of its bounding box. Keypoints are a single pixel.
+
+    :param shape: shape of the object, in normalized coordinates
+    :param media_width: width of the media in pixels
+    :param media_height: height of the media in pixels
+    :return: (width, height) of the object
+    """
+    if isinstance(shape, Rectangle | Ellipse):
+        return int((shape.x2 - shape.x1) * media_width), int((shape.y2 - shape.y1) * media_height)
+    if isinstance(shape, Polygon):
+        return int((shape.max_x - shape.min_x) * media_width), int((shape.max_y - shape.min_y) * media_height)
+    if isinstance(shape, Keypoint):
+        return 1, 1
+    raise ValueError(f"Cannot compute the object size of shape `{shape}`")
+
+
+@dataclass
+class LabelAnnotationCounts:
+    """
+    Counters of the annotations with a given label.
+
+    :param annotation_scene_count: number of annotation scenes (media) containing the label
+    :param shape_count: number of shapes with the label
+    :param object_size_histogram: number of shapes with the label by (width, height) bucket in pixels
+    """
+
+    annotation_scene_count: int = 0
+    shape_count: int = 0
+    object_size_histogram: dict[tuple[int, int], int] = field(default_factory=dict)
+
+    def get_object_sizes(self, max_object_sizes: int) -> tuple[tuple[int, int], ...]:
+        """
+        Expand the histogram into a list of object sizes. If there are more than max_object_sizes objects, the count
+        of each bucket is scaled down proportionally.
+
+        :param max_object_sizes: maximum number of object sizes to return
+        :return: tuple of (width, height) object sizes
+        """
+        buckets = sorted((size, count) for size, count in self.object_size_histogram.items() if count > 0)
+        total_count = sum(count for _, count in buckets)
+        scale = min(1.0, max_object_sizes / total_count) if total_count else 1.0
+        object_sizes: list[tuple[int, int]] = []
+        for size, count in buckets:
+            object_sizes.extend([size] * max(1, round(count * scale)))
+        return tuple(object_sizes[:max_object_sizes])
+
+
+class MediaAnnotationStatistics(PersistentEntity):
+    """
+    Contribution of the latest user annotation scene of a media to the label statistics of its dataset storage.
+    It is kept to subtract the contribution when the media is annotated again or deleted.
+
+    :param media_identifier: identifier of the media
+    :param annotation_scene_id: ID of the annotation scene the counts are computed from
+    :param annotation_scene_creation_date: creation date of the annotation scene, to discard out-of-order events
+    :param counts_per_label: counters by label ID
+    :param ephemeral: True if the entity has not been persisted yet
+    """
+
+    def __init__(
+        self,
+        media_identifier: MediaIdentifierEntity,
+        annotation_scene_id: ID,
+        annotation_scene_creation_date: datetime,
+        counts_per_label: dict[ID, LabelAnnotationCounts],
+        ephemeral: bool = True,
+    ) -> None:
+        self.media_identifier = media_identifier
+        self.annotation_scene_id = annotation_scene_id
+        self.annotation_scene_creation_date = annotation_scene_creation_date
+        self.counts_per_label = counts_per_label
+        super().__init__(id_=media_identifier.as_id(), ephemeral=ephemeral)
+
+    @property
+    def id_(self) -> ID:
+        return self.media_identifier.as_id()
+
+    @id_.setter
+    def id_(self, _) -> None:  # noqa: ANN001
+        raise NotImplementedError(
+            "id_ cannot be set for MediaAnnotationStatistics, it is derived from the media_identifier."
+        )
+
+    @classmethod
+    def from_annotation_scene(cls, annotation_scene: AnnotationScene) -> "MediaAnnotationStatistics":
+        """
+        Count the labels and the object sizes in an annotation scene. Shapes that are not visible are ignored.
+
+        :param annotation_scene: user annotation scene
+        :return: MediaAnnotationStatistics for the media of the annotation scene
+        """
+        counts_per_label: dict[ID, LabelAnnotationCounts] = {}
+        for annotation in annotation_scene.annotations:
+            if not getattr(annotation.shape, "is_visible", True):
+                continue
+            object_size = get_object_size(
+                shape=annotation.shape,
+                media_width=annotation_scene.media_width,
+                media_height=annotation_scene.media_height,
+            )
+            bucket = (quantize_object_size(object_size[0]), quantize_object_size(object_size[1]))
+            for label in annotation.get_labels(include_empty=True):
+                counts = counts_per_label.setdefault(label.id_, LabelAnnotationCounts(annotation_scene_count=1))
+                counts.shape_count += 1
+                counts.object_size_histogram[bucket] = counts.object_size_histogram.get(bucket, 0) + 1
+        return cls(
+            media_identifier=annotation_scene.media_identifier,
+            annotation_scene_id=annotation_scene.id_,
+            annotation_scene_creation_date=annotation_scene.creation_date,
+            counts_per_label=counts_per_label,
+        )
+
+
+class NullMediaAnnotationStatistics(MediaAnnotationStatistics):
+    """Representation of 'MediaAnnotationStatistics not found'"""
+
+    def __init__(self) -> None:
+        super().__init__(
+            media_identifier=NullMediaIdentifier(),
+            annotation_scene_id=ID(),
+            annotation_scene_creation_date=datetime.min.replace(tzinfo=timezone.utc),
+            counts_per_label={},
+        )
+
+
+class LabelAnnotationStatistics(PersistentEntity):
+    """
+    Totals of the annotation counters of a label in a dataset storage, over the latest user annotation scene of
+    every media.
+
+    :param id_: ID of the entity
+    :param label_id: ID of the label
+    :param counts: counters of the label
+    :param ephemeral: True if the entity has not been persisted yet
+    """
+
+    def __init__(self, id_: ID, label_id: ID, counts: LabelAnnotationCounts, ephemeral: bool = True) -> None:
+        super().__init__(id_=id_, ephemeral=ephemeral)
+        self.label_id = label_id
+        self.counts = counts
+
+
+class NullLabelAnnotationStatistics(LabelAnnotationStatistics):
+    """Representation of 'LabelAnnotationStatistics not found'"""
+
+    def __init__(self) -> None:
+        super().__init__(id_=ID(), label_id=ID(), counts=LabelAnnotationCounts())
@@ -27,12 +27,15 @@ class CompiledDatasetShard:
     :param binary_filename: Filename of the binary file, which will be used for its access on the BinaryRepo
     :param size: Size of the file (the number of bytes)
     :param checksum: SHA-256 checksum of the file which will be used for the integrity check
+    :param content_key: Optional, digest of the dataset items contained in the file. It is only set for shard files
+        compiled in content-addressed mode, and it allows to reuse the file as long as its content does not change.
     """
 
     filename: str
     binary_filename: str
     size: int
     checksum: str
+    content_key: str | None = None
 
 
 class CompiledDatasetShards(PersistentEntity):
@@ -118,6 +118,12 @@ class Dataset(PersistentEntity):
     >>> adapter = DatasetAdapter(...)
     >>> dataset = Dataset(dataset_adapter=adapter)
 
+    Datasets loaded from the database with DatasetRepo use a DatasetAdapter, which keeps all the items in memory
+    once deserialized. For large datasets that are only iterated over, DatasetRepo.get_streaming_dataset returns
+    a Dataset backed by a StreamingDatasetAdapter, which fetches the items from the database in batches instead.
+    Since its items are deserialized anew on every access, such a dataset is read-only: it can neither be modified
+    nor saved.
+
     ## Iterate over dataset
 
         Regardless of the instantiation method chosen, the Dataset will work the same.
@@ -211,6 +217,18 @@ class Dataset(PersistentEntity):
         """
         return self._label_schema_id
 
+    @property
+    def read_only(self) -> bool:
+        """
+        Returns True if the dataset items are fetched anew on every access, in which case the dataset
+        can neither be modified nor saved.
+        """
+        return self.dataset_adapter is not None and self.dataset_adapter.read_only
+
+    def __check_not_read_only(self) -> None:
+        if self.read_only:
+            raise ValueError(f"Cannot modify read-only dataset with id `{self.id_}`")
+
     @property
     def __items(self) -> list[DatasetItem]:
         if self.dataset_adapter is not None:
@@ -375,8 +393,10 @@ class Dataset(PersistentEntity):
         Return an iterator for the Dataset.
         This iterator is able to iterate over the Dataset lazily.
 
-        :return: DatasetIterator instance
+        :return: DatasetIterator instance, or the iterator of the dataset adapter
         """
+        if self.dataset_adapter is not None:
+            return self.dataset_adapter.iterate()
         return DatasetIterator(self)
 
     def __copy__(self):
@@ -397,7 +417,7 @@ class Dataset(PersistentEntity):
         # Create a copy of the items (with new ID) so they are not taken away
         # from the original dataset when saving the new dataset.
         items_copy: list[DatasetItem] = []
-        for item in self.__items:
+        for item in self:
             if item.subset == subset:
                 # note: it is important that the annotation scene object in memory is
                 # the same as in the original item because of the mapper cache.
@@ -427,6 +447,7 @@ class Dataset(PersistentEntity):
         :raises ValueError: if the input item is not in the dataset
         :param item: the item to be deleted
         """
+        self.__check_not_read_only()
         index = self.__items.index(item)
         self.remove_at_indices([index])
 
@@ -463,6 +484,7 @@ class Dataset(PersistentEntity):
                 return identifier.media_id, identifier.frame_index, item.roi_id
             return identifier.media_id, item.roi_id
 
+        self.__check_not_read_only()
         self.__items = sorted(self.__items, key=get_sorting_criterion)
 
     def filter_by_media(self, search_media_identifiers: list[MediaIdentifierEntity]) -> list[DatasetItem]:
@@ -475,7 +497,7 @@ class Dataset(PersistentEntity):
         item_list = []
         search_media = {media_identifier.media_id for media_identifier in search_media_identifiers}
 
-        for item in self.__items:
+        for item in self:
             if item.media_identifier.media_id in search_media:
                 item_list.append(item)
         return item_list
@@ -486,6 +508,7 @@ class Dataset(PersistentEntity):
 
         :param indices: the indices of the items that will be deleted from the items.
         """
+        self.__check_not_read_only()
         indices.sort(reverse=True)  # sort in descending order
         if self.dataset_adapter is not None:
             for i_item in indices:
@@ -502,7 +525,7 @@ class Dataset(PersistentEntity):
 
         :return: True if there are any dataset items which are associated with media_id.
         """
-        return any(item.media_identifier.media_id == media_id for item in self.__items)
+        return any(item.media_identifier.media_id == media_id for item in self)
 
     def get_label_ids(self, include_empty: bool = False) -> set[ID]:
         """Returns a set of all unique label ID's that are in the dataset.
@@ -4,6 +4,7 @@
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 
 import abc
+from collections.abc import Iterator
 
 from iai_core.entities.dataset_item import DatasetItem
 
@@ -14,6 +15,14 @@ class DatasetAdapterInterface(metaclass=abc.ABCMeta):
     such as the Dataset to fetch its DatasetItems lazily.
     """
 
+    @property
+    def read_only(self) -> bool:
+        """
+        Whether the dataset items are fetched anew on every access, in which case changes made to them
+        are not retained and the dataset can neither be modified nor saved.
+        """
+        return False
+
     @abc.abstractmethod
     def fetch(self, key: int | slice | list) -> DatasetItem | list[DatasetItem]:
         """
@@ -40,6 +49,18 @@ class DatasetAdapterInterface(metaclass=abc.ABCMeta):
         :return: List of DatasetItems
         """
 
+    def iterate(self) -> Iterator[DatasetItem]:
+        """
+        Iterate over the items in the dataset. Adapters that can fetch the items more efficiently
+        than one by one should override this method.
+
+        :return: Iterator over the DatasetItems
+        """
+        index = 0
+        while index < self.get_length():
+            yield self.fetch(index)  # type: ignore[misc]
+            index += 1
+
     @abc.abstractmethod
     def delete_at_index(self, index: int) -> None:
         """
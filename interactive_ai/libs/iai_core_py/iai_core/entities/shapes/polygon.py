@@ -5,8 +5,8 @@
 
 import datetime
 import warnings
-from operator import attrgetter
 
+import numpy as np
 from shapely.geometry import Polygon as ShapelyPolygon
 
 from iai_core.utils.time_utils import now
@@ -77,6 +77,10 @@ class Polygon(Shape):
 
     NB Freehand drawings are also stored as polygons.
 
+    The coordinates are stored in a (N, 2) NumPy array of xy pairs; the list of Point's exposed by `points` is only
+    built when accessed. Dense contours should be created with `from_coordinates` to avoid the Point objects
+    altogether.
+
     :param points: list of Point's forming the polygon
     :param modification_date: last modified date
     """
@@ -87,21 +91,52 @@ class Polygon(Shape):
         points: list[Point],
         modification_date: datetime.datetime | None = None,
     ):
+        if len(points) == 0:
+            raise ValueError("Cannot create polygon with no points")
+        coordinates = np.array([(point.x, point.y) for point in points], dtype=np.float64)
+        self._init_from_coordinates(coordinates=coordinates, modification_date=modification_date)
+        self._points: list[Point] | None = points
+
+    @classmethod
+    def from_coordinates(
+        cls,
+        coordinates: np.ndarray,
+        modification_date: datetime.datetime | None = None,
+    ) -> "Polygon":
+        """Creates a polygon from an array of coordinates, without instantiating a Point for every vertex.
+
+        :param coordinates: array-like of shape (N, 2) with the x and y coordinates of the vertices
+        :param modification_date: last modified date
+        :return: Polygon backed by the given coordinates
+        """
+        coordinates = np.array(coordinates, dtype=np.float64)  # copy, the array is made read-only below
+        if coordinates.ndim != 2 or coordinates.shape[1] != 2:
+            raise ValueError(f"Polygon coordinates must have shape (N, 2), got {coordinates.shape}")
+        if len(coordinates) == 0:
+            raise ValueError("Cannot create polygon with no points")
+        polygon = cls.__new__(cls)
+        polygon._init_from_coordinates(coordinates=coordinates, modification_date=modification_date)
+        polygon._points = None
+        return polygon
+
+    def _init_from_coordinates(
+        self,
+        coordinates: np.ndarray,
+        modification_date: datetime.datetime | None,
+    ) -> None:
         modification_date = now() if modification_date is None else modification_date
         super().__init__(
             shape_type=ShapeType.POLYGON,
             modification_date=modification_date,
         )
+        # The array is shared with the polygons and mappers that read it, so it must never be modified in place
+        coordinates.setflags(write=False)
+        self._coordinates = coordinates
 
-        if len(points) == 0:
-            raise ValueError("Cannot create polygon with no points")
-
-        self.points = points
-
-        self.min_x = min(points, key=attrgetter("x")).x
-        self.max_x = max(points, key=attrgetter("x")).x
-        self.min_y = min(points, key=attrgetter("y")).y
-        self.max_y = max(points, key=attrgetter("y")).y
+        min_xy = coordinates.min(axis=0)
+        max_xy = coordinates.max(axis=0)
+        self.min_x, self.min_y = min_xy.tolist()
+        self.max_x, self.max_y = max_xy.tolist()
 
         is_valid = True
         for x, y in [(self.min_x, self.min_y), (self.max_x, self.max_y)]:
@@ -113,17 +148,32 @@ class Polygon(Shape):
                 UserWarning,
             )
 
+    @property
+    def coordinates(self) -> np.ndarray:
+        """Read-only (N, 2) array with the x and y coordinates of the vertices of the polygon."""
+        return self._coordinates
+
+    @property
+    def points(self) -> list[Point]:
+        """List of Point's forming the polygon, built from the coordinates on first access."""
+        if self._points is None:
+            self._points = [Point(x=x, y=y) for x, y in self._coordinates.tolist()]
+        return self._points
+
     def __repr__(self):
         """String representation of the polygon."""
         return (
-            f"Polygon(len(points)={len(self.points)},"
+            f"Polygon(len(points)={len(self._coordinates)},"
             f" min_x={self.min_x}, max_x={self.max_x}, min_y={self.min_y}, max_y={self.max_y})"
         )
 
     def __eq__(self, other: object) -> bool:
         """Compares if the polygon has the same points and modification date."""
         if isinstance(other, Polygon):
-            return self.points == other.points and self.modification_date == other.modification_date
+            return (
+                np.array_equal(self._coordinates, other._coordinates)
+                and self.modification_date == other.modification_date
+            )
         return False
 
     def __hash__(self):
@@ -156,8 +206,9 @@ class Polygon(Shape):
 
         roi_shape = roi_shape.clip_to_visible_region()
 
-        points = [p.normalize_wrt_roi(roi_shape) for p in self.points]
-        return Polygon(points=points)
+        # Same arithmetic as Point.normalize_wrt_roi, applied to all the vertices at once
+        coordinates = self._coordinates * (roi_shape.width, roi_shape.height) + (roi_shape.x1, roi_shape.y1)
+        return Polygon.from_coordinates(coordinates=coordinates)
 
     def denormalize_wrt_roi_shape(self, roi_shape: Rectangle) -> "Polygon":
         """Transforming shape from the normalized coordinate system to the `roi` coordinate system.
@@ -187,12 +238,13 @@ class Polygon(Shape):
 
         roi_shape = roi_shape.clip_to_visible_region()
 
-        points = [p.denormalize_wrt_roi_shape(roi_shape) for p in self.points]
-        return Polygon(points=points)
+        # Same arithmetic as Point.denormalize_wrt_roi_shape, applied to all the vertices at once
+        coordinates = (self._coordinates - (roi_shape.x1, roi_shape.y1)) / (roi_shape.width, roi_shape.height)
+        return Polygon.from_coordinates(coordinates=coordinates)
 
     def _as_shapely_polygon(self) -> ShapelyPolygon:
         """Returns the Polygon object as a shapely polygon which is used for calculating intersection between shapes."""
-        return ShapelyPolygon([(point.x, point.y) for point in self.points])
+        return ShapelyPolygon(self._coordinates)
 
     def get_area(self) -> float:
         """Returns the approximate area of the shape.
@@ -554,6 +554,7 @@ class AnnotationSceneRepo(DatasetStorageBasedSessionRepo[AnnotationScene]):
                 (1, 1)
             - for other types of shapes (i.e. POLYGON):
                 (max(shape.points.x) - min(shape.points.x), max(shape.points.y) - min(shape.points.y)
+                or (shape.x2 - shape.x1, shape.y2 - shape.y1) if the points are packed in binary format
 
         2. Counts the number of occurrences for each label_id, at annotation and shape level.
         Only considers the latest user annotations, i.e. of kind `ANNOTATION`.
@@ -660,12 +661,23 @@ class AnnotationSceneRepo(DatasetStorageBasedSessionRepo[AnnotationScene]):
                                                     {
                                                         "$multiply": [
                                                             {
-                                                                "$subtract": [
+                                                                # Polygons with packed points store their bounding box
+                                                                "$ifNull": [
                                                                     {
-                                                                        "$max": "$$this.shape.points.x",
+                                                                        "$subtract": [
+                                                                            "$$this.shape.x2",
+                                                                            "$$this.shape.x1",
+                                                                        ],
                                                                     },
                                                                     {
-                                                                        "$min": "$$this.shape.points.x",
+                                                                        "$subtract": [
+                                                                            {
+                                                                                "$max": "$$this.shape.points.x",
+                                                                            },
+                                                                            {
+                                                                                "$min": "$$this.shape.points.x",
+                                                                            },
+                                                                        ],
                                                                     },
                                                                 ],
                                                             },
@@ -724,12 +736,23 @@ class AnnotationSceneRepo(DatasetStorageBasedSessionRepo[AnnotationScene]):
                                                     {
                                                         "$multiply": [
                                                             {
-                                                                "$subtract": [
+                                                                # Polygons with packed points store their bounding box
+                                                                "$ifNull": [
                                                                     {
-                                                                        "$max": "$$this.shape.points.y",
+                                                                        "$subtract": [
+                                                                            "$$this.shape.y2",
+                                                                            "$$this.shape.y1",
+                                                                        ],
                                                                     },
                                                                     {
-                                                                        "$min": "$$this.shape.points.y",
+                                                                        "$subtract": [
+                                                                            {
+                                                                                "$max": "$$this.shape.points.y",
+                                                                            },
+                                                                            {
+                                                                                "$min": "$$this.shape.points.y",
+                                                                            },
+                                                                        ],
                                                                     },
                                                                 ],
                                                             },
@@ -0,0 +1,242 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""This module implements the repos for the incrementally maintained annotation statistics"""
+
+from collections.abc import Callable, Sequence
+
+from pymongo import DESCENDING, IndexModel, UpdateOne
+from pymongo.command_cursor import CommandCursor
+from pymongo.cursor import Cursor
+from pymongo.errors import DuplicateKeyError
+
+from iai_core.entities.annotation_statistics import (
+    LabelAnnotationCounts,
+    LabelAnnotationStatistics,
+    MediaAnnotationStatistics,
+    NullLabelAnnotationStatistics,
+    NullMediaAnnotationStatistics,
+)
+from iai_core.repos.base import DatasetStorageBasedSessionRepo
+from iai_core.repos.base.session_repo import QueryAccessMode
+from iai_core.repos.mappers import CursorIterator, IDToMongo
+from iai_core.repos.mappers.mongodb_mappers.annotation_statistics_mapper import (
+    LabelAnnotationStatisticsToMongo,
+    MediaAnnotationStatisticsToMongo,
+    ObjectSizeHistogramToMongo,
+)
+
+from geti_types import ID, DatasetStorageIdentifier, Session
+
+
+class MediaAnnotationStatisticsRepo(DatasetStorageBasedSessionRepo[MediaAnnotationStatistics]):
+    """
+    Repository for the contribution of each media to the annotation statistics of the dataset storage
+
+    :param dataset_storage_identifier: Identifier of the dataset_storage
+    :param session: Session object; if not provided, it is loaded through the context variable CTX_SESSION_VAR
+    """
+
+    collection_name = "media_annotation_statistics"
+
+    def __init__(
+        self,
+        dataset_storage_identifier: DatasetStorageIdentifier,
+        session: Session | None = None,
+    ) -> None:
+        super().__init__(
+            collection_name=self.collection_name,
+            session=session,
+            dataset_storage_identifier=dataset_storage_identifier,
+        )
+
+    @property
+    def forward_map(self) -> Callable[[MediaAnnotationStatistics], dict]:
+        return MediaAnnotationStatisticsToMongo.forward
+
+    @property
+    def backward_map(self) -> Callable[[dict], MediaAnnotationStatistics]:
+        return MediaAnnotationStatisticsToMongo.backward
+
+    @property
+    def null_object(self) -> MediaAnnotationStatistics:
+        return NullMediaAnnotationStatistics()
+
+    @property
+    def cursor_wrapper(self) -> Callable[[Cursor | CommandCursor], CursorIterator]:
+        return lambda mongo_cursor: CursorIterator(
+            cursor=mongo_cursor,
+            mapper=MediaAnnotationStatisticsToMongo,
+            parameter=None,
+        )
+
+    @property
+    def indexes(self) -> list[IndexModel]:
+        super_indexes = super().indexes
+        new_indexes = [
+            IndexModel([("media_identifier.media_id", DESCENDING)]),  # Indexed to quickly delete a video's frames
+        ]
+        return super_indexes + new_indexes
+
+    def replace_if_unchanged(
+        self, media_statistics: MediaAnnotationStatistics, previous_annotation_scene_id: ID | None
+    ) -> bool:
+        """
+        Atomically replace the statistics of a media, only if they were still computed from the given annotation
+        scene. This guarantees that concurrent updates of the same media are applied to the totals exactly once.
+
+        :param media_statistics: new statistics of the media
+        :param previous_annotation_scene_id: ID of the annotation scene of the statistics to replace, or None if no
+            statistics should exist yet for the media
+        :return: True if the statistics have been replaced, False if they were changed in the meantime
+        """
+        doc = self.forward_map(media_statistics)
+        doc.update(self.preliminary_query_match_filter(access_mode=QueryAccessMode.WRITE))
+        if previous_annotation_scene_id is None:
+            try:
+                self._collection.insert_one(doc)
+            except DuplicateKeyError:
+                return False
+        else:
+            query = self.preliminary_query_match_filter(access_mode=QueryAccessMode.WRITE)
+            query["_id"] = doc["_id"]
+            query["annotation_scene_id"] = IDToMongo.forward(previous_annotation_scene_id)
+            if self._collection.replace_one(query, doc).matched_count == 0:
+                return False
+        media_statistics.mark_as_persisted()
+        return True
+
+    def pop_all_by_media_id(self, media_id: ID) -> tuple[MediaAnnotationStatistics, ...]:
+        """
+        Delete the statistics of a media (and of its frames, for a video) and return the deleted ones
+
+        :param media_id: ID of the media
+        :return: deleted statistics
+        """
+        query = self.preliminary_query_match_filter(access_mode=QueryAccessMode.WRITE)
+        query["media_identifier.media_id"] = IDToMongo.forward(media_id)
+        deleted = []
+        while (doc := self._collection.find_one_and_delete(query)) is not None:
+            deleted.append(self.backward_map(doc))
+        return tuple(deleted)
+
+
+class LabelAnnotationStatisticsRepo(DatasetStorageBasedSessionRepo[LabelAnnotationStatistics]):
+    """
+    Repository for the annotation statistics totals of each label in the dataset storage
+
+    :param dataset_storage_identifier: Identifier of the dataset_storage
+    :param session: Session object; if not provided, it is loaded through the context variable CTX_SESSION_VAR
+    """
+
+    collection_name = "label_annotation_statistics"
+
+    def __init__(
+        self,
+        dataset_storage_identifier: DatasetStorageIdentifier,
+        session: Session | None = None,
+    ) -> None:
+        super().__init__(
+            collection_name=self.collection_name,
+            session=session,
+            dataset_storage_identifier=dataset_storage_identifier,
+        )
+
+    @property
+    def forward_map(self) -> Callable[[LabelAnnotationStatistics], dict]:
+        return LabelAnnotationStatisticsToMongo.forward
+
+    @property
+    def backward_map(self) -> Callable[[dict], LabelAnnotationStatistics]:
+        return LabelAnnotationStatisticsToMongo.backward
+
+    @property
+    def null_object(self) -> LabelAnnotationStatistics:
+        return NullLabelAnnotationStatistics()
+
+    @property
+    def cursor_wrapper(self) -> Callable[[Cursor | CommandCursor], CursorIterator]:
+        return lambda mongo_cursor: CursorIterator(
+            cursor=mongo_cursor,
+            mapper=LabelAnnotationStatisticsToMongo,
+            parameter=None,
+        )
+
+    @property
+    def indexes(self) -> list[IndexModel]:
+        super_indexes = super().indexes
+        new_indexes = [
+            IndexModel([("label_id", DESCENDING)]),
+        ]
+        return super_indexes + new_indexes
+
+    def increment(
+        self,
+        counts_per_label: dict[ID, LabelAnnotationCounts],
+        decrement_counts_per_label: dict[ID, LabelAnnotationCounts] | None = None,
+    ) -> None:
+        """
+        Add some counters to the totals of the labels, and optionally subtract other ones, in a single bulk write.
+        Totals are created for the labels that do not have them yet.
+
+        :param counts_per_label: counters to add, by label ID
+        :param decrement_counts_per_label: counters to subtract, by label ID
+        """
+        increments: dict[ID, dict[str, int]] = {}
+        for counts_by_label, sign in ((counts_per_label, 1), (decrement_counts_per_label or {}, -1)):
+            for label_id, counts in counts_by_label.items():
+                label_increments = increments.setdefault(label_id, {})
+                fields = {
+                    "annotation_scene_count": counts.annotation_scene_count,
+                    "shape_count": counts.shape_count,
+                    **{
+                        f"object_size_histogram.{ObjectSizeHistogramToMongo.forward_key(size)}": count
+                        for size, count in counts.object_size_histogram.items()
+                    },
+                }
+                for field_name, value in fields.items():
+                    label_increments[field_name] = label_increments.get(field_name, 0) + sign * value
+
+        operations = []
+        for label_id, label_increments in increments.items():
+            non_zero_increments = {field_name: value for field_name, value in label_increments.items() if value != 0}
+            if not non_zero_increments:
+                continue
+            query = self.preliminary_query_match_filter(access_mode=QueryAccessMode.WRITE)
+            query["label_id"] = IDToMongo.forward(label_id)
+            operations.append(UpdateOne(query, {"$inc": non_zero_increments}, upsert=True))
+        if operations:
+            self._collection.bulk_write(operations, ordered=False)
+
+    def mark_as_built(self) -> None:
+        """
+        Record that the totals of the dataset storage have been built from all its annotation scenes.
+        The marker is stored as a document without label_id, which is never returned as label totals.
+        """
+        query = self.preliminary_query_match_filter(access_mode=QueryAccessMode.WRITE)
+        query["label_id"] = None
+        self._collection.update_one(query, {"$set": {"label_id": None}}, upsert=True)
+
+    def is_built(self) -> bool:
+        """
+        Check whether the totals of the dataset storage have been built from all its annotation scenes
+
+        :return: True if the totals have been built, False if they must be backfilled
+        """
+        query = self.preliminary_query_match_filter(access_mode=QueryAccessMode.READ)
+        query["label_id"] = None
+        return self._collection.count_documents(query, limit=1) > 0
+
+    def get_by_label_ids(self, label_ids: Sequence[ID]) -> dict[ID, LabelAnnotationStatistics]:
+        """
+        Get the totals of the given labels
+
+        :param label_ids: IDs of the labels
+        :return: dict mapping the label ID to its totals; labels without annotations are missing
+        """
+        query = self.preliminary_query_match_filter(access_mode=QueryAccessMode.READ)
+        query["label_id"] = {"$in": [IDToMongo.forward(label_id) for label_id in label_ids]}
+        return {
+            label_statistics.label_id: label_statistics
+            for label_statistics in map(self.backward_map, self._collection.find(query))
+        }
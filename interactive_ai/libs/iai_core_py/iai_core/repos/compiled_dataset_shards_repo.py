@@ -2,15 +2,22 @@
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 """This module implements the repository for compiled dataset entities"""
 
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterator, Sequence
 
 from pymongo.command_cursor import CommandCursor
 from pymongo.cursor import Cursor
 
-from iai_core.entities.compiled_dataset_shards import CompiledDatasetShards, NullCompiledDatasetShards
+from iai_core.entities.compiled_dataset_shards import (
+    CompiledDatasetShard,
+    CompiledDatasetShards,
+    NullCompiledDatasetShards,
+)
 from iai_core.repos.base import DatasetStorageBasedSessionRepo
 from iai_core.repos.mappers.cursor_iterator import CursorIterator
-from iai_core.repos.mappers.mongodb_mappers.compiled_dataset_shards_mapper import CompiledDatasetShardsToMongo
+from iai_core.repos.mappers.mongodb_mappers.compiled_dataset_shards_mapper import (
+    CompiledDatasetShardsToMongo,
+    CompiledDatasetShardToMongo,
+)
 from iai_core.repos.mappers.mongodb_mappers.id_mapper import IDToMongo
 
 from geti_types import ID, DatasetStorageIdentifier, Session
@@ -75,3 +82,49 @@ class CompiledDatasetShardsRepo(DatasetStorageBasedSessionRepo[CompiledDatasetSh
         }
 
         return self.get_all(extra_filter=query)
+
+    def get_shard_files_by_content_keys(self, content_keys: Sequence[str]) -> dict[str, CompiledDatasetShard]:
+        """
+        Get the most recent compiled shard file for each of the given content keys, among all the
+        CompiledDatasetShards in the dataset storage.
+
+        :param content_keys: Content keys of the shard files to look for
+        :return: Dictionary mapping each content key to the corresponding shard file. Content keys for which
+            no shard file exists are not included.
+        """
+        if not content_keys:
+            return {}
+
+        content_keys_filter = {"compiled_shard_files.content_key": {"$in": list(content_keys)}}
+        pipeline: list[dict] = [
+            {"$match": content_keys_filter},
+            {"$sort": {"_id": -1}},
+            {"$unwind": "$compiled_shard_files"},
+            {"$match": content_keys_filter},
+            {
+                "$group": {
+                    "_id": "$compiled_shard_files.content_key",
+                    "compiled_shard_file": {"$first": "$compiled_shard_files"},
+                }
+            },
+        ]
+        return {
+            result["_id"]: CompiledDatasetShardToMongo.backward(result["compiled_shard_file"])
+            for result in self.aggregate_read(pipeline)
+        }
+
+    def get_content_keys_of_latest(self, num_compiled_dataset_shards: int) -> set[str]:
+        """
+        Get the content keys of the shard files of the most recent CompiledDatasetShards in the dataset storage.
+
+        :param num_compiled_dataset_shards: Number of most recent CompiledDatasetShards to consider
+        :return: Set of content keys. Shard files without content key are ignored.
+        """
+        pipeline: list[dict] = [
+            {"$sort": {"_id": -1}},
+            {"$limit": num_compiled_dataset_shards},
+            {"$unwind": "$compiled_shard_files"},
+            {"$match": {"compiled_shard_files.content_key": {"$ne": None}}},
+            {"$group": {"_id": "$compiled_shard_files.content_key"}},
+        ]
+        return {result["_id"] for result in self.aggregate_read(pipeline)}
@@ -242,6 +242,28 @@ class _DatasetItemRepo(DatasetBasedSessionRepo[DatasetItem]):
         docs = self._collection.find(query, sort=sort_options)
         return list(docs)
 
+    def get_all_sorted_ids(self) -> list[ID]:
+        """
+        Get the IDs of all the dataset items in the dataset, in the same order as `get_all_docs`
+
+        :return: List of dataset item IDs
+        """
+        query = self.preliminary_query_match_filter(QueryAccessMode.READ)
+        cursor = self._collection.find(query, projection={"_id": 1}, sort=[("_id", 1)])
+        return [IDToMongo.backward(doc["_id"]) for doc in cursor]
+
+    def get_all_sorted(self, batch_size: int) -> CursorIterator[DatasetItem]:
+        """
+        Get all the dataset items in the dataset, in the same order as `get_all_docs`.
+        The items are fetched from the database in batches while iterating over the cursor.
+
+        :param batch_size: Number of documents to fetch from the database at once
+        :return: Cursor over the dataset items
+        """
+        query = self.preliminary_query_match_filter(QueryAccessMode.READ)
+        cursor = self._collection.find(query, sort=[("_id", 1)], batch_size=batch_size)
+        return self.cursor_wrapper(cursor)
+
     def sample(self, size: int, subset: Subset | None = None) -> tuple[DatasetItem, ...]:
         """
         Get randomly picked samples of items belonging to the dataset.
@@ -505,6 +527,25 @@ class DatasetRepo(DatasetStorageBasedSessionRepo[Dataset]):
             ),
         )
 
+    def get_streaming_dataset(self, dataset_id: ID) -> Dataset:
+        """
+        Get a dataset by ID whose items are streamed from the database instead of being loaded in memory.
+        The returned dataset is more suitable than the one returned by `get_by_id` for large datasets that are
+        only read, but it is read-only: its items are deserialized anew on every access, so it can neither be
+        modified nor saved.
+
+        :param dataset_id: ID of the dataset to fetch
+        :return: Found dataset, or NullDataset in case of no match
+        """
+        if dataset_id == ID():
+            return self.null_object
+        query = self.preliminary_query_match_filter(access_mode=QueryAccessMode.READ)
+        query["_id"] = IDToMongo.forward(dataset_id)
+        doc: dict | None = self._collection.find_one(query)
+        if doc is None:
+            return self.null_object
+        return DatasetToMongo.backward(doc, dataset_storage_identifier=self.identifier, streaming=True)
+
     def __save(
         self,
         instance: Dataset,
@@ -513,6 +554,9 @@ class DatasetRepo(DatasetStorageBasedSessionRepo[Dataset]):
     ) -> None:
         if not instance.ephemeral and not instance.mutable:
             raise ValueError(f"Cannot save non-mutable dataset with id `{instance.id_}` twice")
+        if instance.read_only:
+            # The items would be fetched anew from the database, discarding any change made to them
+            raise ValueError(f"Cannot save read-only dataset with id `{instance.id_}`")
 
         dataset_item_repo = self.get_dataset_item_repo(instance.id_)
         dataset_items = tuple(instance)
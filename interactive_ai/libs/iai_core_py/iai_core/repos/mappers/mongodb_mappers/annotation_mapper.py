@@ -13,6 +13,7 @@ from iai_core.repos.mappers.mongodb_mapper_interface import (
     IMapperParametricForward,
     IMapperProjectIdentifierBackward,
 )
+from iai_core.utils.feature_flags import FeatureFlagProvider
 
 from .id_mapper import IDToMongo
 from .label_mapper import ScoredLabelToMongo
@@ -21,6 +22,8 @@ from .primitive_mapper import DatetimeToMongo
 from .shape_mapper import ShapeToMongo, ShapeToMongoForwardParameters
 from geti_types import ID, ProjectIdentifier
 
+FEATURE_FLAG_PACKED_POLYGON_POINTS = "FEATURE_FLAG_PACKED_POLYGON_POINTS"
+
 
 class AnnotationSceneToMongo(
     IMapperForward[AnnotationScene, dict],
@@ -33,6 +36,7 @@ class AnnotationSceneToMongo(
         annotation_to_mongo_parameters = AnnotationToMongoForwardParameters(
             media_width=instance.media_width,
             media_height=instance.media_height,
+            pack_polygon_points=FeatureFlagProvider.is_enabled(FEATURE_FLAG_PACKED_POLYGON_POINTS),
         )
         return {
             "_id": IDToMongo.forward(instance.id_),
@@ -93,6 +97,7 @@ class AnnotationToMongoForwardParameters:
 
     media_height: int  # pixel
     media_width: int  # pixel
+    pack_polygon_points: bool = False
 
 
 class AnnotationToMongo(
@@ -108,7 +113,9 @@ class AnnotationToMongo(
     ) -> dict:
         labels = [ScoredLabelToMongo.forward(label) for label in instance.get_labels(include_empty=True)]
         shape_parameters = ShapeToMongoForwardParameters(
-            media_width=parameters.media_width, media_height=parameters.media_height
+            media_width=parameters.media_width,
+            media_height=parameters.media_height,
+            pack_polygon_points=parameters.pack_polygon_points,
         )
         return {
             "_id": IDToMongo.forward(instance.id_),
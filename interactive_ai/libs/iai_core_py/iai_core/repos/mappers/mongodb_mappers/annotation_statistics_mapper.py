@@ -0,0 +1,105 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""This module implements the mappers for the annotation statistics entities"""
+
+from iai_core.entities.annotation_statistics import (
+    LabelAnnotationCounts,
+    LabelAnnotationStatistics,
+    MediaAnnotationStatistics,
+)
+from iai_core.repos.mappers import DatetimeToMongo, IDToMongo, IMapperSimple, MediaIdentifierToMongo
+
+
+class ObjectSizeHistogramToMongo(IMapperSimple[dict[tuple[int, int], int], dict]):
+    """
+    MongoDB mapper for object size histograms. The (width, height) buckets are stored as "<width>_<height>" keys,
+    so that a bucket can be incremented with `$inc`.
+    """
+
+    @staticmethod
+    def forward_key(size: tuple[int, int]) -> str:
+        return f"{size[0]}_{size[1]}"
+
+    @staticmethod
+    def forward(instance: dict[tuple[int, int], int]) -> dict:
+        return {ObjectSizeHistogramToMongo.forward_key(size): count for size, count in instance.items()}
+
+    @staticmethod
+    def backward(instance: dict) -> dict[tuple[int, int], int]:
+        histogram: dict[tuple[int, int], int] = {}
+        for key, count in instance.items():
+            width, height = key.split("_")
+            histogram[(int(width), int(height))] = count
+        return histogram
+
+
+class LabelAnnotationCountsToMongo(IMapperSimple[LabelAnnotationCounts, dict]):
+    """MongoDB mapper for LabelAnnotationCounts"""
+
+    @staticmethod
+    def forward(instance: LabelAnnotationCounts) -> dict:
+        return {
+            "annotation_scene_count": instance.annotation_scene_count,
+            "shape_count": instance.shape_count,
+            "object_size_histogram": ObjectSizeHistogramToMongo.forward(instance.object_size_histogram),
+        }
+
+    @staticmethod
+    def backward(instance: dict) -> LabelAnnotationCounts:
+        return LabelAnnotationCounts(
+            annotation_scene_count=instance.get("annotation_scene_count", 0),
+            shape_count=instance.get("shape_count", 0),
+            object_size_histogram=ObjectSizeHistogramToMongo.backward(instance.get("object_size_histogram", {})),
+        )
+
+
+class MediaAnnotationStatisticsToMongo(IMapperSimple[MediaAnnotationStatistics, dict]):
+    """MongoDB mapper for MediaAnnotationStatistics"""
+
+    @staticmethod
+    def forward(instance: MediaAnnotationStatistics) -> dict:
+        return {
+            "_id": IDToMongo.forward(instance.id_),
+            "media_identifier": MediaIdentifierToMongo.forward(instance.media_identifier),
+            "annotation_scene_id": IDToMongo.forward(instance.annotation_scene_id),
+            "annotation_scene_creation_date": DatetimeToMongo.forward(instance.annotation_scene_creation_date),
+            "counts_per_label": [
+                {"label_id": IDToMongo.forward(label_id), **LabelAnnotationCountsToMongo.forward(counts)}
+                for label_id, counts in instance.counts_per_label.items()
+            ],
+        }
+
+    @staticmethod
+    def backward(instance: dict) -> MediaAnnotationStatistics:
+        return MediaAnnotationStatistics(
+            media_identifier=MediaIdentifierToMongo.backward(instance["media_identifier"]),
+            annotation_scene_id=IDToMongo.backward(instance["annotation_scene_id"]),
+            annotation_scene_creation_date=DatetimeToMongo.backward(instance["annotation_scene_creation_date"]),
+            counts_per_label={
+                IDToMongo.backward(counts["label_id"]): LabelAnnotationCountsToMongo.backward(counts)
+                for counts in instance["counts_per_label"]
+            },
+            ephemeral=False,
+        )
+
+
+class LabelAnnotationStatisticsToMongo(IMapperSimple[LabelAnnotationStatistics, dict]):
+    """MongoDB mapper for LabelAnnotationStatistics"""
+
+    @staticmethod
+    def forward(instance: LabelAnnotationStatistics) -> dict:
+        return {
+            "_id": IDToMongo.forward(instance.id_),
+            "label_id": IDToMongo.forward(instance.label_id),
+            **LabelAnnotationCountsToMongo.forward(instance.counts),
+        }
+
+    @staticmethod
+    def backward(instance: dict) -> LabelAnnotationStatistics:
+        return LabelAnnotationStatistics(
+            id_=IDToMongo.backward(instance["_id"]),
+            label_id=IDToMongo.backward(instance["label_id"]),
+            counts=LabelAnnotationCountsToMongo.backward(instance),
+            ephemeral=False,
+        )
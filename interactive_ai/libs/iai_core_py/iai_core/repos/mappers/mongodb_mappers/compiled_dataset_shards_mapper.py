@@ -17,12 +17,15 @@ class CompiledDatasetShardToMongo(
 
     @staticmethod
     def forward(instance: CompiledDatasetShard) -> dict:
-        return {
+        doc = {
             "filename": instance.filename,
             "binary_filename": instance.binary_filename,
             "size": instance.size,
             "checksum": instance.checksum,
         }
+        if instance.content_key is not None:
+            doc["content_key"] = instance.content_key
+        return doc
 
     @staticmethod
     def backward(instance: dict) -> CompiledDatasetShard:
@@ -31,6 +34,7 @@ class CompiledDatasetShardToMongo(
             binary_filename=instance["binary_filename"],
             size=instance["size"],
             checksum=instance["checksum"],
+            content_key=instance.get("content_key"),
         )
 
 
@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING
 from weakref import WeakValueDictionary
 
 from iai_core.adapters.adapter import ProxyAdapter
-from iai_core.adapters.dataset_adapter import DatasetAdapter
+from iai_core.adapters.dataset_adapter import DatasetAdapter, StreamingDatasetAdapter
 from iai_core.entities.annotation import AnnotationScene
 from iai_core.entities.datasets import Dataset, DatasetIdentifier, DatasetItem, DatasetPurpose
 from iai_core.entities.subset import Subset
@@ -174,7 +174,13 @@ class DatasetToMongo(
         }
 
     @staticmethod
-    def backward(instance: dict, dataset_storage_identifier: DatasetStorageIdentifier) -> Dataset:
+    def backward(
+        instance: dict, dataset_storage_identifier: DatasetStorageIdentifier, streaming: bool = False
+    ) -> Dataset:
+        """
+        :param streaming: if True, the dataset items are streamed from the database instead of being loaded
+            in memory, and the returned dataset is read-only
+        """
         from iai_core.repos.dataset_repo import _DatasetItemRepo
 
         try:
@@ -193,11 +199,14 @@ class DatasetToMongo(
                 dataset_id=id_,
             ),
         )
-        dataset_items_docs = dataset_item_repo.get_all_docs()
-        dataset_adapter = DatasetAdapter(
-            dataset_item_backward_mapper=dataset_item_repo.backward_map,
-            dataset_items_docs=dataset_items_docs,
-        )
+        dataset_adapter: DatasetAdapter | StreamingDatasetAdapter
+        if streaming:
+            dataset_adapter = StreamingDatasetAdapter(dataset_item_repo=dataset_item_repo)
+        else:
+            dataset_adapter = DatasetAdapter(
+                dataset_item_backward_mapper=dataset_item_repo.backward_map,
+                dataset_items_docs=dataset_item_repo.get_all_docs(),
+            )
 
         return Dataset(
             dataset_adapter=dataset_adapter,
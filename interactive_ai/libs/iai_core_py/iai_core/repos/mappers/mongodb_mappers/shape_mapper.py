@@ -8,7 +8,8 @@
 import math
 from dataclasses import dataclass
 
-from shapely.geometry import Polygon as ShapelyPolygon
+import numpy as np
+from bson import Binary
 
 from iai_core.entities.shapes import Ellipse, Keypoint, Point, Polygon, Rectangle, Shape, ShapeType
 from iai_core.entities.shapes import ShapeType as SDK_ShapeType
@@ -31,6 +32,9 @@ class ShapeToMongoForwardParameters:
     # If include coordinates is False, the coordinates of the shape will not be mapped
     # Note that you can not unmap the documents without shape with the shape mapper!
     include_coordinates: bool = True
+    # If pack_polygon_points is True, the vertices of polygons are stored as a single binary field
+    # (see PolygonToMongo) instead of one sub-document per vertex
+    pack_polygon_points: bool = False
 
 
 class ShapeToMongo(
@@ -168,7 +172,17 @@ class PolygonToMongo(
     IMapperParametricForward[Polygon, dict, ShapeToMongoForwardParameters],
     IMapperBackward[Polygon, dict],
 ):
-    """MongoDB mapper for `Polygon` entities"""
+    """
+    MongoDB mapper for `Polygon` entities
+
+    The vertices are stored in one of two formats:
+     - 'points': list of {"x": x, "y": y} documents, one per vertex
+     - 'packed_points': binary field with the little-endian float32 xy pairs of the vertices. In this format, the
+       bounding box of the polygon is also stored in the x1, y1, x2, y2 fields, so that it can be used in queries.
+    The backward mapper supports both formats.
+    """
+
+    PACKED_POINTS_DTYPE = np.dtype("<f4")
 
     @staticmethod
     def forward(
@@ -176,9 +190,8 @@ class PolygonToMongo(
         parameters: ShapeToMongoForwardParameters,
     ) -> dict:
         # TODO: Move area calculation to OTE SDK with implementation of CVS-83153
-        pixel_area = ShapelyPolygon(
-            [(point.x * parameters.media_width, point.y * parameters.media_height) for point in instance.points]
-        ).area
+        pixel_coordinates = instance.coordinates * (parameters.media_width, parameters.media_height)
+        pixel_area = PolygonToMongo._compute_area(pixel_coordinates)
         percentage_area = 0
         if parameters.media_width != 0 and parameters.media_height != 0:
             percentage_area = pixel_area / (parameters.media_width * parameters.media_height)
@@ -190,18 +203,49 @@ class PolygonToMongo(
         }
 
         if parameters.include_coordinates:
-            shape["points"] = [PointToMongo.forward(p) for p in instance.points]
+            if parameters.pack_polygon_points:
+                shape["packed_points"] = Binary(
+                    instance.coordinates.astype(PolygonToMongo.PACKED_POINTS_DTYPE, copy=False).tobytes()
+                )
+                shape["x1"] = instance.min_x
+                shape["y1"] = instance.min_y
+                shape["x2"] = instance.max_x
+                shape["y2"] = instance.max_y
+            else:
+                shape["points"] = [PointToMongo.forward(p) for p in instance.points]
 
         return shape
 
     @staticmethod
     def backward(instance: dict) -> Polygon:
+        modification_date = DatetimeToMongo.backward(instance.get("modification_date"))
+        if "packed_points" in instance:
+            coordinates = np.frombuffer(instance["packed_points"], dtype=PolygonToMongo.PACKED_POINTS_DTYPE)
+            return Polygon.from_coordinates(
+                coordinates=coordinates.reshape(-1, 2),
+                modification_date=modification_date,
+            )
         points = [PointToMongo.backward(p) for p in instance["points"]]
         return Polygon(
             points=points,
-            modification_date=DatetimeToMongo.backward(instance.get("modification_date")),
+            modification_date=modification_date,
         )
 
+    @staticmethod
+    def _compute_area(coordinates: np.ndarray) -> float:
+        """
+        Compute the area of a polygon with the shoelace formula. The coordinates are shifted to the first vertex
+        beforehand to reduce the round-off error, like Shapely does.
+
+        :param coordinates: (N, 2) array with the coordinates of the vertices
+        :return: area of the polygon, 0 for polygons with less than 3 vertices
+        """
+        if len(coordinates) < 3:
+            return 0.0
+        x = coordinates[:, 0] - coordinates[0, 0]
+        y = coordinates[:, 1]
+        return float(abs(np.dot(x, np.roll(y, -1) - np.roll(y, 1))) / 2.0)
+
 
 class KeypointToMongo(
     IMapperParametricForward[Keypoint, dict, ShapeToMongoForwardParameters],
@@ -10,7 +10,7 @@ import logging
 import os
 import shutil
 from pathlib import Path
-from typing import TypeVar
+from typing import BinaryIO, TypeVar
 
 from iai_core.adapters.binary_interpreters import IBinaryInterpreter
 from iai_core.utils.type_helpers import str2bool
@@ -85,6 +85,16 @@ class BinaryRepo:
         """
         return self.storage_client.get_by_filename(filename=filename, binary_interpreter=binary_interpreter)
 
+    def get_stream_by_filename(self, filename: str) -> BinaryIO:
+        """
+        Open a read-only stream over a binary file of the repository. Unlike `get_by_filename`, the file is read
+        lazily and never fully loaded in memory. The caller is responsible for closing the stream.
+
+        :param filename: File name of the binary file
+        :return: Binary stream over the file
+        """
+        return self.storage_client.get_stream_by_filename(filename=filename)
+
     def save(
         self,
         data_source: str | bytes | BytesStream | None,
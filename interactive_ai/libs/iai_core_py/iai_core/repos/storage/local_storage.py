@@ -12,6 +12,7 @@ import shutil
 import tempfile
 from pathlib import Path
 from shutil import copyfile
+from typing import BinaryIO
 
 from iai_core.adapters.binary_interpreters import IBinaryInterpreter
 from iai_core.entities.model_storage import ModelStorageIdentifier
@@ -91,6 +92,18 @@ class LocalStorageClient(StorageClient):
         with open(path, "rb") as file:
             return binary_interpreter.interpret(data=file, filename=filename)
 
+    def get_stream_by_filename(self, filename: str) -> BinaryIO:
+        """
+        Open a read-only stream over a file. The caller is responsible for closing the stream.
+
+        :param filename: Name used to fetch the object, consisting of name + extension.
+        :return: Binary stream over the file
+        """
+        path = self.__get_physical_path(filename)
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"The given resource does not exist. Expected file at path `{path}`")
+        return open(path, "rb")
+
     def get_path_or_presigned_url(self, filename: str, preset_headers: dict | None = None) -> Path:  # noqa: ARG002
         """
         Get the local path where this file is stored.
@@ -9,20 +9,20 @@ repo.
 import io
 import logging
 import os
-import random
-import time
 from collections.abc import Callable
 from datetime import timedelta
 from functools import wraps
+from typing import BinaryIO
 
 import numpy as np
 import urllib3.exceptions
 from minio import Minio
 from minio.deleteobjects import DeleteObject
-from minio.error import InvalidResponseError, S3Error
+from minio.error import S3Error
 
 from iai_core.adapters.binary_interpreters import IBinaryInterpreter
 from iai_core.entities.model_storage import ModelStorageIdentifier
+from iai_core.repos.storage.retry import retry_on_rate_limit
 from iai_core.repos.storage.s3_connector import S3Connector
 from iai_core.repos.storage.storage_client import (
     BinaryObjectType,
@@ -30,54 +30,13 @@ from iai_core.repos.storage.storage_client import (
     BytesStream,
     StorageClient,
 )
+from iai_core.repos.storage.transfer_manager import ObjectTransferManager
 
 from geti_types import ID, DatasetStorageIdentifier
 
 logger = logging.getLogger(__name__)
 
 
-def retry_on_rate_limit(initial_delay: float = 1.0, max_retries: int = 5, max_backoff: float = 20.0) -> Callable:
-    """
-    Decorator to automatically retry a method using exponential back-off strategy.
-    If the decorated method raises an InvalidResponseError with error code 429 or 503, it will be retried up to 5 times.
-    The delay between requests increases exponentially with jitter, similar to AWS SDK implementation:
-    https://docs.aws.amazon.com/sdkref/latest/guide/feature-retry-behavior.html
-    This is useful to avoid breaking the current operation when the rate limit is hit. When the called method fails due
-    to a 429 or 503 error, it is tried again after a short time.
-
-    :param initial_delay: Initial delay in seconds before retrying after a 429 or 503 error
-    :param max_retries: Maximum number of retries
-    :param max_backoff: Maximum backoff time in seconds
-    """
-
-    def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            delay = initial_delay
-            retries = 0
-            while retries < max_retries:
-                try:
-                    return func(*args, **kwargs)
-                except InvalidResponseError as e:
-                    if e._code not in (429, 503):
-                        raise
-
-                    # ruff: noqa: S311
-                    jitter = random.uniform(0, 1)  # nosec
-                    backoff_time = min(jitter * (2**retries) * delay, max_backoff)
-                    time.sleep(backoff_time)
-                    retries += 1
-
-            raise RuntimeError(
-                f"Max retries reached for function {func.__name__} after receiving 429 or 503 response "
-                f"{retries} times in a row."
-            )
-
-        return wrapper
-
-    return decorator
-
-
 def reinit_client_and_retry_on_timeout(func: Callable) -> Callable:
     """
     Retry the method if it fails due to a urllib.TimeoutError, after re-initializing the S3 client.
@@ -251,53 +210,57 @@ class ObjectStorageClient(StorageClient):
             length=data.length(),
         )
 
-    # TODO CVS-133311 apply retry on rate limit after refactoring
+    def _get_transfer_manager(self) -> ObjectTransferManager:
+        """Get a transfer manager moving the files of this repo with the current Minio client"""
+        return ObjectTransferManager(client=self.client, bucket_name=self.bucket_name)
+
+    @retry_on_rate_limit()
     @reinit_client_and_retry_on_timeout
-    def save_group(self, source_directory: str) -> None:
+    def get_stream_by_filename(self, filename: str) -> BinaryIO:
         """
-        Save a group (e.g. images, videos, models) of entities to the S3 storage.
+        Get a read-only stream over an object. The object is fetched lazily, one part at a time with ranged
+        requests, so it is never fully loaded in memory.
 
-        :param source_directory: Source directory for this group of entities
+        :param filename: Name used to fetch the object, consisting of name + extension.
+        :return: Seekable binary stream over the object
         """
-        if not os.path.exists(source_directory):
-            raise NotADirectoryError("Could not find the source directory of binaries to save to S3 storage")
-        self.__upload_local_directory_to_s3(
-            source_directory=source_directory,
-            bucket_name=self.bucket_name,
-            prefix=self.object_name_base,
-        )
+        object_name = os.path.join(self.object_name_base, filename)
+        try:
+            size = self.client.stat_object(bucket_name=self.bucket_name, object_name=object_name).size
+        except S3Error as e:
+            logger.error(f"The given resource does not exist. Expected file to be present at {object_name}: {e}")
+            raise FileNotFoundError(f"The given resource does not exist. Expected file to be present at {object_name}")
+        return self._get_transfer_manager().open_object(object_name=object_name, size=size or 0)
 
-    def __upload_local_directory_to_s3(self, source_directory: str, bucket_name: str, prefix: str) -> None:
+    @reinit_client_and_retry_on_timeout
+    def save_group(self, source_directory: str) -> None:
         """
-        Upload the contents of a source directory to S3. This method recursively uploads any files in nested folders
-        as well.
+        Save a group (e.g. images, videos, models) of entities to the S3 storage. This method recursively uploads any
+        files in nested folders as well. The files are uploaded concurrently, large files in parts.
 
-        :param source_directory: Source directory to be uploaded to S3
-        :param bucket_name: Bucket name of the S3 bucket
-        :param prefix: Prefix for the file to be uploaded, this is the same as the path from the workspace root.
+        :param source_directory: Source directory for this group of entities
         """
-        for file_or_folder in os.listdir(source_directory):
-            file_or_folder_path = os.path.join(source_directory, file_or_folder)
-            file_or_folder_s3_path = os.path.join(prefix, file_or_folder)
-            if os.path.isfile(file_or_folder_path):
-                self.client.fput_object(
-                    bucket_name=bucket_name,
-                    object_name=file_or_folder_s3_path,
-                    file_path=file_or_folder_path,
-                )
-            else:
-                self.__upload_local_directory_to_s3(
-                    source_directory=file_or_folder_path,
-                    bucket_name=bucket_name,
-                    prefix=file_or_folder_s3_path,
-                )
+        if not os.path.exists(source_directory):
+            raise NotADirectoryError("Could not find the source directory of binaries to save to S3 storage")
+        files_to_upload = []
+        for directory, _, filenames in os.walk(source_directory, followlinks=True):
+            relative_directory = os.path.relpath(directory, source_directory)
+            prefix = (
+                self.object_name_base
+                if relative_directory == "."
+                else os.path.join(self.object_name_base, relative_directory)
+            )
+            files_to_upload.extend(
+                (os.path.join(directory, filename), os.path.join(prefix, filename)) for filename in filenames
+            )
+        self._get_transfer_manager().upload_files(files=files_to_upload)
 
-    # TODO CVS-133311 apply retry on rate limit after refactoring
     @reinit_client_and_retry_on_timeout
     def export_group(self, target_directory: str) -> None:
         """
         Export a group (e.g. images, videos, models) of entities from the storage to the specified target directory.
-        This method exports all the objects in this particular binary repo.
+        This method exports all the objects in this particular binary repo. The objects are downloaded concurrently,
+        large objects in parts.
 
         :param target_directory: Target directory to copy the binary entities to
         """
@@ -306,6 +269,7 @@ class ObjectStorageClient(StorageClient):
             objects_to_fetch = self.client.list_objects(
                 bucket_name=self.bucket_name, prefix=self.object_name_base + "/"
             )
+            objects_to_download = []
             for s3_object in objects_to_fetch:
                 # Get the object name from the owner path onward. This usually consists of the filename and the
                 # extension. Remove slashes from the name and use this name as filename for the saved file.
@@ -317,11 +281,8 @@ class ObjectStorageClient(StorageClient):
                     raise OSError(
                         f"Cannot save binaries from S3 object name {s3_object.object_name} to {target_directory}"
                     ) from exception
-                self.client.fget_object(
-                    bucket_name=self.bucket_name,
-                    file_path=target_location,
-                    object_name=s3_object.object_name,
-                )
+                objects_to_download.append((s3_object.object_name, target_location, s3_object.size))
+            self._get_transfer_manager().download_objects(objects=objects_to_download)
 
     @retry_on_rate_limit()
     @reinit_client_and_retry_on_timeout
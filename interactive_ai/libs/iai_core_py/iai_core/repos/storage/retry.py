@@ -0,0 +1,55 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+This module contains the retry policy shared by the clients of the object storage.
+"""
+
+import random
+import time
+from collections.abc import Callable
+from functools import wraps
+
+from minio.error import InvalidResponseError
+
+
+def retry_on_rate_limit(initial_delay: float = 1.0, max_retries: int = 5, max_backoff: float = 20.0) -> Callable:
+    """
+    Decorator to automatically retry a method using exponential back-off strategy.
+    If the decorated method raises an InvalidResponseError with error code 429 or 503, it will be retried up to 5 times.
+    The delay between requests increases exponentially with jitter, similar to AWS SDK implementation:
+    https://docs.aws.amazon.com/sdkref/latest/guide/feature-retry-behavior.html
+    This is useful to avoid breaking the current operation when the rate limit is hit. When the called method fails due
+    to a 429 or 503 error, it is tried again after a short time.
+
+    :param initial_delay: Initial delay in seconds before retrying after a 429 or 503 error
+    :param max_retries: Maximum number of retries
+    :param max_backoff: Maximum backoff time in seconds
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            delay = initial_delay
+            retries = 0
+            while retries < max_retries:
+                try:
+                    return func(*args, **kwargs)
+                except InvalidResponseError as e:
+                    if e._code not in (429, 503):
+                        raise
+
+                    # ruff: noqa: S311
+                    jitter = random.uniform(0, 1)  # nosec
+                    backoff_time = min(jitter * (2**retries) * delay, max_backoff)
+                    time.sleep(backoff_time)
+                    retries += 1
+
+            raise RuntimeError(
+                f"Max retries reached for function {func.__name__} after receiving 429 or 503 response "
+                f"{retries} times in a row."
+            )
+
+        return wrapper
+
+    return decorator
@@ -108,6 +108,13 @@ class StorageClient(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def get_stream_by_filename(self, filename: str) -> BinaryIO:
+        """
+        Open a read-only stream over a file, without loading the file in memory. Implemented by the child class.
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def get_path_or_presigned_url(self, filename: str, preset_headers: dict | None = None) -> Path | str:
         """
@@ -0,0 +1,316 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+This module contains the transfer manager, which moves files between the local file system and the object storage
+"""
+
+import io
+import logging
+import os
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import BinaryIO
+
+from minio import Minio
+from minio.datatypes import Part
+
+from iai_core.repos.storage.retry import retry_on_rate_limit
+
+logger = logging.getLogger(__name__)
+
+# Size of the parts in which large objects are uploaded and downloaded. S3 requires parts of at least 5 MiB.
+TRANSFER_PART_SIZE = int(os.environ.get("OBJECT_STORAGE_TRANSFER_PART_SIZE_MB", "16")) * 1024**2
+# Maximum number of concurrent requests to the object storage. It should not exceed the connection pool size
+# of the Minio client (10 by default), otherwise connections are discarded instead of being reused.
+TRANSFER_MAX_CONCURRENCY = int(os.environ.get("OBJECT_STORAGE_TRANSFER_MAX_CONCURRENCY", "8"))
+MIN_PART_SIZE = 5 * 1024**2
+DOWNLOAD_CHUNK_SIZE = 1024**2
+
+
+@dataclass
+class _PartedTransfer:
+    """A transfer of an object split in parts"""
+
+    object_name: str
+    file_path: str
+    upload_id: str = ""
+    part_futures: list[Future] = field(default_factory=list)
+    completed: bool = False
+
+
+class ObjectTransferManager:
+    """
+    Transfers files between the local file system and a bucket of the object storage with a bounded number of
+    concurrent requests.
+
+    Files up to the part size are transferred in a single request. Larger files are split in parts transferred
+    concurrently: uploads use S3 multipart uploads and downloads use ranged GET requests. Every request is retried
+    independently when the object storage rate limits the requests.
+
+    :param client: Minio client used to send the requests
+    :param bucket_name: Name of the bucket the objects are stored in
+    :param part_size: Size in bytes of the parts of the large objects
+    :param max_concurrency: Maximum number of requests sent concurrently
+    """
+
+    def __init__(
+        self,
+        client: Minio,
+        bucket_name: str,
+        part_size: int = TRANSFER_PART_SIZE,
+        max_concurrency: int = TRANSFER_MAX_CONCURRENCY,
+    ) -> None:
+        if part_size < MIN_PART_SIZE:
+            raise ValueError(f"The part size must be at least {MIN_PART_SIZE} bytes, got {part_size}")
+        self.client = client
+        self.bucket_name = bucket_name
+        self.part_size = part_size
+        self.max_concurrency = max_concurrency
+
+    def _split_in_parts(self, size: int) -> list[tuple[int, int]]:
+        """Get the offset and length of the parts of an object of the given size"""
+        return [(offset, min(self.part_size, size - offset)) for offset in range(0, size, self.part_size)]
+
+    def upload_files(self, files: Sequence[tuple[str, str]]) -> None:
+        """
+        Upload local files to the object storage. If any upload fails, the multipart uploads in progress are aborted
+        and the error is raised once the running requests are completed.
+
+        :param files: Path of each file to upload and name of the object to upload it to
+        """
+        uploads: list[_PartedTransfer] = []
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="Object_storage_upload")
+        try:
+            futures = []
+            for file_path, object_name in files:
+                size = os.path.getsize(file_path)
+                if size <= self.part_size:
+                    futures.append(executor.submit(self._put_file, file_path=file_path, object_name=object_name))
+                    continue
+                upload = _PartedTransfer(
+                    object_name=object_name,
+                    file_path=file_path,
+                    upload_id=self._create_multipart_upload(object_name=object_name),
+                )
+                uploads.append(upload)
+                for part_number, (offset, length) in enumerate(self._split_in_parts(size), start=1):
+                    part_future = executor.submit(
+                        self._upload_part,
+                        upload=upload,
+                        part_number=part_number,
+                        offset=offset,
+                        length=length,
+                    )
+                    upload.part_futures.append(part_future)
+            for future in futures:
+                future.result()
+            for upload in uploads:
+                parts = [
+                    Part(part_number=part_number, etag=part_future.result())
+                    for part_number, part_future in enumerate(upload.part_futures, start=1)
+                ]
+                self._complete_multipart_upload(upload=upload, parts=parts)
+                upload.completed = True
+        except BaseException:
+            executor.shutdown(wait=True, cancel_futures=True)
+            for upload in uploads:
+                if not upload.completed:
+                    self._abort_multipart_upload(upload=upload)
+            raise
+        finally:
+            executor.shutdown(wait=True)
+
+    def download_objects(self, objects: Sequence[tuple[str, str, int | None]]) -> None:
+        """
+        Download objects from the object storage to local files. Large objects are first downloaded to a temporary
+        file next to the target path, which is renamed once all the parts are downloaded.
+
+        :param objects: Name of each object to download, path of the file to download it to and size of the object in
+            bytes. Objects of unknown size (None) are downloaded in a single request.
+        """
+        downloads: list[_PartedTransfer] = []
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="Object_storage_download")
+        try:
+            futures = []
+            for object_name, file_path, size in objects:
+                if size is None or size <= self.part_size:
+                    futures.append(executor.submit(self._get_file, object_name=object_name, file_path=file_path))
+                    continue
+                download = _PartedTransfer(object_name=object_name, file_path=file_path + ".part")
+                downloads.append(download)
+                with open(download.file_path, "wb") as file:
+                    file.truncate(size)
+                for offset, length in self._split_in_parts(size):
+                    part_future = executor.submit(self._download_part, download=download, offset=offset, length=length)
+                    download.part_futures.append(part_future)
+            for future in futures:
+                future.result()
+            for download in downloads:
+                for part_future in download.part_futures:
+                    part_future.result()
+                os.replace(download.file_path, download.file_path.removesuffix(".part"))
+                download.completed = True
+        except BaseException:
+            executor.shutdown(wait=True, cancel_futures=True)
+            for download in downloads:
+                if not download.completed and os.path.exists(download.file_path):
+                    os.remove(download.file_path)
+            raise
+        finally:
+            executor.shutdown(wait=True)
+
+    def open_object(self, object_name: str, size: int) -> BinaryIO:
+        """
+        Open a read-only stream over an object, which fetches the object one part at a time with ranged requests.
+
+        :param object_name: Name of the object to read
+        :param size: Size of the object in bytes
+        :return: Seekable binary stream over the object
+        """
+        reader = ObjectRangeReader(transfer_manager=self, object_name=object_name, size=size)
+        return io.BufferedReader(reader, buffer_size=DOWNLOAD_CHUNK_SIZE)  # type: ignore[return-value]
+
+    @retry_on_rate_limit()
+    def read_range(self, object_name: str, offset: int, length: int) -> bytes:
+        """
+        Read a range of bytes of an object
+
+        :param object_name: Name of the object to read from
+        :param offset: Position of the first byte to read
+        :param length: Number of bytes to read
+        :return: The bytes read, fewer than requested if the range exceeds the end of the object
+        """
+        response = self.client.get_object(
+            bucket_name=self.bucket_name, object_name=object_name, offset=offset, length=length
+        )
+        try:
+            return response.read()
+        finally:
+            response.close()
+            response.release_conn()
+
+    @retry_on_rate_limit()
+    def _put_file(self, file_path: str, object_name: str) -> None:
+        self.client.fput_object(bucket_name=self.bucket_name, object_name=object_name, file_path=file_path)
+
+    @retry_on_rate_limit()
+    def _get_file(self, object_name: str, file_path: str) -> None:
+        self.client.fget_object(bucket_name=self.bucket_name, object_name=object_name, file_path=file_path)
+
+    @retry_on_rate_limit()
+    def _create_multipart_upload(self, object_name: str) -> str:
+        return self.client._create_multipart_upload(
+            bucket_name=self.bucket_name,
+            object_name=object_name,
+            headers={"Content-Type": "application/octet-stream"},
+        )
+
+    @retry_on_rate_limit()
+    def _upload_part(self, upload: _PartedTransfer, part_number: int, offset: int, length: int) -> str:
+        with open(upload.file_path, "rb") as file:
+            file.seek(offset)
+            data = file.read(length)
+        return self.client._upload_part(
+            bucket_name=self.bucket_name,
+            object_name=upload.object_name,
+            data=data,
+            headers=None,
+            upload_id=upload.upload_id,
+            part_number=part_number,
+        )
+
+    @retry_on_rate_limit()
+    def _complete_multipart_upload(self, upload: _PartedTransfer, parts: list[Part]) -> None:
+        self.client._complete_multipart_upload(
+            bucket_name=self.bucket_name,
+            object_name=upload.object_name,
+            upload_id=upload.upload_id,
+            parts=parts,
+        )
+
+    def _abort_multipart_upload(self, upload: _PartedTransfer) -> None:
+        try:
+            self.client._abort_multipart_upload(
+                bucket_name=self.bucket_name, object_name=upload.object_name, upload_id=upload.upload_id
+            )
+        except Exception:
+            logger.exception(f"Failed to abort the multipart upload of {upload.object_name}")
+
+    @retry_on_rate_limit()
+    def _download_part(self, download: _PartedTransfer, offset: int, length: int) -> None:
+        response = self.client.get_object(
+            bucket_name=self.bucket_name, object_name=download.object_name, offset=offset, length=length
+        )
+        try:
+            with open(download.file_path, "r+b") as file:
+                file.seek(offset)
+                for chunk in response.stream(DOWNLOAD_CHUNK_SIZE):
+                    file.write(chunk)
+        finally:
+            response.close()
+            response.release_conn()
+
+
+class ObjectRangeReader(io.RawIOBase):
+    """
+    Read-only file-like object reading an object of the object storage one part at a time with ranged GET requests,
+    so that at most one part of the object is held in memory.
+
+    :param transfer_manager: Transfer manager used to read the parts of the object
+    :param object_name: Name of the object to read
+    :param size: Size of the object in bytes
+    """
+
+    def __init__(self, transfer_manager: ObjectTransferManager, object_name: str, size: int) -> None:
+        super().__init__()
+        self._transfer_manager = transfer_manager
+        self._object_name = object_name
+        self._size = size
+        self._position = 0
+        self._part = b""
+        self._part_offset = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence value: {whence}")
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+        self._position = position
+        return position
+
+    def readinto(self, buffer) -> int:  # noqa: ANN001
+        if self._position >= self._size:
+            return 0
+        part_position = self._position - self._part_offset
+        if not 0 <= part_position < len(self._part):
+            # Fetch the part starting at the current position
+            self._part_offset = self._position
+            self._part = self._transfer_manager.read_range(
+                object_name=self._object_name,
+                offset=self._position,
+                length=min(self._transfer_manager.part_size, self._size - self._position),
+            )
+            part_position = 0
+            if not self._part:
+                return 0
+        n_bytes = min(len(buffer), len(self._part) - part_position)
+        buffer[:n_bytes] = self._part[part_position : part_position + n_bytes]
+        self._position += n_bytes
+        return n_bytes
@@ -0,0 +1,195 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+This module implements the service maintaining the per-label annotation statistics of the dataset storages.
+
+The statistics are computed over the latest user annotation scene of each media. Instead of aggregating all the
+annotation scenes of a dataset storage at every request, the totals per label are updated incrementally when an
+annotation scene is saved or a media is deleted, so that they can be read with one document per label.
+
+The totals of the existing dataset storages are built by a data migration, and those of the imported projects by the
+import job; new dataset storages are empty, so their totals are built on creation. Until the totals of a dataset
+storage are built, the statistics are aggregated from the annotation scenes.
+"""
+
+import logging
+from collections.abc import Sequence
+
+from iai_core.entities.annotation import AnnotationScene, AnnotationSceneKind, NullAnnotationScene
+from iai_core.entities.annotation_statistics import MediaAnnotationStatistics, NullMediaAnnotationStatistics
+from iai_core.repos import AnnotationSceneRepo
+from iai_core.repos.annotation_statistics_repo import LabelAnnotationStatisticsRepo, MediaAnnotationStatisticsRepo
+
+from geti_types import ID, DatasetStorageIdentifier
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of attempts to update the statistics of a media that is concurrently modified
+MAX_UPDATE_ATTEMPTS = 5
+
+
+class AnnotationStatisticsService:
+    @staticmethod
+    def on_new_annotation_scene(dataset_storage_identifier: DatasetStorageIdentifier, annotation_scene_id: ID) -> None:
+        """
+        Update the statistics with a newly saved annotation scene
+
+        :param dataset_storage_identifier: identifier of the dataset storage containing the annotation scene
+        :param annotation_scene_id: ID of the newly saved annotation scene
+        """
+        annotation_scene = AnnotationSceneRepo(dataset_storage_identifier).get_by_id(annotation_scene_id)
+        if isinstance(annotation_scene, NullAnnotationScene):
+            logger.warning(
+                "Annotation scene `%s` not found, it will not be counted in the annotation statistics",
+                annotation_scene_id,
+            )
+            return
+        AnnotationStatisticsService.apply_annotation_scene(
+            dataset_storage_identifier=dataset_storage_identifier, annotation_scene=annotation_scene
+        )
+
+    @staticmethod
+    def apply_annotation_scene(
+        dataset_storage_identifier: DatasetStorageIdentifier, annotation_scene: AnnotationScene
+    ) -> bool:
+        """
+        Replace the contribution of a media to the statistics with the one of a more recent annotation scene.
+
+        The update is idempotent: applying an annotation scene that is already counted, or that is older than the
+        counted one, has no effect.
+
+        :param dataset_storage_identifier: identifier of the dataset storage containing the annotation scene
+        :param annotation_scene: user annotation scene
+        :return: True if the statistics have been updated
+        """
+        if annotation_scene.kind is not AnnotationSceneKind.ANNOTATION:
+            return False
+        media_repo = MediaAnnotationStatisticsRepo(dataset_storage_identifier)
+        label_repo = LabelAnnotationStatisticsRepo(dataset_storage_identifier)
+        new_statistics = MediaAnnotationStatistics.from_annotation_scene(annotation_scene)
+        for _ in range(MAX_UPDATE_ATTEMPTS):
+            old_statistics = media_repo.get_by_id(new_statistics.id_)
+            is_new_media = isinstance(old_statistics, NullMediaAnnotationStatistics)
+            if not is_new_media and (
+                old_statistics.annotation_scene_id == annotation_scene.id_
+                or old_statistics.annotation_scene_creation_date > annotation_scene.creation_date
+            ):
+                return False
+            if media_repo.replace_if_unchanged(
+                media_statistics=new_statistics,
+                previous_annotation_scene_id=None if is_new_media else old_statistics.annotation_scene_id,
+            ):
+                label_repo.increment(
+                    counts_per_label=new_statistics.counts_per_label,
+                    decrement_counts_per_label=old_statistics.counts_per_label,
+                )
+                return True
+        logger.error(
+            "Could not update the annotation statistics of media `%s` after %d attempts; "
+            "the statistics of dataset storage `%s` should be rebuilt",
+            annotation_scene.media_identifier,
+            MAX_UPDATE_ATTEMPTS,
+            dataset_storage_identifier,
+        )
+        return False
+
+    @staticmethod
+    def on_media_deleted(dataset_storage_identifier: DatasetStorageIdentifier, media_id: ID) -> None:
+        """
+        Remove the contribution of a media (and of its frames, for a video) from the statistics
+
+        :param dataset_storage_identifier: identifier of the dataset storage containing the media
+        :param media_id: ID of the deleted media
+        """
+        label_repo = LabelAnnotationStatisticsRepo(dataset_storage_identifier)
+        for media_statistics in MediaAnnotationStatisticsRepo(dataset_storage_identifier).pop_all_by_media_id(media_id):
+            label_repo.increment(counts_per_label={}, decrement_counts_per_label=media_statistics.counts_per_label)
+
+    @staticmethod
+    def on_dataset_storage_created(dataset_storage_identifier: DatasetStorageIdentifier) -> None:
+        """
+        Mark the statistics of a new dataset storage as built. It has no annotation scenes yet, so its statistics are
+        trivially up to date, and they are maintained incrementally from then on.
+
+        :param dataset_storage_identifier: identifier of the newly created dataset storage
+        """
+        LabelAnnotationStatisticsRepo(dataset_storage_identifier).mark_as_built()
+
+    @staticmethod
+    def delete_statistics(dataset_storage_identifier: DatasetStorageIdentifier) -> None:
+        """
+        Delete all the statistics of a dataset storage
+
+        :param dataset_storage_identifier: identifier of the dataset storage
+        """
+        MediaAnnotationStatisticsRepo(dataset_storage_identifier).delete_all()
+        LabelAnnotationStatisticsRepo(dataset_storage_identifier).delete_all()
+
+    @staticmethod
+    def rebuild_statistics(dataset_storage_identifier: DatasetStorageIdentifier, reset: bool = True) -> int:
+        """
+        Rebuild the statistics of a dataset storage from its latest user annotation scenes, e.g. to build the
+        statistics of an imported dataset storage. The duration is proportional to the number of annotation scenes,
+        so it must not be called while serving a request.
+
+        :param dataset_storage_identifier: identifier of the dataset storage
+        :param reset: if True, the existing statistics are deleted first. Otherwise, only the annotation scenes not
+            counted yet are added, which is safe to run concurrently with the incremental updates.
+        :return: number of annotation scenes added to the statistics
+        """
+        logger.info("Rebuilding the annotation statistics of dataset storage `%s`", dataset_storage_identifier)
+        if reset:
+            AnnotationStatisticsService.delete_statistics(dataset_storage_identifier)
+        annotation_scenes = AnnotationSceneRepo(dataset_storage_identifier).get_all_by_kind(
+            kind=AnnotationSceneKind.ANNOTATION
+        )
+        num_applied = sum(
+            AnnotationStatisticsService.apply_annotation_scene(
+                dataset_storage_identifier=dataset_storage_identifier, annotation_scene=annotation_scene
+            )
+            for annotation_scene in annotation_scenes
+        )
+        LabelAnnotationStatisticsRepo(dataset_storage_identifier).mark_as_built()
+        logger.info(
+            "Rebuilt the annotation statistics of dataset storage `%s` from %d annotation scenes",
+            dataset_storage_identifier,
+            num_applied,
+        )
+        return num_applied
+
+    @staticmethod
+    def get_annotation_count_and_object_sizes(
+        dataset_storage_identifier: DatasetStorageIdentifier,
+        label_ids: Sequence[ID],
+        max_object_sizes_per_label: int,
+    ) -> tuple[dict[ID, tuple[tuple[int, int], ...]], dict[ID, int], dict[ID, int]]:
+        """
+        Get the statistics of the latest user annotations for the given labels. If the statistics of the dataset
+        storage have not been built yet, they are aggregated from the annotation scenes instead.
+
+        :param dataset_storage_identifier: identifier of the dataset storage
+        :param label_ids: IDs of the labels to get the statistics for
+        :param max_object_sizes_per_label: limit the object sizes returned per label
+        :return: Returns a tuple containing 3 dictionaries.
+            1. dictionary with label ID as key and annotation object sizes, with format (width, height), as value
+            2. dictionary with annotation scene count per label id
+            3. dictionary with shape count per label id
+        """
+        label_repo = LabelAnnotationStatisticsRepo(dataset_storage_identifier)
+        if not label_repo.is_built():
+            return AnnotationSceneRepo(dataset_storage_identifier).get_annotation_count_and_object_sizes(
+                label_ids=label_ids, max_object_sizes_per_label=max_object_sizes_per_label
+            )
+
+        statistics_per_label = label_repo.get_by_label_ids(label_ids)
+        obj_sizes_per_label = {}
+        count_annotation_scene_level = {}
+        count_shape_level = {}
+        for label_id, label_statistics in statistics_per_label.items():
+            if label_statistics.counts.shape_count <= 0:
+                continue
+            obj_sizes_per_label[label_id] = label_statistics.counts.get_object_sizes(max_object_sizes_per_label)
+            count_annotation_scene_level[label_id] = label_statistics.counts.annotation_scene_count
+            count_shape_level[label_id] = label_statistics.counts.shape_count
+        return obj_sizes_per_label, count_annotation_scene_level, count_shape_level
@@ -37,6 +37,7 @@ from iai_core.repos import (
 from iai_core.repos.dataset_entity_repo import PipelineDatasetRepo
 from iai_core.repos.dataset_storage_filter_repo import DatasetStorageFilterRepo
 from iai_core.repos.training_revision_filter_repo import _TrainingRevisionFilterRepo
+from iai_core.services.annotation_statistics_service import AnnotationStatisticsService
 
 from geti_types import CTX_SESSION_VAR, ID, DatasetStorageIdentifier, MediaIdentifierEntity, ProjectIdentifier
 
@@ -145,6 +146,9 @@ class DeletionHelpers:
 
         AnnotationSceneRepo(dataset_storage.identifier).delete_all_by_media_id(media_id)
         AnnotationSceneStateRepo(dataset_storage.identifier).delete_all_by_media_id(media_id)
+        AnnotationStatisticsService.on_media_deleted(
+            dataset_storage_identifier=dataset_storage.identifier, media_id=media_id
+        )
 
     @staticmethod
     def delete_annotation_entities_by_dataset_storage(dataset_storage: DatasetStorage) -> None:
@@ -154,6 +158,7 @@ class DeletionHelpers:
         Includes:
          - Annotation scenes
          - Annotation scene states
+         - Annotation statistics
 
         :param dataset_storage: Dataset storage containing the annotation scenes
         """
@@ -161,6 +166,7 @@ class DeletionHelpers:
 
         AnnotationSceneRepo(dataset_storage.identifier).delete_all()
         AnnotationSceneStateRepo(dataset_storage.identifier).delete_all()
+        AnnotationStatisticsService.delete_statistics(dataset_storage_identifier=dataset_storage.identifier)
 
     @staticmethod
     def delete_media_score_entities_by_media_id(dataset_storage: DatasetStorage, media_id: ID) -> None:
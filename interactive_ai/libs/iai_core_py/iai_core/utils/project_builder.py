@@ -47,6 +47,7 @@ from iai_core.repos import (
     ProjectRepo,
     TaskNodeRepo,
 )
+from iai_core.services.annotation_statistics_service import AnnotationStatisticsService
 from iai_core.utils.annotation_scene_state_helper import AnnotationSceneStateHelper
 from iai_core.utils.feature_flags import FeatureFlagProvider
 
@@ -1120,6 +1121,7 @@ class PersistedProjectBuilder(ProjectBuilder):
             use_for_training=use_for_training,
         )
         dataset_storage_repo.save(instance=dataset_storage)
+        AnnotationStatisticsService.on_dataset_storage_created(dataset_storage.identifier)
         return dataset_storage
 
     @classmethod
@@ -33,6 +33,7 @@ from iai_core.repos import (
     ProjectRepo,
     TaskNodeRepo,
 )
+from iai_core.services.annotation_statistics_service import AnnotationStatisticsService
 from iai_core.services.model_service import ModelService
 from iai_core.utils.constants import DEFAULT_USER_NAME
 from iai_core.utils.deletion_helpers import DeletionHelpers
@@ -146,6 +147,7 @@ class ProjectFactory:
             _id=DatasetStorageRepo.generate_id(),
         )
         DatasetStorageRepo(project_identifier).save(dataset_storage)
+        AnnotationStatisticsService.on_dataset_storage_created(dataset_storage.identifier)
         keypoint_structure = None
         if FeatureFlagProvider.is_enabled(FEATURE_FLAG_KEYPOINT_DETECTION):
             keypoint_structure = KeypointStructure(
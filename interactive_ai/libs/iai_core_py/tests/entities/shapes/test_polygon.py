@@ -13,6 +13,7 @@
 # and limitations under the License.
 
 
+import numpy as np
 import pytest
 
 from iai_core.entities.shapes import Point, Polygon, Rectangle
@@ -225,3 +226,34 @@ class TestPolygon:
         area2 = polygon2.get_area()
         assert area == 0.0025000000000000022
         assert area != area2
+
+    def test_polygon_from_coordinates(self):
+        """
+        <b>Description:</b>
+        Check that a Polygon created from a coordinates array is equivalent to one created from Point's
+
+        <b>Input data:</b>
+        Array of coordinates
+
+        <b>Expected results:</b>
+        Test passes if both polygons have the same points, bounds and area
+
+        <b>Steps</b>
+        1. Initialize Polygon from coordinates
+        2. Check points, bounds and area against the Polygon created from Point's
+        3. Check invalid coordinates arrays
+        """
+
+        coordinates = np.array([(point.x, point.y) for point in self.points()])
+        polygon = Polygon.from_coordinates(coordinates, modification_date=self.modification_date)
+
+        assert polygon == self.polygon()
+        assert polygon.points == self.points()
+        assert (polygon.min_x, polygon.max_x, polygon.min_y, polygon.max_y) == (0.5, 0.75, 0.0, 0.2)
+        assert polygon.get_area() == self.polygon().get_area()
+        assert not polygon.coordinates.flags.writeable
+
+        with pytest.raises(ValueError):
+            Polygon.from_coordinates(np.empty((0, 2)))
+        with pytest.raises(ValueError):
+            Polygon.from_coordinates(np.array([0.1, 0.2, 0.3]))
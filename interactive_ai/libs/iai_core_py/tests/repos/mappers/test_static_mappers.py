@@ -121,6 +121,7 @@ from iai_core.repos.mappers.mongodb_mappers.model_mapper import TrainingFramewor
 from iai_core.repos.mappers.mongodb_mappers.project_mapper import KeypointStructureToMongo
 from iai_core.repos.mappers.mongodb_mappers.project_performance_mapper import ProjectPerformanceToMongo
 from iai_core.repos.mappers.mongodb_mappers.session_mapper import SessionToMongo
+from iai_core.repos.mappers.mongodb_mappers.shape_mapper import PolygonToMongo, ShapeToMongoForwardParameters
 from iai_core.repos.mappers.mongodb_mappers.training_revision_mapper import TrainingRevisionToMongo
 from iai_core.utils.deletion_helpers import DeletionHelpers
 from iai_core.utils.project_factory import ProjectFactory
@@ -638,6 +639,52 @@ class TestStaticMongoDBMappers:
             project=fxt_empty_project,
         )
 
+    @pytest.mark.parametrize("pack_polygon_points", [False, True])
+    def test_polygon_mapper(self, pack_polygon_points) -> None:
+        # Coordinates exactly representable in float32, so that the packed encoding round-trips losslessly
+        polygon = Polygon(points=[Point(0.25, 0.5), Point(0.75, 0.5), Point(0.5, 0.875)])
+        parameters = ShapeToMongoForwardParameters(
+            media_height=200, media_width=100, pack_polygon_points=pack_polygon_points
+        )
+
+        polygon_doc, _ = verify_mongo_mapper(
+            entity_to_map=polygon,
+            mapper_class=PolygonToMongo,
+            forward_parameters=parameters,
+        )
+
+        assert polygon_doc["area_pixel"] == polygon._as_shapely_polygon().area * 100 * 200
+        if pack_polygon_points:
+            assert "points" not in polygon_doc
+            assert len(polygon_doc["packed_points"]) == 3 * 2 * 4
+            assert (polygon_doc["x1"], polygon_doc["y1"], polygon_doc["x2"], polygon_doc["y2"]) == (
+                0.25,
+                0.5,
+                0.75,
+                0.875,
+            )
+        else:
+            assert "packed_points" not in polygon_doc
+            assert polygon_doc["points"] == [{"x": 0.25, "y": 0.5}, {"x": 0.75, "y": 0.5}, {"x": 0.5, "y": 0.875}]
+
+    def test_polygon_mapper_backward_compatibility(self) -> None:
+        polygon = Polygon(points=[Point(0.1, 0.2), Point(0.3, 0.4), Point(0.5, 0.1)])
+        legacy_doc = PolygonToMongo.forward(
+            polygon, parameters=ShapeToMongoForwardParameters(media_height=10, media_width=10)
+        )
+        packed_doc = PolygonToMongo.forward(
+            polygon,
+            parameters=ShapeToMongoForwardParameters(media_height=10, media_width=10, pack_polygon_points=True),
+        )
+
+        from_legacy_doc = PolygonToMongo.backward(legacy_doc)
+        from_packed_doc = PolygonToMongo.backward(packed_doc)
+
+        assert from_legacy_doc == polygon
+        # The packed encoding stores float32 coordinates
+        np.testing.assert_allclose(from_packed_doc.coordinates, polygon.coordinates, rtol=1e-7)
+        assert from_packed_doc.modification_date == polygon.modification_date
+
     def test_annotation_scene_state_mapper(self, fxt_mongo_id) -> None:
         annotation_scene_state = AnnotationSceneState(
             media_identifier=ImageIdentifier(image_id=ID(fxt_mongo_id(0))),
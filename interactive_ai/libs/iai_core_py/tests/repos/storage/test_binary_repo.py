@@ -23,11 +23,8 @@ from iai_core.repos.storage.binary_repos import (
     ThumbnailBinaryRepo,
     VideoBinaryRepo,
 )
-from iai_core.repos.storage.object_storage import (
-    ObjectStorageClient,
-    reinit_client_and_retry_on_timeout,
-    retry_on_rate_limit,
-)
+from iai_core.repos.storage.object_storage import ObjectStorageClient, reinit_client_and_retry_on_timeout
+from iai_core.repos.storage.retry import retry_on_rate_limit
 from iai_core.repos.storage.s3_connector import S3Connector
 from iai_core.repos.storage.storage_client import BinaryObjectType
 
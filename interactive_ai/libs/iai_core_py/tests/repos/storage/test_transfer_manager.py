@@ -0,0 +1,162 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+import io
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+from minio import InvalidResponseError
+
+from iai_core.repos.storage.transfer_manager import ObjectRangeReader, ObjectTransferManager
+
+PART_SIZE = 8
+
+
+class DummyResponse:
+    def __init__(self, data: bytes) -> None:
+        self._data = io.BytesIO(data)
+
+    def read(self) -> bytes:
+        return self._data.read()
+
+    def stream(self, amt: int):
+        while chunk := self._data.read(amt):
+            yield chunk
+
+    def close(self) -> None:
+        pass
+
+    def release_conn(self) -> None:
+        pass
+
+
+@pytest.fixture
+def fxt_minio_client():
+    """Minio client mock storing the objects in memory"""
+    objects: dict[str, bytes] = {}
+    uploaded_parts: dict[int, bytes] = {}
+    client = MagicMock()
+    client.objects = objects
+
+    def get_object(bucket_name, object_name, offset=0, length=0):
+        data = objects[object_name]
+        return DummyResponse(data[offset : offset + length] if length else data[offset:])
+
+    def upload_part(bucket_name, object_name, data, headers, upload_id, part_number):
+        uploaded_parts[part_number] = data
+        return f"etag_{part_number}"
+
+    def complete_multipart_upload(bucket_name, object_name, upload_id, parts):
+        objects[object_name] = b"".join(uploaded_parts[part.part_number] for part in parts)
+
+    client.get_object.side_effect = get_object
+    client.fput_object.side_effect = lambda bucket_name, object_name, file_path: objects.__setitem__(
+        object_name, open(file_path, "rb").read()
+    )
+    client._create_multipart_upload.return_value = "dummy_upload_id"
+    client._upload_part.side_effect = upload_part
+    client._complete_multipart_upload.side_effect = complete_multipart_upload
+    return client
+
+
+@pytest.fixture
+def fxt_transfer_manager(fxt_minio_client):
+    with patch("iai_core.repos.storage.transfer_manager.MIN_PART_SIZE", 1):
+        yield ObjectTransferManager(
+            client=fxt_minio_client, bucket_name="dummy_bucket", part_size=PART_SIZE, max_concurrency=2
+        )
+
+
+class TestObjectTransferManager:
+    def test_part_size_too_small(self, fxt_minio_client) -> None:
+        with pytest.raises(ValueError):
+            ObjectTransferManager(client=fxt_minio_client, bucket_name="dummy_bucket", part_size=1024)
+
+    def test_upload_files(self, tmp_path, fxt_minio_client, fxt_transfer_manager) -> None:
+        small_data = b"small"
+        large_data = os.urandom(3 * PART_SIZE + 3)
+        (tmp_path / "small").write_bytes(small_data)
+        (tmp_path / "large").write_bytes(large_data)
+
+        fxt_transfer_manager.upload_files(
+            [(str(tmp_path / "small"), "dummy/small"), (str(tmp_path / "large"), "dummy/large")]
+        )
+
+        assert fxt_minio_client.objects == {"dummy/small": small_data, "dummy/large": large_data}
+        fxt_minio_client.fput_object.assert_called_once_with(
+            bucket_name="dummy_bucket", object_name="dummy/small", file_path=str(tmp_path / "small")
+        )
+        fxt_minio_client._create_multipart_upload.assert_called_once()
+        assert fxt_minio_client._upload_part.call_count == 4
+        parts = fxt_minio_client._complete_multipart_upload.call_args.kwargs["parts"]
+        assert [(part.part_number, part.etag) for part in parts] == [(i, f"etag_{i}") for i in range(1, 5)]
+        fxt_minio_client._abort_multipart_upload.assert_not_called()
+
+    def test_upload_files_part_failure(self, tmp_path, fxt_minio_client, fxt_transfer_manager) -> None:
+        (tmp_path / "large").write_bytes(os.urandom(3 * PART_SIZE))
+        fxt_minio_client._upload_part.side_effect = ValueError("dummy error")
+
+        with pytest.raises(ValueError):
+            fxt_transfer_manager.upload_files([(str(tmp_path / "large"), "dummy/large")])
+
+        fxt_minio_client._complete_multipart_upload.assert_not_called()
+        fxt_minio_client._abort_multipart_upload.assert_called_once_with(
+            bucket_name="dummy_bucket", object_name="dummy/large", upload_id="dummy_upload_id"
+        )
+
+    def test_download_objects(self, tmp_path, fxt_minio_client, fxt_transfer_manager) -> None:
+        large_data = os.urandom(3 * PART_SIZE + 3)
+        fxt_minio_client.objects["dummy/large"] = large_data
+        target = tmp_path / "large"
+
+        get_object = fxt_minio_client.get_object.side_effect
+        responses = iter([InvalidResponseError(429, body="dummy", content_type="dummy")])
+
+        def rate_limited_get_object(**kwargs):
+            if (error := next(responses, None)) is not None:
+                raise error
+            return get_object(**kwargs)
+
+        fxt_minio_client.get_object.side_effect = rate_limited_get_object
+        # The first ranged request is rate limited and retried
+        with patch("iai_core.repos.storage.retry.time.sleep"):
+            fxt_transfer_manager.download_objects([("dummy/large", str(target), len(large_data))])
+
+        assert target.read_bytes() == large_data
+        assert not os.path.exists(str(target) + ".part")
+        assert fxt_minio_client.get_object.call_count == 5
+
+    def test_download_objects_unknown_size(self, tmp_path, fxt_minio_client, fxt_transfer_manager) -> None:
+        target = str(tmp_path / "dummy")
+
+        fxt_transfer_manager.download_objects([("dummy/object", target, None)])
+
+        fxt_minio_client.fget_object.assert_called_once_with(
+            bucket_name="dummy_bucket", object_name="dummy/object", file_path=target
+        )
+        fxt_minio_client.get_object.assert_not_called()
+
+    def test_open_object(self, fxt_minio_client, fxt_transfer_manager) -> None:
+        data = os.urandom(3 * PART_SIZE + 3)
+        fxt_minio_client.objects["dummy/object"] = data
+
+        stream = fxt_transfer_manager.open_object(object_name="dummy/object", size=len(data))
+
+        assert stream.read() == data
+        stream.seek(PART_SIZE - 2)
+        assert stream.read(4) == data[PART_SIZE - 2 : PART_SIZE + 2]
+        stream.seek(-3, io.SEEK_END)
+        assert stream.read() == data[-3:]
+
+    def test_object_range_reader(self, fxt_minio_client, fxt_transfer_manager) -> None:
+        data = os.urandom(2 * PART_SIZE)
+        fxt_minio_client.objects["dummy/object"] = data
+        reader = ObjectRangeReader(transfer_manager=fxt_transfer_manager, object_name="dummy/object", size=len(data))
+
+        # Reads are served from the fetched part until the end of the part is reached
+        assert reader.read(3) == data[:3]
+        assert reader.read(PART_SIZE) == data[3:PART_SIZE]
+        assert reader.read(PART_SIZE) == data[PART_SIZE:]
+        assert reader.read(PART_SIZE) == b""
+        assert fxt_minio_client.get_object.call_count == 2
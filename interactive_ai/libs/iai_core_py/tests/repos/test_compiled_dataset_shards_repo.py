@@ -131,3 +131,78 @@ class TestCompiledDatasetShardsRepo:
             label_schema_id=repo.generate_id(),
         )
         compare(loaded_items, [])
+
+    def test_get_shard_files_by_content_keys(self, fxt_empty_project, fxt_dataset_storage, request) -> None:
+        dataset_storage_identifier = DatasetStorageIdentifier(
+            workspace_id=fxt_empty_project.workspace_id,
+            project_id=fxt_empty_project.id_,
+            dataset_storage_id=fxt_dataset_storage.id_,
+        )
+        repo = CompiledDatasetShardsRepo(dataset_storage_identifier)
+        label_schema_id = repo.generate_id()
+        old_shard_file = CompiledDatasetShard(
+            filename="datum-0-of-2.arrow",
+            binary_filename="datum-0-of-2.arrow",
+            size=10,
+            checksum="old_checksum",
+            content_key="key_a",
+        )
+        new_shard_files = [
+            CompiledDatasetShard(
+                filename=f"datum-{i}-of-2.arrow",
+                binary_filename=f"datum-{i}-of-2.arrow",
+                size=20,
+                checksum=f"new_checksum_{i}",
+                content_key=content_key,
+            )
+            for i, content_key in enumerate(["key_a", "key_b"])
+        ]
+        legacy_item = self._create_item(repo.generate_id(), label_schema_id)
+        old_item = CompiledDatasetShards(
+            dataset_id=repo.generate_id(), label_schema_id=label_schema_id, compiled_shard_files=[old_shard_file]
+        )
+        new_item = CompiledDatasetShards(
+            dataset_id=repo.generate_id(), label_schema_id=label_schema_id, compiled_shard_files=new_shard_files
+        )
+        for item in (legacy_item, old_item, new_item):
+            repo.save(item)
+            request.addfinalizer(lambda item_id=item.id_: repo.delete_by_id(item_id))
+
+        shard_files = repo.get_shard_files_by_content_keys(["key_a", "key_b", "key_c"])
+
+        # The most recent shard file is returned for each key
+        compare(shard_files, {"key_a": new_shard_files[0], "key_b": new_shard_files[1]})
+        assert repo.get_shard_files_by_content_keys([]) == {}
+
+    def test_get_content_keys_of_latest(self, fxt_empty_project, fxt_dataset_storage, request) -> None:
+        dataset_storage_identifier = DatasetStorageIdentifier(
+            workspace_id=fxt_empty_project.workspace_id,
+            project_id=fxt_empty_project.id_,
+            dataset_storage_id=fxt_dataset_storage.id_,
+        )
+        repo = CompiledDatasetShardsRepo(dataset_storage_identifier)
+        label_schema_id = repo.generate_id()
+        legacy_item = self._create_item(repo.generate_id(), label_schema_id)
+        items = [
+            CompiledDatasetShards(
+                dataset_id=repo.generate_id(),
+                label_schema_id=label_schema_id,
+                compiled_shard_files=[
+                    CompiledDatasetShard(
+                        filename=f"datum-{i}-of-2.arrow",
+                        binary_filename=f"datum-{i}-of-2.arrow",
+                        size=10,
+                        checksum=f"checksum_{i}",
+                        content_key=content_key,
+                    )
+                    for i, content_key in enumerate(content_keys)
+                ],
+            )
+            for content_keys in (["key_a", "key_b"], ["key_b", "key_c"], ["key_c", "key_d"])
+        ]
+        for item in (legacy_item, *items):
+            repo.save(item)
+            request.addfinalizer(lambda item_id=item.id_: repo.delete_by_id(item_id))
+
+        assert repo.get_content_keys_of_latest(num_compiled_dataset_shards=2) == {"key_b", "key_c", "key_d"}
+        assert repo.get_content_keys_of_latest(num_compiled_dataset_shards=10) == {"key_a", "key_b", "key_c", "key_d"}
@@ -6,6 +6,7 @@ from unittest.mock import call, patch
 import pytest
 
 from iai_core.adapters.adapter import ReferenceAdapter
+from iai_core.adapters.dataset_adapter import StreamingDatasetAdapter
 from iai_core.entities.annotation import Annotation, AnnotationScene, AnnotationSceneKind
 from iai_core.entities.dataset_item import DatasetItem
 from iai_core.entities.dataset_storage import DatasetStorage
@@ -594,6 +595,34 @@ class TestDatasetRepo:
         assert len(loaded_items) == 2
         assert {item.id_ for item in loaded_items} == set(ids_to_get)
 
+    def test_get_streaming_dataset(self, request, fxt_dataset_storage_identifier, fxt_dataset_item) -> None:
+        # Arrange
+        dataset_repo = DatasetRepo(fxt_dataset_storage_identifier)
+        request.addfinalizer(lambda: dataset_repo.delete_all())
+        dataset_items = [fxt_dataset_item(i) for i in range(5)]
+        dataset = Dataset(id=dataset_repo.generate_id(), items=dataset_items)
+        dataset_repo.save_shallow(dataset)
+        expected_ids = [item.id_ for item in dataset_repo.get_by_id(dataset.id_)]
+
+        # Act
+        streaming_dataset = dataset_repo.get_streaming_dataset(dataset.id_)
+        streaming_dataset.dataset_adapter.batch_size = 2  # type: ignore[union-attr]
+
+        # Assert
+        assert isinstance(streaming_dataset.dataset_adapter, StreamingDatasetAdapter)
+        assert len(streaming_dataset) == 5
+        assert [item.id_ for item in streaming_dataset] == expected_ids
+        assert streaming_dataset[3].id_ == expected_ids[3]
+        assert [item.id_ for item in streaming_dataset[-2:]] == expected_ids[-2:]
+        with pytest.raises(IndexError):
+            streaming_dataset[5]
+        assert streaming_dataset.read_only
+        with pytest.raises(ValueError):
+            streaming_dataset.remove_at_indices([1])
+        with pytest.raises(ValueError):
+            dataset_repo.save_deep(streaming_dataset)
+        assert len(dataset_repo.get_by_id(dataset.id_)) == 5
+
     def test_get_items_by_dataset_and_media_identifiers(self, fxt_dataset_storage_identifier, fxt_dataset_item) -> None:
         # Arrange
         dataset_repo = DatasetRepo(fxt_dataset_storage_identifier)
@@ -0,0 +1,134 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from iai_core.entities.annotation import Annotation, AnnotationScene, AnnotationSceneKind
+from iai_core.entities.annotation_statistics import LabelAnnotationCounts, MediaAnnotationStatistics
+from iai_core.entities.shapes import Rectangle
+from iai_core.repos import AnnotationSceneRepo
+from iai_core.repos.annotation_statistics_repo import LabelAnnotationStatisticsRepo, MediaAnnotationStatisticsRepo
+from iai_core.services.annotation_statistics_service import AnnotationStatisticsService
+
+from geti_types import ID, DatasetStorageIdentifier
+
+
+class TestAnnotationStatisticsService:
+    def test_from_annotation_scene(self, fxt_annotation_scene, fxt_scored_label) -> None:
+        # Act
+        media_statistics = MediaAnnotationStatistics.from_annotation_scene(fxt_annotation_scene)
+
+        # Assert
+        assert media_statistics.id_ == fxt_annotation_scene.media_identifier.as_id()
+        assert media_statistics.counts_per_label == {
+            fxt_scored_label.id_: LabelAnnotationCounts(
+                annotation_scene_count=1, shape_count=1, object_size_histogram={(160, 60): 1}
+            )
+        }
+
+    def test_get_object_sizes(self) -> None:
+        # Arrange
+        counts = LabelAnnotationCounts(shape_count=40, object_size_histogram={(10, 10): 30, (20, 20): 10})
+
+        # Act
+        object_sizes = counts.get_object_sizes(max_object_sizes=8)
+
+        # Assert
+        assert object_sizes == ((10, 10),) * 6 + ((20, 20),) * 2
+
+    def test_incremental_statistics(
+        self, request, fxt_empty_project, fxt_dataset_storage, fxt_annotation_scene, fxt_scored_label
+    ) -> None:
+        # Arrange
+        dataset_storage_identifier = DatasetStorageIdentifier(
+            workspace_id=fxt_empty_project.workspace_id,
+            project_id=fxt_empty_project.id_,
+            dataset_storage_id=fxt_dataset_storage.id_,
+        )
+        request.addfinalizer(lambda: AnnotationStatisticsService.delete_statistics(dataset_storage_identifier))
+        newer_annotation_scene = AnnotationScene(
+            kind=AnnotationSceneKind.ANNOTATION,
+            media_identifier=fxt_annotation_scene.media_identifier,
+            media_height=fxt_annotation_scene.media_height,
+            media_width=fxt_annotation_scene.media_width,
+            id_=MediaAnnotationStatisticsRepo.generate_id(),
+            creation_date=fxt_annotation_scene.creation_date + timedelta(seconds=1),
+            annotations=[
+                Annotation(shape=Rectangle(x1=0, y1=0, x2=0.5, y2=0.5), labels=[fxt_scored_label]),
+                Annotation(shape=Rectangle(x1=0, y1=0, x2=0.1, y2=0.1), labels=[fxt_scored_label]),
+            ],
+        )
+        label_repo = LabelAnnotationStatisticsRepo(dataset_storage_identifier)
+
+        def get_counts() -> LabelAnnotationCounts:
+            return label_repo.get_by_label_ids([fxt_scored_label.id_])[fxt_scored_label.id_].counts
+
+        # Act & Assert
+        assert AnnotationStatisticsService.apply_annotation_scene(dataset_storage_identifier, fxt_annotation_scene)
+        assert not AnnotationStatisticsService.apply_annotation_scene(dataset_storage_identifier, fxt_annotation_scene)
+        assert get_counts() == LabelAnnotationCounts(
+            annotation_scene_count=1, shape_count=1, object_size_histogram={(160, 60): 1}
+        )
+
+        assert AnnotationStatisticsService.apply_annotation_scene(dataset_storage_identifier, newer_annotation_scene)
+        assert not AnnotationStatisticsService.apply_annotation_scene(dataset_storage_identifier, fxt_annotation_scene)
+        assert get_counts() == LabelAnnotationCounts(
+            annotation_scene_count=1, shape_count=2, object_size_histogram={(160, 60): 0, (320, 240): 1, (64, 48): 1}
+        )
+
+        AnnotationStatisticsService.on_media_deleted(
+            dataset_storage_identifier, media_id=fxt_annotation_scene.media_identifier.media_id
+        )
+        assert get_counts().shape_count == 0
+        assert get_counts().annotation_scene_count == 0
+
+    def test_get_annotation_count_and_object_sizes_new_dataset_storage(
+        self, request, fxt_empty_project, fxt_dataset_storage, fxt_annotation_scene, fxt_scored_label
+    ) -> None:
+        # Arrange
+        dataset_storage_identifier = DatasetStorageIdentifier(
+            workspace_id=fxt_empty_project.workspace_id,
+            project_id=fxt_empty_project.id_,
+            dataset_storage_id=fxt_dataset_storage.id_,
+        )
+        request.addfinalizer(lambda: AnnotationStatisticsService.delete_statistics(dataset_storage_identifier))
+        label_id = fxt_scored_label.id_
+
+        # Act
+        AnnotationStatisticsService.on_dataset_storage_created(dataset_storage_identifier)
+        AnnotationStatisticsService.apply_annotation_scene(dataset_storage_identifier, fxt_annotation_scene)
+        with patch.object(AnnotationSceneRepo, "get_annotation_count_and_object_sizes") as mock_aggregate:
+            statistics = AnnotationStatisticsService.get_annotation_count_and_object_sizes(
+                dataset_storage_identifier=dataset_storage_identifier,
+                label_ids=[label_id],
+                max_object_sizes_per_label=100,
+            )
+
+        # Assert
+        mock_aggregate.assert_not_called()
+        assert statistics == ({label_id: ((160, 60),)}, {label_id: 1}, {label_id: 1})
+
+    def test_get_annotation_count_and_object_sizes_not_built(self, fxt_dataset_storage_identifier) -> None:
+        # Arrange
+        label_ids = [ID("label_1")]
+        aggregated_statistics = ({label_ids[0]: ((10, 10),)}, {label_ids[0]: 1}, {label_ids[0]: 1})
+
+        # Act
+        with (
+            patch.object(LabelAnnotationStatisticsRepo, "is_built", return_value=False),
+            patch.object(
+                AnnotationSceneRepo, "get_annotation_count_and_object_sizes", return_value=aggregated_statistics
+            ) as mock_aggregate,
+            patch.object(AnnotationStatisticsService, "rebuild_statistics") as mock_rebuild,
+        ):
+            statistics = AnnotationStatisticsService.get_annotation_count_and_object_sizes(
+                dataset_storage_identifier=fxt_dataset_storage_identifier,
+                label_ids=label_ids,
+                max_object_sizes_per_label=100,
+            )
+
+        # Assert
+        assert statistics == aggregated_statistics
+        mock_aggregate.assert_called_once_with(label_ids=label_ids, max_object_sizes_per_label=100)
+        mock_rebuild.assert_not_called()
@@ -8,6 +8,7 @@ from iai_core.entities.project import Project
 from iai_core.entities.task_graph import TaskEdge, TaskGraph
 from iai_core.entities.task_node import TaskNode, TaskProperties, TaskType
 from iai_core.repos import TaskNodeRepo
+from iai_core.repos.annotation_statistics_repo import LabelAnnotationStatisticsRepo
 from iai_core.utils.project_factory import ProjectFactory
 from tests.test_helpers import register_model_template
 
@@ -112,6 +113,8 @@ class TestProjectFactory:
         )
 
         assert project.task_graph == task_graph
+        # The new dataset storage is empty, so its annotation statistics are maintained incrementally
+        assert LabelAnnotationStatisticsRepo(project.get_training_dataset_storage().identifier).is_built()
 
     def test_save_pipeline_to_project(self, sample_project: Project) -> None:
         """
@@ -1,7 +1,9 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 
+from .decoded_media_cache import DecodedMediaCache, DecodedMediaCacheStats
 from .media_utils import (
+    get_decoded_media_cache_stats,
     get_image_bytes,
     get_image_numpy,
     get_media_numpy,
@@ -14,12 +16,15 @@ from .video_file_repair import VideoFileRepair
 from .video_frame_reader import VideoFrameReader
 
 __all__ = [
+    "DecodedMediaCache",
+    "DecodedMediaCacheStats",
     "VideoDecoder",
     "VideoFileRepair",
     "VideoFrameOutOfRangeInternalException",
     "VideoFrameReader",
     "VideoFrameReadingError",
     "VideoInformation",
+    "get_decoded_media_cache_stats",
     "get_image_bytes",
     "get_image_numpy",
     "get_media_numpy",
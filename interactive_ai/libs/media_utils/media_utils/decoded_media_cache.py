@@ -0,0 +1,233 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""Implementation of a node-wide cache for decoded media, shared by all the worker processes on the same node"""
+
+import fcntl
+import hashlib
+import logging
+import mmap
+import os
+import struct
+from collections.abc import Iterator
+from contextlib import contextmanager
+from threading import Lock, get_ident
+from typing import NamedTuple
+
+import numpy as np
+from geti_types import ID, DatasetStorageIdentifier
+
+logger = logging.getLogger(__name__)
+
+# Size of the cache in bytes; a value of 0 disables the cache
+DECODED_MEDIA_CACHE_MAX_SIZE_BYTES = int(os.getenv("DECODED_MEDIA_CACHE_MAX_SIZE_BYTES", "0"))
+# The directory should be on a memory-backed filesystem (tmpfs) that is visible to all the workers of the node
+DECODED_MEDIA_CACHE_DIR = os.getenv("DECODED_MEDIA_CACHE_DIR", "/dev/shm/geti-decoded-media-cache")  # noqa: S108
+# Fraction of the cache size that can be written by a process before it triggers an eviction round
+DECODED_MEDIA_CACHE_EVICTION_FRACTION = float(os.getenv("DECODED_MEDIA_CACHE_EVICTION_FRACTION", "0.05"))
+
+_ENTRY_SUFFIX = ".npy"
+_LOCK_FILENAME = ".lock"
+_STATS_FILENAME = ".stats"
+_STATS_FORMAT = "<QQQ"  # hits, misses, evictions
+_STATS_SIZE = struct.calcsize(_STATS_FORMAT)
+
+
+class DecodedMediaCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size_bytes: int
+
+
+class DecodedMediaCache:
+    """
+    LRU cache for decoded media (images and video frames) bounded by size in bytes.
+
+    Entries are stored as .npy files in a directory on a memory-backed filesystem, so that the cache is shared
+    by all the processes that mount the same directory (e.g. the uvicorn workers of a pod). The modification time
+    of the entries is refreshed on every hit, and the least recently used entries are evicted first when the total
+    size exceeds the limit. The hit, miss and eviction counters are kept in a memory-mapped file, so they are
+    aggregated over all the processes sharing the cache.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = DECODED_MEDIA_CACHE_DIR,
+        max_size_bytes: int = DECODED_MEDIA_CACHE_MAX_SIZE_BYTES,
+    ) -> None:
+        self._cache_dir = cache_dir
+        self._max_size_bytes = max_size_bytes
+        self._eviction_threshold_bytes = max(1, int(max_size_bytes * DECODED_MEDIA_CACHE_EVICTION_FRACTION))
+        self._lock = Lock()
+        self._bytes_since_eviction = 0
+        self._stats_mmap: mmap.mmap | None = None
+        self.enabled = max_size_bytes > 0
+        if self.enabled:
+            try:
+                self._initialize_storage()
+            except OSError:
+                logger.exception(f"Failed to initialize the decoded media cache at `{cache_dir}`; caching is disabled")
+                self.enabled = False
+        logger.info(
+            f"DecodedMediaCache configuration: enabled: {self.enabled}; directory: {cache_dir}; "
+            f"size: {max_size_bytes} bytes"
+        )
+
+    def _initialize_storage(self) -> None:
+        os.makedirs(self._cache_dir, exist_ok=True)
+        stats_path = os.path.join(self._cache_dir, _STATS_FILENAME)
+        with self._file_lock():
+            fd = os.open(stats_path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                if os.fstat(fd).st_size < _STATS_SIZE:
+                    os.ftruncate(fd, _STATS_SIZE)
+                self._stats_mmap = mmap.mmap(fd, _STATS_SIZE)
+            finally:
+                os.close(fd)
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Inter-process lock guarding the counters and the eviction of entries"""
+        with open(os.path.join(self._cache_dir, _LOCK_FILENAME), "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def make_key(dataset_storage_identifier: DatasetStorageIdentifier, media_id: ID, frame_index: int | None) -> str:
+        """
+        Build the cache key of a media
+
+        :param dataset_storage_identifier: Identifier of the dataset storage containing the media
+        :param media_id: ID of the image or video
+        :param frame_index: Index of the video frame, or None for images
+        :return: Key that uniquely identifies the decoded media within the cache
+        """
+        frame_key = str(frame_index) if frame_index is not None else ""
+        return (
+            f"{dataset_storage_identifier.workspace_id}/{dataset_storage_identifier.project_id}/"
+            f"{dataset_storage_identifier.dataset_storage_id}/{media_id}/{frame_key}"
+        )
+
+    def _entry_path(self, key: str) -> str:
+        digest = hashlib.sha1(key.encode(), usedforsecurity=False).hexdigest()
+        return os.path.join(self._cache_dir, digest + _ENTRY_SUFFIX)
+
+    def get_if_exists(self, key: str) -> np.ndarray | None:
+        """
+        Get a decoded media from the cache, if present.
+
+        :param key: Key of the media, see make_key
+        :return: Decoded media as numpy array, or None if not cached
+        """
+        if not self.enabled:
+            return None
+        entry_path = self._entry_path(key)
+        try:
+            media_numpy = np.load(entry_path, allow_pickle=False)
+            os.utime(entry_path)  # refresh the LRU position of the entry
+        except (OSError, ValueError):
+            # The entry is missing, or it was evicted by another process while being read
+            self._increment_stats(misses=1)
+            return None
+        self._increment_stats(hits=1)
+        return media_numpy
+
+    def store(self, key: str, media_numpy: np.ndarray) -> None:
+        """
+        Store a decoded media in the cache.
+
+        :param key: Key of the media, see make_key
+        :param media_numpy: Decoded media to store
+        """
+        if not self.enabled or not isinstance(media_numpy, np.ndarray) or media_numpy.nbytes > self._max_size_bytes:
+            return
+        entry_path = self._entry_path(key)
+        tmp_path = f"{entry_path}.{os.getpid()}-{get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as tmp_file:
+                np.save(tmp_file, media_numpy, allow_pickle=False)
+            # The rename is atomic, so concurrent readers never observe a partially written entry
+            os.replace(tmp_path, entry_path)
+        except OSError as exc:
+            logger.debug(f"Decoded media could not be cached due to exception: {exc}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        with self._lock:
+            self._bytes_since_eviction += media_numpy.nbytes
+            should_evict = self._bytes_since_eviction >= self._eviction_threshold_bytes
+            if should_evict:
+                self._bytes_since_eviction = 0
+        if should_evict:
+            self._evict()
+
+    def _list_entries(self) -> list[os.DirEntry]:
+        with os.scandir(self._cache_dir) as it:
+            return [entry for entry in it if entry.name.endswith(_ENTRY_SUFFIX)]
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries until the cache size is within the limit"""
+        with self._file_lock():
+            entries_with_stat = []
+            for entry in self._list_entries():
+                try:
+                    entries_with_stat.append((entry, entry.stat()))
+                except FileNotFoundError:
+                    continue
+            total_size = sum(stat.st_size for _, stat in entries_with_stat)
+            if total_size <= self._max_size_bytes:
+                return
+            entries_with_stat.sort(key=lambda entry_with_stat: entry_with_stat[1].st_mtime_ns)
+            num_evicted = 0
+            for entry, stat in entries_with_stat:
+                if total_size <= self._max_size_bytes:
+                    break
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    continue
+                total_size -= stat.st_size
+                num_evicted += 1
+            self._increment_stats(evictions=num_evicted, locked=True)
+        logger.debug(f"Evicted {num_evicted} entries from the decoded media cache")
+
+    def _increment_stats(self, hits: int = 0, misses: int = 0, evictions: int = 0, locked: bool = False) -> None:
+        if self._stats_mmap is None:
+            return
+        if not locked:
+            with self._file_lock():
+                self._increment_stats(hits=hits, misses=misses, evictions=evictions, locked=True)
+            return
+        current_hits, current_misses, current_evictions = struct.unpack_from(_STATS_FORMAT, self._stats_mmap)
+        struct.pack_into(
+            _STATS_FORMAT,
+            self._stats_mmap,
+            0,
+            current_hits + hits,
+            current_misses + misses,
+            current_evictions + evictions,
+        )
+
+    def get_stats(self) -> DecodedMediaCacheStats:
+        """
+        Get the hit, miss and eviction counters aggregated over all the processes sharing the cache
+
+        :return: DecodedMediaCacheStats with the counters and the current size of the cache in bytes
+        """
+        if self._stats_mmap is None:
+            return DecodedMediaCacheStats(hits=0, misses=0, evictions=0, size_bytes=0)
+        with self._file_lock():
+            hits, misses, evictions = struct.unpack_from(_STATS_FORMAT, self._stats_mmap)
+        size_bytes = 0
+        for entry in self._list_entries():
+            try:
+                size_bytes += entry.stat().st_size
+            except FileNotFoundError:
+                continue
+        return DecodedMediaCacheStats(hits=hits, misses=misses, evictions=evictions, size_bytes=size_bytes)
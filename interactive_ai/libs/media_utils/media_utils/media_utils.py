@@ -12,10 +12,13 @@ from iai_core.entities.shapes import Rectangle, Shape
 from iai_core.entities.video import Video, VideoFrame
 from iai_core.repos.storage.binary_repos import ImageBinaryRepo, VideoBinaryRepo
 
+from .decoded_media_cache import DecodedMediaCache, DecodedMediaCacheStats
 from .video_frame_reader import VideoFrameReader
 
 logger = logging.getLogger(__name__)
 
+_decoded_media_cache = DecodedMediaCache()
+
 
 def get_media_roi_numpy(
     dataset_storage_identifier: DatasetStorageIdentifier,
@@ -60,31 +63,49 @@ def get_media_numpy(
 
 def get_video_frame_numpy(dataset_storage_identifier: DatasetStorageIdentifier, video_frame: VideoFrame) -> np.ndarray:
     """
-    Returns video frame numpy array
+    Returns video frame numpy array. The decoded frame is looked up in the decoded media cache first.
     :param dataset_storage_identifier: Dataset storage identifier
     :param video_frame: video frame to get numpy array for
     :return np.ndarray: video frame numpy array
     """
+    cache_key = DecodedMediaCache.make_key(
+        dataset_storage_identifier=dataset_storage_identifier,
+        media_id=video_frame.video.id_,
+        frame_index=video_frame.frame_index,
+    )
+    cached_frame = _decoded_media_cache.get_if_exists(cache_key)
+    if cached_frame is not None:
+        return cached_frame
     video_binary_repo = VideoBinaryRepo(dataset_storage_identifier)
-    return VideoFrameReader.get_frame_numpy(
+    frame_numpy = VideoFrameReader.get_frame_numpy(
         file_location_getter=lambda: str(
             video_binary_repo.get_path_or_presigned_url(filename=video_frame.video.data_binary_filename)
         ),
         frame_index=video_frame.frame_index,
     )
+    _decoded_media_cache.store(cache_key, frame_numpy)
+    return frame_numpy
 
 
 def get_image_numpy(dataset_storage_identifier: DatasetStorageIdentifier, image: Image) -> np.ndarray:
     """
-    Returns image numpy array
+    Returns image numpy array. The decoded image is looked up in the decoded media cache first.
     :param dataset_storage_identifier: Dataset storage identifier
     :param image: image to get numpy array for
     :return np.ndarray: image numpy array
     """
+    cache_key = DecodedMediaCache.make_key(
+        dataset_storage_identifier=dataset_storage_identifier, media_id=image.id_, frame_index=None
+    )
+    cached_image = _decoded_media_cache.get_if_exists(cache_key)
+    if cached_image is not None:
+        return cached_image
     image_binary_repo = ImageBinaryRepo(dataset_storage_identifier)
-    return image_binary_repo.get_by_filename(
+    image_numpy = image_binary_repo.get_by_filename(
         filename=image.data_binary_filename, binary_interpreter=NumpyBinaryInterpreter()
     )
+    _decoded_media_cache.store(cache_key, image_numpy)
+    return image_numpy
 
 
 def get_image_bytes(dataset_storage_identifier: DatasetStorageIdentifier, image: Image) -> bytes:
@@ -111,3 +132,12 @@ def get_video_bytes(dataset_storage_identifier: DatasetStorageIdentifier, video:
     return video_binary_repo.get_by_filename(
         filename=video.data_binary_filename, binary_interpreter=RAWBinaryInterpreter()
     )
+
+
+def get_decoded_media_cache_stats() -> DecodedMediaCacheStats:
+    """
+    Returns the hit, miss and eviction counters of the decoded media cache, aggregated over all the processes
+    sharing the cache on this node
+    :return DecodedMediaCacheStats: cache statistics
+    """
+    return _decoded_media_cache.get_stats()
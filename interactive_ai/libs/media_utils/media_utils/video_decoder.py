@@ -8,7 +8,8 @@ import logging
 import os
 import subprocess
 from abc import abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from threading import Lock
 from typing import Generic, NamedTuple, TypeVar
 
@@ -23,11 +24,15 @@ NUM_VIDEO_FRAME_DECODE_RETRIES = int(os.getenv("NUM_VIDEO_FRAME_DECODE_RETRIES",
 VIDEO_FRAME_CACHE_MAX_SIZE_BYTES = int(os.getenv("VIDEO_FRAME_CACHE_MAX_SIZE_BYTES", "100000000"))  # def 100MB
 # Note that the VIDEO_CACHE_TTL should be less than the expiry time for a video presigned URL.
 VIDEO_CACHE_TTL = int(os.getenv("VIDEO_FRAME_CACHE_TTL", "300"))  # def 5 minutes
+# Should be at least the number of threads decoding different videos concurrently (e.g. media prefetching workers),
+# otherwise the readers keep evicting each other and every decode has to reopen and seek the video.
+VIDEO_READER_CACHE_MAX_SIZE = int(os.getenv("VIDEO_READER_CACHE_MAX_SIZE", "4"))
 logger.info(
     "VideoDecoder configuration: "
     "Backend: 'OpenCV'; "
     f"Frame cache size: {VIDEO_FRAME_CACHE_MAX_SIZE_BYTES} bytes; "
-    f"Video cache TTL: {VIDEO_CACHE_TTL}s "
+    f"Video cache TTL: {VIDEO_CACHE_TTL}s; "
+    f"Video reader cache size: {VIDEO_READER_CACHE_MAX_SIZE} "
 )
 
 ReaderT = TypeVar("ReaderT", bound=cv2.VideoCapture)
@@ -90,7 +95,10 @@ class _VideoFrameCache(metaclass=Singleton):
 
 class VideoTTLCache(TTLCache):
     """
-    Custom TTL cache that can release the video capture when an entry is removed from the cache
+    Custom TTL cache that can release the video capture when an entry is removed from the cache.
+
+    The entries are (video capture, lock) tuples; the video capture is released while holding its lock, so that it is
+    never released while another thread is decoding a frame with it.
     """
 
     @staticmethod
@@ -101,7 +109,9 @@ class VideoTTLCache(TTLCache):
             value.release()
 
     def __delitem__(self, key: str) -> None:
-        self.release_video_capture(self[key][0])
+        video_capture, video_capture_lock = self[key]
+        with video_capture_lock:
+            self.release_video_capture(video_capture)
         super().__delitem__(key)
 
 
@@ -110,7 +120,7 @@ class _VideoReaderCache(Generic[ReaderT, ReaderLockT], metaclass=Singleton):
 
     def __init__(self) -> None:
         self._lock = Lock()
-        self._cache: VideoTTLCache = VideoTTLCache(maxsize=2, ttl=VIDEO_CACHE_TTL)
+        self._cache: VideoTTLCache = VideoTTLCache(maxsize=VIDEO_READER_CACHE_MAX_SIZE, ttl=VIDEO_CACHE_TTL)
 
     def get_or_create(
         self, file_location: str, create_fn: Callable[[], tuple[ReaderT, ReaderLockT]]
@@ -204,6 +214,29 @@ class _VideoDecoderOpenCV(_VideoDecoderInterface, metaclass=Singleton):
 
     __video_reader_cache: _VideoReaderCache[cv2.VideoCapture, Lock] = _VideoReaderCache()
 
+    @contextmanager
+    def _locked_video_reader(self, file_location: str) -> Iterator[cv2.VideoCapture]:
+        """
+        Get the cached video reader for the video, and hold its lock while it is in use.
+
+        If the reader is evicted from the cache (and released) by another thread before its lock is acquired, a new
+        reader is created instead.
+
+        :param file_location: Local path or presigned S3 URL pointing to the video
+        :return: Context manager yielding the video reader
+        """
+        for attempt in range(2):
+            video_reader, video_reader_lock = _VideoDecoderOpenCV.__video_reader_cache.get_or_create(
+                file_location=file_location,
+                create_fn=lambda _fl=file_location: (cv2.VideoCapture(_fl, cv2.CAP_FFMPEG), Lock()),  # type: ignore[misc]
+            )
+            with video_reader_lock:
+                # A reader that still fails to open after a retry is returned as is, to surface the error
+                if video_reader.isOpened() or attempt > 0:
+                    yield video_reader
+                    return
+            logger.debug(f"Cached video reader for {file_location} was released, creating a new one")
+
     def get_video_information(self, file_location: str) -> VideoInformation:
         """
         Create a _VideoInformation object with descriptive information about the video
@@ -211,11 +244,7 @@ class _VideoDecoderOpenCV(_VideoDecoderInterface, metaclass=Singleton):
         :param file_location: Local path or presigned S3 URL pointing to the video
         :return: _VideoInformation object containing information about the video
         """
-        video_reader, video_reader_lock = _VideoDecoderOpenCV.__video_reader_cache.get_or_create(
-            file_location=file_location,
-            create_fn=lambda _fl=file_location: (cv2.VideoCapture(_fl, cv2.CAP_FFMPEG), Lock()),  # type: ignore[misc]
-        )
-        with video_reader_lock:
+        with self._locked_video_reader(file_location) as video_reader:
             return VideoInformation(
                 fps=self.get_fps(file_location),
                 width=int(video_reader.get(cv2.CAP_PROP_FRAME_WIDTH)),
@@ -237,11 +266,7 @@ class _VideoDecoderOpenCV(_VideoDecoderInterface, metaclass=Singleton):
             return cached_frame
 
         # Acquire the VideoCapture
-        video_reader, video_reader_lock = _VideoDecoderOpenCV.__video_reader_cache.get_or_create(
-            file_location=file_location,
-            create_fn=lambda _fl=file_location: (cv2.VideoCapture(_fl, cv2.CAP_FFMPEG), Lock()),  # type: ignore[misc]
-        )
-        with video_reader_lock:
+        with self._locked_video_reader(file_location) as video_reader:
             frame_count = int(video_reader.get(cv2.CAP_PROP_FRAME_COUNT))
             if not (0 <= frame_index < frame_count):
                 raise VideoFrameOutOfRangeInternalException(
@@ -0,0 +1,79 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+import os
+
+import numpy as np
+import pytest
+from geti_types import ID, DatasetStorageIdentifier
+
+from media_utils.decoded_media_cache import DecodedMediaCache
+
+
+@pytest.fixture
+def fxt_dataset_storage_identifier():
+    return DatasetStorageIdentifier(
+        workspace_id=ID("workspace"), project_id=ID("project"), dataset_storage_id=ID("dataset_storage")
+    )
+
+
+class TestDecodedMediaCache:
+    def test_make_key(self, fxt_dataset_storage_identifier) -> None:
+        image_key = DecodedMediaCache.make_key(fxt_dataset_storage_identifier, media_id=ID("media"), frame_index=None)
+        frame_key = DecodedMediaCache.make_key(fxt_dataset_storage_identifier, media_id=ID("media"), frame_index=0)
+
+        assert image_key != frame_key
+        assert frame_key == "workspace/project/dataset_storage/media/0"
+
+    def test_disabled_cache(self, tmp_path) -> None:
+        cache = DecodedMediaCache(cache_dir=str(tmp_path), max_size_bytes=0)
+
+        cache.store("key", np.zeros((2, 2), dtype=np.uint8))
+
+        assert cache.get_if_exists("key") is None
+        assert os.listdir(tmp_path) == []
+
+    def test_store_and_get(self, tmp_path) -> None:
+        cache = DecodedMediaCache(cache_dir=str(tmp_path), max_size_bytes=10_000)
+        media_numpy = np.arange(48, dtype=np.uint8).reshape((4, 4, 3))
+
+        miss = cache.get_if_exists("key")
+        cache.store("key", media_numpy)
+        hit = cache.get_if_exists("key")
+
+        assert miss is None
+        np.testing.assert_array_equal(hit, media_numpy)
+        stats = cache.get_stats()
+        assert (stats.hits, stats.misses, stats.evictions) == (1, 1, 0)
+
+    def test_shared_between_instances(self, tmp_path) -> None:
+        # Two instances on the same directory behave like two worker processes on the same node
+        cache_worker_1 = DecodedMediaCache(cache_dir=str(tmp_path), max_size_bytes=10_000)
+        cache_worker_2 = DecodedMediaCache(cache_dir=str(tmp_path), max_size_bytes=10_000)
+        media_numpy = np.ones((4, 4), dtype=np.uint8)
+
+        cache_worker_1.store("key", media_numpy)
+
+        np.testing.assert_array_equal(cache_worker_2.get_if_exists("key"), media_numpy)
+        assert cache_worker_1.get_stats().hits == 1
+
+    def test_lru_eviction_by_bytes(self, tmp_path) -> None:
+        # Each entry takes ~1128 bytes on disk (1000 bytes of data + the .npy header)
+        cache = DecodedMediaCache(cache_dir=str(tmp_path), max_size_bytes=3000)
+        for i in range(3):
+            cache.store(f"key_{i}", np.full((1000,), i, dtype=np.uint8))
+            os.utime(cache._entry_path(f"key_{i}"), ns=(i * 10**9, i * 10**9))
+
+        assert cache.get_if_exists("key_0") is None
+        assert cache.get_if_exists("key_1") is not None
+        assert cache.get_if_exists("key_2") is not None
+        stats = cache.get_stats()
+        assert stats.evictions == 1
+        assert stats.size_bytes <= 3000
+
+    def test_store_ignores_non_array(self, tmp_path) -> None:
+        cache = DecodedMediaCache(cache_dir=str(tmp_path), max_size_bytes=10_000)
+
+        cache.store("key", "not an array")  # type: ignore[arg-type]
+
+        assert cache.get_if_exists("key") is None
@@ -2,6 +2,7 @@
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 
 
+from threading import Lock
 from unittest.mock import MagicMock
 
 import cv2
@@ -10,6 +11,10 @@ import pytest
 from media_utils.video_decoder import VideoTTLCache, _clean_file_location
 
 
+def assert_locked(lock: Lock) -> None:
+    assert lock.locked()
+
+
 @pytest.fixture
 def video_ttl_cache():
     return VideoTTLCache(maxsize=2, ttl=300)
@@ -27,6 +32,9 @@ class TestDecoder:
 
     @pytest.mark.parametrize("mock_release", [MagicMock(spec=cv2.VideoCapture)])
     def test_release_opencv_video_capture_on_removal(self, mock_release, video_ttl_cache):
-        video_ttl_cache["video1"] = (mock_release, None)
+        lock = Lock()
+        mock_release.release.side_effect = lambda: assert_locked(lock)
+        video_ttl_cache["video1"] = (mock_release, lock)
         del video_ttl_cache["video1"]
         mock_release.release.assert_called_once()
+        assert not lock.locked()
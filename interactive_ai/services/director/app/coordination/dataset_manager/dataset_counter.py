@@ -16,7 +16,7 @@ from entities.dataset_item_count import (
     NewDatasetItemCountData,
     NullDatasetItemCount,
 )
-from entities.dataset_item_labels import DatasetItemLabels, NullDatasetItemLabels
+from entities.dataset_item_labels import DatasetItemLabels
 from service.label_schema_service import LabelSchemaService
 from storage.repos import DatasetItemCountRepo, DatasetItemLabelsRepo
 
@@ -274,36 +274,28 @@ class DatasetCounterUseCase:
         deleted_item_ids: list[ID],
     ) -> DeletedDatasetItemCountData:
         """
-        This method returns a DeletedDatasetItemCountDat with the deleted dataset items.
+        This method returns a DeletedDatasetItemCountData with the deleted dataset items.
         Performs the following steps:
-            - Add the deleted items to 'DeletedDatasetItemCountData.count'
-            - Fetch and delete the dataset item labels from the DatasetItemLabels and subtract one from the
-            'n_items_per_label' for each of those labels.
+            - Fetch the labels of all the deleted items from the DatasetItemLabelsRepo with a single query
+            - Add the deleted items with labels to 'DeletedDatasetItemCountData.count' and count their labels in
+            'DeletedDatasetItemCountData.per_label_count'
             - Add the deleted dataset items IDs to the 'DeletedDatasetItemCountData.dataset_items_ids' list
-            - Add the deleted per label dataset item count to the 'DeletedDatasetItemCountData.dataset_items_ids'
-            dictionary
+            - Delete the labels of all the deleted items with a single query
 
         :param dataset_storage_identifier: Identifier of the dataset storage containing the dataset items
         :param deleted_item_ids: List of deleted dataset item IDs
         :return: a DeletedDatasetItemCountData
         """
         dataset_item_labels_repo = DatasetItemLabelsRepo(dataset_storage_identifier)
-        deleted_dataset_items_count = 0
-        deleted_unassigned_dataset_items = []
+        labels_by_item_id = dataset_item_labels_repo.get_by_ids(deleted_item_ids)
         deleted_items_per_label_count: dict[ID, int] = {}
-        for item_id in deleted_item_ids:
-            dataset_item_labels = dataset_item_labels_repo.get_by_id(item_id)
-            if not isinstance(dataset_item_labels, NullDatasetItemLabels):
-                for label in dataset_item_labels.label_ids:
-                    if deleted_items_per_label_count.get(label) is None:
-                        deleted_items_per_label_count[label] = 0
-                    deleted_items_per_label_count[label] += 1
-                deleted_dataset_items_count += 1
-            deleted_unassigned_dataset_items.append(item_id)
-            dataset_item_labels_repo.delete_by_id(item_id)
+        for dataset_item_labels in labels_by_item_id.values():
+            for label_id in dataset_item_labels.label_ids:
+                deleted_items_per_label_count[label_id] = deleted_items_per_label_count.get(label_id, 0) + 1
+        dataset_item_labels_repo.delete_by_ids(deleted_item_ids)
         return DeletedDatasetItemCountData(
-            count=deleted_dataset_items_count,
-            dataset_item_ids=deleted_unassigned_dataset_items,
+            count=len(labels_by_item_id),
+            dataset_item_ids=list(deleted_item_ids),
             per_label_count=deleted_items_per_label_count,
         )
 
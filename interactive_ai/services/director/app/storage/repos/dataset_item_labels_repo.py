@@ -5,7 +5,7 @@
 This module implements the repository for the DatasetItemLabels
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 
 from pymongo.command_cursor import CommandCursor
 from pymongo.cursor import Cursor
@@ -13,9 +13,10 @@ from pymongo.cursor import Cursor
 from entities.dataset_item_labels import DatasetItemLabels, NullDatasetItemLabels
 from storage.mappers import DatasetItemLabelsToMongo
 
-from geti_types import DatasetStorageIdentifier, Session
+from geti_types import ID, DatasetStorageIdentifier, Session
 from iai_core.repos.base.dataset_storage_based_repo import DatasetStorageBasedSessionRepo
-from iai_core.repos.mappers import CursorIterator
+from iai_core.repos.base.session_repo import QueryAccessMode
+from iai_core.repos.mappers import CursorIterator, IDToMongo
 
 
 class DatasetItemLabelsRepo(DatasetStorageBasedSessionRepo[DatasetItemLabels]):
@@ -59,3 +60,32 @@ class DatasetItemLabelsRepo(DatasetStorageBasedSessionRepo[DatasetItemLabels]):
     @property
     def cursor_wrapper(self) -> Callable[[Cursor | CommandCursor], CursorIterator]:
         return lambda mongo_cursor: CursorIterator(cursor=mongo_cursor, mapper=DatasetItemLabelsToMongo, parameter=None)
+
+    def get_by_ids(self, dataset_item_ids: Sequence[ID]) -> dict[ID, DatasetItemLabels]:
+        """
+        Fetch the labels of multiple dataset items with a single query.
+
+        :param dataset_item_ids: IDs of the dataset items
+        :return: Dictionary with the dataset item ID as key and its DatasetItemLabels as value;
+            dataset items without stored labels are missing
+        """
+        if not dataset_item_ids:
+            return {}
+        ids_filter = {"_id": {"$in": [IDToMongo.forward(dataset_item_id) for dataset_item_id in dataset_item_ids]}}
+        return {
+            dataset_item_labels.dataset_item_id: dataset_item_labels
+            for dataset_item_labels in self.get_all(extra_filter=ids_filter)
+        }
+
+    def delete_by_ids(self, dataset_item_ids: Sequence[ID]) -> int:
+        """
+        Delete the labels of multiple dataset items with a single query.
+
+        :param dataset_item_ids: IDs of the dataset items
+        :return: Number of deleted documents
+        """
+        if not dataset_item_ids:
+            return 0
+        query = self.preliminary_query_match_filter(access_mode=QueryAccessMode.WRITE)
+        query["_id"] = {"$in": [IDToMongo.forward(dataset_item_id) for dataset_item_id in dataset_item_ids]}
+        return self._collection.delete_many(query).deleted_count
@@ -723,6 +723,65 @@ class TestDatasetManagement:
         if time.time() - time_before > MAXIMUM_TIME:
             raise TimeoutError(f"Updating the dataset counter took more than {MAXIMUM_TIME}.")
 
+    @flaky(max_runs=5)
+    def test_dataset_counter_deletion_speed(self, request, fxt_test_dataset_manager_data) -> None:
+        """
+        <b>Description:</b>
+        Tests that the dataset counter processes a large number of deleted dataset items quickly, by fetching and
+        deleting their labels in bulk instead of one by one.
+
+        <b>Input data:</b>
+        A project with a classification and object detection task.
+
+        <b>Steps:</b>
+        1. Simulate that the dataset item labels and dataset item count entities have 10000 dataset items stored
+        2. Simulate dataset update for the deletion of all of them
+        3. Check that the time taken is less than the set maximum time
+        4. Check that the counters are back to zero and that the dataset item labels are deleted
+        """
+        # Arrange parameters
+        N_DATASET_ITEMS = 10000
+        MAXIMUM_TIME = 2.0
+
+        project = fxt_test_dataset_manager_data.project
+        detection_node = fxt_test_dataset_manager_data.detection_node
+        label_id = next(label for label in fxt_test_dataset_manager_data.detection_labels if not label.is_empty).id_
+        dataset_storage = project.get_training_dataset_storage()
+        DatasetCounterUseCase.on_project_create(workspace_id=project.workspace_id, project_id=project.id_)
+
+        dataset_item_count_repo = DatasetItemCountRepo(dataset_storage_identifier=dataset_storage.identifier)
+        request.addfinalizer(lambda: dataset_item_count_repo.delete_all())
+        dataset_item_count = dataset_item_count_repo.get_by_id(id_=detection_node.id_)
+        dataset_item_count.n_dataset_items = N_DATASET_ITEMS
+        dataset_item_count.n_items_per_label[label_id] = N_DATASET_ITEMS
+        dataset_item_count_repo.save(dataset_item_count)
+
+        dataset_item_labels_repo = DatasetItemLabelsRepo(dataset_storage.identifier)
+        request.addfinalizer(lambda: dataset_item_labels_repo.delete_all())
+        dataset_item_labels_list = [
+            DatasetItemLabels(dataset_item_id=ID(ObjectId()), label_ids=[label_id]) for _ in range(N_DATASET_ITEMS)
+        ]
+        dataset_item_labels_repo.save_many(dataset_item_labels_list)
+
+        # Test the speed of dataset update for a list of deleted dataset items
+        time_before = time.time()
+        DatasetCounterUseCase.on_dataset_update(
+            workspace_id=project.workspace_id,
+            project_id=project.id_,
+            task_node_id=detection_node.id_,
+            new_dataset_items=[],
+            deleted_dataset_items=[item_labels.dataset_item_id for item_labels in dataset_item_labels_list],
+            assigned_dataset_items=[],
+            dataset_id=ID(ObjectId()),
+        )
+        if time.time() - time_before > MAXIMUM_TIME:
+            raise TimeoutError(f"Deleting items from the dataset counter took more than {MAXIMUM_TIME}.")
+
+        dataset_item_count = dataset_item_count_repo.get_by_id(id_=detection_node.id_)
+        assert dataset_item_count.n_dataset_items == 0
+        assert dataset_item_count.n_items_per_label[label_id] == 0
+        assert dataset_item_labels_repo.count() == 0
+
 
 def to_scored(label: Label) -> ScoredLabel:
     return ScoredLabel(label_id=label.id_, is_empty=label.is_empty, probability=1.0)
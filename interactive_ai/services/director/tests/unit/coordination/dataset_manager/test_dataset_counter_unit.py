@@ -5,7 +5,7 @@ from unittest.mock import patch
 
 from coordination.dataset_manager.dataset_counter import DatasetCounterUseCase
 from entities.dataset_item_count import DeletedDatasetItemCountData, NewDatasetItemCountData, NullDatasetItemCount
-from entities.dataset_item_labels import DatasetItemLabels, NullDatasetItemLabels
+from entities.dataset_item_labels import DatasetItemLabels
 from service.label_schema_service import LabelSchemaService
 from storage.repos import DatasetItemCountRepo, DatasetItemLabelsRepo
 
@@ -300,10 +300,10 @@ class TestDatasetCounterUseCase:
         with (
             patch.object(
                 DatasetItemLabelsRepo,
-                "get_by_id",
-                return_value=dataset_item_labels,
+                "get_by_ids",
+                return_value={deleted_dataset_item.id_: dataset_item_labels},
             ) as mock_get_dataset_item_labels,
-            patch.object(DatasetItemLabelsRepo, "delete_by_id", return_value=None) as mock_delete_dataset_item_labels,
+            patch.object(DatasetItemLabelsRepo, "delete_by_ids", return_value=1) as mock_delete_dataset_item_labels,
         ):
             delete_dataset_item_count_data = DatasetCounterUseCase._process_deleted_items(
                 dataset_storage_identifier=fxt_dataset_storage.identifier,
@@ -311,8 +311,8 @@ class TestDatasetCounterUseCase:
             )
 
         # Assert
-        mock_get_dataset_item_labels.assert_called_once_with(deleted_dataset_item.id_)
-        mock_delete_dataset_item_labels.assert_called_once_with(deleted_dataset_item.id_)
+        mock_get_dataset_item_labels.assert_called_once_with([deleted_dataset_item.id_])
+        mock_delete_dataset_item_labels.assert_called_once_with([deleted_dataset_item.id_])
         assert delete_dataset_item_count_data.count == 1
         assert delete_dataset_item_count_data.dataset_item_ids == [deleted_dataset_item.id_]
         assert sum(delete_dataset_item_count_data.per_label_count.values()) == 1
@@ -334,10 +334,10 @@ class TestDatasetCounterUseCase:
         with (
             patch.object(
                 DatasetItemLabelsRepo,
-                "get_by_id",
-                return_value=NullDatasetItemLabels(),
+                "get_by_ids",
+                return_value={},
             ) as mock_get_dataset_item_labels,
-            patch.object(DatasetItemLabelsRepo, "delete_by_id", return_value=None) as mock_delete_dataset_item_labels,
+            patch.object(DatasetItemLabelsRepo, "delete_by_ids", return_value=0) as mock_delete_dataset_item_labels,
         ):
             delete_dataset_item_count_data = DatasetCounterUseCase._process_deleted_items(
                 dataset_storage_identifier=fxt_dataset_storage.identifier,
@@ -345,8 +345,8 @@ class TestDatasetCounterUseCase:
             )
 
         # Assert
-        mock_get_dataset_item_labels.assert_called_once_with(deleted_dataset_item.id_)
-        mock_delete_dataset_item_labels.assert_called_once_with(deleted_dataset_item.id_)
+        mock_get_dataset_item_labels.assert_called_once_with([deleted_dataset_item.id_])
+        mock_delete_dataset_item_labels.assert_called_once_with([deleted_dataset_item.id_])
         assert delete_dataset_item_count_data.count == 0
         assert delete_dataset_item_count_data.dataset_item_ids == [deleted_dataset_item.id_]
         assert sum(delete_dataset_item_count_data.per_label_count.values()) == 0
@@ -0,0 +1,200 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+Job loops wake-up module
+
+The scheduler and scheduling policy loops poll MongoDB at fixed intervals. This module lets them sleep until a
+relevant job document changes instead: changes are received from a MongoDB change stream on the job collection (shared
+between the processes) or notified in-process by the code writing the job state. Polling is kept as a slow fallback,
+and as the regular mechanism when the change stream is not available (e.g. MongoDB is not a replica set).
+"""
+
+import logging
+import os
+import threading
+from enum import Enum, auto
+from typing import Any
+
+from pymongo.errors import PyMongoError
+
+from model.job_state import JobState
+
+from geti_types import Singleton
+from iai_core.repos.base.mongo_connector import MongoConnector
+from iai_core.utils.type_helpers import str2bool
+
+logger = logging.getLogger(__name__)
+
+JOBS_CHANGE_STREAM_ENABLED = str2bool(os.environ.get("JOBS_CHANGE_STREAM_ENABLED", "true"))
+# Interval of the loops which are woken up by the change stream, used as a fallback for missed notifications
+JOBS_CHANGE_STREAM_FALLBACK_INTERVAL = int(os.environ.get("JOBS_CHANGE_STREAM_FALLBACK_INTERVAL", 30))
+# Delay before reopening the change stream after a failure
+JOBS_CHANGE_STREAM_RETRY_INTERVAL = int(os.environ.get("JOBS_CHANGE_STREAM_RETRY_INTERVAL", 60))
+
+JOB_COLLECTION_NAME = "job"
+
+
+class JobLoop(Enum):
+    """
+    Loops which can be woken up by job changes
+    """
+
+    POLICY = auto()
+    SCHEDULING = auto()
+    CANCELLATION = auto()
+    DELETION = auto()
+
+
+def _get_field(fields: dict[str, Any], path: str) -> Any:
+    """
+    Gets a field from a document or from the updated fields of a change event, where the field can be either nested
+    or stored with its dotted path as key
+
+    :param fields: document or updated fields
+    :param path: dotted path of the field
+    :return: value of the field, None if not found
+    """
+    if path in fields:
+        return fields[path]
+    value: Any = fields
+    for key in path.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+
+def get_loops_to_wake_up(change: dict) -> set[JobLoop]:
+    """
+    Determines which loops have work to do after a job change
+
+    :param change: change event from the job collection change stream
+    :return: set of loops to wake up
+    """
+    if change.get("operationType") == "update":
+        fields = change.get("updateDescription", {}).get("updatedFields", {})
+    else:
+        fields = change.get("fullDocument") or {}
+
+    loops = set()
+    state = _get_field(fields, "state")
+    if state == JobState.SUBMITTED.value:
+        loops.add(JobLoop.POLICY)
+    elif state == JobState.READY_FOR_SCHEDULING.value:
+        loops.add(JobLoop.SCHEDULING)
+    elif state is not None and state >= JobState.FINISHED.value:
+        # A finished job may unblock a submitted duplicate or a job waiting for the organization's quota
+        loops.update((JobLoop.POLICY, JobLoop.DELETION))
+    if _get_field(fields, "cancellation_info.is_cancelled") is True:
+        loops.add(JobLoop.CANCELLATION)
+    if _get_field(fields, "cancellation_info.delete_job") is True or _get_field(fields, "cost.reported") is True:
+        loops.add(JobLoop.DELETION)
+    return loops
+
+
+class JobWakeUp(metaclass=Singleton):
+    """
+    Per-process registry of the wake-up events of the job loops
+    """
+
+    def __init__(self) -> None:
+        self._events = {loop: threading.Event() for loop in JobLoop}
+        self._change_stream_active = False
+
+    @property
+    def change_stream_active(self) -> bool:
+        return self._change_stream_active
+
+    def set_change_stream_active(self, active: bool) -> None:
+        """
+        Sets whether the job changes are received from the change stream. While they are, the loops wake up on the
+        notifications and poll only every JOBS_CHANGE_STREAM_FALLBACK_INTERVAL seconds.
+
+        :param active: True if the change stream is open
+        """
+        if active != self._change_stream_active:
+            logger.info(f"Job change stream {'opened' if active else 'closed'}")
+        self._change_stream_active = active
+
+    def notify(self, *loops: JobLoop) -> None:
+        """
+        Wakes up the given loops
+
+        :param loops: loops to wake up
+        """
+        for loop in loops:
+            self._events[loop].set()
+
+    def wait(self, loop: JobLoop, loop_interval: int) -> bool:
+        """
+        Waits until the loop is notified or its interval has elapsed. The notification is consumed, so notifications
+        received while the loop is running wake it up again immediately.
+
+        :param loop: loop waiting
+        :param loop_interval: polling interval of the loop when the change stream is not active
+        :return: True if the loop has been notified, False if the interval has elapsed
+        """
+        timeout = loop_interval
+        if self._change_stream_active:
+            timeout = max(loop_interval, JOBS_CHANGE_STREAM_FALLBACK_INTERVAL)
+        event = self._events[loop]
+        notified = event.wait(timeout=timeout)
+        event.clear()
+        return notified
+
+
+class JobChangeStreamWatcher(threading.Thread):
+    """
+    Daemon thread watching the job collection change stream and waking up the loops of this process
+
+    :param loops: loops of this process which should be woken up
+    """
+
+    def __init__(self, loops: tuple[JobLoop, ...]) -> None:
+        super().__init__(name="job_change_stream_watcher", daemon=True)
+        self.loops = frozenset(loops)
+        self._stop_event = threading.Event()
+
+    def stop(self) -> None:
+        """
+        Stops watching the change stream
+        """
+        self._stop_event.set()
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self._watch()
+            except PyMongoError as error:
+                JobWakeUp().set_change_stream_active(False)
+                logger.warning(
+                    f"Job change stream is not available, falling back to polling. Retrying in "
+                    f"{JOBS_CHANGE_STREAM_RETRY_INTERVAL} second(s). Error: {error}"
+                )
+                self._stop_event.wait(timeout=JOBS_CHANGE_STREAM_RETRY_INTERVAL)
+            except Exception:
+                JobWakeUp().set_change_stream_active(False)
+                logger.exception("Unexpected error in job change stream watcher")
+                self._stop_event.wait(timeout=JOBS_CHANGE_STREAM_RETRY_INTERVAL)
+        JobWakeUp().set_change_stream_active(False)
+
+    def _watch(self) -> None:
+        pipeline = [
+            {"$match": {"operationType": {"$in": ["insert", "update", "replace"]}}},
+            {"$project": {"operationType": 1, "fullDocument": 1, "updateDescription.updatedFields": 1}},
+        ]
+        collection = MongoConnector.get_collection(JOB_COLLECTION_NAME)
+        with collection.watch(pipeline=pipeline, max_await_time_ms=1000) as stream:
+            wake_up = JobWakeUp()
+            wake_up.set_change_stream_active(True)
+            # Changes made before the stream was (re)opened are not received, catch up on them instead of resuming
+            wake_up.notify(*self.loops)
+            while stream.alive and not self._stop_event.is_set():
+                change = stream.try_next()
+                if change is None:
+                    continue
+                loops = get_loops_to_wake_up(change) & self.loops
+                if loops:
+                    logger.debug(f"Job change received, waking up loops {[loop.name for loop in loops]}")
+                    wake_up.notify(*loops)
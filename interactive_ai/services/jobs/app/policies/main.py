@@ -10,6 +10,7 @@ from concurrent.futures import ThreadPoolExecutor
 
 from opentelemetry import trace
 
+from model.job_wakeup import JOBS_CHANGE_STREAM_ENABLED, JobChangeStreamWatcher, JobLoop, JobWakeUp
 from policies import Prioritizer, ResourceManager
 
 from geti_telemetry_tools import ENABLE_TRACING
@@ -26,6 +27,7 @@ logger.info(f"Running resource manager every {RESOURCE_MANAGER_LOOP_INTERVAL} se
 
 policy_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scheduling_policy_service")
 resource_manager_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="resource_manager")
+job_change_stream_watcher = JobChangeStreamWatcher(loops=(JobLoop.POLICY,))
 
 
 def stop() -> None:
@@ -34,6 +36,7 @@ def stop() -> None:
     """
     logger.info("Shutting down")
 
+    job_change_stream_watcher.stop()
     policy_executor.shutdown(wait=False)
     resource_manager_executor.shutdown(wait=False)
 
@@ -44,16 +47,19 @@ def start() -> None:
     """
     atexit.register(stop)
 
+    if JOBS_CHANGE_STREAM_ENABLED:
+        job_change_stream_watcher.start()
     policy_executor.submit(start_policy_loop)
     resource_manager_executor.submit(start_resource_manager_loop)
 
 
-def start_loop(loop_id: str, loop: Callable, loop_interval: int) -> None:
+def start_loop(loop_id: str, loop: Callable, loop_interval: int, wake_up_loop: JobLoop | None = None) -> None:
     """
     Starts a loop
     :param loop_id: loop identifier
     :param loop: loop implementation
     :param loop_interval: loop interval
+    :param wake_up_loop: if set, the loop is also woken up by the job changes relevant to it
     """
     while True:
         try:
@@ -63,14 +69,17 @@ def start_loop(loop_id: str, loop: Callable, loop_interval: int) -> None:
             else:
                 loop()
         finally:
-            time.sleep(loop_interval)
+            if wake_up_loop is not None:
+                JobWakeUp().wait(loop=wake_up_loop, loop_interval=loop_interval)
+            else:
+                time.sleep(loop_interval)
 
 
 def start_policy_loop() -> None:
     """
     Job scheduling policy loop implementation
     """
-    start_loop("job-scheduling-policy-loop", run_policy_loop, POLICY_LOOP_INTERVAL)
+    start_loop("job-scheduling-policy-loop", run_policy_loop, POLICY_LOOP_INTERVAL, JobLoop.POLICY)
 
 
 def start_resource_manager_loop() -> None:
@@ -97,8 +106,6 @@ def run_policy_loop() -> None:
                 prioritizer.mark_next_jobs_as_ready_for_scheduling_from_submitted_queue()
     except Exception:
         logger.exception("Error occurred in job scheduling policy loop")
-    finally:
-        time.sleep(POLICY_LOOP_INTERVAL)
 
 
 def run_resource_manager_loop() -> None:
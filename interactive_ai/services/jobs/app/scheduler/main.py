@@ -10,6 +10,7 @@ from multiprocessing import Process
 
 from opentelemetry import trace
 
+from model.job_wakeup import JOBS_CHANGE_STREAM_ENABLED, JobChangeStreamWatcher, JobLoop, JobWakeUp
 from scheduler.grpc_api.job_update_service import JobUpdateService
 from scheduler.kafka_handler import ProgressHandler
 from scheduler.loops.cancellation import run_cancellation_loop
@@ -76,6 +77,9 @@ deletion_executor = ThreadPoolExecutor(max_workers=SCHEDULER_DELETION_LOOP_WORKE
 recovery_executor = ThreadPoolExecutor(max_workers=SCHEDULER_RECOVERY_LOOP_WORKERS, thread_name_prefix="jobs_recovery")
 
 grpc_api_server_process = Process(target=JobUpdateService.serve)
+job_change_stream_watcher = JobChangeStreamWatcher(
+    loops=(JobLoop.SCHEDULING, JobLoop.CANCELLATION, JobLoop.DELETION),
+)
 
 
 def stop() -> None:
@@ -92,6 +96,7 @@ def stop() -> None:
     grpc_api_server_process.join()
     grpc_api_server_process.close()
 
+    job_change_stream_watcher.stop()
     scheduling_executor.shutdown(wait=False)
     revert_scheduling_executor.shutdown(wait=False)
     cancellation_executor.shutdown(wait=False)
@@ -110,6 +115,8 @@ def start() -> None:
     atexit.register(stop)
 
     grpc_api_server_process.start()
+    if JOBS_CHANGE_STREAM_ENABLED:
+        job_change_stream_watcher.start()
 
     for _ in range(SCHEDULER_SCHEDULING_LOOP_WORKERS):
         scheduling_executor.submit(start_scheduling_loop)
@@ -125,12 +132,13 @@ def start() -> None:
         recovery_executor.submit(start_recovery_loop)
 
 
-def start_loop(loop_id: str, loop: Callable, loop_interval: int) -> None:
+def start_loop(loop_id: str, loop: Callable, loop_interval: int, wake_up_loop: JobLoop | None = None) -> None:
     """
     Starts a loop
     :param loop_id: loop identifier
     :param loop: loop implementation
     :param loop_interval: loop interval
+    :param wake_up_loop: if set, the loop is also woken up by the job changes relevant to it
     """
     while True:
         try:
@@ -140,14 +148,17 @@ def start_loop(loop_id: str, loop: Callable, loop_interval: int) -> None:
             else:
                 loop()
         finally:
-            time.sleep(loop_interval)
+            if wake_up_loop is not None:
+                JobWakeUp().wait(loop=wake_up_loop, loop_interval=loop_interval)
+            else:
+                time.sleep(loop_interval)
 
 
 def start_scheduling_loop() -> None:
     """
     Scheduling loop implementation
     """
-    start_loop("scheduling-control-loop", run_scheduling_loop, SCHEDULER_SCHEDULING_LOOP_INTERVAL)
+    start_loop("scheduling-control-loop", run_scheduling_loop, SCHEDULER_SCHEDULING_LOOP_INTERVAL, JobLoop.SCHEDULING)
 
 
 def start_revert_scheduling_loop() -> None:
@@ -161,14 +172,16 @@ def start_cancellation_loop() -> None:
     """
     Cancellation loop implementation
     """
-    start_loop("cancellation-control-loop", run_cancellation_loop, SCHEDULER_CANCELLATION_LOOP_INTERVAL)
+    start_loop(
+        "cancellation-control-loop", run_cancellation_loop, SCHEDULER_CANCELLATION_LOOP_INTERVAL, JobLoop.CANCELLATION
+    )
 
 
 def start_deletion_loop() -> None:
     """
     Deletion loop implementation
     """
-    start_loop("deletion-control-loop", run_deletion_loop, SCHEDULER_DELETION_LOOP_INTERVAL)
+    start_loop("deletion-control-loop", run_deletion_loop, SCHEDULER_DELETION_LOOP_INTERVAL, JobLoop.DELETION)
 
 
 def start_recovery_loop() -> None:
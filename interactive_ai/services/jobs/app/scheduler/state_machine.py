@@ -14,6 +14,7 @@ from pymongo import ReturnDocument
 
 from model.job import Job, JobConsumedResource, JobStepDetails
 from model.job_state import JobGpuRequestState, JobState, JobStateGroup, JobTaskState
+from model.job_wakeup import JobLoop, JobWakeUp
 from model.mapper.job_mapper import JobConsumedResourceMapper, JobMapper, JobStepDetailsMapper
 from scheduler.job_repo import SessionBasedSchedulerJobRepo
 
@@ -134,7 +135,7 @@ class StateMachine(metaclass=Singleton):
         """
         job_repo = SessionBasedSchedulerJobRepo()
         with job_repo._mongo_client.start_session():
-            return job_repo.update(
+            updated = job_repo.update(
                 job_id=job_id,
                 update={
                     "$set": {
@@ -144,6 +145,9 @@ class StateMachine(metaclass=Singleton):
                     }
                 },
             )
+        if updated:
+            JobWakeUp().notify(JobLoop.CANCELLATION, JobLoop.DELETION)
+        return updated
 
     #################################################################################
     # Scheduling / Running                                                          #
@@ -422,6 +426,7 @@ class StateMachine(metaclass=Singleton):
             updated = job_repo.update(job_id=job_id, update={"$set": {"cost.reported": True}})
             if updated:
                 logger.info(f"Job's {job_id} cost has been marked as reported")
+                JobWakeUp().notify(JobLoop.DELETION)
             return updated
 
     def set_gpu_state_released(self, job_id: ID) -> bool:
@@ -471,6 +476,7 @@ class StateMachine(metaclass=Singleton):
             updated = job_repo.update(job_id=job_id, update={"$set": update_set})
         if updated:
             logger.info(f"Job {job_id} has been set to finished state")
+            JobWakeUp().notify(JobLoop.DELETION)
             session = CTX_SESSION_VAR.get()
             body = {
                 "workspace_id": str(session.workspace_id),
@@ -692,6 +698,7 @@ class StateMachine(metaclass=Singleton):
             )
         if updated:
             logger.info(f"Job {job_id} has been set to failed state")
+            JobWakeUp().notify(JobLoop.DELETION)
             session = CTX_SESSION_VAR.get()
             body = {
                 "workspace_id": str(session.workspace_id),
@@ -947,6 +954,7 @@ class StateMachine(metaclass=Singleton):
             )
         if updated:
             logger.info(f"Job {job_id} has been set to cancelled state")
+            JobWakeUp().notify(JobLoop.DELETION)
             session = CTX_SESSION_VAR.get()
             body = {
                 "workspace_id": str(session.workspace_id),
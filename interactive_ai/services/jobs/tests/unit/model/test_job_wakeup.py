@@ -0,0 +1,153 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pymongo.errors import OperationFailure
+
+from model.job_state import JobState
+from model.job_wakeup import JobChangeStreamWatcher, JobLoop, JobWakeUp, get_loops_to_wake_up
+
+
+def reset_singletons() -> None:
+    JobWakeUp._instance = None  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize(
+    "change, expected_loops",
+    [
+        (
+            {"operationType": "insert", "fullDocument": {"state": JobState.SUBMITTED.value}},
+            {JobLoop.POLICY},
+        ),
+        (
+            {"operationType": "update", "updateDescription": {"updatedFields": {"state": 1}}},
+            {JobLoop.SCHEDULING},
+        ),
+        (
+            {"operationType": "update", "updateDescription": {"updatedFields": {"state": JobState.FAILED.value}}},
+            {JobLoop.POLICY, JobLoop.DELETION},
+        ),
+        (
+            {
+                "operationType": "update",
+                "updateDescription": {
+                    "updatedFields": {"cancellation_info.is_cancelled": True, "cancellation_info.request_time": 0}
+                },
+            },
+            {JobLoop.CANCELLATION},
+        ),
+        (
+            {
+                "operationType": "replace",
+                "fullDocument": {
+                    "state": JobState.RUNNING.value,
+                    "cancellation_info": {"is_cancelled": True, "delete_job": True},
+                },
+            },
+            {JobLoop.CANCELLATION, JobLoop.DELETION},
+        ),
+        (
+            {"operationType": "update", "updateDescription": {"updatedFields": {"step_details.0.progress": 50}}},
+            set(),
+        ),
+    ],
+    ids=["submitted", "ready for scheduling", "failed", "cancelled", "cancelled and deleted", "progress"],
+)
+def test_get_loops_to_wake_up(change, expected_loops) -> None:
+    assert get_loops_to_wake_up(change) == expected_loops
+
+
+def test_wait_notified(request) -> None:
+    request.addfinalizer(reset_singletons)
+
+    # Arrange
+    wake_up = JobWakeUp()
+    wake_up.set_change_stream_active(True)
+    notifier = threading.Timer(0.05, wake_up.notify, args=(JobLoop.SCHEDULING,))
+
+    # Act
+    notifier.start()
+    notified = wake_up.wait(loop=JobLoop.SCHEDULING, loop_interval=10)
+    notified_again = wake_up.wait(loop=JobLoop.SCHEDULING, loop_interval=0)
+
+    # Assert
+    assert notified
+    assert not notified_again
+
+
+def test_wait_polling(request) -> None:
+    request.addfinalizer(reset_singletons)
+
+    # Arrange
+    wake_up = JobWakeUp()
+    wake_up.notify(JobLoop.DELETION)
+
+    # Act
+    notified = wake_up.wait(loop=JobLoop.SCHEDULING, loop_interval=0)
+
+    # Assert
+    assert not notified
+    assert wake_up.wait(loop=JobLoop.DELETION, loop_interval=0)
+
+
+def test_change_stream_watcher(request) -> None:
+    request.addfinalizer(reset_singletons)
+
+    # Arrange
+    watcher = JobChangeStreamWatcher(loops=(JobLoop.SCHEDULING, JobLoop.CANCELLATION))
+    changes = [
+        None,
+        {"operationType": "insert", "fullDocument": {"state": JobState.SUBMITTED.value}},
+        {"operationType": "update", "updateDescription": {"updatedFields": {"state": 1}}},
+    ]
+
+    def try_next():
+        if not changes:
+            watcher.stop()
+            return None
+        return changes.pop(0)
+
+    stream = MagicMock()
+    stream.__enter__.return_value = stream
+    stream.alive = True
+    stream.try_next.side_effect = try_next
+    collection = MagicMock()
+    collection.watch.return_value = stream
+
+    # Act
+    with (
+        patch("model.job_wakeup.MongoConnector.get_collection", return_value=collection),
+        patch.object(JobWakeUp, "notify") as mock_notify,
+    ):
+        watcher.run()
+
+    # Assert
+    assert mock_notify.call_count == 2
+    assert set(mock_notify.call_args_list[0].args) == {JobLoop.SCHEDULING, JobLoop.CANCELLATION}
+    assert mock_notify.call_args_list[1].args == (JobLoop.SCHEDULING,)
+    assert not JobWakeUp().change_stream_active
+
+
+def test_change_stream_watcher_not_available(request) -> None:
+    request.addfinalizer(reset_singletons)
+
+    # Arrange
+    watcher = JobChangeStreamWatcher(loops=(JobLoop.POLICY,))
+    collection = MagicMock()
+
+    def watch(*args, **kwargs):
+        watcher.stop()
+        raise OperationFailure("The $changeStream stage is only supported on replica sets", code=40573)
+
+    collection.watch.side_effect = watch
+
+    # Act
+    with patch("model.job_wakeup.MongoConnector.get_collection", return_value=collection):
+        watcher.run()
+
+    # Assert
+    collection.watch.assert_called_once()
+    assert not JobWakeUp().change_stream_active
@@ -0,0 +1,391 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""
+Append-only store of the live metrics of a run.
+
+The metrics are stored in the `live_metrics` directory of the run:
+
+- `segments/segment-<id>-<suffix>.arrow`: Arrow IPC files holding the recently logged metrics
+- `compacted/metrics-<id>-<suffix>.arrow`: Arrow IPC file in which the segments are periodically compacted
+- `index.json`: location of the rows of each metric key in the files above, and latest value of each key
+- `metrics.arrow`: live metrics file read by the jobs, copied from the compacted file once the run is completed
+
+Each logged batch of metrics is written to a new segment of level 0. Whenever the most recent segments are
+LIVE_METRICS_SEGMENT_FANOUT segments of the same level, they are merged into a segment of the next level, and all
+the segments are compacted into a new compacted file once they hold as many metrics as the current one. Every metric
+is thus rewritten a logarithmic number of times, and a run has a logarithmic number of segments.
+
+In every file, the rows of a metric key are stored in a single record batch, in the order they were logged.
+A history query therefore only downloads the record batches of the requested key, and can skip the record batches
+which are entirely before the requested offset. The compacted file keeps the format of the live metrics file.
+
+Files are never modified once written, and every file has a new name: the files referred to by an index hold
+the same data for as long as they exist. The files which are no longer referred to by the index are deleted once
+the index is saved, so a server worker reading the metrics while they are being logged may not find the files
+referred to by the index it loaded. It then loads the index again and retries, up to LIVE_METRICS_READ_ATTEMPTS times.
+
+The metrics of a run are expected to be logged sequentially, by the training job. Concurrent appends to the same run
+are not synchronized: the last one to save the index wins, and the batch logged by the other one is lost. The file
+names have a random suffix, so that a lost batch never overwrites the files referred to by the saved index.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pyarrow as pa
+import pyarrow.compute as pc
+from minio.error import S3Error
+from mlflow.entities import Metric
+from pydantic import BaseModel, ConfigDict
+
+from mlflow_geti_store.s3_object_storage_client import S3ObjectStorageClient
+from mlflow_geti_store.utils import PYARROW_SCHEMA, TimeStampMapper
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+logger = logging.getLogger("mlflow")
+
+LIVE_METRICS_DIR = Path("live_metrics")
+INDEX_PATH = LIVE_METRICS_DIR / "index.json"
+SEGMENTS_DIR = LIVE_METRICS_DIR / "segments"
+COMPACTED_DIR = LIVE_METRICS_DIR / "compacted"
+LIVE_METRICS_PATH = LIVE_METRICS_DIR / "metrics.arrow"
+
+# Number of segments of the same level merged into a segment of the next level
+LIVE_METRICS_SEGMENT_FANOUT = int(os.environ.get("LIVE_METRICS_SEGMENT_FANOUT", "8"))
+# Number of times the history of a metric is read, if the files are merged by a concurrent write while being read
+LIVE_METRICS_READ_ATTEMPTS = int(os.environ.get("LIVE_METRICS_READ_ATTEMPTS", "3"))
+
+
+class KeyRange(BaseModel):
+    """Record batch holding the rows of a metric key in a file"""
+
+    batch: int
+    count: int
+
+
+class SegmentIndex(BaseModel):
+    name: str
+    level: int = 0
+    keys: dict[str, KeyRange]
+
+
+class LatestMetric(BaseModel):
+    # Metrics can be NaN or infinite, e.g. a diverging loss
+    model_config = ConfigDict(ser_json_inf_nan="constants")
+
+    value: float
+    timestamp: int
+    step: int
+
+
+class LiveMetricsIndex(BaseModel):
+    next_segment_id: int = 0
+    compacted_name: str | None = None
+    compacted: dict[str, KeyRange] = {}
+    segments: list[SegmentIndex] = []
+    latest: dict[str, LatestMetric] = {}
+
+
+def _write_grouped_by_key(table: pa.Table, sink: pa.NativeFile | pa.BufferOutputStream) -> dict[str, KeyRange]:
+    """
+    Write the table as an Arrow IPC file with one record batch per metric key.
+
+    :param table: Metrics to write
+    :param sink: Stream to write the file to
+    :return: Record batch of each metric key
+    """
+    # The sort is stable, the rows of a key keep the order they were logged in
+    table = table.take(pc.sort_indices(table, sort_keys=[("key", "ascending")]))
+    key_ranges = {}
+    with pa.ipc.new_file(sink, schema=PYARROW_SCHEMA, options=pa.ipc.IpcWriteOptions(use_threads=False)) as writer:
+        offset = 0
+        for batch_idx, item in enumerate(pc.value_counts(table["key"]).to_pylist()):
+            key, count = item["values"], item["counts"]
+            writer.write_batch(table.slice(offset=offset, length=count).combine_chunks().to_batches()[0])
+            key_ranges[key] = KeyRange(batch=batch_idx, count=count)
+            offset += count
+    return key_ranges
+
+
+def _latest_metrics(table: pa.Table) -> dict[str, LatestMetric]:
+    # The later rows of a key replace the earlier ones
+    latest = dict(
+        zip(
+            table["key"].to_pylist(),
+            zip(
+                table["value"].to_pylist(),
+                table["timestamp"].cast(pa.int64()).to_pylist(),
+                table["step"].to_pylist(),
+            ),
+        )
+    )
+    return {
+        key: LatestMetric(value=value, timestamp=timestamp, step=step)
+        for key, (value, timestamp, step) in latest.items()
+    }
+
+
+def _to_metrics(data: pa.Table | pa.RecordBatch) -> list[Metric]:
+    return [
+        Metric(
+            key=item["key"],
+            value=item["value"],
+            timestamp=TimeStampMapper.forward(item["timestamp"]),
+            step=item["step"],
+        )
+        for item in data.to_pylist()
+    ]
+
+
+class LiveMetricsLog:
+    """
+    Append-only, segmented store of the live metrics of a run.
+
+    Logging a batch of metrics writes a new segment and updates the index, the metrics logged before are only read
+    when segments are merged. Runs logged before the index was introduced only have the live metrics file, which is
+    indexed on the first write and read in full until then.
+
+    :param client: Object storage client of the run
+    """
+
+    def __init__(self, client: S3ObjectStorageClient) -> None:
+        self.client = client
+
+    def append(self, metrics: list[Metric]) -> None:
+        """Store a batch of metrics in a new segment, merging the segments if needed."""
+        index = self._load_index()
+        if index is None:
+            index = self._index_compacted_file()
+
+        table = pa.Table.from_pylist(
+            [
+                {
+                    "key": metric.key,
+                    "value": metric.value,
+                    "step": metric.step,
+                    "timestamp": metric.timestamp,
+                }
+                for metric in metrics
+            ],
+            schema=PYARROW_SCHEMA,
+        )
+        index.segments.append(self._write_segment(index=index, table=table, level=0))
+        index.latest.update(_latest_metrics(table))
+
+        superseded: list[Path] = []
+        segment_rows = sum(key_range.count for segment in index.segments for key_range in segment.keys.values())
+        compacted_rows = sum(key_range.count for key_range in index.compacted.values())
+        if segment_rows >= compacted_rows:
+            superseded = self._write_compacted_file(index)
+        else:
+            fanout = LIVE_METRICS_SEGMENT_FANOUT
+            while len(index.segments) >= fanout and len({segment.level for segment in index.segments[-fanout:]}) == 1:
+                to_merge = index.segments[-fanout:]
+                tables = [self._read_table(path=SEGMENTS_DIR / segment.name) for segment in to_merge]
+                merged = self._write_segment(index=index, table=pa.concat_tables(tables), level=to_merge[0].level + 1)
+                index.segments[-fanout:] = [merged]
+                superseded += [SEGMENTS_DIR / segment.name for segment in to_merge]
+        self._save_index(index)
+        self._delete_files(superseded)
+
+    def compact(self) -> None:
+        """
+        Merge all the segments in a new compacted file, and copy it to the live metrics file read by the job.
+        Called once the run is completed, when no more metrics are logged.
+        """
+        index = self._load_index()
+        if index is None:
+            # Only the live metrics file may exist, which already holds all the metrics
+            return
+        superseded = self._write_compacted_file(index) if index.segments else []
+        if index.compacted_name is not None:
+            self.client.copy_file(
+                source_relative_path=COMPACTED_DIR / index.compacted_name,
+                destination_relative_path=LIVE_METRICS_PATH,
+            )
+        self._save_index(index)
+        self._delete_files(superseded)
+
+    def latest(self) -> list[Metric]:
+        """Get the latest logged metric of each key."""
+        index = self._load_index()
+        if index is None:
+            table = self._read_live_metrics_table()
+            if table is None:
+                return []
+            latest = _latest_metrics(table)
+        else:
+            latest = index.latest
+        return [
+            Metric(key=key, value=metric.value, timestamp=metric.timestamp, step=metric.step)
+            for key, metric in latest.items()
+        ]
+
+    def history(self, metric_key: str, offset: int, limit: int) -> list[Metric]:
+        """
+        Get the logged metrics of a key, in the order they were logged.
+
+        :param metric_key: Key of the metrics
+        :param offset: Number of metrics to skip
+        :param limit: Maximum number of metrics to return, all of them if not positive
+        """
+        attempt = 1
+        while True:
+            index = self._load_index()
+            if index is None:
+                table = self._read_live_metrics_table()
+                if table is None:
+                    return []
+                history = table.filter(pc.field("key") == metric_key)
+                return _to_metrics(history.slice(offset=offset, length=limit if limit > 0 else len(history)))
+            try:
+                return self._read_history(index=index, metric_key=metric_key, offset=offset, limit=limit)
+            except FileNotFoundError:
+                # The files were merged and deleted by a concurrent write since the index was loaded
+                if attempt >= LIVE_METRICS_READ_ATTEMPTS:
+                    raise
+                attempt += 1
+
+    def _read_history(self, index: LiveMetricsIndex, metric_key: str, offset: int, limit: int) -> list[Metric]:
+        key_ranges: list[tuple[Path, KeyRange]] = []
+        if index.compacted_name is not None and metric_key in index.compacted:
+            key_ranges.append((COMPACTED_DIR / index.compacted_name, index.compacted[metric_key]))
+        key_ranges += [
+            (SEGMENTS_DIR / segment.name, segment.keys[metric_key])
+            for segment in index.segments
+            if metric_key in segment.keys
+        ]
+
+        metrics: list[Metric] = []
+        for path, key_range in key_ranges:
+            if offset >= key_range.count:
+                offset -= key_range.count
+                continue
+            batch = self._read_batch(path=path, batch_idx=key_range.batch)
+            length = key_range.count - offset if limit <= 0 else min(key_range.count - offset, limit - len(metrics))
+            metrics += _to_metrics(batch.slice(offset=offset, length=length))
+            offset = 0
+            if 0 < limit <= len(metrics):
+                break
+        return metrics
+
+    def _load_index(self) -> LiveMetricsIndex | None:
+        try:
+            response = self.client.get_by_filename(INDEX_PATH)
+        except S3Error as e:
+            if e.code == "NoSuchKey":
+                return None
+            raise
+        try:
+            return LiveMetricsIndex.model_validate_json(response.data)
+        finally:
+            response.close()
+            response.release_conn()
+
+    def _save_index(self, index: LiveMetricsIndex) -> None:
+        self.client.save_file_from_bytes(
+            relative_path=INDEX_PATH,
+            input_bytes=index.model_dump_json().encode(),
+            overwrite=True,
+        )
+
+    @staticmethod
+    def _new_file_name(index: LiveMetricsIndex, prefix: str) -> str:
+        # The random suffix prevents concurrent appends, which get the same ID, from overwriting each other's files
+        name = f"{prefix}-{index.next_segment_id:010d}-{uuid.uuid4().hex[:8]}.arrow"
+        index.next_segment_id += 1
+        return name
+
+    @contextmanager
+    def _open_file(self, path: Path) -> Iterator[pa.ipc.RecordBatchFileReader]:
+        options = pa.ipc.IpcReadOptions(use_threads=False)
+        if path.parent == COMPACTED_DIR:
+            # The compacted file is read with ranged requests, only the record batches being read are downloaded
+            with self.client.open_input_file(path) as fp, pa.ipc.open_file(source=fp, options=options) as reader:
+                yield reader
+            return
+        try:
+            response = self.client.get_by_filename(path)
+        except S3Error as e:
+            if e.code == "NoSuchKey":
+                raise FileNotFoundError(f"Live metrics file {path} not found") from e
+            raise
+        try:
+            with pa.ipc.open_file(source=pa.py_buffer(response.data), options=options) as reader:
+                yield reader
+        finally:
+            response.close()
+            response.release_conn()
+
+    def _read_table(self, path: Path) -> pa.Table:
+        with self._open_file(path=path) as reader:
+            return reader.read_all()
+
+    def _read_live_metrics_table(self) -> pa.Table | None:
+        """Read the live metrics file of a run which has not been indexed yet, if any"""
+        if not self.client.check_live_metrics_file_exists():
+            return None
+        return self._read_table(path=LIVE_METRICS_PATH)
+
+    def _read_batch(self, path: Path, batch_idx: int) -> pa.RecordBatch:
+        with self._open_file(path=path) as reader:
+            return reader.get_batch(batch_idx)
+
+    def _write_segment(self, index: LiveMetricsIndex, table: pa.Table, level: int) -> SegmentIndex:
+        segment_name = self._new_file_name(index=index, prefix="segment")
+        sink = pa.BufferOutputStream()
+        key_ranges = _write_grouped_by_key(table=table, sink=sink)
+        self.client.save_file_from_bytes(
+            relative_path=SEGMENTS_DIR / segment_name,
+            input_bytes=sink.getvalue().to_pybytes(),
+            overwrite=True,
+        )
+        return SegmentIndex(name=segment_name, level=level, keys=key_ranges)
+
+    def _write_compacted_file(self, index: LiveMetricsIndex) -> list[Path]:
+        """
+        Merge the current compacted file and the segments in a new compacted file.
+
+        :return: The merged files, to be deleted by the caller once the index is saved
+        """
+        paths = [SEGMENTS_DIR / segment.name for segment in index.segments]
+        if index.compacted_name is not None:
+            paths.insert(0, COMPACTED_DIR / index.compacted_name)
+        self._write_new_compacted_file(index=index, table=pa.concat_tables([self._read_table(path) for path in paths]))
+        index.segments = []
+        return paths
+
+    def _delete_files(self, paths: list[Path]) -> None:
+        """Delete files which are not referred to by the index anymore"""
+        if not paths:
+            return
+        errors = self.client.delete_file_list(paths)
+        for error in errors:
+            logger.warning(f"Failed to delete the merged live metrics file {error.name}: {error.message}")
+
+    def _write_new_compacted_file(self, index: LiveMetricsIndex, table: pa.Table) -> None:
+        compacted_name = self._new_file_name(index=index, prefix="metrics")
+        with self.client.open_output_stream(COMPACTED_DIR / compacted_name) as fp:
+            index.compacted = _write_grouped_by_key(table=table, sink=fp)
+        index.compacted_name = compacted_name
+
+    def _index_compacted_file(self) -> LiveMetricsIndex:
+        """
+        Create the index of a run, copying its live metrics file to a compacted file with one record batch per key
+        if it exists. The live metrics file is left as is for the readers which have not loaded the index yet.
+        """
+        index = LiveMetricsIndex()
+        table = self._read_live_metrics_table()
+        if table is not None:
+            logger.info("Indexing the live metrics file")
+            index.latest = _latest_metrics(table)
+            self._write_new_compacted_file(index=index, table=table)
+        return index
@@ -14,6 +14,7 @@ from pathlib import Path
 
 import pyarrow as pa
 from minio import Minio
+from minio.commonconfig import CopySource
 from minio.credentials import IamAwsProvider
 from minio.datatypes import Object
 from minio.deleteobjects import DeleteError, DeleteObject
@@ -297,22 +298,41 @@ class S3ObjectStorageClient:
             expires=timedelta(minutes=15),
         )
 
-    def check_live_metrics_file_exists(self) -> bool:
-        path = self.object_name_base / "live_metrics" / "metrics.arrow"
-        return self.check_file_exists(object_name=str(path))
+    @retry_on_rate_limit()
+    def delete_file_list(self, relative_paths: Sequence[Path]) -> list[DeleteError]:
+        delete_object_list = [DeleteObject(name=str(self.object_name_base / path)) for path in relative_paths]
+        return list(
+            self.client.remove_objects(bucket_name=self.bucket_name, delete_object_list=iter(delete_object_list))
+        )
+
+    @retry_on_rate_limit()
+    def copy_file(self, source_relative_path: Path, destination_relative_path: Path) -> None:
+        self.client.copy_object(
+            bucket_name=self.bucket_name,
+            object_name=str(self.object_name_base / destination_relative_path),
+            source=CopySource(
+                bucket_name=self.bucket_name, object_name=str(self.object_name_base / source_relative_path)
+            ),
+        )
 
     @contextmanager
-    def open_live_metrics_file(self) -> Iterator[pa.NativeFile]:
-        path = Path(self.bucket_name) / self.object_name_base / "live_metrics" / "metrics.arrow"
+    def open_input_file(self, relative_path: Path) -> Iterator[pa.NativeFile]:
+        """Open a file for random access, only the ranges being read are downloaded"""
+        path = Path(self.bucket_name) / self.object_name_base / relative_path
         with self.s3fs.open_input_file(path=str(path)) as fp:
             yield fp
 
     @contextmanager
-    def open_live_metrics_output_stream(self) -> Iterator[pa.NativeFile]:
-        path = Path(self.bucket_name) / self.object_name_base / "live_metrics" / "metrics.arrow"
+    def open_output_stream(self, relative_path: Path) -> Iterator[pa.NativeFile]:
+        """Open a file for writing, uploading it by parts while it is written"""
+        path = Path(self.bucket_name) / self.object_name_base / relative_path
         with self.s3fs.open_output_stream(path=str(path)) as fp:
             yield fp
 
+    def check_live_metrics_file_exists(self) -> bool:
+        path = self.object_name_base / "live_metrics" / "metrics.arrow"
+        return self.check_file_exists(object_name=str(path))
+
 
 class S3ObjectStorageClientSingleton:
     _instance: S3ObjectStorageClient | None = None
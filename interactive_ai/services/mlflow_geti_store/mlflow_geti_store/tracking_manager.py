@@ -6,12 +6,17 @@
 from __future__ import annotations
 
 import logging as log
+import os
+import threading
+import time
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Literal
 
 from mlflow.entities import Experiment, ExperimentTag, LifecycleStage, Metric, Param, Run, RunInfo, RunStatus, RunTag
 from mlflow.store.entities.paged_list import PagedList
 from mlflow.utils.search_utils import SearchUtils
 
+from mlflow_geti_store.live_metrics import LiveMetricsLog
 from mlflow_geti_store.s3_object_storage_client import S3ObjectStorageClient
 from mlflow_geti_store.tracking_model import (
     MetricsHistoryModel,
@@ -31,6 +36,12 @@ MlFlowTag = RunTag | ExperimentTag
 PROGRESS_KEY = "__progress__"
 STAGE_KEY = "__stage__"
 
+# Time after which the cached project and run info are loaded again from the object storage, since another server
+# worker may have updated them
+RUN_CONTEXT_CACHE_TTL_SECONDS = float(os.environ.get("RUN_CONTEXT_CACHE_TTL_SECONDS", "30"))
+# Minimum time between two writes of the training progress
+PROGRESS_FLUSH_INTERVAL_SECONDS = float(os.environ.get("PROGRESS_FLUSH_INTERVAL_SECONDS", "1"))
+
 
 class InvalidIdentifierError(Exception):
     def __init__(self, identifier_type: Literal["project", "job"], query_id: str):
@@ -51,6 +62,118 @@ class InvalidStateError(Exception):
         super().__init__(message)
 
 
+@dataclass(frozen=True)
+class RunContext:
+    project_model: ProjectModel
+    run_info_model: RunInfoModel
+    loaded_at: float
+
+
+class RunContextCache:
+    """
+    Cache of the project and run info models of the runs, which are needed to validate every logged batch.
+
+    :param client: Object storage client of the run
+    :param ttl: Time in seconds after which a cached run context is loaded again
+    """
+
+    def __init__(self, client: S3ObjectStorageClient, ttl: float = RUN_CONTEXT_CACHE_TTL_SECONDS) -> None:
+        self.client = client
+        self.ttl = ttl
+        self._contexts: dict[str, RunContext] = {}
+        self._lock = threading.Lock()
+
+    def get(self, run_id: str) -> RunContext:
+        with self._lock:
+            context = self._contexts.get(run_id)
+        if context is not None and time.monotonic() - context.loaded_at < self.ttl:
+            return context
+
+        context = RunContext(
+            project_model=ProjectModel.from_object_storage(client=self.client),
+            run_info_model=RunInfoModel.from_object_storage(client=self.client),
+            loaded_at=time.monotonic(),
+        )
+        with self._lock:
+            self._contexts[run_id] = context
+        return context
+
+    def invalidate(self, run_id: str) -> None:
+        with self._lock:
+            self._contexts.pop(run_id, None)
+
+
+class ProgressWriter:
+    """
+    Writes the training progress to the object storage at a bounded rate. The progress reported within the
+    minimum interval after a write is coalesced: only the latest one is written, once the interval has elapsed, unless
+    the run has terminated in the meantime. A progress that changes the stage or reaches 100% is written immediately.
+
+    Every server worker has its own writer, so the coalescing is best effort: a coalesced progress is lost if the
+    worker exits before writing it, and a deferred write can still race with the termination of the run by another
+    worker, within the time between reading the run info and writing the progress.
+
+    :param client: Object storage client of the run
+    :param min_interval: Minimum time in seconds between two writes
+    """
+
+    def __init__(self, client: S3ObjectStorageClient, min_interval: float = PROGRESS_FLUSH_INTERVAL_SECONDS) -> None:
+        self.client = client
+        self.min_interval = min_interval
+        self._pending: ProgressModel | None = None
+        self._last_stage: str | None = None
+        self._last_write = -float("inf")
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+        # Serializes the writes, so that a progress is never overwritten by an older one
+        self._write_lock = threading.Lock()
+
+    def submit(self, progress: ProgressModel) -> None:
+        with self._lock:
+            is_milestone = progress.stage != self._last_stage or progress.progress >= 100
+            self._last_stage = progress.stage
+            self._pending = progress
+            delay = self._last_write + self.min_interval - time.monotonic()
+            if delay > 0 and not is_milestone:
+                if self._timer is None:
+                    self._timer = threading.Timer(delay, self._flush_in_background)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+        self.flush()
+
+    def flush(self, only_if_run_active: bool = False) -> None:
+        """
+        Write the pending progress, if any
+
+        :param only_if_run_active: if True, the progress is discarded if the run has terminated
+        """
+        with self._write_lock:
+            with self._lock:
+                progress, self._pending = self._pending, None
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                self._last_write = time.monotonic()
+            if progress is None:
+                return
+            if only_if_run_active and self._is_run_terminated():
+                log.info("Discarding the training progress reported before the run terminated")
+                return
+            progress.to_object_storage(client=self.client)
+
+    def _is_run_terminated(self) -> bool:
+        run_status = RunInfoModel.from_object_storage(client=self.client).status
+        return RunStatus.is_terminated(RunStatus.from_string(run_status))
+
+    def _flush_in_background(self) -> None:
+        try:
+            # The run may have been terminated by another server worker since the progress was reported
+            self.flush(only_if_run_active=True)
+        except Exception:
+            log.exception("Failed to write the training progress")
+
+
 class BaseManager:
     """
     :param artifact_uri: String value, "mlflow-artifacts:/"
@@ -80,6 +203,8 @@ class ExperimentManager(BaseManager):
 class RunManager(BaseManager):
     def __init__(self, client: S3ObjectStorageClient, identifier: Identifier) -> None:
         super().__init__(client=client, identifier=identifier)
+        self.run_context_cache = RunContextCache(client=client)
+        self.progress_writer = ProgressWriter(client=client)
 
     def get_run_by_id(self, run_id: str) -> Run:
         if run_id != self.identifier.job_id:
@@ -108,6 +233,8 @@ class RunManager(BaseManager):
         if run_id != self.identifier.job_id:
             raise InvalidIdentifierError(identifier_type="job", query_id=run_id)
 
+        # The progress reported before the run is updated must not be written after it
+        self.progress_writer.flush()
         project_model = ProjectModel.from_object_storage(client=self.client)
         run_model = RunInfoModel.from_object_storage(client=self.client)
 
@@ -119,6 +246,11 @@ class RunManager(BaseManager):
             raise NotAllowedCommandError(command_name="update_run_info.run_name")
 
         run_model.to_object_storage(client=self.client)
+        self.run_context_cache.invalidate(run_id=run_id)
+
+        if run_status and RunStatus.is_terminated(run_status):
+            # No more metrics are logged, leave a single live metrics file for the job to read
+            LiveMetricsLog(self.client).compact()
 
         return run_model.to_mlflow(project_model=project_model)
 
@@ -164,9 +296,8 @@ class RunManager(BaseManager):
         if run_id != self.identifier.job_id:
             raise InvalidIdentifierError(identifier_type="job", query_id=run_id)
 
-        project_model = ProjectModel.from_object_storage(client=self.client)
-        run_info_model = RunInfoModel.from_object_storage(client=self.client)
-        run_info = run_info_model.to_mlflow(project_model=project_model)
+        run_context = self.run_context_cache.get(run_id=run_id)
+        run_info = run_context.run_info_model.to_mlflow(project_model=run_context.project_model)
 
         if run_info.lifecycle_stage != LifecycleStage.ACTIVE:
             raise InvalidStateError(message=f"Run ID={run_id} is not active")
@@ -193,7 +324,7 @@ class RunManager(BaseManager):
                 msg = "progress and stage should not be None."
                 raise ValueError(msg)
 
-            ProgressModel(progress=progress, stage=stage).to_object_storage(client=self.client)
+            self.progress_writer.submit(ProgressModel(progress=progress, stage=stage))
 
     def record_logged_model(self, run_id: str, mlflow_model: MlflowModel) -> None:
         raise NotAllowedCommandError(command_name="record_logged_model")
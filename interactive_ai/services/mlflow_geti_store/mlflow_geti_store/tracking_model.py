@@ -10,13 +10,12 @@ from datetime import datetime
 from functools import cache
 from pathlib import Path
 
-import pyarrow as pa
-import pyarrow.compute as pc
 from mlflow.entities import Dataset, DatasetInput, Experiment, LifecycleStage, Metric, RunData, RunInfo, RunInputs
 from pydantic import BaseModel as _BaseModel
 
+from mlflow_geti_store.live_metrics import LiveMetricsLog
 from mlflow_geti_store.s3_object_storage_client import S3ObjectStorageClient
-from mlflow_geti_store.utils import ARTIFACT_ROOT_URI_PREFIX, PYARROW_SCHEMA, TimeStampMapper
+from mlflow_geti_store.utils import ARTIFACT_ROOT_URI_PREFIX, TimeStampMapper
 
 logger = logging.getLogger("mlflow")
 
@@ -176,32 +175,7 @@ class LatestMetricsModel(BaseModel):
 
     @classmethod
     def from_object_storage(cls, client: S3ObjectStorageClient) -> LatestMetricsModel:
-        if not client.check_live_metrics_file_exists():
-            return LatestMetricsModel(metrics=[])
-
-        with (
-            client.open_live_metrics_file() as fp,
-            pa.ipc.open_file(source=fp, options=pa.ipc.IpcReadOptions(use_threads=False)) as reader,
-        ):
-            table = reader.read_all()
-            latest = table.group_by("key", use_threads=False).aggregate(
-                [
-                    ("value", "last"),
-                    ("timestamp", "last"),
-                    ("step", "last"),
-                ]
-            )
-            metrics = [
-                Metric(
-                    key=item["key"],
-                    value=item["value_last"],
-                    timestamp=TimeStampMapper.forward(item["timestamp_last"]),
-                    step=item["step_last"],
-                )
-                for item in latest.to_pylist()
-            ]
-
-        return LatestMetricsModel(metrics=metrics)
+        return LatestMetricsModel(metrics=LiveMetricsLog(client).latest())
 
     def to_mlflow(self) -> list[Metric]:
         return self.metrics
@@ -214,69 +188,12 @@ class MetricsHistoryModel(BaseModel):
     def from_object_storage(
         cls, client: S3ObjectStorageClient, metric_key: str, offset: int, limit: int
     ) -> MetricsHistoryModel:
-        if not client.check_live_metrics_file_exists():
-            return MetricsHistoryModel(metrics=[])
-
-        with (
-            client.open_live_metrics_file() as fp,
-            pa.ipc.open_file(source=fp, options=pa.ipc.IpcReadOptions(use_threads=False)) as reader,
-        ):
-            table = reader.read_all()
-            expr = pc.field("key") == metric_key
-            if limit <= 0:
-                limit = len(table)
-            history = (
-                table.filter(expr).slice(offset=offset, length=limit).select(["key", "value", "timestamp", "step"])
-            )
-            metrics = [
-                Metric(
-                    key=item["key"],
-                    value=item["value"],
-                    timestamp=TimeStampMapper.forward(item["timestamp"]),
-                    step=item["step"],
-                )
-                for item in history.to_pylist()
-            ]
-
-        return MetricsHistoryModel(metrics=metrics)
+        return MetricsHistoryModel(
+            metrics=LiveMetricsLog(client).history(metric_key=metric_key, offset=offset, limit=limit)
+        )
 
     def to_object_storage(self, client: S3ObjectStorageClient) -> None:
-        # TODO (vinnamki): It's very ugly and has several other serious issues:
-        # concurrency issues, excessive network I/O, etc.
-        # Need further discussion about another approach.
-        if client.check_live_metrics_file_exists():
-            with (
-                client.open_live_metrics_file() as fp,
-                pa.ipc.open_file(source=fp, options=pa.ipc.IpcReadOptions(use_threads=False)) as reader,
-            ):
-                table = reader.read_all()
-        else:
-            table = None
-
-        with (
-            client.open_live_metrics_output_stream() as fp,
-            pa.ipc.new_file(
-                fp,
-                schema=PYARROW_SCHEMA,
-                options=pa.ipc.IpcWriteOptions(use_threads=False),
-            ) as writer,
-        ):
-            to_append = pa.Table.from_pylist(
-                [
-                    {
-                        "key": metric.key,
-                        "value": metric.value,
-                        "step": metric.step,
-                        "timestamp": metric.timestamp,
-                    }
-                    for metric in self.metrics
-                ],
-                schema=PYARROW_SCHEMA,
-            )
-
-            to_write = pa.concat_tables(tables=[table, to_append]) if table else to_append
-
-            writer.write_table(to_write)
+        LiveMetricsLog(client).append(metrics=self.metrics)
 
     def to_mlflow(self) -> list[Metric]:
         return self.metrics
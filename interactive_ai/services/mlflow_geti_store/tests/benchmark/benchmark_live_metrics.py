@@ -0,0 +1,196 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+Benchmark of the live metrics storage: rewriting a single Arrow file on every logged batch vs. the append-only
+segmented log.
+
+The files are stored in a temporary local directory by a client counting the requests and the transferred bytes,
+which are the costs that dominate with a remote object storage:
+
+    PYTHONPATH=. python tests/benchmark/benchmark_live_metrics.py
+
+BENCHMARK_METRIC_POINTS sets the number of logged metric points (default: 100 000) and BENCHMARK_BATCH_SIZE the
+number of metric points per logged batch (default: 10, i.e. 10 metric keys logged at every step).
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+import time
+from collections.abc import Callable, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+import pyarrow as pa
+import pyarrow.compute as pc
+from minio.error import S3Error
+from mlflow.entities import Metric
+from mlflow_geti_store.live_metrics import LIVE_METRICS_PATH, LiveMetricsLog
+from mlflow_geti_store.utils import PYARROW_SCHEMA
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_METRIC_POINTS = int(os.environ.get("BENCHMARK_METRIC_POINTS", "100000"))
+BENCHMARK_BATCH_SIZE = int(os.environ.get("BENCHMARK_BATCH_SIZE", "10"))
+HISTORY_PAGE_SIZE = 1000
+
+
+@dataclass
+class _Response:
+    data: bytes
+
+    def close(self) -> None:
+        pass
+
+    def release_conn(self) -> None:
+        pass
+
+
+class _CountingFile:
+    def __init__(self, file: BinaryIO, client: "_LocalStorageClient") -> None:
+        self._file = file
+        self._client = client
+
+    def __getattr__(self, name: str):
+        return getattr(self._file, name)
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._file.read(size)
+        self._client.bytes_read += len(data)
+        return data
+
+    def write(self, data: bytes) -> int:
+        self._client.bytes_written += len(data)
+        return self._file.write(data)
+
+
+class _LocalStorageClient:
+    """Stores the files of the job in a local directory, counting the requests and the transferred bytes"""
+
+    def __init__(self, root_dir: Path) -> None:
+        self.root_dir = root_dir
+        self.requests = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+
+    def get_by_filename(self, relative_path: Path) -> _Response:
+        self.requests += 1
+        path = self.root_dir / relative_path
+        if not path.is_file():
+            raise S3Error("NoSuchKey", "Object does not exist", str(relative_path), "", "", None)
+        data = path.read_bytes()
+        self.bytes_read += len(data)
+        return _Response(data=data)
+
+    def save_file_from_bytes(self, relative_path: Path, input_bytes: bytes, overwrite: bool = False) -> None:
+        self.requests += 1
+        path = self.root_dir / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(input_bytes)
+        self.bytes_written += len(input_bytes)
+
+    def delete_file_list(self, relative_paths: Sequence[Path]) -> list:
+        self.requests += 1
+        for relative_path in relative_paths:
+            (self.root_dir / relative_path).unlink()
+        return []
+
+    def check_live_metrics_file_exists(self) -> bool:
+        self.requests += 1
+        return (self.root_dir / LIVE_METRICS_PATH).is_file()
+
+    def copy_file(self, source_relative_path: Path, destination_relative_path: Path) -> None:
+        self.requests += 1
+        shutil.copyfile(self.root_dir / source_relative_path, self.root_dir / destination_relative_path)
+
+    @contextmanager
+    def open_input_file(self, relative_path: Path):
+        self.requests += 1
+        with open(self.root_dir / relative_path, "rb") as fp:
+            yield _CountingFile(fp, client=self)
+
+    @contextmanager
+    def open_output_stream(self, relative_path: Path):
+        self.requests += 1
+        path = self.root_dir / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as fp:
+            yield _CountingFile(fp, client=self)
+
+
+class _RewriteLog:
+    """Former storage of the live metrics, rewriting the whole file on every logged batch"""
+
+    def __init__(self, client: _LocalStorageClient) -> None:
+        self.client = client
+
+    def append(self, metrics: list[Metric]) -> None:
+        table = None
+        if self.client.check_live_metrics_file_exists():
+            with self.client.open_input_file(LIVE_METRICS_PATH) as fp, pa.ipc.open_file(source=fp) as reader:
+                table = reader.read_all()
+        to_append = pa.Table.from_pylist(
+            [{"key": m.key, "value": m.value, "step": m.step, "timestamp": m.timestamp} for m in metrics],
+            schema=PYARROW_SCHEMA,
+        )
+        with (
+            self.client.open_output_stream(LIVE_METRICS_PATH) as fp,
+            pa.ipc.new_file(fp, schema=PYARROW_SCHEMA) as writer,
+        ):
+            writer.write_table(pa.concat_tables(tables=[table, to_append]) if table else to_append)
+
+    def history(self, metric_key: str, offset: int, limit: int) -> list[Metric]:
+        with self.client.open_input_file(LIVE_METRICS_PATH) as fp, pa.ipc.open_file(source=fp) as reader:
+            table = reader.read_all()
+        history = table.filter(pc.field("key") == metric_key).slice(offset=offset, length=limit)
+        return [Metric(key=i["key"], value=i["value"], timestamp=0, step=i["step"]) for i in history.to_pylist()]
+
+
+def _batches() -> list[list[Metric]]:
+    keys = [f"metric_{idx}" for idx in range(BENCHMARK_BATCH_SIZE)]
+    return [
+        [Metric(key=key, value=step / 100, timestamp=step, step=step) for key in keys]
+        for step in range(BENCHMARK_METRIC_POINTS // BENCHMARK_BATCH_SIZE)
+    ]
+
+
+def _run(name: str, create_log: Callable[[_LocalStorageClient], LiveMetricsLog | _RewriteLog]) -> None:
+    batches = _batches()
+    with tempfile.TemporaryDirectory() as root_dir:
+        client = _LocalStorageClient(root_dir=Path(root_dir))
+        log = create_log(client)
+
+        start = time.perf_counter()
+        for batch in batches:
+            log.append(metrics=batch)
+        duration = time.perf_counter() - start
+        logger.info(
+            f"{name}: logged {len(batches)} batches in {duration:.1f} s, {client.requests} requests, "
+            f"{client.bytes_read / 1024**2:.1f} MiB read, {client.bytes_written / 1024**2:.1f} MiB written"
+        )
+
+        client.requests = client.bytes_read = 0
+        n_steps = len(batches)
+        start = time.perf_counter()
+        for offset in range(0, n_steps, HISTORY_PAGE_SIZE):
+            log.history(metric_key="metric_0", offset=offset, limit=HISTORY_PAGE_SIZE)
+        duration = time.perf_counter() - start
+        logger.info(
+            f"{name}: read the history of a key by pages of {HISTORY_PAGE_SIZE} in {duration * 1000:.1f} ms, "
+            f"{client.requests} requests, {client.bytes_read / 1024**2:.1f} MiB read"
+        )
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    logger.info(f"Logging {BENCHMARK_METRIC_POINTS} metric points in batches of {BENCHMARK_BATCH_SIZE}")
+    _run("Segmented log", LiveMetricsLog)  # type: ignore[arg-type]
+    _run("Rewritten file", _RewriteLog)
+
+
+if __name__ == "__main__":
+    main()
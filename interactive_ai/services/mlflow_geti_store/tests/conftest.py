@@ -2,11 +2,15 @@
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 
 import json
+import shutil
 from datetime import datetime, timezone
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pyarrow as pa
 import pytest
+from minio.error import S3Error
+from mlflow_geti_store.s3_object_storage_client import S3ObjectStorageClient
 from mlflow_geti_store.utils import PYARROW_SCHEMA
 
 
@@ -101,3 +105,49 @@ def fxt_live_metrics(tmpdir: Path):
         writer.write_table(table)
 
     yield fpath
+
+
+@pytest.fixture()
+def fxt_local_storage_client(tmpdir):
+    """Object storage client mock storing the files of the job in a local directory"""
+    root_dir = Path(tmpdir)
+    live_metrics_path = root_dir / "live_metrics" / "metrics.arrow"
+    client = MagicMock(spec=S3ObjectStorageClient)
+
+    def _get_by_filename(relative_path):
+        path = root_dir / relative_path
+        if not path.is_file():
+            raise S3Error("NoSuchKey", "Object does not exist", str(relative_path), "", "", None)
+        response = MagicMock()
+        response.data = path.read_bytes()
+        return response
+
+    def _save_file_from_bytes(relative_path, input_bytes, overwrite=False):
+        path = root_dir / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(input_bytes)
+
+    def _delete_file_list(relative_paths):
+        for relative_path in relative_paths:
+            (root_dir / relative_path).unlink()
+        return []
+
+    def _open_input_file(relative_path):
+        return open(root_dir / relative_path, "rb")
+
+    def _open_output_stream(relative_path):
+        path = root_dir / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return open(path, "wb")
+
+    def _copy_file(source_relative_path, destination_relative_path):
+        shutil.copyfile(root_dir / source_relative_path, root_dir / destination_relative_path)
+
+    client.get_by_filename.side_effect = _get_by_filename
+    client.save_file_from_bytes.side_effect = _save_file_from_bytes
+    client.delete_file_list.side_effect = _delete_file_list
+    client.check_live_metrics_file_exists.side_effect = live_metrics_path.is_file
+    client.open_input_file.side_effect = _open_input_file
+    client.open_output_stream.side_effect = _open_output_stream
+    client.copy_file.side_effect = _copy_file
+    return client
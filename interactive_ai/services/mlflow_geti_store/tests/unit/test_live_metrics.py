@@ -0,0 +1,182 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+import math
+import os
+from unittest.mock import patch
+
+import pyarrow as pa
+import pytest
+from mlflow.entities import Metric
+from mlflow_geti_store.live_metrics import (
+    COMPACTED_DIR,
+    INDEX_PATH,
+    LIVE_METRICS_PATH,
+    SEGMENTS_DIR,
+    LiveMetricsIndex,
+    LiveMetricsLog,
+)
+
+
+def _log_steps(log: LiveMetricsLog, keys: list[str], steps: range) -> list[Metric]:
+    """Log one batch per step, with one metric per key"""
+    logged = []
+    for step in steps:
+        metrics = [Metric(key=key, value=float(step), timestamp=step, step=step) for key in keys]
+        log.append(metrics=metrics)
+        logged += metrics
+    return logged
+
+
+def _read_index(tmpdir) -> LiveMetricsIndex:
+    with open(tmpdir / INDEX_PATH) as fp:
+        return LiveMetricsIndex.model_validate_json(fp.read())
+
+
+def _list_files(tmpdir, directory) -> list[str]:
+    return sorted(os.listdir(tmpdir / directory))
+
+
+class TestLiveMetricsLog:
+    def test_append(self, tmpdir, fxt_local_storage_client):
+        log = LiveMetricsLog(fxt_local_storage_client)
+
+        with patch("mlflow_geti_store.live_metrics.LIVE_METRICS_SEGMENT_FANOUT", 100):
+            logged = _log_steps(log, keys=["loss", "lr"], steps=range(10))
+
+        # The segments are compacted each time they hold as many rows as the compacted file: after 1, 2, 4 and 8 steps
+        index = _read_index(tmpdir)
+        assert {key: key_range.count for key, key_range in index.compacted.items()} == {"loss": 8, "lr": 8}
+        assert index.compacted_name.startswith("metrics-0000000011-")
+        assert [segment.name[:18] for segment in index.segments] == ["segment-0000000012", "segment-0000000013"]
+        assert _list_files(tmpdir, SEGMENTS_DIR) == [segment.name for segment in index.segments]
+        assert _list_files(tmpdir, COMPACTED_DIR) == [index.compacted_name]
+        assert index.latest["loss"].step == 9
+        # The live metrics file read by the job is only written once the run is completed
+        assert not (tmpdir / LIVE_METRICS_PATH).exists()
+
+        assert log.history(metric_key="loss", offset=0, limit=0) == [m for m in logged if m.key == "loss"]
+        assert {(metric.key, metric.step) for metric in log.latest()} == {("loss", 9), ("lr", 9)}
+
+    def test_append_merge_segments(self, tmpdir, fxt_local_storage_client):
+        log = LiveMetricsLog(fxt_local_storage_client)
+
+        with patch("mlflow_geti_store.live_metrics.LIVE_METRICS_SEGMENT_FANOUT", 2):
+            logged = _log_steps(log, keys=["loss"], steps=range(50))
+
+        # With a fanout of 2, the remaining segments have distinct levels, from the oldest to the most recent
+        index = _read_index(tmpdir)
+        levels = [segment.level for segment in index.segments]
+        assert levels == sorted(set(levels), reverse=True)
+        assert index.compacted["loss"].count + sum(segment.keys["loss"].count for segment in index.segments) == 50
+        assert _list_files(tmpdir, SEGMENTS_DIR) == [segment.name for segment in index.segments]
+        assert log.history(metric_key="loss", offset=0, limit=0) == logged
+
+    def test_history_concurrent_compaction(self, tmpdir, fxt_local_storage_client):
+        log = LiveMetricsLog(fxt_local_storage_client)
+        with patch("mlflow_geti_store.live_metrics.LIVE_METRICS_SEGMENT_FANOUT", 100):
+            logged = _log_steps(log, keys=["loss"], steps=range(4))
+            old_index = _read_index(tmpdir)
+            # The compaction after 4 steps adds a key, which shifts the record batch of "loss" in the compacted file,
+            # and deletes the files referred to by the old index
+            _log_steps(log, keys=["acc", "loss"], steps=range(4, 8))
+        new_index = _read_index(tmpdir)
+        assert not (tmpdir / COMPACTED_DIR / old_index.compacted_name).exists()
+
+        # A reader which loaded the index before the compaction loads it again
+        with patch.object(log, "_load_index", side_effect=[old_index, new_index]) as mock_load_index:
+            history = log.history(metric_key="loss", offset=0, limit=0)
+
+        assert mock_load_index.call_count == 2
+        assert [metric.step for metric in history] == list(range(8))
+        assert history[:4] == logged
+
+        with (
+            patch.object(log, "_load_index", return_value=old_index),
+            pytest.raises(FileNotFoundError),
+        ):
+            log.history(metric_key="loss", offset=0, limit=0)
+
+    @pytest.mark.parametrize("offset", [0, 3, 7, 12])
+    @pytest.mark.parametrize("limit", [0, 1, 4, 20])
+    def test_history(self, fxt_local_storage_client, offset, limit):
+        log = LiveMetricsLog(fxt_local_storage_client)
+        with patch("mlflow_geti_store.live_metrics.LIVE_METRICS_SEGMENT_FANOUT", 100):
+            logged = _log_steps(log, keys=["loss", "lr", "acc"], steps=range(11))
+        expected = [metric for metric in logged if metric.key == "lr"][offset:]
+        if limit > 0:
+            expected = expected[:limit]
+
+        assert log.history(metric_key="lr", offset=offset, limit=limit) == expected
+
+    def test_history_reads_only_key_segments(self, tmpdir, fxt_local_storage_client):
+        log = LiveMetricsLog(fxt_local_storage_client)
+        with patch("mlflow_geti_store.live_metrics.LIVE_METRICS_SEGMENT_FANOUT", 100):
+            _log_steps(log, keys=["loss"], steps=range(8))
+            _log_steps(log, keys=["lr"], steps=range(3))
+        fxt_local_storage_client.get_by_filename.reset_mock()
+        fxt_local_storage_client.open_input_file.reset_mock()
+
+        history = log.history(metric_key="lr", offset=1, limit=0)
+
+        # The index and the two segments holding the remaining "lr" metrics are read, not the compacted file
+        index = _read_index(tmpdir)
+        assert [metric.step for metric in history] == [1, 2]
+        assert [call.args[0] for call in fxt_local_storage_client.get_by_filename.call_args_list] == [
+            INDEX_PATH,
+            SEGMENTS_DIR / index.segments[-2].name,
+            SEGMENTS_DIR / index.segments[-1].name,
+        ]
+        fxt_local_storage_client.open_input_file.assert_not_called()
+
+    def test_compact(self, tmpdir, fxt_local_storage_client):
+        log = LiveMetricsLog(fxt_local_storage_client)
+        with patch("mlflow_geti_store.live_metrics.LIVE_METRICS_SEGMENT_FANOUT", 100):
+            logged = _log_steps(log, keys=["loss", "lr"], steps=range(6))
+
+        log.compact()
+
+        index = _read_index(tmpdir)
+        assert not index.segments
+        assert _list_files(tmpdir, SEGMENTS_DIR) == []
+        assert _list_files(tmpdir, COMPACTED_DIR) == [index.compacted_name]
+        with (
+            open(tmpdir / LIVE_METRICS_PATH, "rb") as fp,
+            pa.ipc.open_file(source=fp) as reader,
+        ):
+            assert reader.num_record_batches == 2
+            table = reader.read_all()
+        assert table.num_rows == len(logged)
+        assert log.history(metric_key="lr", offset=0, limit=0) == [m for m in logged if m.key == "lr"]
+
+    def test_index_existing_live_metrics_file(self, tmpdir, fxt_local_storage_client, fxt_live_metrics):
+        log = LiveMetricsLog(fxt_local_storage_client)
+        history = log.history(metric_key="dog", offset=2, limit=3)
+
+        log.append(metrics=[Metric(key="dog", value=0.5, timestamp=10, step=10)])
+
+        # The existing live metrics file is indexed on the first write, and left as is for the job
+        index = _read_index(tmpdir)
+        assert {key: key_range.count for key, key_range in index.compacted.items()} == {"car": 10, "cat": 10, "dog": 10}
+        with open(fxt_live_metrics, "rb") as fp, pa.ipc.open_file(source=fp) as reader:
+            assert reader.read_all().num_rows == 30
+        assert log.history(metric_key="dog", offset=2, limit=3) == history
+        assert [metric.step for metric in log.history(metric_key="dog", offset=8, limit=0)] == [8, 9, 10]
+        assert {(metric.key, metric.step) for metric in log.latest()} == {("car", 9), ("cat", 9), ("dog", 10)}
+
+    def test_no_metrics(self, fxt_local_storage_client):
+        log = LiveMetricsLog(fxt_local_storage_client)
+
+        log.compact()
+
+        assert log.latest() == []
+        assert log.history(metric_key="loss", offset=0, limit=10) == []
+
+    def test_nan_metric(self, fxt_local_storage_client):
+        log = LiveMetricsLog(fxt_local_storage_client)
+        log.append(metrics=[Metric(key="loss", value=1.0, timestamp=0, step=0)])
+        log.append(metrics=[Metric(key="loss", value=math.nan, timestamp=1, step=1)])
+
+        (latest,) = log.latest()
+
+        assert math.isnan(latest.value)
@@ -0,0 +1,126 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from mlflow.entities import LifecycleStage, Metric, RunStatus, RunTag
+from mlflow_geti_store.s3_object_storage_client import S3ObjectStorageClient
+from mlflow_geti_store.tracking_manager import PROGRESS_KEY, STAGE_KEY, InvalidStateError, ProgressWriter, RunManager
+from mlflow_geti_store.tracking_model import ProgressModel
+from mlflow_geti_store.utils import Identifier
+
+
+@pytest.fixture()
+def fxt_run_manager(fxt_organization_id, fxt_workspace_id, fxt_project_id, fxt_job_id):
+    identifier = Identifier(fxt_organization_id, fxt_workspace_id, fxt_project_id, fxt_job_id)
+    return RunManager(client=MagicMock(spec=S3ObjectStorageClient), identifier=identifier)
+
+
+@pytest.fixture()
+def fxt_run_info_model():
+    run_info_model = MagicMock()
+    run_info_model.to_mlflow.return_value.lifecycle_stage = LifecycleStage.ACTIVE
+    with (
+        patch("mlflow_geti_store.tracking_manager.ProjectModel.from_object_storage") as mock_project_from_storage,
+        patch(
+            "mlflow_geti_store.tracking_manager.RunInfoModel.from_object_storage", return_value=run_info_model
+        ) as mock_run_info_from_storage,
+        patch("mlflow_geti_store.tracking_manager.MetricsHistoryModel.to_object_storage"),
+        patch("mlflow_geti_store.tracking_manager.LiveMetricsLog"),
+    ):
+        yield run_info_model, mock_project_from_storage, mock_run_info_from_storage
+
+
+class TestRunManager:
+    def test_log_batch_run_context_cache(self, fxt_run_manager, fxt_run_info_model, fxt_job_id):
+        _, mock_project_from_storage, mock_run_info_from_storage = fxt_run_info_model
+        metrics = [Metric(key="loss", value=1.0, timestamp=0, step=0)]
+
+        for _ in range(3):
+            fxt_run_manager.log_batch(run_id=fxt_job_id, metrics=metrics, params=[], tags=[])
+
+        mock_project_from_storage.assert_called_once()
+        mock_run_info_from_storage.assert_called_once()
+
+        # Updating the run invalidates the cached run context
+        fxt_run_manager.update_run_info(run_id=fxt_job_id, run_status=RunStatus.RUNNING, end_time=None, run_name=None)
+        fxt_run_manager.log_batch(run_id=fxt_job_id, metrics=metrics, params=[], tags=[])
+
+        assert mock_run_info_from_storage.call_count == 3  # update_run_info and log_batch
+
+    def test_log_batch_run_context_cache_expiry(self, fxt_run_manager, fxt_run_info_model, fxt_job_id):
+        _, _, mock_run_info_from_storage = fxt_run_info_model
+        fxt_run_manager.run_context_cache.ttl = 0
+
+        for _ in range(2):
+            fxt_run_manager.log_batch(run_id=fxt_job_id, metrics=[], params=[], tags=[])
+
+        assert mock_run_info_from_storage.call_count == 2
+
+    def test_log_batch_inactive_run(self, fxt_run_manager, fxt_run_info_model, fxt_job_id):
+        run_info_model, _, _ = fxt_run_info_model
+        run_info_model.to_mlflow.return_value.lifecycle_stage = LifecycleStage.DELETED
+
+        with pytest.raises(InvalidStateError):
+            fxt_run_manager.log_batch(run_id=fxt_job_id, metrics=[], params=[], tags=[])
+
+    def test_log_batch_progress(self, fxt_run_manager, fxt_run_info_model, fxt_job_id):
+        fxt_run_manager.progress_writer.min_interval = 60
+
+        with patch.object(ProgressModel, "to_object_storage", autospec=True) as mock_to_object_storage:
+            for progress in (10.0, 20.0, 30.0):
+                tags = [RunTag(key=PROGRESS_KEY, value=str(progress)), RunTag(key=STAGE_KEY, value="training")]
+                fxt_run_manager.log_batch(run_id=fxt_job_id, metrics=[], params=[], tags=tags)
+
+            # The first progress is written, the following ones are coalesced until the run is updated
+            assert [call.args[0].progress for call in mock_to_object_storage.call_args_list] == [10.0]
+            fxt_run_manager.update_run_info(
+                run_id=fxt_job_id, run_status=RunStatus.FINISHED, end_time=None, run_name=None
+            )
+
+        assert [call.args[0].progress for call in mock_to_object_storage.call_args_list] == [10.0, 30.0]
+
+
+class TestProgressWriter:
+    @pytest.mark.parametrize("run_status", [RunStatus.RUNNING, RunStatus.FINISHED])
+    def test_submit(self, run_status):
+        writer = ProgressWriter(client=MagicMock(spec=S3ObjectStorageClient), min_interval=0.2)
+        run_info_model = MagicMock(status=RunStatus.to_string(run_status))
+
+        with (
+            patch.object(ProgressModel, "to_object_storage", autospec=True) as mock_to_object_storage,
+            patch("mlflow_geti_store.tracking_manager.RunInfoModel.from_object_storage", return_value=run_info_model),
+        ):
+            for progress in range(5):
+                writer.submit(ProgressModel(progress=progress, stage="training"))
+            assert mock_to_object_storage.call_count == 1
+
+            # The latest progress is written once the interval has elapsed, unless the run has terminated meanwhile
+            time.sleep(0.5)
+
+        expected_progress = [0.0, 4.0] if run_status == RunStatus.RUNNING else [0.0]
+        assert [call.args[0].progress for call in mock_to_object_storage.call_args_list] == expected_progress
+
+    def test_submit_milestones(self):
+        writer = ProgressWriter(client=MagicMock(spec=S3ObjectStorageClient), min_interval=60)
+
+        with patch.object(ProgressModel, "to_object_storage", autospec=True) as mock_to_object_storage:
+            for progress, stage in ((0.0, "training"), (50.0, "training"), (0.0, "evaluation"), (100.0, "evaluation")):
+                writer.submit(ProgressModel(progress=progress, stage=stage))
+
+        # Stage changes and completion are written right away, the intermediate progress is coalesced
+        assert [(call.args[0].stage, call.args[0].progress) for call in mock_to_object_storage.call_args_list] == [
+            ("training", 0.0),
+            ("evaluation", 0.0),
+            ("evaluation", 100.0),
+        ]
+
+    def test_flush_nothing_pending(self):
+        writer = ProgressWriter(client=MagicMock(spec=S3ObjectStorageClient), min_interval=60)
+
+        with patch.object(ProgressModel, "to_object_storage", autospec=True) as mock_to_object_storage:
+            writer.flush()
+
+        mock_to_object_storage.assert_not_called()
@@ -9,6 +9,7 @@ import pyarrow as pa
 import pytest
 from minio.datatypes import Object
 from mlflow.entities import Experiment, LifecycleStage, Metric, RunInfo
+from mlflow_geti_store.live_metrics import LiveMetricsLog
 from mlflow_geti_store.s3_object_storage_client import S3ObjectStorageClient
 from mlflow_geti_store.tracking_model import (
     LatestMetricsModel,
@@ -100,15 +101,8 @@ class TestTrackingModel:
         assert run_info.artifact_uri.startswith(ARTIFACT_ROOT_URI_PREFIX)
         assert_time_delta(TimeStampMapper.backward(run_info.start_time), fxt_start_time)
 
-    @patch("mlflow_geti_store.tracking_model.S3ObjectStorageClient", spec=S3ObjectStorageClient)
-    def test_latest_metrics_model(
-        self,
-        mock_client,
-        fxt_live_metrics,
-    ):
-        with open(fxt_live_metrics, "rb") as fp:
-            mock_client.open_live_metrics_file.return_value.__enter__.return_value = fp
-            model = LatestMetricsModel.from_object_storage(mock_client)
+    def test_latest_metrics_model(self, fxt_local_storage_client, fxt_live_metrics):
+        model = LatestMetricsModel.from_object_storage(fxt_local_storage_client)
 
         assert isinstance(model, LatestMetricsModel)
 
@@ -122,24 +116,20 @@ class TestTrackingModel:
     @pytest.mark.parametrize("offset", [0, 5])
     @pytest.mark.parametrize("limit", [3, 10])
     @pytest.mark.parametrize("key", ["car", "cat", "dog"])
-    @patch("mlflow_geti_store.tracking_model.S3ObjectStorageClient", spec=S3ObjectStorageClient)
     def test_metrics_history_model_from_object_storage(
         self,
-        mock_client,
+        fxt_local_storage_client,
         fxt_live_metrics,
         offset,
         limit,
         key,
     ):
-        with open(fxt_live_metrics, "rb") as fp:
-            mock_client.open_live_metrics_file.return_value.__enter__.return_value = fp
-
-            model = MetricsHistoryModel.from_object_storage(
-                mock_client,
-                metric_key=key,
-                offset=offset,
-                limit=limit,
-            )
+        model = MetricsHistoryModel.from_object_storage(
+            fxt_local_storage_client,
+            metric_key=key,
+            offset=offset,
+            limit=limit,
+        )
 
         assert isinstance(model, MetricsHistoryModel)
 
@@ -155,35 +145,25 @@ class TestTrackingModel:
         assert all(metric.timestamp >= offset for metric in mlflow_metrics)
         assert all(metric.step >= offset for metric in mlflow_metrics)
 
-    @patch("mlflow_geti_store.tracking_model.S3ObjectStorageClient", spec=S3ObjectStorageClient)
-    def test_metrics_history_model_to_object_storage(
-        self,
-        mock_client,
-        fxt_live_metrics,
-        tmpdir,
-    ):
-        fpath_to_write = tmpdir / "tmp.arrow"
-
-        with open(fxt_live_metrics, "rb") as fp_read, open(fpath_to_write, "wb") as fp_write:
-            mock_client.open_live_metrics_file.return_value.__enter__.return_value = fp_read
-            mock_client.open_live_metrics_output_stream.return_value.__enter__.return_value = fp_write
-
-            model = MetricsHistoryModel(
-                metrics=[
-                    Metric(
-                        key=key,
-                        value=20 - idx,
-                        timestamp=idx,
-                        step=idx,
-                    )
-                    for key in ["car", "cat", "dog"]
-                    for idx in range(10, 20)
-                ]
-            )
-            model.to_object_storage(client=mock_client)
+    def test_metrics_history_model_to_object_storage(self, fxt_local_storage_client, fxt_live_metrics):
+        model = MetricsHistoryModel(
+            metrics=[
+                Metric(
+                    key=key,
+                    value=20 - idx,
+                    timestamp=idx,
+                    step=idx,
+                )
+                for key in ["car", "cat", "dog"]
+                for idx in range(10, 20)
+            ]
+        )
+        model.to_object_storage(client=fxt_local_storage_client)
+        # The live metrics file read by the job is updated once the run is completed
+        LiveMetricsLog(fxt_local_storage_client).compact()
 
         with (
-            open(fpath_to_write, "rb") as fp,
+            open(fxt_live_metrics, "rb") as fp,
             pa.ipc.open_file(source=fp, options=pa.ipc.IpcReadOptions(use_threads=False)) as reader,
         ):
             table = reader.read_all()
@@ -199,22 +179,19 @@ class TestTrackingModel:
         kwargs = mock_client.save_file_from_bytes.call_args.kwargs
         assert json.loads(kwargs.get("input_bytes")) == {"progress": 1.0, "stage": "TRAINING"}
 
-    @patch("mlflow_geti_store.tracking_model.S3ObjectStorageClient", spec=S3ObjectStorageClient)
-    def test_run_data_model(self, mock_client, fxt_live_metrics):
-        with open(fxt_live_metrics, "rb") as fp:
-            mock_client.open_live_metrics_file.return_value.__enter__.return_value = fp
-            model = RunDataModel.from_object_storage(client=mock_client)
+    def test_run_data_model(self, fxt_local_storage_client, fxt_live_metrics):
+        model = RunDataModel.from_object_storage(client=fxt_local_storage_client)
 
-            mlflow_run_data = model.to_mlflow()
-            mlflow_metrics = mlflow_run_data.metrics
+        mlflow_run_data = model.to_mlflow()
+        mlflow_metrics = mlflow_run_data.metrics
 
-            # Not supported, it should be empty
-            assert mlflow_run_data.params == {}
-            assert mlflow_run_data.tags == {}
+        # Not supported, it should be empty
+        assert mlflow_run_data.params == {}
+        assert mlflow_run_data.tags == {}
 
-            # Same as the latest metrics
-            assert set(mlflow_metrics.keys()) == {"car", "cat", "dog"}
-            assert all(value == 1.0 for value in mlflow_metrics.values())
+        # Same as the latest metrics
+        assert set(mlflow_metrics.keys()) == {"car", "cat", "dog"}
+        assert all(value == 1.0 for value in mlflow_metrics.values())
 
     @patch("mlflow_geti_store.tracking_model.S3ObjectStorageClient", spec=S3ObjectStorageClient)
     def test_run_inputs_model(self, mock_client):
@@ -70,3 +70,9 @@ MIN_VIDEO_SIZE = int(os.environ.get("MIN_VIDEO_SIZE", "32"))  # pixels
 MAX_VIDEO_WIDTH = int(os.environ.get("MAX_VIDEO_WIDTH", "7680"))  # pixels
 MAX_VIDEO_HEIGHT = int(os.environ.get("MAX_VIDEO_HEIGHT", "4320"))  # pixels
 MAX_VIDEO_LENGTH = int(os.environ.get("MAX_VIDEO_LENGTH", "10800"))  # seconds (=3hours)
+
+# Thumbnails missing at request time are generated in the background by a bounded pool of workers
+THUMBNAIL_GENERATION_WORKERS = int(os.environ.get("THUMBNAIL_GENERATION_WORKERS", "2"))
+THUMBNAIL_GENERATION_QUEUE_SIZE = int(os.environ.get("THUMBNAIL_GENERATION_QUEUE_SIZE", "1000"))
+# Maximum number of thumbnail videos generated by a single ffmpeg process
+THUMBNAIL_VIDEO_BATCH_SIZE = int(os.environ.get("THUMBNAIL_VIDEO_BATCH_SIZE", "4"))
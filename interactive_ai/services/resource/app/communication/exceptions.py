@@ -969,6 +969,24 @@ class VideoThumbnailNotFoundException(GetiBaseException):
         )
 
 
+class ThumbnailNotReadyException(GetiBaseException):
+    """
+    Exception raised when a media thumbnail is missing and its generation has been queued.
+
+    :param media_id: ID of the media
+    """
+
+    def __init__(self, media_id: ID) -> None:
+        super().__init__(
+            message=(
+                f"Thumbnail for this media is not ready yet. Generation of the thumbnail has been queued. "
+                f"Media ID: `{media_id}`."
+            ),
+            error_code="thumbnail_not_ready",
+            http_status=http.HTTPStatus.ACCEPTED,
+        )
+
+
 class NoUserSettingsException(GetiBaseException):
     """
     Exception raised when user settings are requested but not yet in the database
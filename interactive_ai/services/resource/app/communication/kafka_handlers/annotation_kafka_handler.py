@@ -3,7 +3,8 @@
 import logging
 
 from geti_kafka_tools import BaseKafkaHandler, KafkaRawMessage, TopicSubscription
-from geti_types import ID, Singleton
+from geti_types import CTX_SESSION_VAR, ID, DatasetStorageIdentifier, Singleton
+from iai_core.services.annotation_statistics_service import AnnotationStatisticsService
 from iai_core.services.dataset_storage_filter_service import DatasetStorageFilterService
 from iai_core.session.session_propagation import setup_session_kafka
 
@@ -28,8 +29,8 @@ class AnnotationKafkaHandler(BaseKafkaHandler, metaclass=Singleton):
     @setup_session_kafka
     def on_new_annotation_scene(raw_message: KafkaRawMessage) -> None:
         """
-        Updates the DatasetStorageFilterDataRepo with new data from the most recent
-        annotation scene
+        Updates the DatasetStorageFilterDataRepo and the annotation statistics with new data
+        from the most recent annotation scene
         """
         value: dict = raw_message.value
         project_id = ID(value["project_id"])
@@ -40,3 +41,11 @@ class AnnotationKafkaHandler(BaseKafkaHandler, metaclass=Singleton):
             dataset_storage_id=dataset_storage_id,
             annotation_scene_id=annotation_scene_id,
         )
+        AnnotationStatisticsService.on_new_annotation_scene(
+            dataset_storage_identifier=DatasetStorageIdentifier(
+                workspace_id=CTX_SESSION_VAR.get().workspace_id,
+                project_id=project_id,
+                dataset_storage_id=dataset_storage_id,
+            ),
+            annotation_scene_id=annotation_scene_id,
+        )
@@ -3,6 +3,7 @@
 import logging
 
 from resource_management.media_manager import MediaManager
+from service.thumbnail_generation_service import ThumbnailGenerationService, ThumbnailPriority
 
 from geti_kafka_tools import BaseKafkaHandler, KafkaRawMessage, TopicSubscription
 from geti_types import ID, DatasetStorageIdentifier, Singleton
@@ -32,7 +33,9 @@ class ThumbVideoKafkaHandler(BaseKafkaHandler, metaclass=Singleton):
     @setup_session_kafka
     def generate_and_save_thumbnail_video(raw_message: KafkaRawMessage) -> None:
         """
-        Generates a thumbnail video for a video
+        Queues the generation of a thumbnail video for a video. Thumbnail videos requested by a client are
+        generated before the ones of newly uploaded videos, the latter can be generated in batches.
+        If the thumbnail generation queue is full, the thumbnail video is generated right away.
         """
         value: dict = raw_message.value
         dataset_storage_identifier = DatasetStorageIdentifier(
@@ -44,5 +47,15 @@ class ThumbVideoKafkaHandler(BaseKafkaHandler, metaclass=Singleton):
             dataset_storage_identifier=dataset_storage_identifier,
             video_id=ID(value["video_id"]),
         )
+        priority = ThumbnailPriority.REQUESTED if value.get("requested", False) else ThumbnailPriority.BACKGROUND
+        if ThumbnailGenerationService().submit(
+            dataset_storage_identifier=dataset_storage_identifier,
+            media=video,
+            generator=MediaManager.create_and_save_thumbnail_videos,
+            priority=priority,
+            batchable=True,
+        ):
+            logger.info(f"Queued the creation of the thumbnail video for video with ID {video.id_}")
+            return
         logger.info(f"Creating thumbnail video for video with ID {video.id_}")
         MediaManager.create_and_save_thumbnail_video(dataset_storage_identifier=dataset_storage_identifier, video=video)
@@ -31,6 +31,7 @@ from communication.rest_endpoints import (
     workspace_router,
 )
 from metrics.instruments import initialize_metrics
+from service.thumbnail_generation_service import ThumbnailGenerationService
 
 from geti_fastapi_tools.exceptions import GetiBaseException
 from geti_fastapi_tools.responses import error_response_rest
@@ -60,6 +61,7 @@ async def lifespan(app: FastAPI):  # type: ignore # noqa: ANN201
     AnnotationKafkaHandler().stop()
     MiscellaneousKafkaHandler().stop()
     ThumbVideoKafkaHandler().stop()
+    ThumbnailGenerationService().stop()
     if ENABLE_TRACING:
         FastAPITelemetry.uninstrument(app)
         KafkaTelemetry.uninstrument()
@@ -21,6 +21,7 @@ from geti_types import ID, DatasetStorageIdentifier, Singleton
 from iai_core.entities.dataset_storage import DatasetStorage, NullDatasetStorage
 from iai_core.entities.datasets import NullDataset
 from iai_core.repos import DatasetRepo, DatasetStorageRepo, ProjectRepo
+from iai_core.services.annotation_statistics_service import AnnotationStatisticsService
 from iai_core.utils.deletion_helpers import DeletionHelpers
 
 
@@ -52,6 +53,7 @@ class DatasetRESTController(metaclass=Singleton):
             use_for_training=False,
         )
         ProjectManager.add_dataset_storage(project, dataset_storage)
+        AnnotationStatisticsService.on_dataset_storage_created(dataset_storage.identifier)
         return DatasetStorageRESTViews.dataset_storage_to_rest(dataset_storage)
 
     @staticmethod
@@ -196,7 +198,8 @@ class DatasetRESTController(metaclass=Singleton):
         dataset_storage = DatasetStorageRepo(project.identifier).get_by_id(dataset_storage_id)
         if isinstance(dataset_storage, NullDatasetStorage):
             raise DatasetStorageNotFoundException(dataset_storage_id)
-        dataset = DatasetRepo(dataset_storage.identifier).get_by_id(dataset_id)
+        # The statistics are computed with count queries, so the items do not need to be loaded
+        dataset = DatasetRepo(dataset_storage.identifier).get_streaming_dataset(dataset_id)
         if isinstance(dataset, NullDataset):
             raise TrainingRevisionNotFoundException(dataset_id)
         return StatisticsUseCase.get_dataset_statistics(dataset_storage=dataset_storage, dataset=dataset)
@@ -147,11 +147,12 @@ class MediaRESTController(metaclass=Singleton):
         image_id: ID,
     ) -> BinaryIO:
         """
-        Return the image thumbnail in BinaryIO format.
+        Return the image thumbnail in BinaryIO format. If the thumbnail does not exist its generation is queued.
 
         :param dataset_storage_identifier: Identifier of the dataset storage containing the image
         :param image_id: ID of the image
         :return: Image thumbnail in BinaryIO format
+        :raises ThumbnailNotReadyException: if the thumbnail is missing and its generation has been queued
         """
         return MediaManager.get_image_thumbnail(
             dataset_storage_identifier=dataset_storage_identifier, image_id=image_id
@@ -164,11 +165,12 @@ class MediaRESTController(metaclass=Singleton):
         video_id: ID,
     ) -> BinaryIO:
         """
-        Get the video thumbnail in BinaryIO format. If the thumbnail does not exist one is generated.
+        Get the video thumbnail in BinaryIO format. If the thumbnail does not exist its generation is queued.
 
         :param dataset_storage_identifier: Identifier of the dataset storage containing the video
         :param video_id: ID of the video
         :return: Video thumbnail in BinaryIO format
+        :raises ThumbnailNotReadyException: if the thumbnail is missing and its generation has been queued
         """
         return MediaManager.get_video_thumbnail(
             dataset_storage_identifier=dataset_storage_identifier,
@@ -214,6 +216,7 @@ class MediaRESTController(metaclass=Singleton):
                     "workspace_id": dataset_storage_identifier.workspace_id,
                     "project_id": dataset_storage_identifier.project_id,
                     "dataset_storage_id": dataset_storage_identifier.dataset_storage_id,
+                    "requested": True,
                 },
                 key=str(video.id_).encode(),
                 headers_getter=lambda: CTX_SESSION_VAR.get().as_list_bytes(),
@@ -603,8 +606,9 @@ class MediaRESTController(metaclass=Singleton):
         query_results: QueryResults
         video_frame_indices: list[int] = []
         if dataset_id:
-            # If a dataset was specified, verify that it exists and has the 'training' purpose
-            dataset = DatasetRepo(dataset_storage_identifier).get_by_id(dataset_id)
+            # If a dataset was specified, verify that it exists and has the 'training' purpose;
+            # its items are not needed, so the dataset is streamed instead of being loaded in memory
+            dataset = DatasetRepo(dataset_storage_identifier).get_streaming_dataset(dataset_id)
             if isinstance(dataset, NullDataset):
                 raise TrainingRevisionNotFoundException(dataset_id)
             if dataset.purpose is not DatasetPurpose.TRAINING:
@@ -11,10 +11,15 @@ from fastapi import APIRouter, Depends, Query, Request, UploadFile
 from starlette.responses import Response
 
 from communication.constants import MAX_N_MEDIA_RETURNED
-from communication.exceptions import NotEnoughSpaceException
+from communication.exceptions import NotEnoughSpaceException, ThumbnailNotReadyException
 from communication.rest_controllers.media_controller import MediaRESTController
 from communication.rest_data_validator import MediaRestValidator
-from communication.rest_utils import convert_numpy_to_jpeg_response, send_file_from_path_or_url, stream_to_jpeg_response
+from communication.rest_utils import (
+    convert_numpy_to_jpeg_response,
+    send_file_from_path_or_url,
+    stream_to_jpeg_response,
+    thumbnail_placeholder_response,
+)
 from usecases.dataset_filter import DatasetFilter, DatasetFilterField, DatasetFilterSortDirection
 
 from geti_fastapi_tools.dependencies import (
@@ -240,10 +245,13 @@ def get_video_display(  # noqa: ANN201
         )
 
     if display_type == VideoDisplayType.thumb:
-        thumbnail = MediaRESTController.get_video_thumbnail(
-            dataset_storage_identifier=dataset_storage_identifier,
-            video_id=video_id,
-        )
+        try:
+            thumbnail = MediaRESTController.get_video_thumbnail(
+                dataset_storage_identifier=dataset_storage_identifier,
+                video_id=video_id,
+            )
+        except ThumbnailNotReadyException:
+            return thumbnail_placeholder_response()
         return stream_to_jpeg_response(stream=thumbnail, cache=True)
 
 
@@ -279,6 +287,7 @@ def media_query(
     limit: Annotated[int, Query(ge=1, le=MAX_N_MEDIA_RETURNED)] = MAX_N_MEDIA_RETURNED,
     sort_direction: SortDirection = SortDirection.asc,
     sort_by: SortBy = SortBy.media_name,
+    page_token: str | None = None,
 ) -> dict:
     """Query media in the dataset"""
     query = {} if request_json is None else request_json
@@ -288,6 +297,7 @@ def media_query(
         skip=skip,
         sort_direction=DatasetFilterSortDirection[sort_direction.upper()],
         sort_by=DatasetFilterField[sort_by.upper()],
+        page_token=page_token,
     )
     return MediaRESTController.get_filtered_items(
         dataset_storage_identifier=dataset_storage_identifier,
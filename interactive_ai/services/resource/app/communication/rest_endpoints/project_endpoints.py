@@ -8,10 +8,11 @@ from typing import Annotated, Any
 from fastapi import APIRouter, Depends, Query, Request
 from starlette.responses import JSONResponse, Response
 
+from communication.exceptions import ThumbnailNotReadyException
 from communication.rest_controllers.annotation_template_controller import AnnotationTemplateRESTController
 from communication.rest_controllers.media_controller import MediaRESTController
 from communication.rest_controllers.project_controller import ProjectRESTController
-from communication.rest_utils import project_query_data, stream_to_jpeg_response
+from communication.rest_utils import project_query_data, stream_to_jpeg_response, thumbnail_placeholder_response
 from features.feature_flags import FeatureFlag
 from managers.project_manager import ProjectManager
 
@@ -169,7 +170,10 @@ def get_project_thumbnail(
         dataset_storage_id=dataset_storage_id,
     )
 
-    thumbnail = MediaRESTController.get_project_thumbnail(dataset_storage_identifier=dataset_storage_identifier)
+    try:
+        thumbnail = MediaRESTController.get_project_thumbnail(dataset_storage_identifier=dataset_storage_identifier)
+    except ThumbnailNotReadyException:
+        return thumbnail_placeholder_response()
     return stream_to_jpeg_response(stream=thumbnail, cache=True)
 
 
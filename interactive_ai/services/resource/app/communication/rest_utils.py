@@ -1,6 +1,8 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 
+import functools
+import http
 import io
 import logging
 import os
@@ -16,11 +18,14 @@ from communication.constants import DEFAULT_N_PROJECTS_RETURNED, MAX_N_PROJECTS_
 
 from geti_telemetry_tools import unified_tracing
 from iai_core.repos.project_repo_helpers import ProjectQueryData, ProjectSortBy, ProjectSortDirection, SortDirection
+from iai_core.utils.constants import DEFAULT_THUMBNAIL_SIZE
 
 API_GATEWAY_VERSION = 10
 CACHE_CONTROL_HEADER = {"Cache-Control": "private, max-age=3600"}
 JPEG_EXTENSION = ".jpg"
 JPEG_MIME_TYPE = "image/jpeg"
+# Seconds after which the client should request a thumbnail again when its generation is in progress
+THUMBNAIL_RETRY_AFTER = 2
 logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
@@ -128,3 +133,28 @@ def stream_to_jpeg_response(stream: BinaryIO, cache: bool = False) -> StreamingR
     headers = CACHE_CONTROL_HEADER if cache else None
     stream.seek(0)
     return StreamingResponse(content=stream, media_type=JPEG_MIME_TYPE, headers=headers)
+
+
+@functools.cache
+def _get_thumbnail_placeholder() -> bytes:
+    """Encode the placeholder displayed while a thumbnail is being generated: a plain gray JPEG image."""
+    placeholder = np.full((DEFAULT_THUMBNAIL_SIZE, DEFAULT_THUMBNAIL_SIZE, 3), 128, dtype=np.uint8)
+    _, buffer_ = cv2.imencode(JPEG_EXTENSION, placeholder)
+    return buffer_.tobytes()
+
+
+def thumbnail_placeholder_response() -> Response:
+    """
+    Returns a placeholder JPEG image for a thumbnail whose generation is in progress.
+
+    The response has status 202 and must not be cached; the Retry-After header tells the client when to
+    request the thumbnail again.
+
+    :return: Response containing the placeholder image
+    """
+    return Response(
+        content=_get_thumbnail_placeholder(),
+        status_code=http.HTTPStatus.ACCEPTED,
+        media_type=JPEG_MIME_TYPE,
+        headers={"Cache-Control": "no-store", "Retry-After": str(THUMBNAIL_RETRY_AFTER)},
+    )
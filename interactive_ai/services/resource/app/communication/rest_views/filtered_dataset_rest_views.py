@@ -43,7 +43,16 @@ class FilteredDatasetRESTView:
         project_id = dataset_storage_identifier.project_id
         dataset_storage_id = dataset_storage_identifier.dataset_storage_id
 
-        if len(query_results.media_query_results) == dataset_filter.limit:
+        if query_results.next_page_token is not None:
+            # The next page is fetched with keyset pagination, which does not slow down on deep pages
+            next_page = (
+                f"/api/v1/organizations/{str(organization_id)}/workspaces/{str(workspace_id)}/projects/{str(project_id)}"
+                f"/datasets/{str(dataset_storage_id)}/media:query?limit={str(dataset_filter.limit)}"
+                f"&page_token={query_results.next_page_token}&sort_by={dataset_filter.sort_by.name.lower()}"
+                f"&sort_direction={dataset_filter.sort_direction.name.lower()}"
+            )
+            rest_views["next_page"] = next_page
+        elif len(query_results.media_query_results) == dataset_filter.limit:
             next_page = (
                 f"/api/v1/organizations/{str(organization_id)}/workspaces/{str(workspace_id)}/projects/{str(project_id)}"
                 f"/datasets/{str(dataset_storage_id)}/media:query?limit={str(dataset_filter.limit)}"
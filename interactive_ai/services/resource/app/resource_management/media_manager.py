@@ -7,6 +7,7 @@ import datetime
 import functools
 import logging
 import subprocess
+from collections.abc import Sequence
 from pathlib import Path
 from typing import BinaryIO
 
@@ -26,10 +27,12 @@ from communication.exceptions import (
     FileNotFoundException,
     ImageNotFoundException,
     ProjectLockedException,
+    ThumbnailNotReadyException,
     VideoFrameNotFoundException,
     VideoFrameOutOfRangeException,
     VideoNotFoundException,
 )
+from service.thumbnail_generation_service import ThumbnailGenerationService, ThumbnailGenerator, ThumbnailPriority
 
 from geti_fastapi_tools.exceptions import InvalidMediaException
 from geti_kafka_tools import publish_event
@@ -65,6 +68,9 @@ from media_utils import (
     get_media_roi_numpy,
 )
 
+# Maximum duration in seconds of the generation of a single thumbnail video
+THUMBNAIL_VIDEO_TIMEOUT = 885
+
 IMAGES = "images"
 VIDEOS = "videos"
 IMAGE = "image"
@@ -104,12 +110,13 @@ class MediaManager:
         video_id: ID,
     ) -> BinaryIO:
         """
-        Fetch a video frame from the repo and crop it to a thumbnail. Will try to use an
-        existing thumbnail, otherwise one is created and saved.
+        Fetch the thumbnail of a video. If the thumbnail is missing, the generation of a thumbnail from a frame
+        of the video is queued with priority.
 
         :param dataset_storage_identifier: Identifier of the dataset storage containing the video
         :param video_id: ID of the video to fetch from the repo
         :return BinaryIO: image bytes stream that is a RGB representation of the image thumbnail
+        :raises ThumbnailNotReadyException: if the thumbnail is missing and its generation has been queued
         """
         thumbnail_filename = Video.thumbnail_filename_by_video_id(str(video_id))
         try:
@@ -118,22 +125,14 @@ class MediaManager:
                 binary_interpreter=StreamBinaryInterpreter(),
             )
         except FileNotFoundError:
-            try:
-                video_numpy = MediaManager.get_video_frame_by_id(
-                    dataset_storage_identifier=dataset_storage_identifier,
-                    video_id=video_id,
-                )
-                return Media2DFactory.create_and_save_media_thumbnail(
-                    dataset_storage_identifier=dataset_storage_identifier,
-                    media_numpy=video_numpy,
-                    thumbnail_binary_filename=thumbnail_filename,
-                )
-            except FileNotFoundError:
-                raise FileNotFoundException(
-                    f"Attempted to fetch a video frame from the video, but the data was not "
-                    f"present in the repository."
-                    f"Video ID: `{video_id}`."
-                )
+            video = MediaManager.get_video_by_id(
+                dataset_storage_identifier=dataset_storage_identifier, video_id=video_id
+            )
+            return MediaManager._request_thumbnail_generation(
+                dataset_storage_identifier=dataset_storage_identifier,
+                media=video,
+                generator=MediaManager.create_and_save_video_thumbnails,
+            )
 
     @staticmethod
     def get_image_thumbnail(
@@ -141,11 +140,13 @@ class MediaManager:
         image_id: ID,
     ) -> BinaryIO:
         """
-        Return the image thumbnail in BinaryIO format. If the thumbnail file is missing it is generated.
+        Return the image thumbnail in BinaryIO format. If the thumbnail file is missing, its generation is queued
+        with priority.
 
         :param dataset_storage_identifier: Identifier of the dataset storage containing the image
         :param image_id: ID of the image
         :return: Image thumbnail in BinaryIO format
+        :raises ThumbnailNotReadyException: if the thumbnail is missing and its generation has been queued
         """
 
         thumbnail_filename = Image.thumbnail_filename_by_image_id(str(image_id))
@@ -158,11 +159,87 @@ class MediaManager:
             image = MediaManager.get_image_by_id(
                 dataset_storage_identifier=dataset_storage_identifier, image_id=image_id
             )
+            return MediaManager._request_thumbnail_generation(
+                dataset_storage_identifier=dataset_storage_identifier,
+                media=image,
+                generator=MediaManager.create_and_save_image_thumbnails,
+            )
+
+    @staticmethod
+    def _request_thumbnail_generation(
+        dataset_storage_identifier: DatasetStorageIdentifier,
+        media: Image | Video,
+        generator: ThumbnailGenerator,
+    ) -> BinaryIO:
+        """
+        Queue the generation of a missing thumbnail requested by a client ahead of the background requests.
+        If the thumbnail generation queue is full, the thumbnail is generated synchronously instead.
+
+        :param dataset_storage_identifier: Identifier of the dataset storage containing the media
+        :param media: Image or video whose thumbnail is missing
+        :param generator: Function generating and saving the thumbnail of the media
+        :return: Thumbnail in BinaryIO format, if it was generated synchronously
+        :raises ThumbnailNotReadyException: if the generation of the thumbnail has been queued
+        """
+        if ThumbnailGenerationService().submit(
+            dataset_storage_identifier=dataset_storage_identifier,
+            media=media,
+            generator=generator,
+            priority=ThumbnailPriority.REQUESTED,
+        ):
+            raise ThumbnailNotReadyException(media_id=media.id_)
+        generator(dataset_storage_identifier, [media])
+        return ThumbnailBinaryRepo(dataset_storage_identifier).get_by_filename(
+            filename=media.thumbnail_filename,
+            binary_interpreter=StreamBinaryInterpreter(),
+        )
+
+    @staticmethod
+    def create_and_save_image_thumbnails(
+        dataset_storage_identifier: DatasetStorageIdentifier,
+        images: Sequence[Image],
+    ) -> None:
+        """
+        Create and save the thumbnails of images.
+
+        :param dataset_storage_identifier: Identifier of the dataset storage containing the images
+        :param images: Images to create the thumbnails for
+        """
+        for image in images:
             image_numpy_data = get_image_numpy(dataset_storage_identifier=dataset_storage_identifier, image=image)
-            return Media2DFactory.create_and_save_media_thumbnail(
+            Media2DFactory.create_and_save_media_thumbnail(
                 dataset_storage_identifier=dataset_storage_identifier,
                 media_numpy=image_numpy_data,
-                thumbnail_binary_filename=thumbnail_filename,
+                thumbnail_binary_filename=image.thumbnail_filename,
+            )
+
+    @staticmethod
+    def create_and_save_video_thumbnails(
+        dataset_storage_identifier: DatasetStorageIdentifier,
+        videos: Sequence[Video],
+    ) -> None:
+        """
+        Create and save the thumbnails of videos from the frame in the middle of each video.
+
+        :param dataset_storage_identifier: Identifier of the dataset storage containing the videos
+        :param videos: Videos to create the thumbnails for
+        """
+        for video in videos:
+            try:
+                video_numpy = MediaManager.get_video_frame_by_id(
+                    dataset_storage_identifier=dataset_storage_identifier,
+                    video_id=video.id_,
+                )
+            except FileNotFoundError:
+                raise FileNotFoundException(
+                    f"Attempted to fetch a video frame from the video, but the data was not "
+                    f"present in the repository."
+                    f"Video ID: `{video.id_}`."
+                )
+            Media2DFactory.create_and_save_media_thumbnail(
+                dataset_storage_identifier=dataset_storage_identifier,
+                media_numpy=video_numpy,
+                thumbnail_binary_filename=video.thumbnail_filename,
             )
 
     @staticmethod
@@ -594,22 +671,47 @@ class MediaManager:
         video: Video,
     ) -> None:
         """
-        Creates and saves a video thumbnail. Tries to maintain aspect ratio up until
-        16:9 when generating the thumbnail video. Anything above that will be squared.
+        Creates and saves a video thumbnail. See `create_and_save_thumbnail_videos`.
+
+        :param dataset_storage_identifier: Identifier of the dataset storage containing the video
+        :param video: Base Video to use for thumbnail generation
+        """
+        MediaManager.create_and_save_thumbnail_videos(
+            dataset_storage_identifier=dataset_storage_identifier, videos=[video]
+        )
+
+    @staticmethod
+    def create_and_save_thumbnail_videos(
+        dataset_storage_identifier: DatasetStorageIdentifier,
+        videos: Sequence[Video],
+    ) -> None:
+        """
+        Creates and saves the thumbnail videos of a batch of videos with a single ffmpeg process. Tries to maintain
+        aspect ratio up until 16:9 when generating the thumbnail video. Anything above that will be squared.
         Thumbnail video is first written to a temporary file and then renamed to the
         original thumbnail video file path. This is done so any checks if the thumbnail
         video path already exists do not pass while the file is still being written to.
 
-        :param dataset_storage_identifier: Identifier of the dataset storage containing the video
-        :param video: Base Video to use for thumbnail generation
+        If ffmpeg fails on a batch of several videos, e.g. because one of them cannot be decoded, the thumbnail
+        videos are generated one video at a time so that the other videos of the batch still get their thumbnail.
+
+        :param dataset_storage_identifier: Identifier of the dataset storage containing the videos
+        :param videos: Base Videos to use for thumbnail generation
         """
-        VideoRepo(dataset_storage_identifier)
         thumbnail_binary_repo = ThumbnailBinaryRepo(dataset_storage_identifier)
         video_binary_repo = VideoBinaryRepo(dataset_storage_identifier)
-        # This checks if the video thumbnail has already been generated. If so,the
-        # thumbnail video is not generated
-        thumbnail_exists = thumbnail_binary_repo.exists(filename=video.thumbnail_video_filename)
-        if not thumbnail_exists:
+        # This checks if the video thumbnails have already been generated. If so, these
+        # thumbnail videos are not generated
+        videos = [
+            video for video in videos if not thumbnail_binary_repo.exists(filename=video.thumbnail_video_filename)
+        ]
+        if not videos:
+            return
+
+        input_args: list[str] = []
+        output_args: list[str] = []
+        tmp_thumbnail_paths: list[str] = []
+        for input_index, video in enumerate(videos):
             aspect_ratio = video.width / video.height
             target_resolution = f"{DEFAULT_THUMBNAIL_SIZE}:{DEFAULT_THUMBNAIL_SIZE}"
             if 1 < aspect_ratio < 1.8:
@@ -618,30 +720,35 @@ class MediaManager:
             tmp_thumbnail_path = thumbnail_binary_repo.create_path_for_temporary_file(
                 filename=video.thumbnail_video_filename, make_unique=False
             )
+            tmp_thumbnail_paths.append(tmp_thumbnail_path)
             video_path_or_url = str(video_binary_repo.get_path_or_presigned_url(filename=video.data_binary_filename))
-            process = subprocess.Popen(  # noqa: S603
-                [  # noqa: S607
-                    "ffmpeg",
-                    "-threads",
-                    "1",
-                    "-y",
-                    "-i",
-                    video_path_or_url,
-                    "-vf",
-                    f"scale={target_resolution}",
-                    "-r",
-                    "1",
-                    "-an",
-                    "-threads",
-                    "1",
-                    tmp_thumbnail_path,
-                ],
-            )
-            # Since this method is usually called from a Kafka event, this needs to complete within 15 minutes so the
-            # Kafka consumer is not kicked out for exceeding the polling interval.
-            exit_code = process.wait(timeout=885)
-            if exit_code != 0:
-                logger.warning(f"Failed writing thumbnail video for video {video.id_} with exit code: {exit_code}")
+            input_args += ["-i", video_path_or_url]
+            if len(videos) > 1:
+                # Each output is made from the video stream of the corresponding input
+                output_args += ["-map", f"{input_index}:v:0"]
+            output_args += ["-vf", f"scale={target_resolution}", "-r", "1", "-an", "-threads", "1", tmp_thumbnail_path]
+
+        process = subprocess.Popen(  # noqa: S603
+            ["ffmpeg", "-threads", "1", "-y", *input_args, *output_args],  # noqa: S607
+        )
+        try:
+            exit_code = process.wait(timeout=THUMBNAIL_VIDEO_TIMEOUT * len(videos))
+        except subprocess.TimeoutExpired:
+            process.kill()
+            exit_code = process.wait()
+        if exit_code != 0 and len(videos) > 1:
+            logger.warning(
+                f"Failed writing thumbnail videos for videos {[video.id_ for video in videos]} with exit code: "
+                f"{exit_code}, retrying one video at a time"
+            )
+            for video in videos:
+                MediaManager.create_and_save_thumbnail_videos(
+                    dataset_storage_identifier=dataset_storage_identifier, videos=[video]
+                )
+            return
+        if exit_code != 0:
+            logger.warning(f"Failed writing thumbnail video for video {videos[0].id_} with exit code: {exit_code}")
+        for video, tmp_thumbnail_path in zip(videos, tmp_thumbnail_paths):
             thumbnail_binary_repo.save(
                 data_source=tmp_thumbnail_path,
                 remove_source=True,
@@ -0,0 +1,206 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""This module contains the service generating media thumbnails in the background"""
+
+import heapq
+import itertools
+import logging
+import threading
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any
+
+from communication.constants import (
+    THUMBNAIL_GENERATION_QUEUE_SIZE,
+    THUMBNAIL_GENERATION_WORKERS,
+    THUMBNAIL_VIDEO_BATCH_SIZE,
+)
+
+from geti_types import CTX_SESSION_VAR, ID, DatasetStorageIdentifier, Session, Singleton, session_context
+from iai_core.entities.image import Image
+from iai_core.entities.video import Video
+
+logger = logging.getLogger(__name__)
+
+ThumbnailGenerator = Callable[[DatasetStorageIdentifier, Sequence[Any]], None]
+
+
+class ThumbnailPriority(IntEnum):
+    """
+    Priority of a thumbnail generation request, lower values are served first.
+
+    REQUESTED: the thumbnail is being requested by a client (e.g. the UI is displaying the media)
+    BACKGROUND: the thumbnail is generated ahead of time (e.g. after a media upload)
+    """
+
+    REQUESTED = 0
+    BACKGROUND = 1
+
+
+@dataclass(order=True)
+class _ThumbnailTask:
+    priority: ThumbnailPriority
+    sequence: int
+    key: tuple[ThumbnailGenerator, DatasetStorageIdentifier, ID] = field(compare=False)
+    dataset_storage_identifier: DatasetStorageIdentifier = field(compare=False)
+    media: Image | Video = field(compare=False)
+    generator: ThumbnailGenerator = field(compare=False)
+    batchable: bool = field(compare=False)
+    session: Session = field(compare=False)
+
+
+class ThumbnailGenerationService(metaclass=Singleton):
+    """
+    Generates media thumbnails with a bounded pool of worker threads, so that requests for missing thumbnails
+    do not have to wait for them to be created.
+
+    Requests for a media whose thumbnail is already queued or being generated are de-duplicated; a queued
+    request is promoted if the same media is requested again with a higher priority. Batchable requests with
+    the same generator and dataset storage are handed over to the generator together, up to
+    THUMBNAIL_VIDEO_BATCH_SIZE at a time.
+
+    :param max_workers: Number of worker threads generating thumbnails
+    :param max_queue_size: Maximum number of queued requests, further requests are rejected
+    :param max_batch_size: Maximum number of batchable requests passed to a generator at once
+    """
+
+    def __init__(
+        self,
+        max_workers: int = THUMBNAIL_GENERATION_WORKERS,
+        max_queue_size: int = THUMBNAIL_GENERATION_QUEUE_SIZE,
+        max_batch_size: int = THUMBNAIL_VIDEO_BATCH_SIZE,
+    ) -> None:
+        self._max_workers = max_workers
+        self._max_queue_size = max_queue_size
+        self._max_batch_size = max_batch_size
+        self._condition = threading.Condition()
+        # Heap of queued tasks; a task is stale (skipped) when it is no longer the queued task for its key
+        self._heap: list[_ThumbnailTask] = []
+        self._queued: dict[tuple[ThumbnailGenerator, DatasetStorageIdentifier, ID], _ThumbnailTask] = {}
+        self._in_progress: set[tuple[ThumbnailGenerator, DatasetStorageIdentifier, ID]] = set()
+        self._sequence = itertools.count()
+        self._workers: list[threading.Thread] = []
+        self._stopped = False
+
+    def submit(
+        self,
+        dataset_storage_identifier: DatasetStorageIdentifier,
+        media: Image | Video,
+        generator: ThumbnailGenerator,
+        priority: ThumbnailPriority = ThumbnailPriority.BACKGROUND,
+        batchable: bool = False,
+    ) -> bool:
+        """
+        Queue the generation of a thumbnail. The generator is called from a worker thread within the session
+        of the caller, with the dataset storage identifier and the list of media to generate the thumbnails for.
+
+        :param dataset_storage_identifier: Identifier of the dataset storage containing the media
+        :param media: Image or video to generate the thumbnail for
+        :param generator: Function generating and saving the thumbnails
+        :param priority: Priority of the request
+        :param batchable: Whether the generator can process several media of the dataset storage at once
+        :return: True if the thumbnail generation is queued or in progress, False if the request was rejected
+            because the queue is full or the service is stopped
+        """
+        key = (generator, dataset_storage_identifier, media.id_)
+        with self._condition:
+            if self._stopped:
+                return False
+            if key in self._in_progress:
+                return True
+            queued_task = self._queued.get(key)
+            if queued_task is not None and queued_task.priority <= priority:
+                return True
+            if queued_task is None and len(self._queued) >= self._max_queue_size:
+                logger.warning(f"Thumbnail generation queue is full, rejecting the request for media {media.id_}")
+                return False
+            # A task re-queued with a higher priority replaces the queued one, which becomes stale
+            task = _ThumbnailTask(
+                priority=priority,
+                sequence=next(self._sequence),
+                key=key,
+                dataset_storage_identifier=dataset_storage_identifier,
+                media=media,
+                generator=generator,
+                batchable=batchable,
+                session=CTX_SESSION_VAR.get(),
+            )
+            self._queued[key] = task
+            heapq.heappush(self._heap, task)
+            self._start_workers()
+            self._condition.notify()
+        return True
+
+    def stop(self, wait: bool = True) -> None:
+        """
+        Stop the workers. Queued requests are discarded, the ones in progress are completed.
+
+        :param wait: Whether to wait for the workers to complete the requests in progress
+        """
+        with self._condition:
+            self._stopped = True
+            self._heap.clear()
+            self._queued.clear()
+            self._condition.notify_all()
+        if wait:
+            for worker in self._workers:
+                worker.join()
+
+    def _start_workers(self) -> None:
+        """Start the worker threads on the first request. Must be called while holding the condition lock."""
+        if self._workers:
+            return
+        for index in range(self._max_workers):
+            worker = threading.Thread(target=self._work, name=f"Thumbnail_generation_worker_{index}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def _is_stale(self, task: _ThumbnailTask) -> bool:
+        return self._queued.get(task.key) is not task
+
+    def _take_batch(self) -> list[_ThumbnailTask] | None:
+        """
+        Wait for the next queued task and take it, together with the queued tasks it can be batched with.
+
+        :return: The tasks to process, or None if the service is stopped
+        """
+        with self._condition:
+            while True:
+                while self._heap and self._is_stale(self._heap[0]):
+                    heapq.heappop(self._heap)
+                if self._heap:
+                    break
+                if self._stopped:
+                    return None
+                self._condition.wait()
+            batch = [heapq.heappop(self._heap)]
+            if batch[0].batchable and self._max_batch_size > 1:
+                candidates = sorted(
+                    task
+                    for task in self._heap
+                    if task.batchable
+                    and task.generator == batch[0].generator
+                    and task.dataset_storage_identifier == batch[0].dataset_storage_identifier
+                    and not self._is_stale(task)
+                )
+                # The batched tasks stay in the heap, where they are skipped as stale
+                batch.extend(candidates[: self._max_batch_size - 1])
+            for task in batch:
+                del self._queued[task.key]
+                self._in_progress.add(task.key)
+            return batch
+
+    def _work(self) -> None:
+        while (batch := self._take_batch()) is not None:
+            first_task = batch[0]
+            media_ids = [task.media.id_ for task in batch]
+            try:
+                with session_context(session=first_task.session):
+                    first_task.generator(first_task.dataset_storage_identifier, [task.media for task in batch])
+            except Exception:
+                logger.exception(f"Failed to generate the thumbnails of media {media_ids}")
+            finally:
+                with self._condition:
+                    self._in_progress.difference_update(task.key for task in batch)
@@ -2,7 +2,10 @@
 
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+import base64
+import binascii
 import datetime
+import hashlib
 import re
 import typing
 import uuid
@@ -11,7 +14,7 @@ from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Any
 
-from bson import ObjectId
+from bson import ObjectId, json_util
 
 from communication.exceptions import InvalidFilterException
 
@@ -469,6 +472,73 @@ class DatasetFilterRuleGroup:
         return value
 
 
+@dataclass(frozen=True)
+class DatasetFilterPageToken:
+    """
+    Opaque token pointing to the next page of results of a dataset filter (keyset pagination).
+
+    Instead of skipping over all the items of the previous pages, the next page is matched directly
+    from the sort key and '_id' of the last item of the previous page. The counts of the matching media
+    are computed once, for the first page, and carried over to the next pages by the token.
+
+    :param filter_hash: Hash of the filter and sort order that the token was generated for
+    :param last_sort_value: Value of the sort field of the last item of the previous page
+    :param last_id: '_id' of the last item of the previous page
+    :param matching_images_count: Number of images matching the filter
+    :param matching_videos_count: Number of videos matching the filter
+    :param matching_video_frames_count: Number of video frames matching the filter
+    """
+
+    filter_hash: str
+    last_sort_value: Any
+    last_id: Any
+    matching_images_count: int
+    matching_videos_count: int
+    matching_video_frames_count: int
+
+    def encode(self) -> str:
+        """
+        Serialize the token to an opaque URL-safe string
+        """
+        # Extended JSON is used to preserve the type of ObjectId and datetime values
+        serialized = json_util.dumps(
+            {
+                "f": self.filter_hash,
+                "v": self.last_sort_value,
+                "i": self.last_id,
+                "c": [
+                    self.matching_images_count,
+                    self.matching_videos_count,
+                    self.matching_video_frames_count,
+                ],
+            }
+        )
+        return base64.urlsafe_b64encode(serialized.encode()).decode()
+
+    @classmethod
+    def decode(cls, token: str) -> "DatasetFilterPageToken":
+        """
+        Deserialize a token from the string generated by encode
+
+        :param token: Encoded token
+        :return: DatasetFilterPageToken
+        :raises InvalidFilterException: if the token is malformed
+        """
+        try:
+            token_dict = json_util.loads(base64.urlsafe_b64decode(token.encode()))
+            images_count, videos_count, video_frames_count = token_dict["c"]
+            return cls(
+                filter_hash=token_dict["f"],
+                last_sort_value=token_dict["v"],
+                last_id=token_dict["i"],
+                matching_images_count=int(images_count),
+                matching_videos_count=int(videos_count),
+                matching_video_frames_count=int(video_frames_count),
+            )
+        except (binascii.Error, ValueError, TypeError, KeyError):
+            raise InvalidFilterException(f"Invalid page token provided: '{token}'")
+
+
 @dataclass
 class DatasetFilter:
     """
@@ -482,6 +552,7 @@ class DatasetFilter:
     sort_by: FilterField
     sort_direction: DatasetFilterSortDirection
     id_: str
+    page_token: DatasetFilterPageToken | None = None
 
     @classmethod
     def from_dict(
@@ -491,6 +562,7 @@ class DatasetFilter:
         skip: int = 0,
         sort_by: FilterField = DatasetFilterField.MEDIA_NAME,
         sort_direction: DatasetFilterSortDirection = DatasetFilterSortDirection.ASC,
+        page_token: str | None = None,
     ) -> "DatasetFilter":
         """
         Generate a DatasetFilter object from a dictionary.
@@ -500,10 +572,13 @@ class DatasetFilter:
         :param skip: How many items to skip ahead of. Used for pagination
         :param sort_by: Field to sort on
         :param sort_direction: Direction to sort the sort_by field
+        :param page_token: Optional token returned with the previous page, to fetch the next page
+            with keyset pagination. If provided, 'skip' is ignored.
         :return: DatasetFilter
         """
+        dataset_filter: DatasetFilter
         if query == {}:
-            return NullDatasetFilter(
+            dataset_filter = NullDatasetFilter(
                 limit=limit,
                 skip=skip,
                 _ruleset=DatasetFilterRuleGroup(group_of_rules=[]),
@@ -511,7 +586,29 @@ class DatasetFilter:
                 sort_direction=sort_direction,
                 id_=uuid.uuid4().hex[:16],
             )
+        else:
+            dataset_filter = cls._from_query(
+                query=query, limit=limit, skip=skip, sort_by=sort_by, sort_direction=sort_direction
+            )
+        if page_token is not None:
+            decoded_page_token = DatasetFilterPageToken.decode(page_token)
+            if decoded_page_token.filter_hash != dataset_filter.compute_hash():
+                raise InvalidFilterException(
+                    "The page token was generated for a different filter or sort order than the requested one."
+                )
+            dataset_filter.page_token = decoded_page_token
+        return dataset_filter
 
+    @classmethod
+    def _from_query(
+        cls,
+        query: dict,
+        limit: int,
+        skip: int,
+        sort_by: FilterField,
+        sort_direction: DatasetFilterSortDirection,
+    ) -> "DatasetFilter":
+        """Generate a DatasetFilter object from a non-empty dictionary of rules"""
         is_media_score_filter = isinstance(sort_by, MediaScoreFilterField)
         rule_set = DatasetFilterRuleGroup.from_dict(query, is_media_score_filter=is_media_score_filter)
         if len(rule_set.group_of_rules) == 0:
@@ -557,20 +654,106 @@ class DatasetFilter:
             }
         }
 
+    def compute_hash(self) -> str:
+        """
+        Computes a hash of the filter rules and sort order, used to bind page tokens to the filter
+        """
+        serialized = json_util.dumps(
+            [
+                self.generate_match_query(),
+                self.sort_by.column_name,
+                self.sort_direction.value,
+            ],
+            sort_keys=True,
+        )
+        return hashlib.sha256(serialized.encode()).hexdigest()[:32]
+
+    def generate_keyset_match_query(self) -> dict:
+        """
+        Creates a query that matches the items sorted after the last item of the previous page,
+        as pointed by the page token.
+
+        Items with null or missing sort value are sorted before any other value in ascending order
+        and after any other value in descending order, consistently with the MongoDB sort order.
+
+        :return: keyset match query
+        :raises ValueError: if the filter has no page token
+        """
+        if self.page_token is None:
+            raise ValueError("A page token is required to generate the keyset match query")
+        column = self.sort_by.column_name
+        last_value = self.page_token.last_sort_value
+        last_id = self.page_token.last_id
+        if self.sort_direction == DatasetFilterSortDirection.ASC:
+            if last_value is None:
+                conditions = [{column: {"$ne": None}}, {column: None, "_id": {"$gt": last_id}}]
+            else:
+                conditions = [{column: {"$gt": last_value}}, {column: last_value, "_id": {"$gt": last_id}}]
+        elif last_value is None:
+            conditions = [{column: None, "_id": {"$lt": last_id}}]
+        else:
+            conditions = [
+                {column: {"$lt": last_value}},
+                {column: last_value, "_id": {"$lt": last_id}},
+                {column: None},
+            ]
+        return {"$match": {"$or": conditions}}
+
+    def generate_pagination_stages(self, group_stage: dict | None = None) -> list[dict]:
+        """
+        Creates the pipeline stages to get one page of results. If the filter has a page token, the
+        page is matched by keyset, otherwise the dataset filter skip is applied.
+
+        :param group_stage: dict containing MongoDB group stage in case video frames should be grouped by video
+        :return: list of pipeline stages
+        """
+        pagination_pipeline: list[dict] = [] if group_stage is None else [group_stage]
+        if self.page_token is not None:
+            pagination_pipeline.append(self.generate_keyset_match_query())
+            pagination_pipeline.append(self.generate_sort_query())
+        else:
+            pagination_pipeline.append(self.generate_sort_query())
+            pagination_pipeline.append({"$skip": self.skip})
+        pagination_pipeline.append({"$limit": self.limit})
+        return pagination_pipeline
+
+    def generate_next_page_token(
+        self,
+        last_doc: dict,
+        matching_images_count: int,
+        matching_videos_count: int,
+        matching_video_frames_count: int,
+    ) -> DatasetFilterPageToken:
+        """
+        Creates the token pointing to the page after the one ending with last_doc
+
+        :param last_doc: Last document of the current page
+        :param matching_images_count: Number of images matching the filter
+        :param matching_videos_count: Number of videos matching the filter
+        :param matching_video_frames_count: Number of video frames matching the filter
+        :return: DatasetFilterPageToken
+        """
+        last_sort_value: Any = last_doc
+        for key in self.sort_by.column_name.split("."):
+            last_sort_value = last_sort_value.get(key) if isinstance(last_sort_value, dict) else None
+        return DatasetFilterPageToken(
+            filter_hash=self.compute_hash(),
+            last_sort_value=last_sort_value,
+            last_id=last_doc["_id"],
+            matching_images_count=matching_images_count,
+            matching_videos_count=matching_videos_count,
+            matching_video_frames_count=matching_video_frames_count,
+        )
+
     def generate_pagination_query(self, group_stage: dict | None = None) -> dict:
         """
-        Creates a query that can be used to paginate results based on dataset filter skip and limit
+        Creates a query that can be used to paginate results based on dataset filter skip and limit,
+        and to count the matching media
 
         :param group_stage: dict containing MongoDB group stage in case video frames should be grouped by video
         :return: pagination query
         """
-        pagination_pipeline = [
-            self.generate_sort_query(),
-            {"$skip": self.skip},
-            {"$limit": self.limit},
-        ]
-        if group_stage is not None:
-            pagination_pipeline.insert(0, group_stage)
+        pagination_pipeline = self.generate_pagination_stages(group_stage=group_stage)
 
         return {
             "$facet": {
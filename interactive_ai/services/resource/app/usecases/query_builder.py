@@ -69,7 +69,8 @@ class MediaQueryResult:
 class QueryResults:
     """
     This class can be used to store resulting media identifiers from a query and the
-    counts of each matched media type. Also contains the skip integer for the next page.
+    counts of each matched media type. Also contains the skip integer and, if there may be
+    more results, the keyset pagination token for the next page.
     """
 
     media_query_results: list[MediaQueryResult]
@@ -79,6 +80,7 @@ class QueryResults:
     matching_video_frames_count: int
     total_images_count: int
     total_videos_count: int
+    next_page_token: str | None = None
 
     @property
     def media_identifiers(self) -> list[MediaIdentifierEntity]:
@@ -279,10 +281,12 @@ class QueryBuilder:
         DatasetStorage and counts the amount of images, videos and video frames in the
         results.
 
+        If the dataset filter has a page token, the page is fetched with keyset pagination and
+        the counts are taken from the token instead of being recomputed.
+
         :param dataset_filter: Filter to select find media items
         :param dataset_storage_identifier: DatasetStorageIdentifier to initialize repo which items need
         to be found in
-        :param video_id: ID of a video to find frames for
         :return: a QueryResults object with the media identifiers and counts per matched
         media category.
         """
@@ -314,9 +318,12 @@ class QueryBuilder:
                 "preprocessing": {"$first": "$preprocessing"},
             },
         }
-        query.append(dataset_filter.generate_pagination_query(group_stage=group_stage))
-
-        doc = repo.aggregate_read(query, collation=Collation(locale="en_US")).next()
+        if dataset_filter.page_token is None:
+            query.append(dataset_filter.generate_pagination_query(group_stage=group_stage))
+            doc = repo.aggregate_read(query, collation=Collation(locale="en_US")).next()
+        else:
+            query.extend(dataset_filter.generate_pagination_stages(group_stage=group_stage))
+            doc = {"paginated_results": list(repo.aggregate_read(query, collation=Collation(locale="en_US")))}
         total_images = repo.count(extra_filter={"media_identifier.type": "image"})
         total_videos = repo.count(extra_filter={"media_identifier.type": "video"})
 
@@ -480,6 +487,7 @@ class QueryBuilder:
     ) -> QueryResults:
         """
         Create a QueryResults object from a database result object and dataset filter.
+        If the dataset filter has a page token, the counts of the matching media are taken from it.
 
         :param doc: the result object from database
         :param dataset_filter: the dataset filter object
@@ -540,9 +548,23 @@ class QueryBuilder:
                 )
             )
 
-        matching_images_count = doc["image_count"][0]["count"] if doc["image_count"] else 0
-        matching_videos_count = doc["video_count"][0]["count"] if doc["video_count"] else 0
-        matching_video_frames_count = doc["video_frame_count"][0]["count"] if doc["video_frame_count"] else 0
+        if dataset_filter.page_token is not None:
+            matching_images_count = dataset_filter.page_token.matching_images_count
+            matching_videos_count = dataset_filter.page_token.matching_videos_count
+            matching_video_frames_count = dataset_filter.page_token.matching_video_frames_count
+        else:
+            matching_images_count = doc["image_count"][0]["count"] if doc["image_count"] else 0
+            matching_videos_count = doc["video_count"][0]["count"] if doc["video_count"] else 0
+            matching_video_frames_count = doc["video_frame_count"][0]["count"] if doc["video_frame_count"] else 0
+
+        next_page_token = None
+        if docs and len(docs) == dataset_filter.limit:
+            next_page_token = dataset_filter.generate_next_page_token(
+                last_doc=docs[-1],
+                matching_images_count=matching_images_count,
+                matching_videos_count=matching_videos_count,
+                matching_video_frames_count=matching_video_frames_count,
+            ).encode()
 
         return QueryResults(
             media_query_results=media_query_results,
@@ -552,6 +574,7 @@ class QueryBuilder:
             matching_video_frames_count=matching_video_frames_count,
             total_images_count=total_images,
             total_videos_count=total_videos,
+            next_page_token=next_page_token,
         )
 
     @staticmethod
@@ -36,7 +36,6 @@ from iai_core.entities.model import Model, NullModel
 from iai_core.entities.project import Project
 from iai_core.entities.subset import Subset
 from iai_core.repos import (
-    AnnotationSceneRepo,
     AnnotationSceneStateRepo,
     DatasetRepo,
     EvaluationResultRepo,
@@ -45,6 +44,7 @@ from iai_core.repos import (
     ProjectRepo,
     VideoRepo,
 )
+from iai_core.services.annotation_statistics_service import AnnotationStatisticsService
 
 logger = logging.getLogger(__name__)
 
@@ -396,14 +396,15 @@ class StatisticsUseCase:
         :param include_empty: whether to include the empty label in the stats
         """
         labels = task_node_label_schema.get_labels(include_empty=include_empty)
-        ann_scene_repo = AnnotationSceneRepo(dataset_storage_identifier)
         label_ids = [label.id_ for label in labels]
         (
             obj_sizes_per_label,
             label_count_per_annotation,
             label_count_per_shape,
-        ) = ann_scene_repo.get_annotation_count_and_object_sizes(
-            label_ids=label_ids, max_object_sizes_per_label=MAX_OBJECT_SIZES_PER_LABEL
+        ) = AnnotationStatisticsService.get_annotation_count_and_object_sizes(
+            dataset_storage_identifier=dataset_storage_identifier,
+            label_ids=label_ids,
+            max_object_sizes_per_label=MAX_OBJECT_SIZES_PER_LABEL,
         )
 
         computed_size_distribution_per_label = {
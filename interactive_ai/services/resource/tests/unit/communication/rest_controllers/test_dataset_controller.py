@@ -5,13 +5,18 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from communication.exceptions import DatasetStorageAlreadyExistsException, MaxNumberOfDatasetsException
+from communication.exceptions import (
+    DatasetStorageAlreadyExistsException,
+    MaxNumberOfDatasetsException,
+    TrainingRevisionNotFoundException,
+)
 from communication.rest_controllers import DatasetRESTController
 from communication.rest_views.dataset_storage_rest_views import NAME, USE_FOR_TRAINING
 from managers.project_manager import ProjectManager
 
 from geti_fastapi_tools.exceptions import BadRequestException
 from geti_types import ID
+from iai_core.entities.datasets import NullDataset
 from iai_core.entities.project import Project
 from iai_core.repos import DatasetStorageRepo
 
@@ -149,7 +154,7 @@ class TestDatasetRESTControllerUnit(unittest.TestCase):
         mock_dataset = MagicMock()
         mock_get_project.return_value = mock_project
         mock_dataset_storage_repo.return_value.get_by_id.return_value = mock_dataset_storage
-        mock_dataset_repo.return_value.get_by_id.return_value = mock_dataset
+        mock_dataset_repo.return_value.get_streaming_dataset.return_value = mock_dataset
         mock_get_stats.return_value = {"dataset_stats": "data"}
 
         result = DatasetRESTController.get_dataset_statistics(project_id, dataset_storage_id, dataset_id)
@@ -157,5 +162,28 @@ class TestDatasetRESTControllerUnit(unittest.TestCase):
         self.assertEqual(result, {"dataset_stats": "data"})
         mock_get_project.assert_called_once_with(project_id=project_id)
         mock_dataset_storage_repo.return_value.get_by_id.assert_called_once_with(dataset_storage_id)
-        mock_dataset_repo.return_value.get_by_id.assert_called_once_with(dataset_id)
+        mock_dataset_repo.return_value.get_streaming_dataset.assert_called_once_with(dataset_id)
+        mock_dataset_repo.return_value.get_by_id.assert_not_called()
         mock_get_stats.assert_called_once_with(dataset_storage=mock_dataset_storage, dataset=mock_dataset)
+
+    @patch("communication.rest_controllers.dataset_controller.ProjectManager.get_project_by_id")
+    @patch("communication.rest_controllers.dataset_controller.DatasetStorageRepo")
+    @patch("communication.rest_controllers.dataset_controller.DatasetRepo")
+    @patch("communication.rest_controllers.dataset_controller.StatisticsUseCase.get_dataset_statistics")
+    def test_get_dataset_statistics_dataset_not_found(
+        self,
+        mock_get_stats,
+        mock_dataset_repo,
+        mock_dataset_storage_repo,
+        mock_get_project,
+    ):
+        dataset_id = ID("dataset_id")
+        mock_get_project.return_value = MagicMock()
+        mock_dataset_storage_repo.return_value.get_by_id.return_value = MagicMock()
+        mock_dataset_repo.return_value.get_streaming_dataset.return_value = NullDataset()
+
+        with pytest.raises(TrainingRevisionNotFoundException):
+            DatasetRESTController.get_dataset_statistics(ID("project_id"), ID("dataset_storage_id"), dataset_id)
+
+        mock_dataset_repo.return_value.get_streaming_dataset.assert_called_once_with(dataset_id)
+        mock_get_stats.assert_not_called()
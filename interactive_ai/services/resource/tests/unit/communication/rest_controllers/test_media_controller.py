@@ -594,6 +594,7 @@ class TestMediaRESTController:
                     "project_id": dataset_storage.identifier.project_id,
                     "dataset_storage_id": fxt_project.get_training_dataset_storage().id_,
                     "video_id": video.id_,
+                    "requested": True,
                 },
                 key=str(video.id_).encode(),
                 headers_getter=ANY,
@@ -645,7 +646,7 @@ class TestMediaRESTController:
                 "get_dataset_storage_by_id",
                 return_value=dataset_storage,
             ) as mock_get_dataset_storage_by_id,
-            patch.object(DatasetRepo, "get_by_id", return_value=dataset) as mock_get_dataset,
+            patch.object(DatasetRepo, "get_streaming_dataset", return_value=dataset) as mock_get_dataset,
             patch.object(
                 AnnotationManager,
                 "get_media_states_per_task",
@@ -671,7 +672,7 @@ class TestMediaRESTController:
                 project=fxt_project, dataset_storage_id=dataset_storage.id_
             )
             if lazyfxt_dataset_id:
-                mock_get_dataset.assert_called_once()
+                mock_get_dataset.assert_called_once_with(lazyfxt_dataset_id)
             else:
                 mock_get_dataset.assert_not_called()
             mock_get_media_states.assert_called_once_with(
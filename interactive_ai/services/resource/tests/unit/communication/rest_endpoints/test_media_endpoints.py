@@ -16,6 +16,7 @@ from starlette import status
 from testfixtures import compare
 
 from communication.constants import MAX_N_MEDIA_RETURNED
+from communication.exceptions import ThumbnailNotReadyException
 from communication.rest_controllers import MediaRESTController
 from usecases.dataset_filter import DatasetFilter, DatasetFilterField, DatasetFilterSortDirection
 
@@ -366,6 +367,24 @@ class TestMediaRESTEndpoint:
             video_id=ID(DUMMY_VIDEO_ID),
         )
 
+    def test_media_video_display_endpoint_thumb_not_ready(self, fxt_resource_rest) -> None:
+        # Arrange
+        endpoint = f"{API_VIDEO_PATTERN}/{DUMMY_VIDEO_ID}/display/{THUMB}"
+
+        # Act
+        with patch.object(
+            MediaRESTController,
+            "get_video_thumbnail",
+            side_effect=ThumbnailNotReadyException(media_id=ID(DUMMY_VIDEO_ID)),
+        ):
+            result = fxt_resource_rest.get(endpoint)
+
+        # Assert
+        assert result.status_code == HTTPStatus.ACCEPTED
+        assert result.headers["content-type"] == "image/jpeg"
+        assert result.headers["cache-control"] == "no-store"
+        assert "retry-after" in result.headers
+
     def test_media_video_display_endpoint_thumb_stream(self, fxt_resource_rest, request) -> None:
         # Arrange
         endpoint = f"{API_VIDEO_PATTERN}/{DUMMY_VIDEO_ID}/display/{THUMB_STREAM}"
@@ -1,14 +1,18 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 
+from http import HTTPStatus
 from pathlib import Path
 
+import cv2
+import numpy as np
 from starlette.responses import FileResponse, RedirectResponse
 
 from communication.constants import DEFAULT_N_PROJECTS_RETURNED
-from communication.rest_utils import project_query_data, send_file_from_path_or_url
+from communication.rest_utils import project_query_data, send_file_from_path_or_url, thumbnail_placeholder_response
 
 from iai_core.repos.project_repo_helpers import ProjectQueryData, ProjectSortBy, ProjectSortDirection, SortDirection
+from iai_core.utils.constants import DEFAULT_THUMBNAIL_SIZE
 
 
 class TestRestUtils:
@@ -56,3 +60,12 @@ class TestRestUtils:
             sort_direction=ProjectSortDirection.DSC,
             with_size=False,
         )
+
+    def test_thumbnail_placeholder_response(self) -> None:
+        response = thumbnail_placeholder_response()
+
+        assert response.status_code == HTTPStatus.ACCEPTED
+        assert response.media_type == "image/jpeg"
+        assert response.headers["Cache-Control"] == "no-store"
+        placeholder = cv2.imdecode(np.frombuffer(response.body, dtype=np.uint8), cv2.IMREAD_COLOR)
+        assert placeholder.shape == (DEFAULT_THUMBNAIL_SIZE, DEFAULT_THUMBNAIL_SIZE, 3)
@@ -10,12 +10,14 @@ from communication.exceptions import (
     FileNotFoundException,
     ImageNotFoundException,
     ProjectLockedException,
+    ThumbnailNotReadyException,
     VideoFrameNotFoundException,
     VideoFrameOutOfRangeException,
     VideoNotFoundException,
 )
 from communication.rest_views.filtered_dataset_rest_views import FilteredDatasetRESTView
 from resource_management.media_manager import IMAGE_EXT_SAVE_MAPPING, MediaManager
+from service.thumbnail_generation_service import ThumbnailGenerationService, ThumbnailPriority
 from usecases.dataset_filter import DatasetFilter
 from usecases.query_builder import MediaQueryResult, QueryResults
 
@@ -801,6 +803,100 @@ class TestMediaManager:
                 dst_file_name=fxt_video_entity.thumbnail_video_filename,
             )
 
+    def test_create_and_save_thumbnail_videos_batch(self, fxt_dataset_storage_identifier, fxt_video_entity) -> None:
+        videos = [fxt_video_entity, MagicMock(width=100, height=100, thumbnail_video_filename="other_thumbnail.mp4")]
+        process = MagicMock()
+        process.wait.return_value = 0
+        with (
+            patch.object(ThumbnailBinaryRepo, "exists", return_value=False),
+            patch.object(
+                ThumbnailBinaryRepo, "create_path_for_temporary_file", side_effect=["tmp_path_1", "tmp_path_2"]
+            ),
+            patch.object(VideoBinaryRepo, "get_path_or_presigned_url", side_effect=["url_1", "url_2"]),
+            patch.object(ThumbnailBinaryRepo, "save", return_value=None) as patch_save,
+            patch("resource_management.media_manager.subprocess.Popen", return_value=process) as patch_popen,
+        ):
+            MediaManager.create_and_save_thumbnail_videos(
+                dataset_storage_identifier=fxt_dataset_storage_identifier,
+                videos=videos,
+            )
+
+        # A single ffmpeg process generates both thumbnail videos
+        patch_popen.assert_called_once_with(
+            [
+                *("ffmpeg", "-threads", "1", "-y", "-i", "url_1", "-i", "url_2"),
+                *("-map", "0:v:0", "-vf", ANY, "-r", "1", "-an", "-threads", "1", "tmp_path_1"),
+                *("-map", "1:v:0", "-vf", "scale=256:256", "-r", "1", "-an", "-threads", "1", "tmp_path_2"),
+            ]
+        )
+        patch_save.assert_has_calls(
+            [
+                call(
+                    data_source="tmp_path_1",
+                    remove_source=True,
+                    dst_file_name=fxt_video_entity.thumbnail_video_filename,
+                ),
+                call(data_source="tmp_path_2", remove_source=True, dst_file_name="other_thumbnail.mp4"),
+            ]
+        )
+
+    def test_create_and_save_thumbnail_videos_batch_failure(
+        self, fxt_dataset_storage_identifier, fxt_video_entity
+    ) -> None:
+        videos = [fxt_video_entity, MagicMock(width=100, height=100, thumbnail_video_filename="other_thumbnail.mp4")]
+        process = MagicMock()
+        process.wait.side_effect = [1, 0, 1]
+        with (
+            patch.object(ThumbnailBinaryRepo, "exists", return_value=False),
+            patch.object(ThumbnailBinaryRepo, "create_path_for_temporary_file", return_value="tmp_path"),
+            patch.object(VideoBinaryRepo, "get_path_or_presigned_url", return_value="url"),
+            patch.object(ThumbnailBinaryRepo, "save", return_value=None) as patch_save,
+            patch("resource_management.media_manager.subprocess.Popen", return_value=process) as patch_popen,
+        ):
+            MediaManager.create_and_save_thumbnail_videos(
+                dataset_storage_identifier=fxt_dataset_storage_identifier,
+                videos=videos,
+            )
+
+        # The failed batch is retried one video at a time
+        assert patch_popen.call_count == 3
+        assert patch_save.call_count == 2
+
+    def test_get_image_thumbnail_missing(self, fxt_dataset_storage_identifier, fxt_image_entity) -> None:
+        with (
+            patch.object(ThumbnailBinaryRepo, "get_by_filename", side_effect=FileNotFoundError),
+            patch.object(MediaManager, "get_image_by_id", return_value=fxt_image_entity),
+            patch.object(ThumbnailGenerationService, "submit", return_value=True) as mock_submit,
+            pytest.raises(ThumbnailNotReadyException),
+        ):
+            MediaManager.get_image_thumbnail(
+                dataset_storage_identifier=fxt_dataset_storage_identifier,
+                image_id=fxt_image_entity.id_,
+            )
+
+        mock_submit.assert_called_once_with(
+            dataset_storage_identifier=fxt_dataset_storage_identifier,
+            media=fxt_image_entity,
+            generator=MediaManager.create_and_save_image_thumbnails,
+            priority=ThumbnailPriority.REQUESTED,
+        )
+
+    def test_get_video_thumbnail_missing_queue_full(self, fxt_dataset_storage_identifier, fxt_video_entity) -> None:
+        thumbnail = io.BytesIO(b"thumbnail")
+        with (
+            patch.object(ThumbnailBinaryRepo, "get_by_filename", side_effect=[FileNotFoundError, thumbnail]),
+            patch.object(MediaManager, "get_video_by_id", return_value=fxt_video_entity),
+            patch.object(ThumbnailGenerationService, "submit", return_value=False),
+            patch.object(MediaManager, "create_and_save_video_thumbnails") as mock_create_thumbnails,
+        ):
+            result = MediaManager.get_video_thumbnail(
+                dataset_storage_identifier=fxt_dataset_storage_identifier,
+                video_id=fxt_video_entity.id_,
+            )
+
+        mock_create_thumbnails.assert_called_once_with(fxt_dataset_storage_identifier, [fxt_video_entity])
+        assert result == thumbnail
+
     def test_get_presigned_url_for_video(self, fxt_dataset_storage_identifier, fxt_video_entity) -> None:
         with (
             patch.object(VideoRepo, "get_by_id", return_value=fxt_video_entity) as mock_get_by_id,
@@ -0,0 +1,132 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from service.thumbnail_generation_service import ThumbnailGenerationService, ThumbnailPriority
+
+from geti_types import CTX_SESSION_VAR, ID
+
+TIMEOUT = 10
+
+
+def _make_media(media_id: str) -> MagicMock:
+    media = MagicMock()
+    media.id_ = ID(media_id)
+    return media
+
+
+class _BlockingGenerator:
+    """Generator recording its calls, blocking on its first call until released"""
+
+    def __init__(self) -> None:
+        self.calls: list[list[ID]] = []
+        self.sessions: list = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.done = threading.Semaphore(0)
+
+    def __call__(self, dataset_storage_identifier, media) -> None:
+        self.calls.append([item.id_ for item in media])
+        self.sessions.append(CTX_SESSION_VAR.get())
+        self.started.set()
+        self.release.wait(timeout=TIMEOUT)
+        self.done.release()
+
+    def wait_for_calls(self, n_calls: int) -> None:
+        for _ in range(n_calls):
+            assert self.done.acquire(timeout=TIMEOUT)
+
+
+@pytest.fixture
+def fxt_thumbnail_generation_service():
+    def _build(**kwargs) -> ThumbnailGenerationService:
+        ThumbnailGenerationService._instance = None
+        return ThumbnailGenerationService(**kwargs)
+
+    yield _build
+    if ThumbnailGenerationService._instance is not None:
+        ThumbnailGenerationService().stop(wait=False)
+    ThumbnailGenerationService._instance = None
+
+
+class TestThumbnailGenerationService:
+    def test_submit(self, fxt_thumbnail_generation_service, fxt_dataset_storage_identifier, fxt_session_ctx) -> None:
+        service = fxt_thumbnail_generation_service(max_workers=1)
+        generator = _BlockingGenerator()
+        generator.release.set()
+
+        queued = service.submit(
+            dataset_storage_identifier=fxt_dataset_storage_identifier,
+            media=_make_media("image_1"),
+            generator=generator,
+        )
+        generator.wait_for_calls(1)
+
+        assert queued
+        assert generator.calls == [[ID("image_1")]]
+        assert generator.sessions == [fxt_session_ctx]
+
+    def test_submit_deduplicates_and_prioritizes(
+        self, fxt_thumbnail_generation_service, fxt_dataset_storage_identifier
+    ) -> None:
+        service = fxt_thumbnail_generation_service(max_workers=1)
+        generator = _BlockingGenerator()
+        # Keep the only worker busy while the other requests are queued
+        service.submit(fxt_dataset_storage_identifier, media=_make_media("busy"), generator=generator)
+        assert generator.started.wait(timeout=TIMEOUT)
+
+        for media_id in ("background_1", "background_2", "background_1", "busy"):
+            assert service.submit(fxt_dataset_storage_identifier, media=_make_media(media_id), generator=generator)
+        service.submit(
+            fxt_dataset_storage_identifier,
+            media=_make_media("background_2"),
+            generator=generator,
+            priority=ThumbnailPriority.REQUESTED,
+        )
+        generator.release.set()
+        generator.wait_for_calls(3)
+
+        assert generator.calls == [[ID("busy")], [ID("background_2")], [ID("background_1")]]
+
+    def test_submit_batches(self, fxt_thumbnail_generation_service, fxt_dataset_storage_identifier) -> None:
+        service = fxt_thumbnail_generation_service(max_workers=1, max_batch_size=2)
+        generator = _BlockingGenerator()
+        service.submit(fxt_dataset_storage_identifier, media=_make_media("busy"), generator=generator)
+        assert generator.started.wait(timeout=TIMEOUT)
+
+        for media_id in ("video_1", "video_2", "video_3"):
+            service.submit(
+                fxt_dataset_storage_identifier, media=_make_media(media_id), generator=generator, batchable=True
+            )
+        generator.release.set()
+        generator.wait_for_calls(3)
+
+        assert generator.calls == [[ID("busy")], [ID("video_1"), ID("video_2")], [ID("video_3")]]
+
+    def test_submit_queue_full(self, fxt_thumbnail_generation_service, fxt_dataset_storage_identifier) -> None:
+        service = fxt_thumbnail_generation_service(max_workers=1, max_queue_size=1)
+        generator = _BlockingGenerator()
+        service.submit(fxt_dataset_storage_identifier, media=_make_media("busy"), generator=generator)
+        assert generator.started.wait(timeout=TIMEOUT)
+
+        assert service.submit(fxt_dataset_storage_identifier, media=_make_media("image_1"), generator=generator)
+        assert not service.submit(fxt_dataset_storage_identifier, media=_make_media("image_2"), generator=generator)
+        generator.release.set()
+
+    def test_stop(self, fxt_thumbnail_generation_service, fxt_dataset_storage_identifier) -> None:
+        service = fxt_thumbnail_generation_service(max_workers=1)
+        generator = _BlockingGenerator()
+        service.submit(fxt_dataset_storage_identifier, media=_make_media("busy"), generator=generator)
+        assert generator.started.wait(timeout=TIMEOUT)
+        service.submit(fxt_dataset_storage_identifier, media=_make_media("image_1"), generator=generator)
+
+        service.stop(wait=False)
+        generator.release.set()
+        service.stop()
+
+        assert generator.calls == [[ID("busy")]]
+        assert not service.submit(fxt_dataset_storage_identifier, media=_make_media("image_2"), generator=generator)
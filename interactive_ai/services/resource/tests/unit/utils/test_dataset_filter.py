@@ -1,10 +1,19 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 
+import datetime
+
 import pytest
+from bson import ObjectId
 
 from communication.exceptions import InvalidFilterException
-from usecases.dataset_filter import DatasetFilter, MediaScoreFilterField
+from usecases.dataset_filter import (
+    DatasetFilter,
+    DatasetFilterField,
+    DatasetFilterPageToken,
+    DatasetFilterSortDirection,
+    MediaScoreFilterField,
+)
 
 
 class TestDatasetFilter:
@@ -103,3 +112,88 @@ class TestDatasetFilter:
         DatasetFilter.from_dict(query=float_filter, limit=100)
         float_filter["rules"][0]["value"] = 1  # type: ignore
         DatasetFilter.from_dict(query=float_filter, limit=100)
+
+    def test_page_token_round_trip(self, fxt_dataset_filter_dict) -> None:
+        """
+        Tests that a page token generated for a page can be used to build the filter for the next page,
+        and that the keyset match query points after the last item of the page.
+        """
+        dataset_filter = DatasetFilter.from_dict(
+            query=fxt_dataset_filter_dict, limit=10, sort_by=DatasetFilterField.MEDIA_UPLOAD_DATE
+        )
+        last_id = ObjectId()
+        last_upload_date = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+        page_token = dataset_filter.generate_next_page_token(
+            last_doc={"_id": last_id, "upload_date": last_upload_date},
+            matching_images_count=20,
+            matching_videos_count=2,
+            matching_video_frames_count=50,
+        )
+
+        next_page_filter = DatasetFilter.from_dict(
+            query=fxt_dataset_filter_dict,
+            limit=10,
+            sort_by=DatasetFilterField.MEDIA_UPLOAD_DATE,
+            page_token=page_token.encode(),
+        )
+
+        assert next_page_filter.page_token == page_token
+        assert next_page_filter.generate_keyset_match_query() == {
+            "$match": {
+                "$or": [
+                    {"upload_date": {"$gt": last_upload_date}},
+                    {"upload_date": last_upload_date, "_id": {"$gt": last_id}},
+                ]
+            }
+        }
+        pagination_stages = next_page_filter.generate_pagination_stages()
+        assert {"$skip": 0} not in pagination_stages
+        assert pagination_stages[-1] == {"$limit": 10}
+
+    def test_page_token_descending_null_value(self) -> None:
+        """
+        Tests the keyset match query when the last item of the page has no value for the sort field
+        """
+        dataset_filter = DatasetFilter.from_dict(
+            query={},
+            limit=10,
+            sort_by=DatasetFilterField.ANNOTATION_CREATION_DATE,
+            sort_direction=DatasetFilterSortDirection.DSC,
+        )
+        last_id = ObjectId()
+        dataset_filter.page_token = dataset_filter.generate_next_page_token(
+            last_doc={"_id": last_id},
+            matching_images_count=20,
+            matching_videos_count=0,
+            matching_video_frames_count=0,
+        )
+
+        assert dataset_filter.generate_keyset_match_query() == {
+            "$match": {"$or": [{"creation_date": None, "_id": {"$lt": last_id}}]}
+        }
+
+    def test_page_token_for_different_filter(self, fxt_dataset_filter_dict) -> None:
+        """
+        Tests that a page token cannot be used with a filter or sort order other than the one it was generated for
+        """
+        dataset_filter = DatasetFilter.from_dict(query=fxt_dataset_filter_dict, limit=10)
+        page_token = dataset_filter.generate_next_page_token(
+            last_doc={"_id": ObjectId(), "media_name": "image"},
+            matching_images_count=20,
+            matching_videos_count=0,
+            matching_video_frames_count=0,
+        ).encode()
+
+        with pytest.raises(InvalidFilterException):
+            DatasetFilter.from_dict(
+                query=fxt_dataset_filter_dict,
+                limit=10,
+                sort_direction=DatasetFilterSortDirection.DSC,
+                page_token=page_token,
+            )
+        with pytest.raises(InvalidFilterException):
+            DatasetFilter.from_dict(query={}, limit=10, page_token=page_token)
+
+    def test_malformed_page_token(self) -> None:
+        with pytest.raises(InvalidFilterException):
+            DatasetFilterPageToken.decode("not-a-token")
@@ -112,6 +112,52 @@ class TestQueryBuilder:
         )
         assert query_result_1.media_identifiers == query_result_2.media_identifiers
 
+    @pytest.mark.parametrize("fxt_filled_image_dataset_storage", [40], indirect=True)
+    def test_keyset_pagination(self, fxt_filled_image_dataset_storage, fxt_media_filter) -> None:
+        """
+        This test verifies that following the page tokens returns the same items, in the same order,
+        as the skip-based pagination, and that the counts are carried over from the first page.
+        """
+        skip_filter = DatasetFilter.from_dict(
+            query=fxt_media_filter,
+            limit=40,
+            sort_by=DatasetFilterField.MEDIA_UPLOAD_DATE,
+        )
+        expected_media_identifiers = QueryBuilder.get_media_results_for_dataset_storage_filter(
+            dataset_filter=skip_filter,
+            dataset_storage_identifier=fxt_filled_image_dataset_storage.identifier,
+        ).media_identifiers
+
+        media_identifiers = []
+        page_token = None
+        for _ in range(4):
+            dataset_filter = DatasetFilter.from_dict(
+                query=fxt_media_filter,
+                limit=10,
+                sort_by=DatasetFilterField.MEDIA_UPLOAD_DATE,
+                page_token=page_token,
+            )
+            query_results = QueryBuilder.get_media_results_for_dataset_storage_filter(
+                dataset_filter=dataset_filter,
+                dataset_storage_identifier=fxt_filled_image_dataset_storage.identifier,
+            )
+            assert query_results.matching_images_count == 40
+            media_identifiers.extend(query_results.media_identifiers)
+            page_token = query_results.next_page_token
+
+        assert media_identifiers == expected_media_identifiers
+        last_page = QueryBuilder.get_media_results_for_dataset_storage_filter(
+            dataset_filter=DatasetFilter.from_dict(
+                query=fxt_media_filter,
+                limit=10,
+                sort_by=DatasetFilterField.MEDIA_UPLOAD_DATE,
+                page_token=page_token,
+            ),
+            dataset_storage_identifier=fxt_filled_image_dataset_storage.identifier,
+        )
+        assert last_page.media_identifiers == []
+        assert last_page.next_page_token is None
+
     def test_use_latest_annotation(
         self,
         fxt_storage_with_partial_and_full_annotation_on_one_image,
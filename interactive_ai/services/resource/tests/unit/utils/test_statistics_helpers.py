@@ -35,6 +35,7 @@ from iai_core.repos import (
     ProjectRepo,
     VideoRepo,
 )
+from iai_core.services.annotation_statistics_service import AnnotationStatisticsService
 
 if TYPE_CHECKING:
     from iai_core.entities.annotation import Annotation
@@ -385,7 +386,7 @@ class TestStatisticsHelper:
         with (
             patch.object(LabelSchema, "get_labels", return_value=[fxt_label]) as mock_schema_get_labels,
             patch.object(
-                AnnotationSceneRepo,
+                AnnotationStatisticsService,
                 "get_annotation_count_and_object_sizes",
                 return_value=(
                     fxt_object_sizes,
@@ -44,3 +44,25 @@ class VideoNotFoundException(GetiBaseException):
             error_code="video_not_found",
             http_status=http.HTTPStatus.NOT_FOUND,
         )
+
+
+class VisualPromptServiceBusyException(GetiBaseException):
+    """
+    Exception raised when no visual prompting model becomes available within the request timeout, or when too many
+    requests are already waiting for a model.
+
+    :param timeout: time in seconds that the request waited for a model, or None if the request was rejected
+        without waiting because too many requests are queued
+    """
+
+    def __init__(self, timeout: float | None = None) -> None:
+        reason = (
+            f"could not process the request within {timeout} seconds"
+            if timeout is not None
+            else "has too many requests waiting to be processed"
+        )
+        super().__init__(
+            message=f"The visual prompting service is busy and {reason}. Please try again later.",
+            error_code="visual_prompt_service_busy",
+            http_status=http.HTTPStatus.SERVICE_UNAVAILABLE,
+        )
@@ -4,9 +4,10 @@ import logging
 from functools import lru_cache
 
 from repos.reference_feature_repo import ReferenceFeatureRepo
+from services.reference_feature_cache import ReferenceFeatureCache
 
-from geti_kafka_tools import BaseKafkaHandler, KafkaRawMessage, TopicSubscription
-from geti_types import ID, DatasetStorageIdentifier, ProjectIdentifier, Singleton
+from geti_kafka_tools import BaseKafkaHandler, KafkaRawMessage, TopicSubscription, publish_event
+from geti_types import CTX_SESSION_VAR, ID, DatasetStorageIdentifier, ProjectIdentifier, Singleton
 from iai_core.algorithms.visual_prompting import VISUAL_PROMPTING_MODEL_TEMPLATE_ID
 from iai_core.entities.label_schema import LabelSchema, LabelSchemaView, NullLabelSchema
 from iai_core.entities.model import NullModel
@@ -22,9 +23,32 @@ from iai_core.repos import (
 )
 from iai_core.session.session_propagation import setup_session_kafka
 
+# Topic notifying every VPS replica that the reference features of a project may have changed
+CACHE_INVALIDATION_TOPIC = "vps_cache_invalidations"
+
 logger = logging.getLogger(__name__)
 
 
+def publish_cache_invalidation(project_identifier: ProjectIdentifier) -> None:
+    """
+    Notify all the VPS replicas that their cached reference features of a project are stale.
+
+    The event must be published after the reference features have been changed in the database, so that the
+    replicas cannot reload and cache the old ones after invalidating them.
+
+    :param project_identifier: identifier of the project whose reference features changed
+    """
+    publish_event(
+        topic=CACHE_INVALIDATION_TOPIC,
+        body={
+            "workspace_id": str(project_identifier.workspace_id),
+            "project_id": str(project_identifier.project_id),
+        },
+        key=str(project_identifier.project_id).encode(),
+        headers_getter=lambda: CTX_SESSION_VAR.get().as_list_bytes(),
+    )
+
+
 class VPSKafkaHandler(BaseKafkaHandler, metaclass=Singleton):
     """KafkaHandler for project-ie-related workflows without a well-defined use case"""
 
@@ -95,12 +119,17 @@ class VPSKafkaHandler(BaseKafkaHandler, metaclass=Singleton):
                     dataset_repo.delete_by_id(sam_model.train_dataset_id)
                     model_repo.delete_all()
                     model_storage_repo.delete_by_id(model_storage.id_)
+                    ReferenceFeatureCache().invalidate(
+                        project_identifier=project_identifier, task_id=model_storage.task_node_id
+                    )
                     logger.info(
                         "Removed all reference features and visual prompting model for task ID %s in project ID %s"
                         " due to label schema mismatch.",
                         model_storage.task_node_id,
                         project_identifier.project_id,
                     )
+        # The labels may have changed even if the reference features are still valid
+        publish_cache_invalidation(project_identifier)
 
     @staticmethod
     @setup_session_kafka
@@ -115,6 +144,8 @@ class VPSKafkaHandler(BaseKafkaHandler, metaclass=Singleton):
         )
         ref_feat_repo = ReferenceFeatureRepo(project_identifier)
         ref_feat_repo.delete_all()
+        ReferenceFeatureCache().invalidate_project(project_id=project_identifier.project_id)
+        publish_cache_invalidation(project_identifier)
         logger.info(
             "Removed all reference features for deleted project ID %s",
             project_identifier.project_id,
@@ -172,3 +203,28 @@ class VPSKafkaHandler(BaseKafkaHandler, metaclass=Singleton):
                 f"Could not find LabelSchemaView for task with ID {task_node_id} of project `{project_identifier}`",
             )
         return latest_schema_view
+
+
+class VPSCacheInvalidationKafkaHandler(BaseKafkaHandler, metaclass=Singleton):
+    """
+    KafkaHandler that invalidates the in-memory reference feature cache of this process.
+
+    The invalidation events are published by VPSKafkaHandler, on any replica, once it has updated the reference
+    features of a project. Unlike VPSKafkaHandler, the consumer runs in broadcast mode, so that all the replicas
+    receive all the events without joining a consumer group of their own.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(group_id="vps_cache_invalidation", broadcast=True)
+
+    @property
+    def topics_subscriptions(self) -> list[TopicSubscription]:
+        return [TopicSubscription(topic=CACHE_INVALIDATION_TOPIC, callback=self.on_cache_invalidation)]
+
+    @staticmethod
+    def on_cache_invalidation(raw_message: KafkaRawMessage) -> None:
+        """
+        When the reference features or the labels of a project change, the cached ones are discarded.
+        """
+        value: dict = raw_message.value
+        ReferenceFeatureCache().invalidate_project(project_id=ID(value["project_id"]))
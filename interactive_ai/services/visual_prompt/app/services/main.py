@@ -15,7 +15,7 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
 
 from services.endpoints.prompt_endpoints import router as prompt_router
-from services.kafka_handler import VPSKafkaHandler
+from services.kafka_handler import VPSCacheInvalidationKafkaHandler, VPSKafkaHandler
 from services.visual_prompt_service import VisualPromptService
 from utils.feature_flag import FeatureFlag
 
@@ -35,6 +35,7 @@ async def lifespan(app: FastAPI):  # type: ignore # noqa: ANN201
     # Startup
     logger.info("Starting up kafka handlers")
     VPSKafkaHandler()
+    VPSCacheInvalidationKafkaHandler()
 
     if ENABLE_TRACING:
         KafkaTelemetry.instrument()
@@ -49,6 +50,7 @@ async def lifespan(app: FastAPI):  # type: ignore # noqa: ANN201
     logger.info("Shutting down kafka handlers")
 
     VPSKafkaHandler().stop()
+    VPSCacheInvalidationKafkaHandler().stop()
 
     if ENABLE_TRACING:
         FastAPITelemetry.uninstrument(app)
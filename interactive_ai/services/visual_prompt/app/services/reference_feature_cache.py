@@ -0,0 +1,133 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""This module implements the in-memory cache of the reference features used for visual prompting inference"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic
+
+from model_api.models.visual_prompting import VisualPromptingFeatures
+
+from services.converters import VisualPromptingFeaturesConverter
+
+from geti_types import ID, ProjectIdentifier, Singleton
+from iai_core.entities.label import Label
+from iai_core.entities.scored_label import LabelSource
+
+# Maximum number of (project, task) entries kept in memory by each process
+VPS_REFERENCE_FEATURE_CACHE_SIZE = int(os.getenv("VPS_REFERENCE_FEATURE_CACHE_SIZE", "256"))
+# Time after which an entry is reloaded even if no invalidation event was received; 0 disables the cache
+VPS_REFERENCE_FEATURE_CACHE_TTL_SECONDS = float(os.getenv("VPS_REFERENCE_FEATURE_CACHE_TTL_SECONDS", "600"))
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TaskReferenceState:
+    """
+    Everything that visual prompting inference needs for a task, besides the image.
+
+    :param compatible_labels_by_id: labels of the task that can be predicted by visual prompting, by ID
+    :param empty_label: empty label of the task, used when nothing is predicted
+    :param missing_label_ids: IDs of the compatible labels without reference features
+    :param feature_converter: converter between label IDs and ModelAPI label indices
+    :param visual_prompting_features: reference features in ModelAPI format, None if no label is learned yet
+    :param label_source: source of the predicted labels (the SAM model), None if no label is learned yet
+    """
+
+    compatible_labels_by_id: dict[ID, Label]
+    empty_label: Label
+    missing_label_ids: frozenset[ID]
+    feature_converter: VisualPromptingFeaturesConverter
+    visual_prompting_features: VisualPromptingFeatures | None
+    label_source: LabelSource | None
+
+
+class ReferenceFeatureCache(metaclass=Singleton):
+    """
+    Per-process LRU cache of TaskReferenceState, by project and task.
+
+    Entries are invalidated when the reference features or the labels of the project change, either locally or
+    through Kafka events, and in any case after VPS_REFERENCE_FEATURE_CACHE_TTL_SECONDS.
+    """
+
+    def __init__(
+        self,
+        max_size: int = VPS_REFERENCE_FEATURE_CACHE_SIZE,
+        ttl_seconds: float = VPS_REFERENCE_FEATURE_CACHE_TTL_SECONDS,
+    ) -> None:
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[ID, ID], tuple[float, TaskReferenceState]] = OrderedDict()
+        self._entries_lock = threading.Lock()
+        logger.info(f"ReferenceFeatureCache configuration: size: {max_size}; TTL: {ttl_seconds} seconds")
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_size > 0 and self._ttl_seconds > 0
+
+    def get(self, project_identifier: ProjectIdentifier, task_id: ID) -> TaskReferenceState | None:
+        """
+        Get the cached state of a task, if present and not expired.
+
+        :param project_identifier: identifier of the project containing the task
+        :param task_id: ID of the task
+        :return: TaskReferenceState, or None if not cached
+        """
+        key = (project_identifier.project_id, task_id)
+        with self._entries_lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            insertion_time, state = entry
+            if monotonic() - insertion_time > self._ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return state
+
+    def put(self, project_identifier: ProjectIdentifier, task_id: ID, state: TaskReferenceState) -> None:
+        """
+        Cache the state of a task, evicting the least recently used entry if the cache is full.
+
+        :param project_identifier: identifier of the project containing the task
+        :param task_id: ID of the task
+        :param state: TaskReferenceState to cache
+        """
+        if not self.enabled:
+            return
+        key = (project_identifier.project_id, task_id)
+        with self._entries_lock:
+            self._entries[key] = (monotonic(), state)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, project_identifier: ProjectIdentifier, task_id: ID) -> None:
+        """
+        Remove the cached state of a task.
+
+        :param project_identifier: identifier of the project containing the task
+        :param task_id: ID of the task
+        """
+        with self._entries_lock:
+            self._entries.pop((project_identifier.project_id, task_id), None)
+
+    def invalidate_project(self, project_id: ID) -> None:
+        """
+        Remove the cached state of all the tasks of a project.
+
+        :param project_id: ID of the project
+        """
+        with self._entries_lock:
+            for key in [key for key in self._entries if key[0] == project_id]:
+                del self._entries[key]
+        logger.debug(f"Invalidated cached reference features of project `{project_id}`")
+
+    def clear(self) -> None:
+        """Remove all the entries"""
+        with self._entries_lock:
+            self._entries.clear()
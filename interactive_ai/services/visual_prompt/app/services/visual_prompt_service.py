@@ -4,7 +4,6 @@ import io
 import json
 import logging
 import os
-import threading
 from collections import defaultdict
 from collections.abc import Generator
 from dataclasses import dataclass
@@ -24,6 +23,8 @@ from repos.vps_dataset_filter_repo import VPSDatasetFilterRepo
 from services.converters import AnnotationConverter, PromptConverter, VisualPromptingFeaturesConverter
 from services.exceptions import ImageNotFoundException, VideoNotFoundException
 from services.readme import PROMPT_MODEL_README
+from services.reference_feature_cache import ReferenceFeatureCache, TaskReferenceState
+from services.visual_prompter_pool import VisualPrompterModelPool
 
 from geti_fastapi_tools.exceptions import InvalidMediaException
 from geti_types import (
@@ -43,7 +44,7 @@ from iai_core.entities.dataset_item import DatasetItem
 from iai_core.entities.datasets import Dataset, DatasetPurpose
 from iai_core.entities.evaluation_result import EvaluationPurpose, EvaluationResult, NullEvaluationResult
 from iai_core.entities.image import Image, NullImage
-from iai_core.entities.label import Domain
+from iai_core.entities.label import Domain, Label
 from iai_core.entities.metrics import MultiScorePerformance, ScoreMetric
 from iai_core.entities.model import (
     Model,
@@ -93,11 +94,15 @@ REFERENCE_FEATURES_JSON = "reference_features.json"
 DICE_INTERSECTION = "dice_intersection"
 DICE_CARDINALITY = "dice_cardinality"
 RESIZED_IMAGE_SIZE = 800  # fixed pixel dimensions for the resized image
+# Number of SAM model instances serving requests concurrently. Each instance holds its own compiled encoder and decoder.
+VPS_MODEL_POOL_SIZE = int(os.getenv("VPS_MODEL_POOL_SIZE", "1"))
+# Maximum time in seconds that a request waits for an idle model before failing
+VPS_MODEL_ACQUIRE_TIMEOUT_SECONDS = float(os.getenv("VPS_MODEL_ACQUIRE_TIMEOUT_SECONDS", "60"))
+# Maximum number of requests waiting for an idle model; further requests are rejected. 0 means no limit.
+VPS_MAX_QUEUED_REQUESTS = int(os.getenv("VPS_MAX_QUEUED_REQUESTS", "0"))
 
 logger = logging.getLogger(__name__)
 
-lock = threading.RLock()
-
 
 @dataclass(frozen=True)
 class VPSPredictionResults:
@@ -123,6 +128,8 @@ class VisualPromptService:
         Defaults to 0, equivalent to number of cores available.
     :param visual_prompter_model: SAMLearnableVisualPrompter model to be used for inference.
         If None, the model is loaded from S3.
+    :param pool_size: number of model instances serving requests concurrently; ignored if visual_prompter_model
+        is provided. The CPU cores are split between the instances.
     """
 
     pretrained_weights_bucket_name: str = os.getenv("BUCKET_NAME_PRETRAINEDWEIGHTS", "pretrainedweights")
@@ -132,22 +139,36 @@ class VisualPromptService:
         device: str = "CPU",
         max_async_requests: int = 0,
         visual_prompter_model: SAMLearnableVisualPrompter | None = None,
+        pool_size: int = VPS_MODEL_POOL_SIZE,
     ) -> None:
         self._openvino_core = create_core()
         self._device = device
         self._max_async_requests = max_async_requests
+        self._plugin_config = {"PERFORMANCE_HINT": PERFORMANCE_HINT}
+        if pool_size > 1 and (cpu_count := os.cpu_count()):
+            # Avoid oversubscription: each model instance would otherwise use all the cores of the node
+            self._plugin_config["INFERENCE_NUM_THREADS"] = str(max(1, cpu_count // pool_size))
         self.s3_client, _ = S3Connector.get_clients()
         self._sam_encoder_xml_path = os.getenv(SAM_ENCODER_XML_PATH_ENV)
         self._sam_encoder_bin_path = os.getenv(SAM_ENCODER_BIN_PATH_ENV)
         self._sam_decoder_xml_path = os.getenv(SAM_DECODER_XML_PATH_ENV)
         self._sam_decoder_bin_path = os.getenv(SAM_DECODER_BIN_PATH_ENV)
         if visual_prompter_model:
-            self.visual_prompter_model = visual_prompter_model
+            models = [visual_prompter_model]
         else:
-            self.visual_prompter_model = SAMLearnableVisualPrompter(
-                encoder_model=self._load_sam_encoder(),
-                decoder_model=self._load_sam_mask_decoder(),
-            )
+            models = [
+                SAMLearnableVisualPrompter(
+                    encoder_model=self._load_sam_encoder(),
+                    decoder_model=self._load_sam_mask_decoder(),
+                )
+                for _ in range(max(1, pool_size))
+            ]
+        self._model_pool = VisualPrompterModelPool(
+            models=models,
+            acquire_timeout=VPS_MODEL_ACQUIRE_TIMEOUT_SECONDS,
+            max_queued_requests=VPS_MAX_QUEUED_REQUESTS,
+        )
+        logger.info(f"VisualPromptService initialized with {self._model_pool.size} model instance(s).")
 
     def infer(
         self,
@@ -165,64 +186,34 @@ class VisualPromptService:
         :param roi: The region of interest (ROI) to be used for inference. Defaults to None.
         :return: list of predicted annotations
         """
-        # Stage 1: check reference features and apply one-shot-learning for missing labels
-        reference_features_repo = ReferenceFeatureRepo(project_identifier)
-        learned_label_ids = set(reference_features_repo.get_all_ids_by_task_id(task_id=task_id))
-        label_schema = LabelSchemaRepo(project_identifier).get_latest_view_by_task(task_node_id=task_id)
-        compatible_labels_by_id = {
-            label.id_: label
-            for label in label_schema.get_all_labels()
-            if label.domain in SUPPORTED_LABEL_DOMAINS and not label.is_empty
-        }
-        compatible_label_ids = set(compatible_labels_by_id.keys())
-        missing_labels = compatible_label_ids - learned_label_ids
-
-        if missing_labels:
-            self.one_shot_learn(
-                project_identifier=project_identifier,
-                label_ids=list(missing_labels),
-                task_id=task_id,
-            )
-
-        # Stage 2: fetch latest reference features and infer on media
-        reference_features = reference_features_repo.get_all_by_task_id(task_id=task_id)
+        # Stage 1: get the reference features (cached), applying one-shot-learning for missing labels
+        task_reference_state = self._get_task_reference_state(project_identifier=project_identifier, task_id=task_id)
+        compatible_labels_by_id = task_reference_state.compatible_labels_by_id
+        feature_converter = task_reference_state.feature_converter
         # add full box rectangle annotation with empty label if no predictions are made
-        empty_label = label_schema.get_empty_labels()[0]
         empty_annotation = Annotation(
             shape=Rectangle.generate_full_box(),
-            labels=[ScoredLabel(label_id=empty_label.id_, is_empty=True, probability=1.0)],
+            labels=[ScoredLabel(label_id=task_reference_state.empty_label.id_, is_empty=True, probability=1.0)],
         )
 
-        if not reference_features:
+        if task_reference_state.visual_prompting_features is None or task_reference_state.label_source is None:
             logger.warning(
                 "No reference features found for project with ID `%s`. Returning empty predictions.",
                 project_identifier.project_id,
             )
             return VPSPredictionResults(bboxes=[empty_annotation], rotated_bboxes=[], polygons=[])
 
-        logger.debug(
-            "Retrieved reference features for project with ID `%s`: %s",
-            project_identifier.project_id,
-            reference_features,
-        )
-
-        # conversion to ModelAPI input format
-        feature_converter = VisualPromptingFeaturesConverter(list(compatible_labels_by_id.keys()))
-        visual_prompting_features = feature_converter.convert_to_visual_prompting_features(
-            reference_features=reference_features
-        )
+        # Stage 2: infer on media
         resized_image = self._resize_image(media)
-        with lock:
-            visual_prompting_result = self.visual_prompter_model.infer(
+        with self._model_pool.acquire() as visual_prompter_model:
+            visual_prompting_result = visual_prompter_model.infer(
                 image=resized_image,
-                reference_features=visual_prompting_features,
+                reference_features=task_reference_state.visual_prompting_features,
                 apply_masks_refinement=False,
             )
 
         # Stage 3: convert ModelAPI predicted segmentation masks to annotations
-        model_storage = self._get_or_create_sam_model_storage(project_identifier=project_identifier, task_id=task_id)
-        model = ModelRepo(model_storage.identifier).get_one()
-        label_source = LabelSource(model_id=model.id_, model_storage_id=model_storage.id_)
+        label_source = task_reference_state.label_source
         predicted_bboxes = []
         predicted_rotated_bboxes = []
         predicted_polygons = []
@@ -261,6 +252,108 @@ class VisualPromptService:
             polygons=predicted_polygons,
         )
 
+    def _get_task_reference_state(self, project_identifier: ProjectIdentifier, task_id: ID) -> TaskReferenceState:
+        """
+        Get the labels and the reference features needed to run inference for a task, applying one-shot-learning
+        for the labels that have no reference features yet.
+
+        The state is cached per task, so that the database and object storage are only accessed again when the
+        reference features or the labels change, or when some labels could not be learned yet.
+
+        :param project_identifier: project identifier
+        :param task_id: ID of the task
+        :return: TaskReferenceState of the task
+        """
+        cache = ReferenceFeatureCache()
+        cached_state = cache.get(project_identifier=project_identifier, task_id=task_id)
+        if cached_state is not None and not cached_state.missing_label_ids:
+            return cached_state
+
+        if cached_state is None:
+            learned_label_ids = set(ReferenceFeatureRepo(project_identifier).get_all_ids_by_task_id(task_id=task_id))
+            label_schema = LabelSchemaRepo(project_identifier).get_latest_view_by_task(task_node_id=task_id)
+            compatible_labels_by_id = {
+                label.id_: label
+                for label in label_schema.get_all_labels()
+                if label.domain in SUPPORTED_LABEL_DOMAINS and not label.is_empty
+            }
+            empty_label = label_schema.get_empty_labels()[0]
+            missing_label_ids = set(compatible_labels_by_id.keys()) - learned_label_ids
+        else:
+            compatible_labels_by_id = cached_state.compatible_labels_by_id
+            empty_label = cached_state.empty_label
+            missing_label_ids = set(cached_state.missing_label_ids)
+
+        if missing_label_ids:
+            learned_reference_features = self.one_shot_learn(
+                project_identifier=project_identifier,
+                label_ids=list(missing_label_ids),
+                task_id=task_id,
+            )
+            if cached_state is not None and not learned_reference_features:
+                # The missing labels still have no annotations to learn from, so the cached state is up-to-date
+                return cached_state
+
+        task_reference_state = self._load_task_reference_state(
+            project_identifier=project_identifier,
+            task_id=task_id,
+            compatible_labels_by_id=compatible_labels_by_id,
+            empty_label=empty_label,
+        )
+        cache.put(project_identifier=project_identifier, task_id=task_id, state=task_reference_state)
+        return task_reference_state
+
+    def _load_task_reference_state(
+        self,
+        project_identifier: ProjectIdentifier,
+        task_id: ID,
+        compatible_labels_by_id: dict[ID, Label],
+        empty_label: Label,
+    ) -> TaskReferenceState:
+        """
+        Load the reference features of a task and convert them to ModelAPI format.
+
+        :param project_identifier: project identifier
+        :param task_id: ID of the task
+        :param compatible_labels_by_id: labels of the task that are supported by visual prompting, by ID
+        :param empty_label: empty label of the task
+        :return: TaskReferenceState of the task
+        """
+        feature_converter = VisualPromptingFeaturesConverter(list(compatible_labels_by_id.keys()))
+        reference_features = ReferenceFeatureRepo(project_identifier).get_all_by_task_id(task_id=task_id)
+        if not reference_features:
+            return TaskReferenceState(
+                compatible_labels_by_id=compatible_labels_by_id,
+                empty_label=empty_label,
+                missing_label_ids=frozenset(compatible_labels_by_id.keys()),
+                feature_converter=feature_converter,
+                visual_prompting_features=None,
+                label_source=None,
+            )
+
+        logger.debug(
+            "Retrieved reference features for project with ID `%s`: %s",
+            project_identifier.project_id,
+            reference_features,
+        )
+        # conversion to ModelAPI input format
+        visual_prompting_features = feature_converter.convert_to_visual_prompting_features(
+            reference_features=reference_features
+        )
+        learned_label_ids = {
+            feature_converter.index_to_label_id(label_index) for label_index in visual_prompting_features.used_indices
+        }
+        model_storage = self._get_or_create_sam_model_storage(project_identifier=project_identifier, task_id=task_id)
+        model = ModelRepo(model_storage.identifier).get_one()
+        return TaskReferenceState(
+            compatible_labels_by_id=compatible_labels_by_id,
+            empty_label=empty_label,
+            missing_label_ids=frozenset(compatible_labels_by_id.keys() - learned_label_ids),
+            feature_converter=feature_converter,
+            visual_prompting_features=visual_prompting_features,
+            label_source=LabelSource(model_id=model.id_, model_storage_id=model_storage.id_),
+        )
+
     @staticmethod
     def _get_2d_media_by_media_identifier(
         dataset_storage_identifier: DatasetStorageIdentifier,
@@ -358,13 +451,18 @@ class VisualPromptService:
                 width=image_width,
             )
 
-            with lock:
-                visual_prompting_features, masks = self.visual_prompter_model.learn(
+            with self._model_pool.acquire() as visual_prompter_model:
+                visual_prompting_features, masks = visual_prompter_model.learn(
                     image=resized_image,
                     boxes=bbox_prompts,
                     polygons=polygon_prompts,
                     reset_features=True,
                 )
+                results = visual_prompter_model.infer(
+                    image=resized_image,
+                    reference_features=visual_prompting_features,
+                    apply_masks_refinement=False,
+                )
             ref_features = feature_converter.convert_to_reference_features(
                 visual_prompting_features=visual_prompting_features,
                 reference_media_info=ReferenceMediaInfo(
@@ -374,13 +472,6 @@ class VisualPromptService:
                 ),
                 task_id=task_id,
             )
-
-            with lock:
-                results = self.visual_prompter_model.infer(
-                    image=resized_image,
-                    reference_features=visual_prompting_features,
-                    apply_masks_refinement=False,
-                )
             dice_generator = self._generate_intersection_and_cardinalities(
                 image_height=resized_image.shape[0],
                 image_width=resized_image.shape[1],
@@ -441,7 +532,7 @@ class VisualPromptService:
             weights_path=self._sam_encoder_bin,
             device=self._device,
             max_num_requests=self._max_async_requests,
-            plugin_config={"PERFORMANCE_HINT": PERFORMANCE_HINT},
+            plugin_config=self._plugin_config,
         )
         logger.info("SAM encoder loaded successfully.")
         return SAMImageEncoder(
@@ -459,7 +550,7 @@ class VisualPromptService:
             weights_path=self._sam_decoder_bin,
             device=self._device,
             max_num_requests=self._max_async_requests,
-            plugin_config={"PERFORMANCE_HINT": PERFORMANCE_HINT},
+            plugin_config=self._plugin_config,
         )
         logger.info("SAM decoder loaded successfully.")
         return SAMDecoder(
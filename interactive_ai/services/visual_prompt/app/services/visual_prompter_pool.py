@@ -0,0 +1,85 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""This module implements a pool of visual prompting models that can serve requests concurrently"""
+
+import logging
+import queue
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from time import monotonic
+
+from model_api.models.visual_prompting import SAMLearnableVisualPrompter
+
+from services.exceptions import VisualPromptServiceBusyException
+
+logger = logging.getLogger(__name__)
+
+
+class VisualPrompterModelPool:
+    """
+    Pool of SAMLearnableVisualPrompter instances.
+
+    The models are stateful (one-shot-learning stores the reference features in the model) and their inference
+    adapters are not thread-safe, so each model serves a single request at a time. Requests that find no idle model
+    wait until a model is released, up to a timeout.
+
+    :param models: models in the pool, each one with its own compiled encoder and decoder
+    :param acquire_timeout: maximum time in seconds that a request waits for an idle model
+    :param max_queued_requests: maximum number of requests waiting for an idle model; further requests are rejected
+        immediately. A value of 0 means no limit.
+    """
+
+    def __init__(
+        self,
+        models: list[SAMLearnableVisualPrompter],
+        acquire_timeout: float,
+        max_queued_requests: int = 0,
+    ) -> None:
+        if not models:
+            raise ValueError("Cannot create a visual prompter model pool without models.")
+        self._acquire_timeout = acquire_timeout
+        self._max_queued_requests = max_queued_requests
+        self._idle_models: queue.Queue[SAMLearnableVisualPrompter] = queue.Queue()
+        for model in models:
+            self._idle_models.put(model)
+        self._size = len(models)
+        self._num_queued_requests = 0
+        self._queued_requests_lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Number of models in the pool"""
+        return self._size
+
+    @contextmanager
+    def acquire(self) -> Iterator[SAMLearnableVisualPrompter]:
+        """
+        Acquire an idle model for the duration of the context; the model is returned to the pool on exit.
+
+        :return: context manager yielding the model
+        :raises VisualPromptServiceBusyException: if no model becomes idle within the timeout, or if too many
+            requests are already waiting for a model
+        """
+        with self._queued_requests_lock:
+            if self._max_queued_requests and self._num_queued_requests >= self._max_queued_requests:
+                logger.warning(
+                    "Rejecting visual prompting request: %d requests are already waiting for a model.",
+                    self._num_queued_requests,
+                )
+                raise VisualPromptServiceBusyException
+            self._num_queued_requests += 1
+        start_time = monotonic()
+        try:
+            model = self._idle_models.get(timeout=self._acquire_timeout)
+        except queue.Empty:
+            logger.warning("No visual prompting model became available within %s seconds.", self._acquire_timeout)
+            raise VisualPromptServiceBusyException(timeout=self._acquire_timeout) from None
+        finally:
+            with self._queued_requests_lock:
+                self._num_queued_requests -= 1
+        logger.debug("Acquired visual prompting model after waiting %.3f seconds.", monotonic() - start_time)
+        try:
+            yield model
+        finally:
+            self._idle_models.put(model)
@@ -1,12 +1,13 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 from datetime import datetime
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import ANY, MagicMock, call, patch
 
 import pytest
 
 from repos.reference_feature_repo import ReferenceFeatureRepo
-from services.kafka_handler import VPSKafkaHandler
+from services.kafka_handler import VPSCacheInvalidationKafkaHandler, VPSKafkaHandler
+from services.reference_feature_cache import ReferenceFeatureCache
 
 from geti_kafka_tools import KafkaRawMessage
 from iai_core.entities.label_schema import NullLabelSchema
@@ -68,6 +69,7 @@ class TestVPSKafkaHandler:
             patch.object(ReferenceFeatureRepo, "delete_all_by_task_id") as mock_delete_ref_features_by_task_id,
             patch.object(DatasetRepo, "delete_by_id") as mock_delete_dataset,
             patch("services.kafka_handler.isinstance", return_value=False) as mock_isinstance,
+            patch("services.kafka_handler.publish_event") as mock_publish_event,
         ):
             VPSKafkaHandler.on_project_updated(raw_message)
 
@@ -94,6 +96,12 @@ class TestVPSKafkaHandler:
             mock_delete_dataset.assert_called_once_with(mock_model.train_dataset_id)
             mock_delete_model.assert_called_once()
             mock_delete_model_storage.assert_called_once_with(mock_model_storage.id_)
+        mock_publish_event.assert_called_once_with(
+            topic="vps_cache_invalidations",
+            body={"workspace_id": str(fxt_project.identifier.workspace_id), "project_id": str(fxt_project.id_)},
+            key=str(fxt_project.id_).encode(),
+            headers_getter=ANY,
+        )
 
     def test_on_project_deleted(self, fxt_project_identifier) -> None:
         raw_message = KafkaRawMessage(
@@ -114,7 +122,41 @@ class TestVPSKafkaHandler:
             ],
         )
 
-        with patch.object(ReferenceFeatureRepo, "delete_all") as mock_delete_all_ref_features:
+        with (
+            patch.object(ReferenceFeatureRepo, "delete_all") as mock_delete_all_ref_features,
+            patch("services.kafka_handler.publish_event") as mock_publish_event,
+        ):
             VPSKafkaHandler.on_project_deleted(raw_message)
 
         mock_delete_all_ref_features.assert_called_once_with()
+        mock_publish_event.assert_called_once_with(
+            topic="vps_cache_invalidations",
+            body={
+                "workspace_id": str(fxt_project_identifier.workspace_id),
+                "project_id": str(fxt_project_identifier.project_id),
+            },
+            key=str(fxt_project_identifier.project_id).encode(),
+            headers_getter=ANY,
+        )
+
+
+class TestVPSCacheInvalidationKafkaHandler:
+    def test_on_cache_invalidation(self, fxt_project_identifier) -> None:
+        raw_message = KafkaRawMessage(
+            topic="vps_cache_invalidations",
+            partition=0,
+            offset=0,
+            timestamp=int(datetime.now().timestamp()),
+            timestamp_type=0,
+            key="",
+            value={
+                "workspace_id": fxt_project_identifier.workspace_id,
+                "project_id": fxt_project_identifier.project_id,
+            },
+            headers=[],
+        )
+
+        with patch.object(ReferenceFeatureCache, "invalidate_project") as mock_invalidate_project:
+            VPSCacheInvalidationKafkaHandler.on_cache_invalidation(raw_message)
+
+        mock_invalidate_project.assert_called_once_with(project_id=fxt_project_identifier.project_id)
@@ -0,0 +1,77 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services.reference_feature_cache import ReferenceFeatureCache
+
+from geti_types import ID, ProjectIdentifier
+
+
+def _project_identifier(project_id: str) -> ProjectIdentifier:
+    return ProjectIdentifier(workspace_id=ID("workspace"), project_id=ID(project_id))
+
+
+@pytest.fixture(autouse=True)
+def fxt_reset_singleton():
+    # Each test creates its own instance of the singleton, with a custom configuration
+    ReferenceFeatureCache._instance = None
+    yield
+    ReferenceFeatureCache._instance = None
+
+
+class TestReferenceFeatureCache:
+    @staticmethod
+    def _new_cache(**kwargs) -> ReferenceFeatureCache:
+        return ReferenceFeatureCache(**kwargs)
+
+    def test_get_and_put(self) -> None:
+        cache = self._new_cache(max_size=10, ttl_seconds=60)
+        state = MagicMock()
+
+        assert cache.get(_project_identifier("p1"), ID("task")) is None
+        cache.put(_project_identifier("p1"), ID("task"), state)
+
+        assert cache.get(_project_identifier("p1"), ID("task")) is state
+        assert cache.get(_project_identifier("p1"), ID("other_task")) is None
+
+    def test_lru_eviction(self) -> None:
+        cache = self._new_cache(max_size=2, ttl_seconds=60)
+        states = [MagicMock() for _ in range(3)]
+
+        cache.put(_project_identifier("p1"), ID("task"), states[0])
+        cache.put(_project_identifier("p2"), ID("task"), states[1])
+        cache.get(_project_identifier("p1"), ID("task"))  # p1 becomes the most recently used
+        cache.put(_project_identifier("p3"), ID("task"), states[2])
+
+        assert cache.get(_project_identifier("p1"), ID("task")) is states[0]
+        assert cache.get(_project_identifier("p2"), ID("task")) is None
+        assert cache.get(_project_identifier("p3"), ID("task")) is states[2]
+
+    def test_expiration(self) -> None:
+        cache = self._new_cache(max_size=10, ttl_seconds=60)
+        with patch("services.reference_feature_cache.monotonic", return_value=1000.0):
+            cache.put(_project_identifier("p1"), ID("task"), MagicMock())
+
+        with patch("services.reference_feature_cache.monotonic", return_value=1061.0):
+            assert cache.get(_project_identifier("p1"), ID("task")) is None
+
+    def test_invalidate_project(self) -> None:
+        cache = self._new_cache(max_size=10, ttl_seconds=60)
+        cache.put(_project_identifier("p1"), ID("task_1"), MagicMock())
+        cache.put(_project_identifier("p1"), ID("task_2"), MagicMock())
+        cache.put(_project_identifier("p2"), ID("task_1"), MagicMock())
+
+        cache.invalidate_project(ID("p1"))
+
+        assert cache.get(_project_identifier("p1"), ID("task_1")) is None
+        assert cache.get(_project_identifier("p1"), ID("task_2")) is None
+        assert cache.get(_project_identifier("p2"), ID("task_1")) is not None
+
+    def test_disabled(self) -> None:
+        cache = self._new_cache(max_size=10, ttl_seconds=0)
+
+        cache.put(_project_identifier("p1"), ID("task"), MagicMock())
+
+        assert cache.get(_project_identifier("p1"), ID("task")) is None
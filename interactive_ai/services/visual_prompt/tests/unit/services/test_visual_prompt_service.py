@@ -15,6 +15,7 @@ from repos.reference_feature_repo import ReferenceFeatureRepo
 from repos.vps_dataset_filter_repo import VPSDatasetFilterRepo, VPSSamplingResult
 from services.converters import AnnotationConverter, PromptConverter, VisualPromptingFeaturesConverter
 from services.readme import PROMPT_MODEL_README
+from services.reference_feature_cache import ReferenceFeatureCache
 from services.visual_prompt_service import (
     SAM_DECODER_BIN_PATH_ENV,
     SAM_DECODER_XML_PATH_ENV,
@@ -124,6 +125,13 @@ def fxt_visual_prompt_service(fxt_vps_envs):
         yield VisualPromptService()
 
 
+@pytest.fixture(autouse=True)
+def fxt_clear_reference_feature_cache():
+    ReferenceFeatureCache().clear()
+    yield
+    ReferenceFeatureCache().clear()
+
+
 @pytest.fixture
 def fxt_task_node(fxt_project, fxt_ote_id):
     return TaskNode(
@@ -322,6 +330,67 @@ class TestVisualPromptService:
         assert predicted_annotations.rotated_bboxes == []
         assert predicted_annotations.polygons == []
 
+    def test_infer_uses_cached_reference_features(
+        self,
+        fxt_project_identifier,
+        fxt_visual_prompt_service,
+        fxt_image,
+        fxt_ote_id,
+        fxt_model,
+    ) -> None:
+        # Arrange
+        labels = [Label(name="label_1", domain=Domain.DETECTION, id_=fxt_ote_id(1))]
+        task_id = fxt_ote_id(1001)
+        mock_label_schema = MagicMock()
+        mock_label_schema.get_all_labels.return_value = labels
+        mock_vp_features = MagicMock()
+        mock_vp_features.used_indices = [0]
+        dummy_vp_results = ZSLVisualPromptingResult(data={})
+
+        # Act
+        with (
+            patch.object(
+                ReferenceFeatureRepo, "get_all_ids_by_task_id", return_value=[fxt_ote_id(1)]
+            ) as mock_get_learned_ids,
+            patch.object(ReferenceFeatureRepo, "get_all_by_task_id", return_value=[MagicMock()]),
+            patch.object(
+                LabelSchemaRepo, "get_latest_view_by_task", return_value=mock_label_schema
+            ) as mock_get_label_schema,
+            patch.object(VisualPromptService, "one_shot_learn") as mock_learn,
+            patch.object(
+                VisualPromptingFeaturesConverter,
+                "convert_to_visual_prompting_features",
+                return_value=mock_vp_features,
+            ) as mock_convert_vp_features,
+            patch.object(SAMLearnableVisualPrompter, "infer", return_value=dummy_vp_results) as mock_vp_infer,
+            patch.object(
+                VisualPromptService, "_get_or_create_sam_model_storage", return_value=fxt_model.model_storage
+            ) as mock_get_sam_model_storage,
+            patch.object(ModelRepo, "get_one", return_value=fxt_model),
+            patch.object(VisualPromptService, "_resize_image", return_value=np.ones((2, 2))),
+        ):
+            for _ in range(3):
+                fxt_visual_prompt_service.infer(
+                    project_identifier=fxt_project_identifier,
+                    task_id=task_id,
+                    media=fxt_image,
+                )
+            ReferenceFeatureCache().invalidate_project(project_id=fxt_project_identifier.project_id)
+            fxt_visual_prompt_service.infer(
+                project_identifier=fxt_project_identifier,
+                task_id=task_id,
+                media=fxt_image,
+            )
+
+        # Assert
+        mock_learn.assert_not_called()
+        assert mock_vp_infer.call_count == 4
+        # the reference features are loaded once, and once more after the invalidation
+        assert mock_get_learned_ids.call_count == 2
+        assert mock_get_label_schema.call_count == 2
+        assert mock_convert_vp_features.call_count == 2
+        assert mock_get_sam_model_storage.call_count == 2
+
     def test_one_shot_learn(
         self,
         fxt_project,
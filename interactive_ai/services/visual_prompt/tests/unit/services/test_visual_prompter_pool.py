@@ -0,0 +1,79 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from services.exceptions import VisualPromptServiceBusyException
+from services.visual_prompter_pool import VisualPrompterModelPool
+
+
+class TestVisualPrompterModelPool:
+    def test_acquire_and_release(self) -> None:
+        model = MagicMock()
+        pool = VisualPrompterModelPool(models=[model], acquire_timeout=1)
+
+        with pool.acquire() as acquired_model:
+            assert acquired_model is model
+        with pool.acquire() as acquired_model:
+            assert acquired_model is model
+
+    def test_acquire_timeout(self) -> None:
+        pool = VisualPrompterModelPool(models=[MagicMock()], acquire_timeout=0.01)
+
+        with pool.acquire(), pytest.raises(VisualPromptServiceBusyException), pool.acquire():
+            pass
+
+        # the model is released after the timeout of the second request
+        with pool.acquire():
+            pass
+
+    def test_max_queued_requests(self) -> None:
+        pool = VisualPrompterModelPool(models=[MagicMock()], acquire_timeout=5, max_queued_requests=1)
+        waiting_thread_errors: list[Exception] = []
+
+        def wait_for_model() -> None:
+            try:
+                with pool.acquire():
+                    pass
+            except Exception as e:
+                waiting_thread_errors.append(e)
+
+        with pool.acquire():
+            waiting_thread = threading.Thread(target=wait_for_model)
+            waiting_thread.start()
+            while pool._num_queued_requests == 0:
+                time.sleep(0.001)
+            # the queue is full: the request is rejected without waiting for the timeout
+            with pytest.raises(VisualPromptServiceBusyException, match="too many requests"), pool.acquire():
+                pass
+        waiting_thread.join()
+
+        assert not waiting_thread_errors
+
+    def test_concurrent_requests(self) -> None:
+        models = [MagicMock(), MagicMock()]
+        pool = VisualPrompterModelPool(models=models, acquire_timeout=5)
+        barrier = threading.Barrier(2, timeout=5)
+        acquired_models = []
+
+        def infer() -> None:
+            with pool.acquire() as model:
+                acquired_models.append(model)
+                # both requests must hold a model at the same time to pass the barrier
+                barrier.wait()
+
+        threads = [threading.Thread(target=infer) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not barrier.broken
+        assert sorted(map(id, acquired_models)) == sorted(map(id, models))
+
+    def test_empty_pool(self) -> None:
+        with pytest.raises(ValueError):
+            VisualPrompterModelPool(models=[], acquire_timeout=1)
@@ -1,6 +1,7 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 import logging
+from typing import NamedTuple
 
 import numpy as np
 from geti_types import ID, MediaIdentifierEntity
@@ -21,7 +22,11 @@ from iai_core.entities.metrics import (
 from iai_core.entities.shapes import Rectangle
 from iai_core.utils.shape_factory import ShapeFactory
 
-from jobs_common_extras.evaluation.utils.evaluation_helpers import get_iou_matrix, get_n_false_negatives
+from jobs_common_extras.evaluation.utils.evaluation_helpers import (
+    boxes_to_coords_array,
+    get_iou_matrix_from_arrays,
+    get_n_false_negatives,
+)
 
 from .performance_metric import PerformanceMetric
 
@@ -271,10 +276,25 @@ class _OverallResults:
         self.recall = recall
 
 
+class _BoxArrays(NamedTuple):
+    """
+    Array representation of the boxes of an image.
+
+    :param coords: float array of shape [num_boxes, 4] with the coordinates (x1, y1, x2, y2) of each box
+    :param class_indices: int array of shape [num_boxes] with the index of the class of each box
+    """
+
+    coords: np.ndarray
+    class_indices: np.ndarray
+
+
 class _FMeasureCalculator:
     """
     This class contains the functions to calculate FMeasure.
 
+    The boxes are converted once to arrays (coordinates and integer class indices), so that the boxes of a class
+    can be selected with a mask and the IoU can be computed with broadcasting.
+
     :param ground_truth_boxes_per_image: list containing:
         a box: [x1: float, y1, x2, y2, class: str, score: float]
         boxes_per_image: [box1, box2, …]
@@ -295,6 +315,27 @@ class _FMeasureCalculator:
         self.ground_truth_boxes_per_image = ground_truth_boxes_per_image
         self.prediction_boxes_per_image = prediction_boxes_per_image
         self.empty_label = empty_label
+        # Classes are matched case-insensitively
+        self._class_indices: dict[str, int] = {}
+        self._ground_truth_arrays = self.__to_box_arrays(ground_truth_boxes_per_image)
+        self._prediction_arrays = self.__to_box_arrays(prediction_boxes_per_image)
+
+    def __to_box_arrays(
+        self, boxes_per_image: list[list[tuple[float, float, float, float, ID, float]]]
+    ) -> list[_BoxArrays]:
+        box_arrays = []
+        for boxes in boxes_per_image:
+            class_indices = [
+                self._class_indices.setdefault(str(box[BOX_CLASS_INDEX]).lower(), len(self._class_indices))
+                for box in boxes
+            ]
+            box_arrays.append(
+                _BoxArrays(
+                    coords=boxes_to_coords_array(boxes),
+                    class_indices=np.array(class_indices, dtype=np.int64),
+                )
+            )
+        return box_arrays
 
     def evaluate_detections(
         self,
@@ -308,25 +349,15 @@ class _FMeasureCalculator:
         :param iou_threshold: IOU threshold. Defaults to 0.5.
         :return: _OverallResults object with the result statistics (e.g F-measure).
         """
-
-        f_measure_per_class = {}
-
-        # F-measure with no optimization
         result, all_classes_result = self.evaluate_classes(
             classes=classes.copy(),
             iou_threshold=iou_threshold,
         )
-        f_measure = all_classes_result.f_measure
-        precision = all_classes_result.precision
-        recall = all_classes_result.recall
-        for class_name in classes:
-            f_measure_per_class[class_name] = result[class_name].f_measure
-
         return _OverallResults(
-            f_measure_per_class=f_measure_per_class,
-            f_measure=f_measure,
-            precision=precision,
-            recall=recall,
+            f_measure_per_class={class_name: result[class_name].f_measure for class_name in classes},
+            f_measure=all_classes_result.f_measure,
+            precision=all_classes_result.precision,
+            recall=all_classes_result.recall,
         )
 
     def evaluate_classes(self, classes: list[ID], iou_threshold: float) -> tuple[dict[ID, _Metrics], _Metrics]:
@@ -371,56 +402,19 @@ class _FMeasureCalculator:
         """
         Get f_measure for specific class and iou threshold.
 
-        In order to reduce the number of redundant iterations and allow for cleaner, more general code later on,
-        all boxes are filtered at this stage by class.
-
         :param class_name: Name of the class for which the F measure is computed
         :param iou_threshold: IoU threshold
         :return: a structure containing the statistics (e.g. f_measure) and a structure containing the intermediated
             counters used to derive the stats (e.g. num. false positives)
         """
-        class_ground_truth_boxes_per_image = self.__filter_class(self.ground_truth_boxes_per_image, class_name)
-        class_predicted_boxes_per_image = self.__filter_class(self.prediction_boxes_per_image, class_name)
-        if len(class_ground_truth_boxes_per_image) > 0:
-            boxes_pair_per_class = _FMeasureCalculator(
-                ground_truth_boxes_per_image=class_ground_truth_boxes_per_image,
-                prediction_boxes_per_image=class_predicted_boxes_per_image,
-                empty_label=self.empty_label,
-            )
-            result_counters = boxes_pair_per_class.get_counters(iou_threshold=iou_threshold)
-            result_metrics = result_counters.calculate_f_measure()
-            results = (result_metrics, result_counters)
-        else:
+        if len(self._ground_truth_arrays) == 0:
             logger.warning("No ground truth images supplied for f-measure calculation.")
             # [f_measure, precision, recall, n_false_negatives, n_true, n_predicted]
-            results = (_Metrics(0.0, 0.0, 0.0), _ResultCounters(0, 0, 0))
-        return results
+            return _Metrics(0.0, 0.0, 0.0), _ResultCounters(0, 0, 0)
+        result_counters = self.get_counters(iou_threshold=iou_threshold, class_name=class_name)
+        return result_counters.calculate_f_measure(), result_counters
 
-    @staticmethod
-    def __filter_class(
-        boxes_per_image: list[list[tuple[float, float, float, float, ID, float]]],
-        class_name: ID,
-    ) -> list[list[tuple[float, float, float, float, ID, float]]]:
-        """
-        Filters boxes to only keep members of one class.
-
-        :param boxes_per_image: list of boxes per image, contains:
-            - a box: [x1: float, y1, x2, y2, class: str, score: float]
-            - boxes_per_image: [box1, box2, …]
-        :param class_name: Name of the class for which the boxes are filtered
-        :return: a list of lists of boxes
-        """
-        filtered_boxes_per_image = []
-        for boxes in boxes_per_image:
-            filtered_boxes = []
-            for box in boxes:
-                # TODO boxes tuple should be refactored to dataclass. This way we can access box.class
-                if box[BOX_CLASS_INDEX].lower() == class_name.lower():  # type: ignore[union-attr]
-                    filtered_boxes.append(box)
-            filtered_boxes_per_image.append(filtered_boxes)
-        return filtered_boxes_per_image
-
-    def get_counters(self, iou_threshold: float) -> _ResultCounters:
+    def get_counters(self, iou_threshold: float, class_name: ID | None = None) -> _ResultCounters:
         """
         Return counts of true positives, false positives and false negatives for a given iou threshold.
 
@@ -428,20 +422,25 @@ class _FMeasureCalculator:
         of ground truth boxes, then add each value to its corresponding counter
 
         :param iou_threshold: IoU threshold
+        :param class_name: Optional name of the class to count the boxes of. If None, all the boxes are counted.
         :return: Structure containing the number of false negatives, true positives and predictions.
         """
+        class_index = None if class_name is None else self._class_indices.get(str(class_name).lower(), -1)
         n_false_negatives = 0
         n_true = 0
         n_predicted = 0
-        for ground_truth_boxes, predicted_boxes in zip(
-            self.ground_truth_boxes_per_image, self.prediction_boxes_per_image
-        ):
-            n_true += len(ground_truth_boxes)
-            n_predicted += len(predicted_boxes)
-            if len(predicted_boxes) > 0:
-                if len(ground_truth_boxes) > 0:
-                    iou_matrix = get_iou_matrix(ground_truth_boxes, predicted_boxes)
+        for ground_truth_boxes, predicted_boxes in zip(self._ground_truth_arrays, self._prediction_arrays):
+            ground_truth_coords = ground_truth_boxes.coords
+            predicted_coords = predicted_boxes.coords
+            if class_index is not None:
+                ground_truth_coords = ground_truth_coords[ground_truth_boxes.class_indices == class_index]
+                predicted_coords = predicted_coords[predicted_boxes.class_indices == class_index]
+            n_true += len(ground_truth_coords)
+            n_predicted += len(predicted_coords)
+            if len(predicted_coords) > 0:
+                if len(ground_truth_coords) > 0:
+                    iou_matrix = get_iou_matrix_from_arrays(ground_truth_coords, predicted_coords)
                     n_false_negatives += get_n_false_negatives(iou_matrix, iou_threshold)
             else:
-                n_false_negatives += len(ground_truth_boxes)
+                n_false_negatives += len(ground_truth_coords)
         return _ResultCounters(n_false_negatives, n_true, n_predicted)
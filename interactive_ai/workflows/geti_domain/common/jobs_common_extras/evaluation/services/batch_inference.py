@@ -29,6 +29,7 @@ from jobs_common_extras.evaluation.services.inferencer import (
     ClassificationInferencer,
     InferencerFactory,
 )
+from jobs_common_extras.evaluation.services.media_prefetcher import MediaPrefetcher
 
 ASYNC_INFERENCE_SIZE_MB_THRESHOLD = int(os.environ.get("ASYNC_INFERENCE_SIZE_MB_THRESHOLD", 150))
 ASYNC_INFERENCE_GIGAFLOPS_THRESHOLD = int(os.environ.get("ASYNC_INFERENCE_GIGAFLOPS_THRESHOLD", 400))
@@ -190,7 +191,11 @@ class BatchInference:
             else:
                 dataset_item.append_annotations(predicted_ann_scene.annotations)
 
-        for idx, dataset_item in enumerate(dataset):
+        # Media are downloaded and decoded in background threads, while the inferencer processes the previous ones
+        prefetcher = MediaPrefetcher(dataset_storage_id=dataset_storage_id, dataset_items=dataset)
+        infer_time = 0.0
+        for n_inferred, (idx, dataset_item, media_numpy) in enumerate(prefetcher, start=1):
+            infer_start = time.perf_counter()
             if use_async:
                 self.inferencer.enqueue_prediction(
                     dataset_storage_id=dataset_storage_id,
@@ -198,19 +203,31 @@ class BatchInference:
                     media=dataset_item.media,
                     result_handler=add_prediction,
                     roi=dataset_item.roi,
+                    media_numpy=media_numpy,
                 )
             else:  # use sync API
                 predicted_ann_scene, metadata = self.inferencer.predict(
                     dataset_storage_id=dataset_storage_id,
                     media=dataset_item.media,
                     roi=dataset_item.roi,
+                    media_numpy=media_numpy,
                 )
                 add_prediction(
                     dataset_item_idx=idx,
                     predicted_ann_scene=predicted_ann_scene,
                     metadata=metadata,
                 )
-            self._update_progress()
+            infer_time += time.perf_counter() - infer_start
+            if self._update_progress():
+                logger.info(
+                    "Batch inference progress: %s/%s items; prefetch queue depth: %s; "
+                    "avg. fetch latency: %.1f ms; avg. infer latency: %.1f ms.",
+                    n_inferred,
+                    len(dataset),
+                    prefetcher.queue_depth,
+                    prefetcher.avg_fetch_latency_ms,
+                    1000 * infer_time / n_inferred,
+                )
 
         if use_async:
             self.inferencer.await_all()
@@ -223,8 +240,12 @@ class BatchInference:
             int(total_time / len(dataset) * 1000),
         )
 
-    def _update_progress(self) -> None:
-        """Update total progress"""
+    def _update_progress(self) -> bool:
+        """
+        Update total progress
+
+        :return: True if the progress percentage changed and was reported, False otherwise
+        """
         self._progress += 1
         _progress_pct = (
             int(self._progress / self.total_progress_size * (self.progress_end - self.progress_start))
@@ -234,6 +255,8 @@ class BatchInference:
         if _progress_pct > self._progress_pct:
             self.progress_callback(_progress_pct, self.progress_message)
             self._progress_pct = _progress_pct
+            return True
+        return False
 
     @staticmethod
     def _validate_model(model: Model) -> None:
@@ -180,6 +180,7 @@ class Inferencer(ABC):
         media: Media2D,
         roi: Annotation | None = None,
         annotation_scene: AnnotationScene | None = None,
+        media_numpy: np.ndarray | None = None,
     ) -> tuple[AnnotationScene, Sequence[IMetadata]]:
         """
         Performs inference on the given image and returns the prediction results.
@@ -189,14 +190,13 @@ class Inferencer(ABC):
             The media is expected to be an RGB array of shape (Height, Width, Channels) with uint8 type (0-255).
         :param roi: The region of interest (ROI) to be used for inference. Defaults to None.
         :param annotation_scene: optional annotation scene object to add annotations to
+        :param media_numpy: optional ROI-cropped media numpy array, if already fetched (e.g. by a prefetcher)
         :return: A tuple containing:
             - AnnotationScene object containing prediction results
             - sequence of metadata generated by the inference
         """
-        numpy_image = get_media_roi_numpy(
-            dataset_storage_identifier=dataset_storage_id,
-            media=media,
-            roi_shape=roi.shape if roi is not None else None,
+        numpy_image = self._get_media_roi_numpy(
+            dataset_storage_id=dataset_storage_id, media=media, roi=roi, media_numpy=media_numpy
         )
         result, metadata = self._predict_raw(numpy_image)
         annotations = self.convert_to_annotations(raw_predictions=result, metadata=metadata)
@@ -247,6 +247,7 @@ class Inferencer(ABC):
         media: Media2D,
         result_handler: Callable[[int, AnnotationScene, Sequence[IMetadata]], None],
         roi: Annotation | None = None,
+        media_numpy: np.ndarray | None = None,
     ) -> None:
         """
         Enqueues the prediction request for the given media.
@@ -258,17 +259,18 @@ class Inferencer(ABC):
         :param media: the media (image or video frame) for which predictions are to be made
         :param result_handler: the callback function to handle the prediction results
         :param roi: the region of interest (ROI) to be used for inference. Defaults to None.
+        :param media_numpy: optional ROI-cropped media numpy array, if already fetched (e.g. by a prefetcher)
         """
         # If tiling is enabled, predict using the synchronous method
         # The tiling model runs prediction using the async API for each image tile
         if self.tiling_enabled:
-            pred_ann_scene, metadata = self.predict(dataset_storage_id=dataset_storage_id, media=media, roi=roi)
+            pred_ann_scene, metadata = self.predict(
+                dataset_storage_id=dataset_storage_id, media=media, roi=roi, media_numpy=media_numpy
+            )
             result_handler(item_idx, pred_ann_scene, metadata)
             return
-        numpy_image = get_media_roi_numpy(
-            dataset_storage_identifier=dataset_storage_id,
-            media=media,
-            roi_shape=roi.shape if roi is not None else None,
+        numpy_image = self._get_media_roi_numpy(
+            dataset_storage_id=dataset_storage_id, media=media, roi=roi, media_numpy=media_numpy
         )
         img, metadata = self.model.preprocess(numpy_image)
         callback_data = item_idx, media, metadata, result_handler
@@ -278,6 +280,22 @@ class Inferencer(ABC):
         """Await all running infer requests if any."""
         self.model.await_all()
 
+    @staticmethod
+    def _get_media_roi_numpy(
+        dataset_storage_id: DatasetStorageIdentifier,
+        media: Media2D,
+        roi: Annotation | None,
+        media_numpy: np.ndarray | None,
+    ) -> np.ndarray:
+        """Return the prefetched media numpy array if available, otherwise fetch and decode the media"""
+        if media_numpy is not None:
+            return media_numpy
+        return get_media_roi_numpy(
+            dataset_storage_identifier=dataset_storage_id,
+            media=media,
+            roi_shape=roi.shape if roi is not None else None,
+        )
+
 
 class ClassificationInferencer(Inferencer):
     def __init__(self, model: Model, **kwargs):
@@ -621,6 +639,7 @@ class VisualPromptingInferencer(Inferencer):
         media: Media2D,
         result_handler: Callable[[int, AnnotationScene, Sequence[IMetadata]], None],
         roi: Annotation | None = None,
+        media_numpy: np.ndarray | None = None,
     ) -> None:
         raise NotImplementedError("Visual prompting models do not support asynchronous inference.")
 
@@ -0,0 +1,173 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""This module contains the MediaPrefetcher class, which fetches and decodes media ahead of inference"""
+
+import logging
+import os
+import time
+from collections import deque
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import NamedTuple
+
+import numpy as np
+from geti_types import CTX_SESSION_VAR, ID, DatasetStorageIdentifier, Session, session_context
+from iai_core.entities.dataset_item import DatasetItem
+from iai_core.entities.datasets import Dataset
+from iai_core.entities.video import VideoFrame
+from media_utils import get_media_roi_numpy
+
+# Number of threads fetching and decoding media; 0 disables the prefetching
+BATCH_INFERENCE_PREFETCH_WORKERS = int(os.environ.get("BATCH_INFERENCE_PREFETCH_WORKERS", "4"))
+# Maximum number of decoded media held in memory ahead of inference
+BATCH_INFERENCE_PREFETCH_DEPTH = int(os.environ.get("BATCH_INFERENCE_PREFETCH_DEPTH", "16"))
+
+logger = logging.getLogger(__name__)
+
+
+class PrefetchedItem(NamedTuple):
+    """
+    Dataset item with its decoded media
+
+    :param item_idx: index of the item in the dataset
+    :param dataset_item: the dataset item
+    :param media_numpy: ROI-cropped media numpy array, or None if the media was not prefetched
+    """
+
+    item_idx: int
+    dataset_item: DatasetItem
+    media_numpy: np.ndarray | None
+
+
+class _WorkUnit(NamedTuple):
+    """
+    Dataset items whose media are fetched sequentially by the same worker
+
+    :param video_id: ID of the video if the items are frames of the same video, None otherwise
+    :param items: the items, with their index in the dataset
+    """
+
+    video_id: ID | None
+    items: list[tuple[int, DatasetItem]]
+
+
+class MediaPrefetcher:
+    """
+    Bounded pipeline that fetches and decodes the media of the dataset items in a thread pool, ahead of the
+    consumer (inference).
+
+    The frames of the same video are decoded in increasing frame order, in chunks that are fetched one after the
+    other, so that the video reader can decode them sequentially instead of seeking each frame. The items are
+    therefore yielded grouped by video, not necessarily in dataset order; each item carries its index in the dataset.
+
+    :param dataset_storage_id: identifier of the dataset storage containing the media
+    :param dataset_items: dataset items to prefetch the media for
+    :param num_workers: number of threads fetching the media. If 0, the media is fetched lazily by the consumer.
+    :param max_prefetched_items: maximum number of decoded media waiting to be consumed
+    """
+
+    def __init__(
+        self,
+        dataset_storage_id: DatasetStorageIdentifier,
+        dataset_items: Dataset | Sequence[DatasetItem],
+        num_workers: int = BATCH_INFERENCE_PREFETCH_WORKERS,
+        max_prefetched_items: int = BATCH_INFERENCE_PREFETCH_DEPTH,
+    ) -> None:
+        self.dataset_storage_id = dataset_storage_id
+        self.dataset_items = dataset_items
+        self.num_workers = num_workers
+        self.max_prefetched_items = max(1, max_prefetched_items)
+        self._queued_items = 0
+        self._fetch_time = 0.0
+        self._num_fetched = 0
+        self._stats_lock = Lock()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of items that are being fetched or waiting to be consumed"""
+        return self._queued_items
+
+    @property
+    def avg_fetch_latency_ms(self) -> float:
+        """Average time to fetch and decode the media of one item, in milliseconds"""
+        return 1000 * self._fetch_time / self._num_fetched if self._num_fetched else 0.0
+
+    def _group_items(self) -> list[_WorkUnit]:
+        """
+        Group the items into work units: one unit per image, and one unit per chunk of frames of the same video,
+        sorted by frame index. The units are ordered by first appearance in the dataset.
+        """
+        units: list[_WorkUnit] = []
+        video_units: dict[ID, _WorkUnit] = {}
+        for idx, dataset_item in enumerate(self.dataset_items):
+            media = dataset_item.media
+            if isinstance(media, VideoFrame):
+                if media.video.id_ not in video_units:
+                    video_units[media.video.id_] = _WorkUnit(video_id=media.video.id_, items=[])
+                    units.append(video_units[media.video.id_])
+                video_units[media.video.id_].items.append((idx, dataset_item))
+            else:
+                units.append(_WorkUnit(video_id=None, items=[(idx, dataset_item)]))
+
+        chunked_units: list[_WorkUnit] = []
+        for unit in units:
+            unit.items.sort(key=lambda idx_and_item: getattr(idx_and_item[1].media, "frame_index", 0))
+            for start in range(0, len(unit.items), self.max_prefetched_items):
+                chunked_units.append(unit._replace(items=unit.items[start : start + self.max_prefetched_items]))
+        return chunked_units
+
+    def _fetch_unit(self, session: Session, unit: _WorkUnit) -> list[PrefetchedItem]:
+        """Fetch and decode the media of a work unit, sequentially"""
+        start = time.perf_counter()
+        prefetched_items = []
+        with session_context(session=session):
+            for idx, dataset_item in unit.items:
+                media_numpy = get_media_roi_numpy(
+                    dataset_storage_identifier=self.dataset_storage_id,
+                    media=dataset_item.media,
+                    roi_shape=dataset_item.roi.shape if dataset_item.roi is not None else None,
+                )
+                prefetched_items.append(PrefetchedItem(idx, dataset_item, media_numpy))
+        with self._stats_lock:
+            self._fetch_time += time.perf_counter() - start
+            self._num_fetched += len(unit.items)
+        return prefetched_items
+
+    def __iter__(self) -> Iterator[PrefetchedItem]:
+        if self.num_workers <= 0:
+            for idx, dataset_item in enumerate(self.dataset_items):
+                yield PrefetchedItem(idx, dataset_item, None)
+            return
+
+        session = CTX_SESSION_VAR.get()
+        units = deque(self._group_items())
+        pending: deque[tuple[_WorkUnit, Future[list[PrefetchedItem]]]] = deque()
+        # Videos with a chunk being fetched: their next chunk waits, so that a video is never read by two workers
+        fetching_video_ids: set[ID] = set()
+        self._queued_items = 0
+        with ThreadPoolExecutor(max_workers=self.num_workers, thread_name_prefix="media_prefetcher") as executor:
+            try:
+                while units or pending:
+                    # Keep the workers busy, as long as the number of queued items is within the limit
+                    while (
+                        units
+                        and units[0].video_id not in fetching_video_ids
+                        and (not pending or self._queued_items + len(units[0].items) <= self.max_prefetched_items)
+                    ):
+                        unit = units.popleft()
+                        pending.append((unit, executor.submit(self._fetch_unit, session, unit)))
+                        self._queued_items += len(unit.items)
+                        if unit.video_id is not None:
+                            fetching_video_ids.add(unit.video_id)
+                    unit, future = pending.popleft()
+                    prefetched_items = future.result()
+                    if unit.video_id is not None:
+                        fetching_video_ids.discard(unit.video_id)
+                    for prefetched_item in prefetched_items:
+                        self._queued_items -= 1
+                        yield prefetched_item
+            finally:
+                for _, future in pending:
+                    future.cancel()
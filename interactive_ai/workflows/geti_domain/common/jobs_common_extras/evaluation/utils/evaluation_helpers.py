@@ -73,29 +73,73 @@ def get_iou_matrix(
         boxes2: [boxes_per_image_1, boxes_per_image_2, boxes_per_image_3, …]
     :return: IoU matrix of shape [ground_truth_boxes, predicted_boxes]
     """
-    gt_rects = [Rectangle(x1=x1, y1=y1, x2=x2, y2=y2) for x1, y1, x2, y2, *_ in ground_truth]
-    pred_rects = [Rectangle(x1=x1, y1=y1, x2=x2, y2=y2) for x1, y1, x2, y2, *_ in predicted]
-    return np.array([[intersection_over_union(gts, preds) for preds in pred_rects] for gts in gt_rects])
+    return get_iou_matrix_from_arrays(
+        ground_truth_coords=boxes_to_coords_array(ground_truth),
+        predicted_coords=boxes_to_coords_array(predicted),
+    )
+
+
+def boxes_to_coords_array(boxes: Sequence[Sequence]) -> np.ndarray:
+    """
+    Converts a sequence of boxes to an array of coordinates.
+
+    :param boxes: sequence of boxes, each starting with the coordinates [x1: float, y1, x2, y2, ...]
+    :return: float array of shape [num_boxes, 4] with the coordinates (x1, y1, x2, y2) of each box
+    """
+    return np.array([box[:4] for box in boxes], dtype=np.float64).reshape(-1, 4)
+
+
+def get_iou_matrix_from_arrays(ground_truth_coords: np.ndarray, predicted_coords: np.ndarray) -> np.ndarray:
+    """
+    Constructs an iou matrix of shape [num_ground_truth_boxes, num_predicted_boxes] from arrays of box coordinates.
+
+    The intersection over union of all the pairs of boxes is computed at once by broadcasting. The result is
+    identical to computing intersection_over_union for each pair of boxes.
+
+    :param ground_truth_coords: array of shape [num_ground_truth_boxes, 4] with the coordinates (x1, y1, x2, y2)
+    :param predicted_coords: array of shape [num_predicted_boxes, 4] with the coordinates (x1, y1, x2, y2)
+    :return: IoU matrix of shape [ground_truth_boxes, predicted_boxes]
+    """
+    gt_x1, gt_y1, gt_x2, gt_y2 = (ground_truth_coords[:, i, np.newaxis] for i in range(4))
+    pred_x1, pred_y1, pred_x2, pred_y2 = (predicted_coords[np.newaxis, :, i] for i in range(4))
+    x_left = np.maximum(gt_x1, pred_x1)
+    y_top = np.maximum(gt_y1, pred_y1)
+    x_right = np.minimum(gt_x2, pred_x2)
+    y_bottom = np.minimum(gt_y2, pred_y2)
+    has_intersection = (x_right > x_left) & (y_bottom > y_top)
+    intersection_area = np.where(has_intersection, (x_right - x_left) * (y_bottom - y_top), 0.0)
+    gt_area = (gt_x2 - gt_x1) * (gt_y2 - gt_y1)
+    pred_area = (pred_x2 - pred_x1) * (pred_y2 - pred_y1)
+    union_area = gt_area + pred_area - intersection_area
+    iou_matrix = np.divide(
+        intersection_area,
+        union_area,
+        out=np.zeros_like(intersection_area),
+        where=has_intersection & (union_area != 0),
+    )
+    if np.any((iou_matrix < 0.0) | (iou_matrix > 1.0)):
+        raise ValueError(
+            f"intersection over union should be in range [0,1], instead got iou in "
+            f"[{iou_matrix.min()}, {iou_matrix.max()}]"
+        )
+    return iou_matrix
 
 
 def get_n_false_negatives(iou_matrix: np.ndarray, iou_threshold: float) -> int:
     """
     Get the number of false negatives inside the IoU matrix for a given threshold.
 
-    The first loop accounts for all the ground truth boxes which do not have a high enough iou with any predicted
+    The first term accounts for all the ground truth boxes which do not have a high enough iou with any predicted
     box (they go undetected)
-    The second loop accounts for the much rarer case where two ground truth boxes are detected by the same predicted
+    The second term accounts for the much rarer case where two ground truth boxes are detected by the same predicted
     box. The principle is that each ground truth box requires a unique prediction box
 
     :param iou_matrix: IoU matrix of shape [ground_truth_boxes, predicted_boxes]
     :param iou_threshold: IoU threshold to use for the false negatives.
     :return: Number of false negatives
     """
-    n_false_negatives = 0
-    for row in iou_matrix:
-        if max(row) < iou_threshold:
-            n_false_negatives += 1
-    for column in np.rot90(iou_matrix):
-        indices = np.where(column > iou_threshold)
-        n_false_negatives += max(len(indices[0]) - 1, 0)
-    return n_false_negatives
+    max_iou_per_ground_truth = iou_matrix.max(axis=1)
+    n_undetected = np.count_nonzero(max_iou_per_ground_truth < iou_threshold)
+    n_matches_per_prediction = np.count_nonzero(iou_matrix > iou_threshold, axis=0)
+    n_duplicate_matches = np.maximum(n_matches_per_prediction - 1, 0).sum()
+    return int(n_undetected + n_duplicate_matches)
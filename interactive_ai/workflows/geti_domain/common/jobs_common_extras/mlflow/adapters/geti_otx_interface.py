@@ -7,6 +7,7 @@ import io
 import json
 import logging
 import os
+from collections.abc import Collection
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Any
@@ -48,6 +49,10 @@ logger = logging.getLogger(__name__)
 
 __all__ = ["GetiOTXInterfaceAdapter", "MLFlowLifecycleStage", "MLFlowRunStatus"]
 
+# Directory of the project, outside any job directory, where content-addressed dataset shard files are kept
+# so that they can be reused by the following jobs
+DATASET_SHARDS_CACHE_DIR = "dataset_shards"
+
 UNAVAILABLE_PERFORMANCE_WARNING = (
     "Performance metrics are not available for the trained model due to an internal error; please contact support."
 )
@@ -217,6 +222,64 @@ class GetiOTXInterfaceAdapter:
             # It is because iai-core binary repo `save()` function only allows a filename, not a filepath.
             self.binary_repo.save_group(source_directory=root)
 
+    @staticmethod
+    def get_cached_dataset_shard_path(content_key: str) -> str:
+        """Path of a content-addressed dataset shard file in the binary repo.
+
+        :param content_key: Content key of the shard file
+        :return: `dataset_shards/<content-key>.arrow`
+        """
+        return os.path.join(DATASET_SHARDS_CACHE_DIR, f"{content_key}.arrow")
+
+    @unified_tracing
+    def push_cached_input_dataset(self, shard_file_local_path: Path, content_key: str) -> None:
+        """Push the dataset shard file to the dataset shards cache, then copy it to the inputs directory.
+
+        :param shard_file_local_path: Local disk path of shard file
+        :param content_key: Content key of the shard file
+        """
+        with TemporaryDirectory() as root:
+            cached_shard_path = self.get_cached_dataset_shard_path(content_key)
+            local_dst = os.path.join(root, cached_shard_path)
+            os.makedirs(os.path.dirname(local_dst))
+            os.symlink(src=shard_file_local_path, dst=local_dst)
+
+            # NOTE: This is a workaround to construct
+            # dataset_shards/... directory structure in the S3 bucket.
+            # It is because iai-core binary repo `save()` function only allows a filename, not a filepath.
+            self.binary_repo.save_group(source_directory=root)
+
+        self.pull_cached_input_dataset(content_key=content_key, filename=shard_file_local_path.name)
+
+    @unified_tracing
+    def pull_cached_input_dataset(self, content_key: str, filename: str) -> bool:
+        """Copy a dataset shard file from the dataset shards cache to the inputs directory, without downloading it.
+
+        :param content_key: Content key of the shard file
+        :param filename: Name of the shard file in the inputs directory
+        :return: True if the shard file was copied, False if it is not present in the cache
+        """
+        cached_shard_path = self.get_cached_dataset_shard_path(content_key)
+        if not self.binary_repo.exists(cached_shard_path):
+            return False
+
+        self.binary_repo.copy_within(
+            src_filepath=cached_shard_path,
+            dst_filepath=os.path.join(self.dst_path_prefix, "inputs", filename),
+        )
+        return True
+
+    @unified_tracing
+    def prune_cached_input_datasets(self, content_keys_to_keep: Collection[str]) -> None:
+        """Remove the dataset shard files from the dataset shards cache, except the given ones.
+
+        :param content_keys_to_keep: Content keys of the shard files to keep in the cache
+        """
+        self.binary_repo.delete_all_under_dir_except(
+            directory=DATASET_SHARDS_CACHE_DIR,
+            keep_filepaths={self.get_cached_dataset_shard_path(content_key) for content_key in content_keys_to_keep},
+        )
+
     @unified_tracing
     def push_input_configuration(
         self,
@@ -4,6 +4,7 @@
 import logging
 import os
 import uuid
+from collections.abc import Collection
 
 from geti_types import ID
 from iai_core.repos.storage.binary_repo import BinaryRepo
@@ -92,6 +93,31 @@ class MLFlowExperimentBinaryRepo(BinaryRepo):
         )
         return dst_filename
 
+    def copy_within(self, src_filepath: str, dst_filepath: str) -> str:
+        """Copy a file to another location of this MLFLow experiment binary repo with a server-side copy.
+
+        :param src_filepath: Path of the file in this repo to copy ('dataset_shards/<filename>')
+        :param dst_filepath: Path of the copy in this repo ('jobs/<job-id>/inputs/<filename>')
+        :return: Same as dst_filepath
+        """
+        storage_client = self.storage_client
+        if not isinstance(storage_client, ObjectStorageClient):
+            msg = "MLFlow storage client should be ObjectStorageClient."
+            raise TypeError(msg)
+
+        source = CopySource(
+            bucket_name=storage_client.bucket_name,
+            object_name=os.path.join(storage_client.object_name_base, src_filepath),
+        )
+
+        # Server side copy
+        storage_client.client.copy_object(
+            bucket_name=storage_client.bucket_name,
+            object_name=os.path.join(storage_client.object_name_base, dst_filepath),
+            source=source,
+        )
+        return dst_filepath
+
     def _check_storage_clients(
         self, model_binary_repo: ModelBinaryRepo
     ) -> tuple[ObjectStorageClient, ObjectStorageClient]:
@@ -130,3 +156,32 @@ class MLFlowExperimentBinaryRepo(BinaryRepo):
         errors = client.remove_objects(bucket_name, delete_object_list=delete_object_list)
         for error in errors:
             logger.error("An error occurred when deleting object: %s", error)
+
+    # TODO CVS-133311 apply retry on rate limit after refactoring
+    @reinit_client_and_retry_on_timeout
+    def delete_all_under_dir_except(self, directory: str, keep_filepaths: Collection[str]) -> None:
+        """Delete all objects under `mlflowexperiments/.../<directory>`, except the given ones.
+
+        :param directory: Directory of the objects to remove ('dataset_shards')
+        :param keep_filepaths: Paths of the objects to keep in this repo ('dataset_shards/<filename>')
+        """
+        if not isinstance(self.storage_client, ObjectStorageClient):
+            logger.warning("Only ObjectStorageClient is available for delete all under dir.")
+            return
+
+        client = self.storage_client.client
+        bucket_name = self.storage_client.bucket_name
+
+        prefix = os.path.join(self.storage_client.object_name_base, directory, "")
+        keep_object_names = {
+            os.path.join(self.storage_client.object_name_base, filepath) for filepath in keep_filepaths
+        }
+
+        delete_object_list = (
+            DeleteObject(x.object_name)
+            for x in client.list_objects(bucket_name, prefix=prefix, recursive=True)
+            if x.object_name not in keep_object_names
+        )
+        errors = client.remove_objects(bucket_name, delete_object_list=delete_object_list)
+        for error in errors:
+            logger.error("An error occurred when deleting object: %s", error)
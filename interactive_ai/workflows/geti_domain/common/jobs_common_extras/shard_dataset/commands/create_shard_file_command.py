@@ -120,7 +120,17 @@ class CreateShardFileCommand(ICommand):
     @property
     def fname(self) -> str:
         """Get shard file name"""
-        return f"datum-{self.shard_idx}-of-{self.total_num_shards}.arrow"
+        return self.get_fname(shard_idx=self.shard_idx, total_num_shards=self.total_num_shards)
+
+    @staticmethod
+    def get_fname(shard_idx: int, total_num_shards: int) -> str:
+        """Get the name of the shard file with the given index
+
+        :param shard_idx: Integer index of the shard file
+        :param total_num_shards: Total number of shard files
+        :return: Shard file name
+        """
+        return f"datum-{shard_idx}-of-{total_num_shards}.arrow"
 
     @property
     def fsize(self) -> int:
@@ -1,9 +1,13 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+import hashlib
 import logging
+import math
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 
 from geti_telemetry_tools import unified_tracing
+from geti_types import ID
 from iai_core.entities.dataset_item import DatasetItem
 from iai_core.entities.datasets import Dataset
 from iai_core.entities.image import Image
@@ -14,6 +18,10 @@ from jobs_common.exceptions import DataShardCreationFailedException
 
 logger = logging.getLogger(__name__)
 
+# Version of the shard file layout, part of each content key. Increase it whenever the content of the shard files
+# changes for the same dataset items (e.g. Datumaro export changes), so that the cached shard files are not reused.
+SHARD_CONTENT_KEY_VERSION = "1"
+
 
 def _get_sort_keys(item: DatasetItem) -> tuple[str, int]:
     """Create keys for sorting dataset items.
@@ -25,6 +33,45 @@ def _get_sort_keys(item: DatasetItem) -> tuple[str, int]:
     return item.media.name, 0
 
 
+def _get_bucket_hash(item: DatasetItem) -> int:
+    """Stable hash of the media of a dataset item, used to assign the item to a content-addressed shard"""
+    media_key = "/".join(str(value) for value in item.media_identifier.as_tuple())
+    return int.from_bytes(hashlib.sha1(media_key.encode(), usedforsecurity=False).digest()[:8], "big")
+
+
+def _get_item_content_key(item: DatasetItem) -> str:
+    """Digest of everything in a dataset item that ends up in the shard file"""
+    annotation_ids = sorted(str(annotation.id_) for annotation in item.annotation_scene.annotations)
+    ignored_label_ids = sorted(str(label_id) for label_id in item.ignored_label_ids)
+    return "|".join(
+        [
+            "/".join(str(value) for value in item.media_identifier.as_tuple()),
+            str(item.annotation_scene.id_),
+            ",".join(annotation_ids),
+            str(item.roi_id),
+            item.subset.name,
+            ",".join(ignored_label_ids),
+        ]
+    )
+
+
+def get_shard_content_key(items: Sequence[DatasetItem], label_schema_id: ID) -> str:
+    """Compute the content key of a shard, which changes whenever any of its dataset items changes.
+
+    Annotation scenes are immutable, so the key changes when the annotations of a media are edited, when items are
+    added or removed from the shard, when their subset changes or when the label schema changes.
+
+    :param items: Dataset items in the shard
+    :param label_schema_id: ID of the label schema used to compile the shard
+    :return: SHA-256 hex digest identifying the content of the shard
+    """
+    hash_object = hashlib.sha256()
+    hash_object.update(f"{SHARD_CONTENT_KEY_VERSION}|{label_schema_id}\n".encode())
+    for item_content_key in sorted(_get_item_content_key(item) for item in items):
+        hash_object.update(f"{item_content_key}\n".encode())
+    return hash_object.hexdigest()
+
+
 @dataclass
 class Shard:
     """Shard dataclass
@@ -65,6 +112,10 @@ class MapItemsToShardsCommand(ICommand):
     :param max_shard_size: Maximum number of DatasetItems that can be contained in each shard
     :param max_media_size: Maximum bytes of DatasetItems' media that can be contained in each shard
         (Default is 512 MiB)
+    :param content_addressed: If True, each item is assigned to a shard by hashing its media identifier, so that
+        the same media always goes to the same shard as long as the number of shards does not change. The number
+        of shards is a power of two, chosen so that shards are on average between half-full and full; as a result,
+        max_shard_size and max_media_size are targets rather than strict limits in this mode.
     """
 
     def __init__(
@@ -72,11 +123,13 @@ class MapItemsToShardsCommand(ICommand):
         train_dataset: Dataset,
         max_shard_size: int,
         max_media_size: int = 512 * 1024**2,  # 512 MiB
+        content_addressed: bool = False,
     ) -> None:
         super().__init__()
         self.train_dataset = train_dataset
         self.max_shard_size = max_shard_size
         self.max_media_size = max_media_size
+        self.content_addressed = content_addressed
         self._shards: list[Shard] | None = None
 
     @unified_tracing
@@ -89,6 +142,10 @@ class MapItemsToShardsCommand(ICommand):
         try:
             items: list[DatasetItem] = list(self.train_dataset)
 
+            if self.content_addressed:
+                self._shards = self._map_items_to_buckets(items)
+                return
+
             items.sort(key=_get_sort_keys)
 
             self._shards = []
@@ -108,6 +165,22 @@ class MapItemsToShardsCommand(ICommand):
             logger.exception(f"Could not map items to shards for Dataset[id={self.train_dataset.id_}]")
             raise DataShardCreationFailedException from exc
 
+    def _map_items_to_buckets(self, items: list[DatasetItem]) -> list[Shard]:
+        """Assign the items to a power-of-two number of shards by hashing their media identifier"""
+        total_media_size = sum(Shard._get_media_size(item) for item in items)
+        min_num_buckets = max(
+            math.ceil(len(items) / self.max_shard_size),
+            math.ceil(total_media_size / self.max_media_size),
+            1,
+        )
+        num_buckets = 1 << (min_num_buckets - 1).bit_length()
+
+        buckets = [Shard() for _ in range(num_buckets)]
+        for item in sorted(items, key=_get_sort_keys):
+            buckets[_get_bucket_hash(item) % num_buckets].append(item)
+
+        return [bucket for bucket in buckets if bucket.cnt > 0]
+
     @property
     def shards(self) -> list[list[DatasetItem]]:
         """Return a nested list of dataset items
@@ -0,0 +1,58 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""This module defines a command to remove the unused shard files from the dataset shards cache"""
+
+import logging
+import os
+
+from geti_telemetry_tools import unified_tracing
+from geti_types import DatasetStorageIdentifier, ProjectIdentifier
+from iai_core.repos import CompiledDatasetShardsRepo
+
+from jobs_common.commands.interfaces.command import ICommand
+from jobs_common.tasks.utils.secrets import JobMetadata
+from jobs_common_extras.mlflow.adapters.geti_otx_interface import GetiOTXInterfaceAdapter
+
+logger = logging.getLogger(__name__)
+
+# Number of most recent compiled dataset shards whose shard files are kept in the dataset shards cache
+DATASET_SHARDS_CACHE_RETENTION = int(os.environ.get("DATASET_SHARDS_CACHE_RETENTION", "4"))
+
+
+class PruneShardFileCacheCommand(ICommand):
+    """Remove from the dataset shards cache of the project the shard files that are not part of the most recent
+    compiled dataset shards, so that the cache does not grow with every job.
+
+    :param project_identifier: Project identifier
+    :param dataset_storage_identifier: Identifier of the dataset storage containing the compiled dataset shards
+    :param num_compiled_dataset_shards_to_keep: Number of most recent compiled dataset shards whose shard files are
+        kept in the cache
+    """
+
+    def __init__(
+        self,
+        project_identifier: ProjectIdentifier,
+        dataset_storage_identifier: DatasetStorageIdentifier,
+        num_compiled_dataset_shards_to_keep: int = DATASET_SHARDS_CACHE_RETENTION,
+    ) -> None:
+        super().__init__()
+        self.project_identifier = project_identifier
+        self.dataset_storage_identifier = dataset_storage_identifier
+        self.num_compiled_dataset_shards_to_keep = num_compiled_dataset_shards_to_keep
+        self._otx_api_adapter = GetiOTXInterfaceAdapter(
+            project_identifier=self.project_identifier, job_metadata=JobMetadata.from_env_vars()
+        )
+
+    @unified_tracing
+    def execute(self) -> None:
+        """
+        Remove the unused shard files from the cache. Failures are only logged, since they do not affect the job.
+        """
+        try:
+            content_keys_to_keep = CompiledDatasetShardsRepo(
+                self.dataset_storage_identifier
+            ).get_content_keys_of_latest(num_compiled_dataset_shards=self.num_compiled_dataset_shards_to_keep)
+            self._otx_api_adapter.prune_cached_input_datasets(content_keys_to_keep=content_keys_to_keep)
+        except Exception:
+            logger.exception(f"Could not prune the dataset shards cache of project {self.project_identifier}")
@@ -0,0 +1,87 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""This module defines a command to reuse a shard file compiled by a previous job"""
+
+import logging
+
+from geti_telemetry_tools import unified_tracing
+from geti_types import ProjectIdentifier
+from iai_core.entities.compiled_dataset_shards import CompiledDatasetShard
+
+from jobs_common.commands.interfaces.command import ICommand
+from jobs_common.exceptions import DataShardCreationFailedException
+from jobs_common.tasks.utils.secrets import JobMetadata
+from jobs_common_extras.mlflow.adapters.geti_otx_interface import GetiOTXInterfaceAdapter
+
+logger = logging.getLogger(__name__)
+
+
+class ReuseShardFileCommand(ICommand):
+    """Reuse a content-addressed shard file compiled by a previous job, by copying it from the dataset shards cache
+    of the project to the inputs of the current job.
+
+    :param dataset_id: ID of Dataset to shard
+    :param project_identifier: Project identifier
+    :param cached_shard_file: Shard file with the same content key, compiled by a previous job
+    :param fname: Name of the shard file in the inputs of the current job
+    """
+
+    def __init__(
+        self,
+        dataset_id: str,
+        project_identifier: ProjectIdentifier,
+        cached_shard_file: CompiledDatasetShard,
+        fname: str,
+    ) -> None:
+        super().__init__()
+        if cached_shard_file.content_key is None:
+            raise ValueError("Only content-addressed shard files can be reused.")
+        self.dataset_id = dataset_id
+        self.project_identifier = project_identifier
+        self.cached_shard_file = cached_shard_file
+        self.fname = fname
+        self._compiled_shard_file: CompiledDatasetShard | None = None
+        self._executed = False
+        self._otx_api_adapter = GetiOTXInterfaceAdapter(
+            project_identifier=self.project_identifier, job_metadata=JobMetadata.from_env_vars()
+        )
+
+    @unified_tracing
+    def execute(self) -> None:
+        """
+        Copy the cached shard file to the inputs of the job, if it still exists.
+
+        :raises DataShardCreationFailedException: if the shard file cannot be copied
+        """
+        content_key = self.cached_shard_file.content_key
+        try:
+            copied = self._otx_api_adapter.pull_cached_input_dataset(
+                content_key=content_key,  # type: ignore[arg-type]
+                filename=self.fname,
+            )
+        except Exception as exc:
+            logger.exception(f"Could not reuse the dataset shard file {content_key} for Dataset[id={self.dataset_id}]")
+            raise DataShardCreationFailedException from exc
+        finally:
+            self._executed = True
+
+        if not copied:
+            logger.warning(f"Dataset shard file {content_key} is no longer cached; it will be compiled again.")
+            return
+
+        self._compiled_shard_file = CompiledDatasetShard(
+            filename=self.fname,
+            binary_filename=self.fname,
+            size=self.cached_shard_file.size,
+            checksum=self.cached_shard_file.checksum,
+            content_key=content_key,
+        )
+
+    @property
+    def compiled_shard_file(self) -> CompiledDatasetShard | None:
+        """Reused shard file, or None if the shard file was not found in the cache and must be compiled again"""
+        if not self._executed:
+            raise RuntimeError("Please do execute() first")
+
+        return self._compiled_shard_file
@@ -22,13 +22,22 @@ class UploadShardFileCommand(ICommand):
     :param dataset_id: ID of Dataset to shard
     :param project_identifier: Project identifier
     :param fpath: File path of the shard file to upload
+    :param content_key: Optional, content key of the shard file. If given, the file is also kept in the dataset
+        shards cache of the project, so that it can be reused by the following jobs.
     """
 
-    def __init__(self, dataset_id: str, project_identifier: ProjectIdentifier, fpath: str) -> None:
+    def __init__(
+        self,
+        dataset_id: str,
+        project_identifier: ProjectIdentifier,
+        fpath: str,
+        content_key: str | None = None,
+    ) -> None:
         super().__init__()
         self.dataset_id = dataset_id
         self.project_identifier = project_identifier
         self.fpath = fpath
+        self.content_key = content_key
         self._binary_filename: str | None = None
         self._otx_api_adapter = GetiOTXInterfaceAdapter(
             project_identifier=self.project_identifier, job_metadata=JobMetadata.from_env_vars()
@@ -37,7 +46,12 @@ class UploadShardFileCommand(ICommand):
     @unified_tracing
     def execute(self) -> None:
         try:
-            self._otx_api_adapter.push_input_dataset(shard_file_local_path=Path(self.fpath))
+            if self.content_key is not None:
+                self._otx_api_adapter.push_cached_input_dataset(
+                    shard_file_local_path=Path(self.fpath), content_key=self.content_key
+                )
+            else:
+                self._otx_api_adapter.push_input_dataset(shard_file_local_path=Path(self.fpath))
             self._binary_filename = os.path.basename(self.fpath)
         except Exception as exc:
             logger.exception(f"Could not upload a dataset shard file for Dataset[id={self.dataset_id}]")
@@ -12,11 +12,14 @@ import flytekit
 from geti_telemetry_tools import unified_tracing
 from geti_types import DatasetStorageIdentifier
 from iai_core.entities.compiled_dataset_shards import CompiledDatasetShard
+from iai_core.entities.dataset_item import DatasetItem
 from iai_core.entities.datasets import Dataset
 from iai_core.entities.label_schema import LabelSchema
 from iai_core.entities.project import Project
+from iai_core.repos import CompiledDatasetShardsRepo
 from kubernetes.client.models import V1ResourceRequirements
 
+from jobs_common.features.feature_flag_provider import FeatureFlag, FeatureFlagProvider
 from jobs_common.tasks.primary_container_task import get_flyte_pod_spec
 from jobs_common.utils.annotation_filter import AnnotationFilter
 from jobs_common.utils.progress_helper import noop_progress_callback
@@ -24,7 +27,12 @@ from jobs_common_extras.shard_dataset.commands.create_and_save_compiled_dataset_
     CreateAndSaveCompiledDatasetShardsCommand,
 )
 from jobs_common_extras.shard_dataset.commands.create_shard_file_command import CreateShardFileCommand
-from jobs_common_extras.shard_dataset.commands.map_items_to_shards_command import MapItemsToShardsCommand
+from jobs_common_extras.shard_dataset.commands.map_items_to_shards_command import (
+    MapItemsToShardsCommand,
+    get_shard_content_key,
+)
+from jobs_common_extras.shard_dataset.commands.prune_shard_file_cache_command import PruneShardFileCacheCommand
+from jobs_common_extras.shard_dataset.commands.reuse_shard_file_command import ReuseShardFileCommand
 from jobs_common_extras.shard_dataset.commands.upload_shard_file_command import UploadShardFileCommand
 
 logger = logging.getLogger(__name__)
@@ -51,11 +59,13 @@ def shard_dataset(  # noqa: PLR0913
     label_schema: LabelSchema,
     train_dataset: Dataset,
     max_shard_size: int,
+    *,
     num_image_pulling_threads: int = 10,
     num_upload_threads: int = 2,
     progress_callback: Callable[[float, str], None] = noop_progress_callback,
     max_number_of_annotations: int | None = None,
     min_annotation_size: int | None = None,
+    content_addressed: bool | None = None,
 ) -> str:
     """
     Shard SC Dataset
@@ -72,9 +82,14 @@ def shard_dataset(  # noqa: PLR0913
         ignored during training
     :param max_number_of_annotations: Maximum number of annotation allowed in one annotation scene. If exceeded, the
     annotation scene will be ignored during training.
+    :param content_addressed: If True, items are assigned to shards deterministically and the shard files whose
+        content did not change since a previous job are reused instead of being compiled again. If None, the mode is
+        enabled by FEATURE_FLAG_CONTENT_ADDRESSED_DATASET_SHARDS.
     :return: ID of CompiledDatasetShards entity
     """
     progress_callback(0, "Preparing dataset")
+    if content_addressed is None:
+        content_addressed = FeatureFlagProvider.is_enabled(FeatureFlag.FEATURE_FLAG_CONTENT_ADDRESSED_DATASET_SHARDS)
 
     dataset_id = str(train_dataset.id_)
 
@@ -86,12 +101,13 @@ def shard_dataset(  # noqa: PLR0913
     map_items_to_shards_command = MapItemsToShardsCommand(
         train_dataset=filtered_dataset,
         max_shard_size=max_shard_size,
+        content_addressed=content_addressed,
     )
     map_items_to_shards_command.execute()
 
     work_dir = flytekit.current_context().working_directory
 
-    futures: list[AsyncResult[CompiledDatasetShard]] = []
+    futures: list[AsyncResult[CompiledDatasetShard] | CompiledDatasetShard] = []
 
     n_complete = 0
     total_num_shards = len(map_items_to_shards_command.shards)
@@ -109,8 +125,35 @@ def shard_dataset(  # noqa: PLR0913
         dataset_storage_id=project.get_training_dataset_storage().id_,
     )
 
+    content_keys: list[str | None] = [None] * total_num_shards
+    cached_shard_files: dict[str, CompiledDatasetShard] = {}
+    if content_addressed:
+        content_keys, cached_shard_files = get_cached_shard_files(
+            shards=map_items_to_shards_command.shards,
+            label_schema=label_schema,
+            dataset_storage_identifier=dataset_storage_identifier,
+        )
+
     with ThreadPool(processes=num_upload_threads) as pool:
         for shard_idx, dataset_items in enumerate(map_items_to_shards_command.shards):
+            content_key = content_keys[shard_idx]
+            fname = CreateShardFileCommand.get_fname(shard_idx=shard_idx, total_num_shards=total_num_shards)
+            if content_key is not None and content_key in cached_shard_files:
+                reuse_command = ReuseShardFileCommand(
+                    dataset_id=dataset_id,
+                    project_identifier=project.identifier,
+                    cached_shard_file=cached_shard_files[content_key],
+                    fname=fname,
+                )
+                reuse_command.execute()
+                if reuse_command.compiled_shard_file is not None:
+                    futures.append(reuse_command.compiled_shard_file)
+                    n_complete += 1
+                    msg = f"Preparing dataset: processed {n_complete}/{total_num_shards} shards (reused)"
+                    logger.info(msg)
+                    progress_callback(100.0 * n_complete / total_num_shards, msg)
+                    continue
+
             can_create_ticket = queue.get(timeout=TIMEOUT)
             logger.debug(f"Acquired can_create_ticket: {can_create_ticket}")
 
@@ -129,6 +172,7 @@ def shard_dataset(  # noqa: PLR0913
                 dataset_id=dataset_id,
                 project_identifier=project.identifier,
                 fpath=create_command.fpath,
+                content_key=content_key,
             )
 
             future = pool.apply_async(
@@ -146,7 +190,9 @@ def shard_dataset(  # noqa: PLR0913
             logger.info(msg)
             progress_callback(100.0 * n_complete / total_num_shards, msg)
 
-        compiled_shard_files = [future.get(timeout=TIMEOUT) for future in futures]
+        compiled_shard_files = [
+            future.get(timeout=TIMEOUT) if isinstance(future, AsyncResult) else future for future in futures
+        ]
 
     command = CreateAndSaveCompiledDatasetShardsCommand(
         dataset_id=dataset_id,
@@ -156,10 +202,38 @@ def shard_dataset(  # noqa: PLR0913
     )
 
     command.execute()
+    if content_addressed:
+        PruneShardFileCacheCommand(
+            project_identifier=project.identifier, dataset_storage_identifier=dataset_storage_identifier
+        ).execute()
     progress_callback(100.0, "Dataset is ready")
     return command.compiled_dataset_shards_id
 
 
+def get_cached_shard_files(
+    shards: list[list[DatasetItem]],
+    label_schema: LabelSchema,
+    dataset_storage_identifier: DatasetStorageIdentifier,
+) -> tuple[list[str | None], dict[str, CompiledDatasetShard]]:
+    """
+    Compute the content key of each shard and look for the shard files with the same content that were compiled
+    by previous jobs.
+
+    :param shards: Dataset items of each shard
+    :param label_schema: LabelSchema used for the training
+    :param dataset_storage_identifier: Identifier of the training dataset storage
+    :return: Content key of each shard, and the cached shard files by content key
+    """
+    content_keys: list[str | None] = [
+        get_shard_content_key(items=dataset_items, label_schema_id=label_schema.id_) for dataset_items in shards
+    ]
+    cached_shard_files = CompiledDatasetShardsRepo(dataset_storage_identifier).get_shard_files_by_content_keys(
+        content_keys=[content_key for content_key in content_keys if content_key is not None]
+    )
+    logger.info(f"{len(cached_shard_files)}/{len(shards)} shard files can be reused from previous jobs")
+    return content_keys, cached_shard_files
+
+
 @unified_tracing
 def upload_shard_file(
     upload_command: UploadShardFileCommand,
@@ -176,4 +250,5 @@ def upload_shard_file(
         binary_filename=upload_command.binary_filename,
         size=create_command.fsize,
         checksum=create_command.fchecksum,
+        content_key=upload_command.content_key,
     )
@@ -0,0 +1,55 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+Benchmark of the array-backed f-measure against the scalar implementation, on a synthetic dataset of boxes.
+Both must produce identical results:
+
+    PYTHONPATH=. python tests/benchmark/benchmark_f_measure.py
+
+BENCHMARK_IMAGES sets the number of images (default: 10 000) and BENCHMARK_BOXES the average number of ground truth
+boxes per image (default: 10).
+"""
+
+import logging
+import os
+import time
+
+import numpy as np
+
+from jobs_common_extras.evaluation.entities.f_measure_metric import _FMeasureCalculator
+from tests.f_measure_helpers import CLASSES, generate_boxes_per_image, perturb_boxes_per_image, reference_f_measure
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_IMAGES = int(os.environ.get("BENCHMARK_IMAGES", "10000"))
+BENCHMARK_BOXES = int(os.environ.get("BENCHMARK_BOXES", "10"))
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    rng = np.random.default_rng(seed=1)
+    ground_truth = generate_boxes_per_image(rng, n_images=BENCHMARK_IMAGES, boxes_per_image=BENCHMARK_BOXES)
+    predictions = perturb_boxes_per_image(rng, ground_truth)
+
+    start = time.perf_counter()
+    reference = reference_f_measure(ground_truth, predictions, iou_threshold=0.5)
+    reference_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    calculator = _FMeasureCalculator(ground_truth, predictions)
+    counters = {class_name: calculator.get_counters(iou_threshold=0.5, class_name=class_name) for class_name in CLASSES}
+    vectorized_duration = time.perf_counter() - start
+
+    logger.info(
+        f"F-measure on {sum(len(boxes) for boxes in ground_truth)} ground truth boxes: "
+        f"scalar {reference_duration:.2f}s, vectorized {vectorized_duration:.2f}s"
+    )
+    assert {
+        class_name: (counter.n_false_negatives, counter.n_true, counter.n_predicted)
+        for class_name, counter in counters.items()
+    } == reference
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""Synthetic boxes and scalar reference implementations, to check and benchmark the f-measure computation"""
+
+import numpy as np
+from geti_types import ID
+from iai_core.entities.shapes import Rectangle
+
+from jobs_common_extras.evaluation.utils.evaluation_helpers import intersection_over_union
+
+CLASSES = [ID("label_a_id"), ID("label_b_id"), ID("label_c_id")]
+
+
+def reference_iou_matrix(ground_truth, predicted) -> np.ndarray:
+    """Scalar implementation of the IoU matrix, one Rectangle and one IoU computation at a time"""
+    gt_rects = [Rectangle(x1=x1, y1=y1, x2=x2, y2=y2) for x1, y1, x2, y2, *_ in ground_truth]
+    pred_rects = [Rectangle(x1=x1, y1=y1, x2=x2, y2=y2) for x1, y1, x2, y2, *_ in predicted]
+    return np.array([[intersection_over_union(gts, preds) for preds in pred_rects] for gts in gt_rects])
+
+
+def reference_n_false_negatives(iou_matrix: np.ndarray, iou_threshold: float) -> int:
+    """Scalar implementation of the false negatives count"""
+    n_false_negatives = 0
+    for row in iou_matrix:
+        if max(row) < iou_threshold:
+            n_false_negatives += 1
+    for column in np.rot90(iou_matrix):
+        indices = np.where(column > iou_threshold)
+        n_false_negatives += max(len(indices[0]) - 1, 0)
+    return n_false_negatives
+
+
+def reference_f_measure(ground_truth_boxes_per_image, prediction_boxes_per_image, iou_threshold: float) -> dict:
+    """Scalar implementation of the per-class counters of the f-measure"""
+    counters = {}
+    for class_name in CLASSES:
+        n_false_negatives = n_true = n_predicted = 0
+        for gt_boxes, pred_boxes in zip(ground_truth_boxes_per_image, prediction_boxes_per_image):
+            gt_boxes = [box for box in gt_boxes if box[4].lower() == class_name.lower()]
+            pred_boxes = [box for box in pred_boxes if box[4].lower() == class_name.lower()]
+            n_true += len(gt_boxes)
+            n_predicted += len(pred_boxes)
+            if len(pred_boxes) > 0:
+                if len(gt_boxes) > 0:
+                    iou_matrix = reference_iou_matrix(gt_boxes, pred_boxes)
+                    n_false_negatives += reference_n_false_negatives(iou_matrix, iou_threshold)
+            else:
+                n_false_negatives += len(gt_boxes)
+        counters[class_name] = (n_false_negatives, n_true, n_predicted)
+    return counters
+
+
+def generate_boxes_per_image(rng: np.random.Generator, n_images: int, boxes_per_image: int) -> list:
+    """Generates random boxes of the CLASSES, in the format expected by _FMeasureCalculator"""
+    boxes = []
+    for _ in range(n_images):
+        image_boxes = []
+        for _ in range(rng.integers(boxes_per_image // 2, 2 * boxes_per_image + 1)):
+            x1, y1 = rng.uniform(0.0, 0.9, size=2)
+            width, height = rng.uniform(0.0, 0.3, size=2)
+            image_boxes.append(
+                (
+                    float(x1),
+                    float(y1),
+                    float(min(x1 + width, 1.0)),
+                    float(min(y1 + height, 1.0)),
+                    CLASSES[rng.integers(0, len(CLASSES))],
+                    float(rng.uniform()),
+                )
+            )
+        boxes.append(image_boxes)
+    return boxes
+
+
+def perturb_boxes_per_image(rng: np.random.Generator, boxes_per_image: list) -> list:
+    """Simulates predictions by moving the ground truth boxes and dropping some of them"""
+    predictions = []
+    for image_boxes in boxes_per_image:
+        image_predictions = []
+        for x1, y1, x2, y2, label_id, _ in image_boxes:
+            if rng.uniform() < 0.1:
+                continue
+            dx, dy = rng.normal(0.0, 0.02, size=2)
+            image_predictions.append(
+                (
+                    float(np.clip(x1 + dx, 0.0, x2)),
+                    float(np.clip(y1 + dy, 0.0, y2)),
+                    float(x2),
+                    float(y2),
+                    label_id,
+                    float(rng.uniform()),
+                )
+            )
+        predictions.append(image_predictions)
+    return predictions
@@ -0,0 +1,124 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+import threading
+import time
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from iai_core.entities.image import Image
+from iai_core.entities.video import VideoFrame
+
+from jobs_common_extras.evaluation.services.media_prefetcher import MediaPrefetcher
+
+
+@pytest.mark.JobsComponent
+class TestMediaPrefetcher:
+    @pytest.fixture
+    def fxt_mixed_dataset_items(self, fxt_dataset_item):
+        # Frames of two videos interleaved with images, with frames out of order
+        return [
+            fxt_dataset_item(index=3, media_type=VideoFrame, video_id_index=1),
+            fxt_dataset_item(index=1, media_type=Image),
+            fxt_dataset_item(index=1, media_type=VideoFrame, video_id_index=2),
+            fxt_dataset_item(index=0, media_type=VideoFrame, video_id_index=1),
+            fxt_dataset_item(index=2, media_type=Image),
+            fxt_dataset_item(index=2, media_type=VideoFrame, video_id_index=1),
+        ]
+
+    def test_prefetch(self, fxt_dataset_storage_identifier, fxt_mixed_dataset_items) -> None:
+        # Arrange
+        fetching_threads: dict[int, int] = {}
+
+        def fake_get_media_roi_numpy(dataset_storage_identifier, media, roi_shape):
+            fetching_threads[id(media)] = threading.get_ident()
+            return np.full((2, 2, 3), id(media) % 256, dtype=np.uint8)
+
+        prefetcher = MediaPrefetcher(
+            dataset_storage_id=fxt_dataset_storage_identifier,
+            dataset_items=fxt_mixed_dataset_items,
+            num_workers=3,
+            max_prefetched_items=2,
+        )
+
+        # Act
+        with patch(
+            "jobs_common_extras.evaluation.services.media_prefetcher.get_media_roi_numpy",
+            side_effect=fake_get_media_roi_numpy,
+        ):
+            prefetched_items = []
+            for prefetched_item in prefetcher:
+                assert prefetcher.queue_depth <= 2
+                prefetched_items.append(prefetched_item)
+
+        # Assert
+        # Every item is yielded once, with its index in the dataset and its own media
+        assert sorted(item.item_idx for item in prefetched_items) == list(range(len(fxt_mixed_dataset_items)))
+        for item_idx, dataset_item, media_numpy in prefetched_items:
+            assert dataset_item is fxt_mixed_dataset_items[item_idx]
+            assert media_numpy[0, 0, 0] == id(dataset_item.media) % 256
+        # Frames of the same video are yielded together, in increasing frame order
+        assert [item.item_idx for item in prefetched_items] == [3, 5, 0, 1, 2, 4]
+        # Frames of the same video chunk are decoded by the same thread
+        assert (
+            fetching_threads[id(fxt_mixed_dataset_items[3].media)]
+            == fetching_threads[id(fxt_mixed_dataset_items[5].media)]
+        )
+        assert prefetcher.queue_depth == 0
+        assert prefetcher.avg_fetch_latency_ms > 0
+
+    def test_prefetch_video_chunks_sequentially(self, fxt_dataset_storage_identifier, fxt_dataset_item) -> None:
+        # Arrange
+        dataset_items = [
+            fxt_dataset_item(index=frame_index, media_type=VideoFrame, video_id_index=1) for frame_index in range(5)
+        ]
+        fetched_frames: list[int] = []
+        concurrent_fetches = 0
+        max_concurrent_fetches = 0
+        lock = threading.Lock()
+
+        def fake_get_media_roi_numpy(dataset_storage_identifier, media, roi_shape):
+            nonlocal concurrent_fetches, max_concurrent_fetches
+            with lock:
+                concurrent_fetches += 1
+                max_concurrent_fetches = max(max_concurrent_fetches, concurrent_fetches)
+            time.sleep(0.01)
+            with lock:
+                concurrent_fetches -= 1
+                fetched_frames.append(media.frame_index)
+            return np.zeros((2, 2, 3), dtype=np.uint8)
+
+        prefetcher = MediaPrefetcher(
+            dataset_storage_id=fxt_dataset_storage_identifier,
+            dataset_items=dataset_items,
+            num_workers=3,
+            max_prefetched_items=2,
+        )
+
+        # Act
+        with patch(
+            "jobs_common_extras.evaluation.services.media_prefetcher.get_media_roi_numpy",
+            side_effect=fake_get_media_roi_numpy,
+        ):
+            prefetched_items = list(prefetcher)
+
+        # Assert
+        # The chunks of the video are never fetched concurrently, so the frames are decoded in order
+        assert max_concurrent_fetches == 1
+        assert fetched_frames == list(range(5))
+        assert [item.item_idx for item in prefetched_items] == list(range(5))
+
+    def test_prefetch_disabled(self, fxt_dataset_storage_identifier, fxt_mixed_dataset_items) -> None:
+        prefetcher = MediaPrefetcher(
+            dataset_storage_id=fxt_dataset_storage_identifier,
+            dataset_items=fxt_mixed_dataset_items,
+            num_workers=0,
+        )
+
+        with patch("jobs_common_extras.evaluation.services.media_prefetcher.get_media_roi_numpy") as mock_get_numpy:
+            prefetched_items = list(prefetcher)
+
+        mock_get_numpy.assert_not_called()
+        assert [item.item_idx for item in prefetched_items] == list(range(len(fxt_mixed_dataset_items)))
+        assert all(item.media_numpy is None for item in prefetched_items)
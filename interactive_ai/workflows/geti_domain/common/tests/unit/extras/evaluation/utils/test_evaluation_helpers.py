@@ -0,0 +1,65 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+import numpy as np
+import pytest
+
+from jobs_common_extras.evaluation.entities.f_measure_metric import _FMeasureCalculator
+from jobs_common_extras.evaluation.utils.evaluation_helpers import get_iou_matrix, get_n_false_negatives
+from tests.f_measure_helpers import (
+    CLASSES,
+    generate_boxes_per_image,
+    perturb_boxes_per_image,
+    reference_f_measure,
+    reference_iou_matrix,
+    reference_n_false_negatives,
+)
+
+
+class TestEvaluationHelpers:
+    def test_get_iou_matrix(self) -> None:
+        ground_truth = [
+            (0.0, 0.0, 0.5, 0.5, "a", 1.0),
+            (0.25, 0.25, 0.75, 0.75, "a", 1.0),
+            (0.5, 0.5, 1.0, 1.0, "a", 1.0),
+            (0.1, 0.1, 0.1, 0.1, "a", 1.0),  # degenerate box
+        ]
+        predicted = [
+            (0.0, 0.0, 0.5, 0.5, "a", 0.9),
+            (0.5, 0.0, 1.0, 0.5, "a", 0.9),
+            (0.1, 0.1, 0.1, 0.1, "a", 0.9),
+        ]
+
+        iou_matrix = get_iou_matrix(ground_truth, predicted)
+
+        np.testing.assert_array_equal(iou_matrix, reference_iou_matrix(ground_truth, predicted))
+        assert iou_matrix[0, 0] == 1.0
+        assert iou_matrix[0, 1] == 0.0
+
+    @pytest.mark.parametrize("iou_threshold", [0.0, 0.3, 0.5, 0.75, 1.0])
+    def test_get_n_false_negatives(self, iou_threshold) -> None:
+        rng = np.random.default_rng(seed=0)
+        ground_truth = generate_boxes_per_image(rng, n_images=1, boxes_per_image=20)[0]
+        predicted = perturb_boxes_per_image(rng, [ground_truth])[0]
+        iou_matrix = get_iou_matrix(ground_truth, predicted)
+
+        assert get_n_false_negatives(iou_matrix, iou_threshold) == reference_n_false_negatives(
+            iou_matrix, iou_threshold
+        )
+
+    @pytest.mark.parametrize("iou_threshold", [0.3, 0.5, 0.7])
+    def test_f_measure_counters_match_reference(self, iou_threshold) -> None:
+        rng = np.random.default_rng(seed=42)
+        ground_truth = generate_boxes_per_image(rng, n_images=50, boxes_per_image=10)
+        predictions = perturb_boxes_per_image(rng, ground_truth)
+        calculator = _FMeasureCalculator(ground_truth, predictions)
+
+        counters = {
+            class_name: calculator.get_counters(iou_threshold=iou_threshold, class_name=class_name)
+            for class_name in CLASSES
+        }
+
+        assert {
+            class_name: (counter.n_false_negatives, counter.n_true, counter.n_predicted)
+            for class_name, counter in counters.items()
+        } == reference_f_measure(ground_truth, predictions, iou_threshold)
@@ -3,10 +3,16 @@
 """This module tests commands to map dataset items to shards"""
 
 import pytest
+from geti_types import ID
+from iai_core.entities.datasets import Dataset
 from iai_core.entities.image import Image
+from iai_core.entities.subset import Subset
 from iai_core.entities.video import VideoFrame
 
-from jobs_common_extras.shard_dataset.commands.map_items_to_shards_command import MapItemsToShardsCommand
+from jobs_common_extras.shard_dataset.commands.map_items_to_shards_command import (
+    MapItemsToShardsCommand,
+    get_shard_content_key,
+)
 
 
 @pytest.mark.JobsComponent
@@ -83,3 +89,49 @@ class TestMapItemsToShardsCommand:
         # Each shard can contain at most 1 item since each media file size is heavy (1 GiB)
         assert len(command.shards) == len(fxt_large_media_datasets)
         assert all(len(shard) == 1 for shard in command.shards)
+
+    def test_content_addressed_mode(self, fxt_dataset_with_images, fxt_dataset_item) -> None:
+        # Arrange
+        max_shard_size = 3
+        label_schema_id = ID("label_schema")
+
+        # Act
+        command = MapItemsToShardsCommand(
+            train_dataset=fxt_dataset_with_images,
+            max_shard_size=max_shard_size,
+            content_addressed=True,
+        )
+        command.execute()
+        keys = {get_shard_content_key(items=shard, label_schema_id=label_schema_id) for shard in command.shards}
+
+        # A new item with a different media only changes the shard it is assigned to
+        new_item = fxt_dataset_item(index=100, subset=Subset.TRAINING)
+        updated_command = MapItemsToShardsCommand(
+            train_dataset=Dataset(id=fxt_dataset_with_images.id_, items=[*fxt_dataset_with_images, new_item]),
+            max_shard_size=max_shard_size,
+            content_addressed=True,
+        )
+        updated_command.execute()
+        updated_keys = {
+            get_shard_content_key(items=shard, label_schema_id=label_schema_id) for shard in updated_command.shards
+        }
+
+        # Assert
+        # 10 items with max_shard_size=3 are spread over 4 shards (the next power of two)
+        assert len(command.shards) <= 4
+        assert sum(len(shard) for shard in command.shards) == 10
+        # (the shard of the new item may have been empty before)
+        assert len(keys - updated_keys) <= 1
+        assert len(updated_keys - keys) == 1
+
+    def test_get_shard_content_key(self, fxt_dataset_with_images) -> None:
+        items = list(fxt_dataset_with_images)
+        label_schema_id = ID("label_schema")
+
+        key = get_shard_content_key(items=items, label_schema_id=label_schema_id)
+
+        assert get_shard_content_key(items=list(reversed(items)), label_schema_id=label_schema_id) == key
+        assert get_shard_content_key(items=items, label_schema_id=ID("other_label_schema")) != key
+        assert get_shard_content_key(items=items[1:], label_schema_id=label_schema_id) != key
+        items[0].subset = Subset.UNASSIGNED
+        assert get_shard_content_key(items=items, label_schema_id=label_schema_id) != key
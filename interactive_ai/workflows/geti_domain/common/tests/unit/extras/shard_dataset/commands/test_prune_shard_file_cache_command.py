@@ -0,0 +1,62 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""This module tests the command to remove the unused shard files from the dataset shards cache"""
+
+from unittest.mock import patch
+
+import pytest
+from iai_core.repos import CompiledDatasetShardsRepo
+
+from jobs_common_extras.shard_dataset.commands.prune_shard_file_cache_command import PruneShardFileCacheCommand
+
+
+@pytest.mark.JobsComponent
+class TestPruneShardFileCacheCommand:
+    @patch("jobs_common_extras.mlflow.adapters.geti_otx_interface.MLFlowExperimentBinaryRepo")
+    def test_prune_shard_file_cache_command(
+        self,
+        mock_mlflow_binary_repo,
+        fxt_project_identifier,
+        fxt_dataset_storage_identifier,
+        fxt_job_metadata,
+    ) -> None:
+        # Arrange
+        with patch.object(
+            CompiledDatasetShardsRepo, "get_content_keys_of_latest", return_value={"key_a", "key_b"}
+        ) as mock_get_content_keys:
+            # Act
+            command = PruneShardFileCacheCommand(
+                project_identifier=fxt_project_identifier,
+                dataset_storage_identifier=fxt_dataset_storage_identifier,
+                num_compiled_dataset_shards_to_keep=2,
+            )
+            command.execute()
+
+        # Assert
+        mock_get_content_keys.assert_called_once_with(num_compiled_dataset_shards=2)
+        mock_mlflow_binary_repo.return_value.delete_all_under_dir_except.assert_called_once_with(
+            directory="dataset_shards",
+            keep_filepaths={"dataset_shards/key_a.arrow", "dataset_shards/key_b.arrow"},
+        )
+
+    @patch("jobs_common_extras.mlflow.adapters.geti_otx_interface.MLFlowExperimentBinaryRepo")
+    def test_prune_shard_file_cache_command_error(
+        self,
+        mock_mlflow_binary_repo,
+        fxt_project_identifier,
+        fxt_dataset_storage_identifier,
+        fxt_job_metadata,
+    ) -> None:
+        # Arrange
+        mock_mlflow_binary_repo.return_value.delete_all_under_dir_except.side_effect = RuntimeError("dummy error")
+
+        # Act
+        with patch.object(CompiledDatasetShardsRepo, "get_content_keys_of_latest", return_value={"key_a"}):
+            command = PruneShardFileCacheCommand(
+                project_identifier=fxt_project_identifier,
+                dataset_storage_identifier=fxt_dataset_storage_identifier,
+            )
+            command.execute()
+
+        # Assert: the error does not fail the job
+        mock_mlflow_binary_repo.return_value.delete_all_under_dir_except.assert_called_once()
@@ -0,0 +1,64 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+"""This module tests the command to reuse shard files compiled by previous jobs"""
+
+from unittest.mock import patch
+
+import pytest
+from iai_core.entities.compiled_dataset_shards import CompiledDatasetShard
+
+from jobs_common_extras.shard_dataset.commands.reuse_shard_file_command import ReuseShardFileCommand
+
+
+@pytest.mark.JobsComponent
+class TestReuseShardFileCommand:
+    @pytest.fixture
+    def fxt_cached_shard_file(self) -> CompiledDatasetShard:
+        return CompiledDatasetShard(
+            filename="datum-3-of-8.arrow",
+            binary_filename="datum-3-of-8.arrow",
+            size=1024,
+            checksum="checksum",
+            content_key="content_key",
+        )
+
+    @pytest.mark.parametrize("is_cached", [True, False])
+    @patch("jobs_common_extras.mlflow.adapters.geti_otx_interface.MLFlowExperimentBinaryRepo")
+    def test_reuse_shard_file_command(
+        self,
+        mock_mlflow_binary_repo,
+        is_cached,
+        fxt_mongo_id,
+        fxt_project_identifier,
+        fxt_job_metadata,
+        fxt_cached_shard_file,
+    ) -> None:
+        # Arrange
+        mock_mlflow_binary_repo.return_value.exists.return_value = is_cached
+
+        # Act
+        command = ReuseShardFileCommand(
+            dataset_id=fxt_mongo_id(1003),
+            project_identifier=fxt_project_identifier,
+            cached_shard_file=fxt_cached_shard_file,
+            fname="datum-0-of-4.arrow",
+        )
+        command.execute()
+
+        # Assert
+        mock_mlflow_binary_repo.return_value.exists.assert_called_once_with("dataset_shards/content_key.arrow")
+        if is_cached:
+            mock_mlflow_binary_repo.return_value.copy_within.assert_called_once_with(
+                src_filepath="dataset_shards/content_key.arrow",
+                dst_filepath=f"jobs/{fxt_job_metadata.id}/inputs/datum-0-of-4.arrow",
+            )
+            assert command.compiled_shard_file == CompiledDatasetShard(
+                filename="datum-0-of-4.arrow",
+                binary_filename="datum-0-of-4.arrow",
+                size=1024,
+                checksum="checksum",
+                content_key="content_key",
+            )
+        else:
+            mock_mlflow_binary_repo.return_value.copy_within.assert_not_called()
+            assert command.compiled_shard_file is None
@@ -49,3 +49,36 @@ class TestUploadShardFileCommand:
 
         # File removal after uploading
         assert not os.path.exists(fxt_fpath)
+
+    @patch("jobs_common_extras.mlflow.adapters.geti_otx_interface.MLFlowExperimentBinaryRepo")
+    def test_upload_shard_file_command_content_addressed(
+        self,
+        mock_mlflow_binary_repo,
+        fxt_mongo_id,
+        fxt_project_identifier,
+        fxt_job_metadata,
+        fxt_fpath: str,
+    ) -> None:
+        # Arrange
+        dataset_id = fxt_mongo_id(1003)
+        mock_mlflow_binary_repo.return_value.exists.return_value = True
+
+        # Act
+        command = UploadShardFileCommand(
+            dataset_id,
+            project_identifier=fxt_project_identifier,
+            fpath=fxt_fpath,
+            content_key="content_key",
+        )
+
+        command.execute()
+
+        # Assert
+        # The file is saved in the dataset shards cache, then copied to the inputs of the job
+        mock_mlflow_binary_repo.return_value.save_group.assert_called_once()
+        mock_mlflow_binary_repo.return_value.copy_within.assert_called_once_with(
+            src_filepath="dataset_shards/content_key.arrow",
+            dst_filepath=f"jobs/{fxt_job_metadata.id}/inputs/TRAINING-0-of-3.arrow",
+        )
+        assert command.binary_filename == "TRAINING-0-of-3.arrow"
+        assert not os.path.exists(fxt_fpath)
@@ -38,6 +38,7 @@ from iai_core.repos import (
     VideoAnnotationRangeRepo,
     VideoRepo,
 )
+from iai_core.services.annotation_statistics_service import AnnotationStatisticsService
 from jobs_common_extras.datumaro_conversion.convert_utils import ConvertUtils, MediaInfo
 from jobs_common_extras.datumaro_conversion.definitions import GetiProjectType
 from jobs_common_extras.datumaro_conversion.import_utils import ImportUtils as BaseImportUtils
@@ -256,6 +257,7 @@ class ImportUtils(BaseImportUtils):
         )
         dataset_storage_repo = DatasetStorageRepo(project_identifier=project.identifier)
         dataset_storage_repo.save(dataset_storage)
+        AnnotationStatisticsService.on_dataset_storage_created(dataset_storage.identifier)
         project.dataset_storage_adapters.append(ReferenceAdapter(dataset_storage))
         ProjectRepo().save(project)
 
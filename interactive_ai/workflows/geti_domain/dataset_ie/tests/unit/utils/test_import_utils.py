@@ -18,6 +18,7 @@ from iai_core.entities.label import NullLabel
 from iai_core.entities.model_template import TaskType
 from iai_core.entities.project import Project
 from iai_core.entities.video import NullVideo
+from iai_core.services.annotation_statistics_service import AnnotationStatisticsService
 
 from job.utils.exceptions import (
     DatasetFormatException,
@@ -265,9 +266,11 @@ class TestImportUtils:
             with (
                 patch("job.utils.import_utils.DatasetStorageRepo"),
                 patch("job.utils.import_utils.ProjectRepo") as mocked_obj,
+                patch.object(AnnotationStatisticsService, "on_dataset_storage_created") as mock_init_statistics,
             ):
                 ds = ImportUtils.create_dataset_storage(project=project, dataset_name=dataset_name)
                 mocked_obj.assert_called_once()
+                mock_init_statistics.assert_called_once_with(ds.identifier)
             assert ds.workspace_id == workspace_id
             assert ds.project_id == project_id
             if dataset_name:
@@ -7,11 +7,15 @@ import abc
 import json
 import logging
 import os
+import shutil
 import tempfile
-from collections.abc import Generator, Iterable, Sequence
+import time
+from collections.abc import Generator, Iterable, Iterator, Sequence
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
-from zipfile import ZipFile
+from typing import BinaryIO
+from zipfile import ZipFile, ZipInfo
 
 from bson import ObjectId, json_util
 from iai_core.repos.storage.storage_client import BinaryObjectType
@@ -29,6 +33,8 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+OBJECT_COPY_BUFFER_SIZE = 2**20  # 1MB
+
 
 class PublicKeyBytes(bytes):
     """Public key as raw bytes"""
@@ -64,14 +70,20 @@ class ZipArchive(abc.ABC):
     ZipArchive represent a generic zip archive.
 
     :param zip_file_path: Local file path of the zip archive. If no file exists at the
-        specified path, then a new archive will be created.
+        specified path, then a new archive will be created. Alternatively, a writable stream
+        to which a new archive is written sequentially, e.g. to upload it while it is created.
     :param readonly: If True, open the file in 'read' mode, preventing any modification
         to the content of the archive. If False, the file is opened in 'append' mode.
     """
 
-    def __init__(self, zip_file_path: str, readonly: bool = False) -> None:
+    def __init__(self, zip_file_path: str | BinaryIO, readonly: bool = False) -> None:
         self._zip_file_path = zip_file_path
-        self._zip_file = ZipFile(self._zip_file_path, mode="r" if readonly else "a")
+        if readonly:
+            mode = "r"
+        else:
+            # A stream cannot be read back, so the archive can only be written from scratch
+            mode = "a" if isinstance(zip_file_path, str) else "w"
+        self._zip_file = ZipFile(self._zip_file_path, mode=mode)
 
     def get_uncompressed_size(self) -> int:
         """Get the overall size of the files in the zip after decompression"""
@@ -169,7 +181,8 @@ class ProjectZipArchive(ZipArchive):
     documents, binary objects and the manifest.
 
     :param zip_file_path: Local file path of the zip archive. If no file exists at the
-        specified path, then a new archive will be created.
+        specified path, then a new archive will be created. Alternatively, a writable stream
+        to which a new archive is written sequentially.
     :param readonly: If True, open the file in 'read' mode, preventing any modification
         to the content of the archive. If False, the file is opened in 'append' mode.
     """
@@ -178,7 +191,7 @@ class ProjectZipArchive(ZipArchive):
     DOCUMENTS_FOLDER = "documents"
     BINARIES_FOLDER = "binaries"
 
-    def __init__(self, zip_file_path: str, readonly: bool = False) -> None:
+    def __init__(self, zip_file_path: str | BinaryIO, readonly: bool = False) -> None:
         super().__init__(zip_file_path=zip_file_path, readonly=readonly)
         self.__manifest: Manifest | None = None  # created or loaded lazily
 
@@ -272,12 +285,15 @@ class ProjectZipArchive(ZipArchive):
         except KeyError as ke:
             raise CollectionNotFoundError from ke
 
-    def add_collection_with_documents(self, collection_name: str, documents: Iterable[str]) -> None:
+    @contextmanager
+    def __open_new_collection(self, collection_name: str) -> Iterator[BinaryIO]:
         """
-        Create a new collection in the project archive and add documents to it.
+        Create a new collection in the project archive and open it for writing.
 
         :param collection_name: Name of the collection
-        :param documents: Stream of BSON-encoded documents to write to the collection
+        :return: Writable stream of the collection file
+        :raises CollectionAlreadyExistsError: if the archive already contains the collection
+        :raises CollectionWriteError: if the collection cannot be written
         """
         collection_path = os.path.join(self.DOCUMENTS_FOLDER, f"{collection_name}.jsonl")
 
@@ -290,11 +306,32 @@ class ProjectZipArchive(ZipArchive):
 
         try:
             with self._zip_file.open(collection_path, mode="w", force_zip64=True) as coll_fp:
-                for doc in documents:
-                    coll_fp.write(bytes(f"{doc}\n", "utf-8"))
+                yield coll_fp  # type: ignore[misc]
         except Exception as exc:
             raise CollectionWriteError from exc
 
+    def add_collection_with_documents(self, collection_name: str, documents: Iterable[str]) -> None:
+        """
+        Create a new collection in the project archive and add documents to it.
+
+        :param collection_name: Name of the collection
+        :param documents: Stream of BSON-encoded documents to write to the collection
+        """
+        with self.__open_new_collection(collection_name=collection_name) as coll_fp:
+            for doc in documents:
+                coll_fp.write(bytes(f"{doc}\n", "utf-8"))
+
+    def add_collection_from_stream(self, collection_name: str, stream: BinaryIO) -> None:
+        """
+        Create a new collection in the project archive by copying its documents from a stream,
+        e.g. documents that were serialized in advance by another thread.
+
+        :param collection_name: Name of the collection
+        :param stream: Readable stream of BSON-encoded documents, one document per line (JSON Lines)
+        """
+        with self.__open_new_collection(collection_name=collection_name) as coll_fp:
+            shutil.copyfileobj(stream, coll_fp, OBJECT_COPY_BUFFER_SIZE)
+
     def get_objects_by_type(self, object_type: BinaryObjectType) -> Generator[tuple[str, str], None, None]:
         """
         Get the binary objects of a given type from the project archive.
@@ -364,6 +401,31 @@ class ProjectZipArchive(ZipArchive):
             zip_object_path = os.path.join(zip_objects_folder, remote_object_path_from_project_root)
             self._zip_file.write(local_object_path, zip_object_path)
 
+    def add_object_from_stream(
+        self,
+        object_type: BinaryObjectType,
+        remote_object_path_from_project_root: str,
+        stream: BinaryIO,
+        size: int,
+    ) -> None:
+        """
+        Write a binary to the project archive by copying it from a stream, e.g. the response of a S3 request
+
+        :param object_type: Type of the binary object
+        :param remote_object_path_from_project_root: Relative location of the binary in the S3 storage
+            w.r.t. the project root folder
+        :param stream: Readable stream with the content of the binary
+        :param size: Size of the binary in bytes
+        """
+        zip_objects_folder = os.path.join(self.BINARIES_FOLDER, object_type.name.lower())
+        zip_object_path = os.path.join(zip_objects_folder, remote_object_path_from_project_root)
+        zip_info = ZipInfo(filename=zip_object_path, date_time=time.localtime()[:6])
+        zip_info.external_attr = 0o644 << 16  # regular file readable by everyone, as the files added from disk
+        # The size determines whether the entry needs the ZIP64 extension
+        zip_info.file_size = size
+        with self._zip_file.open(zip_info, mode="w") as object_fp:
+            shutil.copyfileobj(stream, object_fp, OBJECT_COPY_BUFFER_SIZE)
+
 
 class ProjectZipArchiveWrapper(ZipArchive):
     """
@@ -382,6 +444,17 @@ class ProjectZipArchiveWrapper(ZipArchive):
         """Write the nested project archive containing data exported project files"""
         self._zip_file.write(project_archive_path, self.PROJECT_ARCHIVE)
 
+    @contextmanager
+    def open_project_archive(self) -> Iterator[BinaryIO]:
+        """
+        Open the nested project archive for writing, so that it can be created directly inside the wrapper
+        instead of being created on disk first and then copied with 'add_project_archive'.
+
+        :return: Writable, non-seekable stream of the nested project archive
+        """
+        with self._zip_file.open(self.PROJECT_ARCHIVE, mode="w", force_zip64=True) as project_archive_fp:
+            yield project_archive_fp  # type: ignore[misc]
+
     def extract_project_archive(self) -> str:
         """Extracts and returns the path of the nested project archive containing the exported project files"""
         folder = os.path.dirname(self._zip_file_path)
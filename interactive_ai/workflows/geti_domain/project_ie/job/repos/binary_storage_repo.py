@@ -6,6 +6,8 @@
 import logging
 import os
 from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from typing import BinaryIO
 
 from geti_types import ID
 from iai_core.repos.storage.storage_client import BinaryObjectType
@@ -72,54 +74,54 @@ class BinaryStorageRepo(StorageRepo):
             if object_type not in BinaryStorageRepo.BLACKLISTED_OBJECT_TYPES
         )
 
-    def get_all_objects_by_type(self, object_type: BinaryObjectType, target_folder: str) -> Iterator[tuple[str, str]]:
+    def list_objects_by_type(self, object_type: BinaryObjectType) -> list[tuple[str, int]]:
         """
-        Iterates over objects of a specific project and type. For each object, it downloads it to a temporary local
-         folder, yields the local path and the remote path from the project root onward, then removes the local copy.
-
-        :param object_type: The type of the binary object to be processed, corresponds to a bucket
-        :param target_folder: Folder in the local filesystem where to download the objects from S3
-        :return: An iterator yielding tuples of:
-            - The local path where the object is downloaded to
-            - The remote path from the project root onward where the object was downloaded from
+        List the objects of a specific project and type.
+
+        :param object_type: The type of the binary objects to list, corresponds to a bucket
+        :return: A list of tuples of:
+            - The remote path from the project root onward where the object is stored
+            - The size of the object in bytes
         """
         bucket_name = object_type.bucket_name()
         if not self.minio_client.bucket_exists(bucket_name=bucket_name):
             raise FileNotFoundError(f"Bucket {bucket_name} does not exist.")
-        logger.info(
-            "Storing project-related files at %s from bucket %s to temporary local folder %s.",
-            self.s3_project_root,
-            bucket_name,
-            target_folder,
-        )
+        logger.info("Listing project-related files at %s from bucket %s.", self.s3_project_root, bucket_name)
 
-        objects_to_fetch = self.minio_client.list_objects(
-            bucket_name=bucket_name, prefix=self.s3_project_root + "/", recursive=True
-        )
+        return [
+            (s3_object.object_name.replace(self.s3_project_root + "/", ""), s3_object.size)
+            for s3_object in self.minio_client.list_objects(
+                bucket_name=bucket_name, prefix=self.s3_project_root + "/", recursive=True
+            )
+        ]
 
-        for s3_object in objects_to_fetch:
-            object_name = s3_object.object_name
-            object_name_from_project_root = object_name.replace(self.s3_project_root + "/", "")
-            local_path = os.path.join(target_folder, object_name_from_project_root)
-            try:
-                self.minio_client.fget_object(
-                    bucket_name=bucket_name,
-                    file_path=local_path,
-                    object_name=object_name,
-                )
-            except Exception:
-                logger.exception(
-                    "Failed to fetch object from location %s in bucket %s to local temporary path %s.",
-                    object_name,
-                    bucket_name,
-                    local_path,
-                )
-                raise
+    @contextmanager
+    def open_object(self, object_type: BinaryObjectType, object_name_from_project_root: str) -> Iterator[BinaryIO]:
+        """
+        Open a stream to read the content of an object from S3, without storing it locally.
+        The stream is closed when the context is exited.
 
-            yield local_path, object_name_from_project_root
+        :param object_type: The type of the binary object, corresponds to a bucket
+        :param object_name_from_project_root: The remote path from the project root onward where the object is stored
+        :return: The stream to read the content of the object
+        """
+        bucket_name = object_type.bucket_name()
+        object_name = os.path.join(self.s3_project_root, object_name_from_project_root)
+        try:
+            response = self.minio_client.get_object(bucket_name=bucket_name, object_name=object_name)
+        except Exception:
+            logger.exception(
+                "Failed to fetch object from location %s in bucket %s.",
+                object_name,
+                bucket_name,
+            )
+            raise
 
-            if os.path.exists(local_path):
-                os.remove(local_path)
+        try:
+            yield response
+        finally:
+            response.close()
+            response.release_conn()
 
     def store_objects_by_type(
         self,
@@ -41,6 +41,8 @@ class DocumentRepo(ProjectBasedSessionRepo[None]):  # type: ignore[type-var]
         "code_deployment",  # can be regenerated if required
         "ndr_config",  # deleted collection
         "ndr_hash",  # deleted collection
+        "media_annotation_statistics",  # can be regenerated from the annotation scenes
+        "label_annotation_statistics",  # can be regenerated from the annotation scenes
     ]
 
     def __init__(
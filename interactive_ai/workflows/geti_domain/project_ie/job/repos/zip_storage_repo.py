@@ -3,15 +3,132 @@
 
 """Repos to fetch/store project zip archives from/to S3"""
 
+import io
 import logging
 import os
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import BinaryIO
 
+from botocore.client import BaseClient
 from geti_types import ID
 
 from .base.storage_repo import StorageRepo
 
 logger = logging.getLogger(__name__)
 
+MIN_UPLOAD_PART_SIZE = 5 * 2**20  # minimum size of the parts of a S3 multipart upload, except for the last one
+UPLOAD_PART_SIZE = int(os.environ.get("PROJECT_EXPORT_UPLOAD_PART_SIZE_MB", "16")) * 2**20
+UPLOAD_MAX_CONCURRENCY = int(os.environ.get("PROJECT_EXPORT_UPLOAD_MAX_CONCURRENCY", "4"))
+
+
+class MultipartUploadStream(io.RawIOBase):
+    """
+    Non-seekable writable stream that uploads the written data to a S3 object with a multipart upload.
+
+    The data is buffered until a part is complete, then the part is uploaded in the background while the next one
+    is written, with at most PROJECT_EXPORT_UPLOAD_MAX_CONCURRENCY parts being uploaded at the same time.
+    Closing the stream uploads the last part and completes the upload.
+
+    :param client: boto3 S3 client
+    :param bucket_name: Name of the bucket to upload the object to
+    :param key: Key of the object to upload
+    :param part_size: Size in bytes of the uploaded parts, except for the last one
+    :param max_concurrency: Maximum number of parts that are uploaded at the same time
+    """
+
+    def __init__(
+        self,
+        client: BaseClient,
+        bucket_name: str,
+        key: str,
+        part_size: int = UPLOAD_PART_SIZE,
+        max_concurrency: int = UPLOAD_MAX_CONCURRENCY,
+    ) -> None:
+        if part_size < MIN_UPLOAD_PART_SIZE:
+            raise ValueError(f"The part size must be at least {MIN_UPLOAD_PART_SIZE} bytes, got {part_size}.")
+        self._client = client
+        self._bucket_name = bucket_name
+        self._key = key
+        self._part_size = part_size
+        self._max_concurrency = max_concurrency
+        self._buffer = bytearray()
+        self._position = 0
+        self._parts: list[Future[dict]] = []
+        self._finished = False  # whether the upload is completed or aborted
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="multipart-upload")
+        self._upload_id: str = self._client.create_multipart_upload(Bucket=bucket_name, Key=key)["UploadId"]
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def write(self, data) -> int:  # noqa: ANN001
+        if self.closed:
+            raise ValueError("I/O operation on closed stream.")
+        self._buffer += data
+        self._position += len(data)
+        while len(self._buffer) >= self._part_size:
+            part_data = bytes(self._buffer[: self._part_size])
+            del self._buffer[: self._part_size]
+            self._submit_part(part_data)
+        return len(data)
+
+    def close(self) -> None:
+        """Upload the last part and complete the upload"""
+        if self.closed:
+            return
+        try:
+            # An object is made of at least one part, which can be smaller than the minimum part size
+            if self._buffer or not self._parts:
+                self._submit_part(bytes(self._buffer))
+                self._buffer.clear()
+            parts = [future.result() for future in self._parts]
+            self._client.complete_multipart_upload(
+                Bucket=self._bucket_name,
+                Key=self._key,
+                UploadId=self._upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+            self._finished = True
+        finally:
+            self._executor.shutdown(wait=True)
+            super().close()
+        logger.info("Uploaded object '%s' in %d parts (%d bytes)", self._key, len(parts), self._position)
+
+    def abort(self) -> None:
+        """Abort the upload if it is not completed, deleting the parts uploaded so far"""
+        if self._finished:
+            return
+        self._finished = True
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        super().close()
+        try:
+            self._client.abort_multipart_upload(Bucket=self._bucket_name, Key=self._key, UploadId=self._upload_id)
+        except Exception:
+            logger.exception("Failed to abort the multipart upload of object '%s'", self._key)
+
+    def _submit_part(self, part_data: bytes) -> None:
+        # Wait for the oldest upload in progress to bound the memory used by the buffered parts
+        in_progress = [future for future in self._parts if not future.done()]
+        if len(in_progress) >= self._max_concurrency:
+            in_progress[0].result()
+        part_number = len(self._parts) + 1
+        self._parts.append(self._executor.submit(self._upload_part, part_number, part_data))
+
+    def _upload_part(self, part_number: int, part_data: bytes) -> dict:
+        response = self._client.upload_part(
+            Bucket=self._bucket_name,
+            Key=self._key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=part_data,
+        )
+        return {"ETag": response["ETag"], "PartNumber": part_number}
+
 
 class ZipStorageRepo(StorageRepo):
     """
@@ -66,16 +183,24 @@ class ZipStorageRepo(StorageRepo):
         """
         return os.path.join(self.s3_workspace_root, "downloads", operation_id, self.zipped_file_name)
 
-    def upload_downloadable_archive(self, operation_id: ID, zip_local_path: str) -> None:
+    @contextmanager
+    def open_downloadable_archive(self, operation_id: ID) -> Iterator[BinaryIO]:
         """
-        Upload a (exported) project archive to S3 so that it can be later downloaded by the user.
+        Open a stream to upload a (exported) project archive to S3 while it is being created, so that it can be
+        later downloaded by the user. The archive is uploaded in parts as the data is written, and it becomes
+        available once the context is exited. If an exception is raised within the context, the upload is aborted.
 
         :param operation_id: ID of the export operation
-        :param zip_local_path: Path of the project zip archive in the local filesystem
+        :return: Writable, non-seekable stream of the archive
         """
         zip_s3_path = self.__get_download_zip_path(operation_id=operation_id)
-        with open(zip_local_path, "rb") as fp:
-            self.boto_client.upload_fileobj(Bucket=self.bucket_name, Key=zip_s3_path, Fileobj=fp)
+        upload_stream = MultipartUploadStream(client=self.boto_client, bucket_name=self.bucket_name, key=zip_s3_path)
+        try:
+            yield upload_stream  # type: ignore[misc]
+            upload_stream.close()
+        except BaseException:
+            upload_stream.abort()
+            raise
 
     def download_import_zip(self, operation_id: ID, target_local_path: str) -> None:
         """
@@ -4,27 +4,58 @@
 This module is responsible for data redaction during the import and export processes.
 """
 
+import itertools
+import json
 import logging
+import math
+import multiprocessing
 import os
 import random
 import re
 import shutil
+import threading
 from abc import ABC
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import cast
+from typing import Any, TypeVar, cast
 from uuid import UUID
 from zipfile import ZipFile
 
-from bson import ObjectId, UuidRepresentation
-from bson.json_util import JSONOptions, dumps
+from bson import ObjectId, UuidRepresentation, json_util
+from bson.binary import UUID_SUBTYPE, Binary
+from bson.json_util import DatetimeRepresentation, JSONOptions, dumps
 from defusedxml import ElementTree
 from iai_core.repos.mappers import DatetimeToMongo, MediaIdentifierToMongo
+from iai_core.utils.iteration import grouper
 from iai_core.utils.time_utils import now
 
 from job.entities.exceptions import ExportDataRedactionFailedException, ImportDataRedactionFailedException
+from job.utils.concurrency_utils import ordered_executor_map
 
 logger = logging.getLogger(__name__)
 
+R = TypeVar("R")
+
+# Options to serialize the documents in the project archive, the same options are used to export and import them
+PROJECT_ARCHIVE_JSON_OPTIONS = JSONOptions(
+    uuid_representation=UuidRepresentation.STANDARD,
+    datetime_representation=DatetimeRepresentation.ISO8601,
+    tz_aware=True,
+    tzinfo=timezone.utc,
+)
+# Number of documents redacted together, i.e. sent at once to a redaction process
+REDACTION_BATCH_SIZE = int(os.environ.get("PROJECT_IE_REDACTION_BATCH_SIZE", "1000"))
+# Number of processes redacting the documents; if 0, the documents are redacted by the thread reading them
+REDACTION_PROCESSES = int(os.environ.get("PROJECT_IE_REDACTION_PROCESSES", "0"))
+
+# Types which are serialized as-is by 'bson.json_util.dumps'
+JSON_NATIVE_TYPES = frozenset({str, int, bool, type(None)})
+OBJECTID_HEX_PATTERN = re.compile(r"[0-9a-fA-F]{24}")
+OBJECTID_BASED_BINARY_FILENAME_PATTERN = re.compile(r"([0-9a-fA-F]{24})\.([0-9a-zA-Z]{3,4})")
+
 
 def get_random_objectid_between_dates(min_date: datetime, max_date: datetime) -> ObjectId:
     """
@@ -43,12 +74,202 @@ def get_random_objectid_between_dates(min_date: datetime, max_date: datetime) ->
     return ObjectId(ObjectId.from_datetime(random_datetime).binary[:4].hex() + random_hex)
 
 
+@contextmanager
+def open_redaction_process_pool() -> Iterator[Executor | None]:
+    """
+    Open a pool of processes to redact the documents in, if enabled with PROJECT_IE_REDACTION_PROCESSES.
+    The processes are spawned rather than forked, because the job process is multi-threaded.
+
+    :return: The process pool, or None if the documents should be redacted by the calling thread
+    """
+    if REDACTION_PROCESSES <= 0:
+        yield None
+        return
+    with ProcessPoolExecutor(
+        max_workers=REDACTION_PROCESSES, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        yield executor
+
+
+@dataclass(frozen=True)
+class ExportDocumentRedactor:
+    """
+    Redacts and serializes the documents to export with a single traversal of each document tree.
+
+    The redaction is applied while converting the documents to JSON-compatible values, in place of
+    'bson.json_util.dumps', so the output is the same as serializing the documents and then applying the regex-based
+    methods 'replace_objectid_in_mongodb_doc', 'replace_objectid_based_binary_filename_in_mongodb_doc' and
+    'mask_user_info_in_mongodb_doc' of ExportDataRedactionUseCase. The redactor is picklable, so that the batches
+    of documents can be redacted in a process pool.
+
+    :param objectid_replacement_base_int: Base of the ObjectId replacement algorithm, as integer
+    :param user_keys: Keys of the fields that refer to users
+    """
+
+    objectid_replacement_base_int: int
+    user_keys: frozenset[str]
+
+    def redact_batch(self, docs: list[dict]) -> tuple[list[str], int | None]:  # noqa: C901
+        """
+        Redact and serialize a batch of documents. The fields referring to users are redacted in-place.
+
+        :param docs: MongoDB documents
+        :return: The serialized documents, and the minimum transformed ObjectId of the batch as integer
+        """
+        base_int = self.objectid_replacement_base_int
+        user_keys = self.user_keys
+        redacted_keys = user_keys | {"binary_filename"}
+        min_int: int | None = None
+
+        def shift_back(objectid_hex: str) -> str:
+            nonlocal min_int
+            objectid_int_shifted = int(objectid_hex, 16) - base_int
+            if objectid_int_shifted < 0:
+                logger.error(
+                    "While replacing IDs, found a document containing an ObjectId (%s) lower than the base (%s)",
+                    objectid_hex,
+                    f"{base_int:024x}",
+                )
+                raise ExportDataRedactionFailedException
+            if min_int is None or objectid_int_shifted < min_int:
+                min_int = objectid_int_shifted
+            return f"{objectid_int_shifted:024x}"
+
+        def redact_field(key: str, value: Any) -> Any:
+            if key in user_keys:
+                if isinstance(value, str):
+                    return "$user_id_str"
+                if isinstance(value, UUID) or (isinstance(value, Binary) and value.subtype == UUID_SUBTYPE):
+                    return "$user_id_uuid4"
+            elif isinstance(value, str) and (match := OBJECTID_BASED_BINARY_FILENAME_PATTERN.fullmatch(value)):
+                return f"{shift_back(match.group(1))}.{match.group(2)}"
+            return value
+
+        def convert(value: Any) -> Any:
+            # Same conversion as 'bson.json_util.dumps', with fast paths for the most frequent types
+            value_type = type(value)
+            if value_type in JSON_NATIVE_TYPES or (value_type is float and math.isfinite(value)):
+                return value
+            if value_type is ObjectId:
+                # Serialized as '{"$sid": ...}', like the '{"$oid": ...}' of the ObjectId after the replacement
+                return {"$sid": shift_back(str(value))}
+            if hasattr(value, "items"):
+                if not redacted_keys.isdisjoint(value):
+                    for key in redacted_keys.intersection(value):
+                        value[key] = redact_field(key, value[key])
+                return {k: convert(v) for k, v in value.items()}
+            if hasattr(value, "__iter__") and not isinstance(value, str | bytes):
+                return [convert(v) for v in value]
+            try:
+                return json_util.default(value, PROJECT_ARCHIVE_JSON_OPTIONS)
+            except TypeError:
+                return value
+
+        redacted_docs = [json.dumps(convert(doc)) for doc in docs]
+        return redacted_docs, min_int
+
+
+@dataclass(frozen=True)
+class ImportDocumentRestorer:
+    """
+    Parses and restores the imported documents with a single traversal of each document tree.
+
+    The restoration is applied while parsing the documents, in place of 'bson.json_util.loads', so the output
+    is the same as applying the regex-based methods 'update_user_info_in_mongodb_doc',
+    'recreate_objectid_based_binary_filename_in_mongodb_doc' and 'recreate_objectid_in_mongodb_doc'
+    of ImportDataRedactionUseCase and then parsing the documents. The restorer is picklable,
+    so that the batches of documents can be restored in a process pool.
+
+    :param objectid_replacement_offset_int: Offset between the recreated ObjectIds and the substitute ids
+    :param user_replacement_new_id: Identifier to use when updating user-relative data
+    :param user_keys: Keys of the fields that refer to users
+    """
+
+    objectid_replacement_offset_int: int
+    user_replacement_new_id: UUID
+    user_keys: frozenset[str]
+
+    def restore_batch(self, bson_docs: list[str]) -> list[dict]:  # noqa: C901
+        """
+        Parse and restore a batch of documents
+
+        :param bson_docs: MongoDB documents encoded as BSON
+        :return: The restored documents
+        """
+        offset_int = self.objectid_replacement_offset_int
+        user_keys = self.user_keys
+        restored_keys = user_keys | {"binary_filename"}
+        new_user_id = self.user_replacement_new_id
+        new_user_id_str = str(new_user_id)
+
+        def shift_forward(sid_hex: str) -> str:
+            return f"{int(sid_hex, 16) + offset_int:024x}"
+
+        def restore_field(key: str, value: Any) -> Any:
+            if not isinstance(value, str):
+                return value
+            if key in user_keys:
+                if value == "$user_id_str":
+                    return new_user_id_str
+                if value == "$user_id_uuid4":
+                    return new_user_id
+            elif match := OBJECTID_BASED_BINARY_FILENAME_PATTERN.fullmatch(value):
+                return f"{shift_forward(match.group(1))}.{match.group(2)}"
+            return value
+
+        def object_hook(dct: dict) -> Any:
+            # Called for each JSON object once its values are parsed, like the hook of 'bson.json_util.loads'
+            if (
+                len(dct) == 1
+                and isinstance(sid_hex := dct.get("$sid"), str)
+                and OBJECTID_HEX_PATTERN.fullmatch(sid_hex)
+            ):
+                return ObjectId(shift_forward(sid_hex))
+            if not restored_keys.isdisjoint(dct):
+                for key in restored_keys.intersection(dct):
+                    dct[key] = restore_field(key, dct[key])
+            return json_util.object_hook(dct, PROJECT_ARCHIVE_JSON_OPTIONS)
+
+        return [json.loads(bson_doc, object_hook=object_hook) for bson_doc in bson_docs]
+
+
 class BaseDataRedactionUseCase(ABC):
-    """Base class for the common logic between import and export data redaction use cases."""
+    """
+    Base class for the common logic between import and export data redaction use cases.
+
+    :param executor: Executor (e.g. process pool) to redact the batches of documents in.
+        If None, the documents are redacted by the calling thread.
+    """
 
     # for all the keys listed below we also consider their variants with '_id', '_uid' or '_name' suffix
     USER_RELATED_KEYS = ("author", "creator", "editor", "uploader", "user")
 
+    def __init__(self, executor: Executor | None = None) -> None:
+        self.executor = executor
+
+    @classmethod
+    def _get_user_related_keys(cls, suffixes: tuple[str, ...]) -> frozenset[str]:
+        """Get the keys relative to user info, with each of the given suffixes"""
+        return frozenset(key + suffix for key in cls.USER_RELATED_KEYS for suffix in ("", *suffixes))
+
+    def _map_batches(self, function: Callable[[list], R], items: Iterable[Any]) -> Iterator[R]:
+        """
+        Apply a function to batches of items, in the executor of the use case if any
+
+        :param function: Function to apply to each batch; it must be picklable to run in a process pool
+        :param items: Items to batch
+        :return: Generator of the results of the function, in the order of the batches
+        """
+        batches = grouper(items, chunk_size=REDACTION_BATCH_SIZE)
+        if self.executor is None:
+            return map(function, batches)
+        return ordered_executor_map(
+            executor=self.executor,
+            function=function,
+            items=batches,
+            max_pending=2 * max(REDACTION_PROCESSES, 1),
+        )
+
     @staticmethod
     def _is_file_label_schema_json(file_basename: str) -> bool:
         """Determine if a file is a label schema representation in JSON format"""
@@ -77,6 +298,17 @@ class BaseDataRedactionUseCase(ABC):
             return False
         return "reference_features" in file_basename
 
+    @classmethod
+    def is_file_redactable(cls, file_path: str) -> bool:
+        """Determine if a file is a model-related object file which may embed ObjectIds to redact"""
+        base_name = os.path.basename(file_path)
+        return (
+            cls._is_file_label_schema_json(base_name)
+            or cls._is_file_reference_features_json(base_name)
+            or cls._is_file_model_xml(base_name)
+            or cls._is_file_exportable_code(base_name)
+        )
+
 
 class ExportDataRedactionUseCase(BaseDataRedactionUseCase):
     """
@@ -86,12 +318,18 @@ class ExportDataRedactionUseCase(BaseDataRedactionUseCase):
     - Replace the ObjectIDs in the documents
     - Remove the project, workspace and organization ID from the documents
     - Remove user IDs and personal data from documents
+
+    :param executor: Executor (e.g. process pool) to redact the batches of documents in.
+        If None, the documents are redacted by the calling thread.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, executor: Executor | None = None) -> None:
+        super().__init__(executor=executor)
         self.objectid_replacement_base_oid: ObjectId = self._generate_random_base_oid()
         self.objectid_replacement_base_int = int(str(self.objectid_replacement_base_oid), 16)
         self.objectid_replacement_min_int: int | None = None  # this attribute is updated during the redaction
+        # Documents may be redacted concurrently by multiple threads
+        self._objectid_replacement_min_int_lock = threading.Lock()
 
     @staticmethod
     def _generate_random_base_oid() -> ObjectId:
@@ -130,11 +368,20 @@ class ExportDataRedactionUseCase(BaseDataRedactionUseCase):
         objectid_hex_shifted = f"{objectid_int_shifted:024x}"
 
         # Cache the minimum transformed value
-        if self.objectid_replacement_min_int is None or objectid_int_shifted < self.objectid_replacement_min_int:
-            self.objectid_replacement_min_int = objectid_int_shifted
+        self.__update_objectid_replacement_min_int(objectid_int_shifted)
 
         return objectid_hex_shifted
 
+    def __update_objectid_replacement_min_int(self, objectid_int_shifted: int) -> None:
+        """Update the minimum transformed id. The lock is only taken when the value may need to be updated."""
+        if self.objectid_replacement_min_int is None or objectid_int_shifted < self.objectid_replacement_min_int:
+            with self._objectid_replacement_min_int_lock:
+                if (
+                    self.objectid_replacement_min_int is None
+                    or objectid_int_shifted < self.objectid_replacement_min_int
+                ):
+                    self.objectid_replacement_min_int = objectid_int_shifted
+
     @property
     def objectid_replacement_min_id(self) -> str:
         """Value of the minimum transformed id (ObjectId) as a hex string"""
@@ -142,6 +389,27 @@ class ExportDataRedactionUseCase(BaseDataRedactionUseCase):
             raise ValueError("The minimum id has not been initialized yet")
         return f"{self.objectid_replacement_min_int:024x}"
 
+    def redact_mongodb_docs(self, docs: Iterable[dict]) -> Iterator[str]:
+        """
+        Redact the documents to export and serialize them.
+
+        This is equivalent to serializing the documents, then applying 'replace_objectid_in_mongodb_doc',
+        'replace_objectid_based_binary_filename_in_mongodb_doc' and 'mask_user_info_in_mongodb_doc',
+        but each document is traversed only once. The documents are redacted in batches,
+        in the executor of the use case if any.
+
+        :param docs: MongoDB documents; note that they are modified in-place
+        :return: Generator of the redacted documents, encoded as BSON
+        """
+        redactor = ExportDocumentRedactor(
+            objectid_replacement_base_int=self.objectid_replacement_base_int,
+            user_keys=self._get_user_related_keys(suffixes=("_id", "_name", "_uid")),
+        )
+        for redacted_docs, min_int in self._map_batches(redactor.redact_batch, docs):
+            if min_int is not None:
+                self.__update_objectid_replacement_min_int(min_int)
+            yield from redacted_docs
+
     def replace_objectid_in_mongodb_doc(self, bson_doc: str) -> str:
         """
         Replace the ObjectIDs in a document with substitute ids, which preserve the ordering of the original ids
@@ -422,13 +690,17 @@ class ImportDataRedactionUseCase(BaseDataRedactionUseCase):
         Only needed for ObjectId reconstruction.
     :param user_replacement_new_id: Identifier to use when updating user-relative data.
         Only needed for personal data replacement.
+    :param executor: Executor (e.g. process pool) to restore the batches of documents in.
+        If None, the documents are restored by the calling thread.
     """
 
     def __init__(
         self,
         objectid_replacement_min_int: int | None = None,
         user_replacement_new_id: UUID | None = None,
+        executor: Executor | None = None,
     ) -> None:
+        super().__init__(executor=executor)
         self.objectid_replacement_min_int = objectid_replacement_min_int
         self.objectid_replacement_seed_int = int(str(self._generate_random_seed_oid()), 16)
         self.user_replacement_new_id = user_replacement_new_id
@@ -469,6 +741,31 @@ class ImportDataRedactionUseCase(BaseDataRedactionUseCase):
             f"{self.objectid_replacement_seed_int + objectid_int - cast('int', self.objectid_replacement_min_int):024x}"
         )
 
+    def restore_mongodb_docs(self, bson_docs: Iterable[str]) -> Iterator[dict]:
+        """
+        Parse the imported documents and restore them.
+
+        This is equivalent to applying 'update_user_info_in_mongodb_doc',
+        'recreate_objectid_based_binary_filename_in_mongodb_doc' and 'recreate_objectid_in_mongodb_doc',
+        then parsing the documents, but each document is traversed only once. The documents are restored
+        in batches, in the executor of the use case if any.
+
+        :param bson_docs: MongoDB documents encoded as BSON
+        :return: Generator of the restored documents
+        """
+        if self.objectid_replacement_min_int is None:
+            logger.error("Cannot reconstruct ObjectIds for imported docs if the minimum transformed id is not provided")
+            raise ImportDataRedactionFailedException
+        if self.user_replacement_new_id is None:
+            logger.error("Cannot update user-relative info in imported docs because the new user id is not provided")
+            raise ImportDataRedactionFailedException
+        restorer = ImportDocumentRestorer(
+            objectid_replacement_offset_int=self.objectid_replacement_seed_int - self.objectid_replacement_min_int,
+            user_replacement_new_id=self.user_replacement_new_id,
+            user_keys=self._get_user_related_keys(suffixes=("_id", "_name")),
+        )
+        return itertools.chain.from_iterable(self._map_batches(restorer.restore_batch, bson_docs))
+
     def recreate_objectid_in_mongodb_doc(self, bson_doc: str) -> str:
         """
         Replace the substitute ids in a document with newly generated ObjectIds. This is needed for project import.
@@ -4,18 +4,19 @@
 This module implements the project export usecase.
 """
 
+import io
 import logging
 import os
+import shutil
 import tempfile
-import uuid
 from collections.abc import Callable
-from datetime import timezone
+from dataclasses import dataclass
 from functools import partial
+from typing import IO
 
-from bson.binary import UuidRepresentation
-from bson.json_util import DatetimeRepresentation, JSONOptions, dumps
 from geti_types import CTX_SESSION_VAR, ID, ProjectIdentifier, Session
 from iai_core.repos.base import SessionBasedRepo
+from iai_core.repos.storage.storage_client import BinaryObjectType
 from iai_core.utils.iteration import multi_map
 from iai_core.versioning import DataVersion
 from jobs_common.tasks.utils.progress import publish_metadata_update
@@ -25,12 +26,98 @@ from job.entities.exceptions import ExportProjectFailedException
 from job.repos.binary_storage_repo import BinaryStorageRepo
 from job.repos.document_repo import DocumentRepo
 from job.repos.zip_storage_repo import ZipStorageRepo
-from job.usecases.data_redaction_usecase import ExportDataRedactionUseCase
+from job.usecases.data_redaction_usecase import ExportDataRedactionUseCase, open_redaction_process_pool
 from job.usecases.signature_usecase import SignatureUseCaseHelper
-from job.utils.file_utils import read_file_in_chunks
+from job.utils.concurrency_utils import ordered_parallel_map
+from job.utils.file_utils import HashingWriter
 
 logger = logging.getLogger(__name__)
 
+# Number of worker threads fetching and redacting the binary objects, while the zip archive is written
+EXPORT_FETCH_CONCURRENCY = int(os.environ.get("PROJECT_EXPORT_FETCH_CONCURRENCY", "8"))
+# Number of DB collections fetched and redacted at the same time, while the zip archive is written.
+# It also bounds the number of serialized collections waiting to be written.
+EXPORT_COLLECTION_CONCURRENCY = int(os.environ.get("PROJECT_EXPORT_COLLECTION_CONCURRENCY", "2"))
+# Binary objects up to this size are prefetched in memory by the workers; larger ones are streamed by the zip writer
+PREFETCH_MAX_OBJECT_SIZE = 4 * 2**20  # 4MB
+# Serialized collections are kept in memory up to this size, then spooled to disk
+COLLECTION_SPOOL_MAX_SIZE = 4 * 2**20  # 4MB
+# Share of the export progress (percentage) given to the DB collections, whose size is not known in advance
+DB_EXPORT_PROGRESS_SHARE = 10
+
+
+@dataclass(frozen=True)
+class FetchedCollection:
+    """Redacted documents of a collection, serialized in JSON Lines format and ready to be written to the archive"""
+
+    collection_name: str
+    data: IO[bytes]
+
+    def close(self) -> None:
+        """Release the serialized documents"""
+        self.data.close()
+
+
+@dataclass(frozen=True)
+class FetchedObject:
+    """Binary object ready to be written to the archive. Large objects are not prefetched ('data' is None)."""
+
+    object_type: BinaryObjectType
+    remote_path: str  # path of the object from the project root in the S3 storage
+    redacted_remote_path: str  # path of the object from the project root in the archive
+    data: IO[bytes] | None
+    size: int
+
+    def close(self) -> None:
+        """Release the prefetched data, if any"""
+        if self.data is not None:
+            self.data.close()
+
+
+class ExportProgressReporter:
+    """
+    Reports the progress of the export. The size of the DB collections is only known once they are exported,
+    so they account for a fixed share of the progress, split equally between them; the rest of the progress
+    is proportional to the number of bytes of binary objects written to the project archive.
+    The progress is only reported when its percentage or its message changes.
+
+    :param progress_callback: callback function to report progress
+    :param num_collections: number of DB collections to export
+    :param total_object_bytes: total size of the binary objects to export
+    """
+
+    def __init__(
+        self, progress_callback: Callable[[float, str], None], num_collections: int, total_object_bytes: int
+    ) -> None:
+        self._progress_callback = progress_callback
+        self._num_collections = num_collections
+        self._total_object_bytes = total_object_bytes
+        self._collections_share = DB_EXPORT_PROGRESS_SHARE if total_object_bytes else 100
+        self._exported_collections = 0
+        self._written_object_bytes = 0
+        self._last_reported: tuple[float, str] | None = None
+
+    def advance(self, message: str, num_collections: int = 0, num_object_bytes: int = 0) -> None:
+        """
+        Record the data written to the archive since the last call and report the progress
+
+        :param message: progress message
+        :param num_collections: number of DB collections written since the last call
+        :param num_object_bytes: number of bytes of binary objects written since the last call
+        """
+        self._exported_collections += num_collections
+        self._written_object_bytes += num_object_bytes
+        progress = 0.0
+        if self._num_collections:
+            progress += self._collections_share * self._exported_collections / self._num_collections
+        if self._total_object_bytes:
+            progress += (100 - self._collections_share) * self._written_object_bytes / self._total_object_bytes
+        # The export is only complete once the archive is signed and uploaded
+        progress = float(min(99, int(progress)))
+        if (progress, message) != self._last_reported:
+            self._last_reported = (progress, message)
+            self._progress_callback(progress, message)
+
 
 class ProjectExportUseCase:
     """The ProjectExportUseCase coordinates the main operations for the export process"""
@@ -55,7 +142,6 @@ class ProjectExportUseCase:
         """
         session: Session = CTX_SESSION_VAR.get()
         project_identifier = ProjectIdentifier(workspace_id=session.workspace_id, project_id=project_id)
-        data_redaction_use_case = ExportDataRedactionUseCase()
         document_repo = DocumentRepo(project_identifier=project_identifier)
         binary_storage_repo = BinaryStorageRepo(
             organization_id=session.organization_id,
@@ -66,103 +152,113 @@ class ProjectExportUseCase:
             organization_id=session.organization_id,
             workspace_id=session.workspace_id,
         )
-        json_options = JSONOptions(
-            uuid_representation=UuidRepresentation.STANDARD,
-            datetime_representation=DatetimeRepresentation.ISO8601,
-            tz_aware=True,
-            tzinfo=timezone.utc,
-        )
-
-        # Create the zip file in a local temporary folder
+        # The project archive is created in a single pass: it is written directly inside the wrapper archive,
+        # which is uploaded to S3 while it is being written, and it is hashed on the fly to be signed at the end.
         logger.info("Creating zip archive to export project '%s'", project_id)
-        project_archive_path = os.path.join(tmp_folder, ProjectZipArchiveWrapper.PROJECT_ARCHIVE)
-        with ProjectZipArchive(zip_file_path=project_archive_path) as zip_archive:
-            # Fetch MongoDB documents, redact them and finally add them to the zip archive
-            logger.info(
-                "Exporting the documents from DB collections for project '%s'",
-                project_id,
-            )
-            progress_callback(25, "Exporting project database")
-            collection_names = document_repo.get_collection_names()
-            for collection_name in collection_names:
-                db_raw_documents = document_repo.get_all_documents_from_db_for_collection(
-                    collection_name=collection_name
-                )
-                lock_redaction: list[Callable] = (
-                    [data_redaction_use_case.remove_lock_in_mongodb_doc]
-                    if collection_name in ProjectExportUseCase.COLLECTIONS_WITH_LOCKS
-                    else []
-                )
-                media_based_id_redaction: list[Callable] = (
-                    [data_redaction_use_case.replace_media_based_objectid_in_mongodb_doc]
-                    if collection_name in ProjectExportUseCase.COLLECTIONS_WITH_MEDIA_BASED_ID
-                    else []
+        export_signature_use_case = SignatureUseCaseHelper.get_signature_use_case()
+        export_operation_id = SessionBasedRepo.generate_id()
+        with (
+            open_redaction_process_pool() as redaction_executor,
+            zip_storage_repo.open_downloadable_archive(operation_id=export_operation_id) as upload_stream,
+            ProjectZipArchiveWrapper(zip_file_path=upload_stream) as wrapper_zip_archive,
+        ):
+            data_redaction_use_case = ExportDataRedactionUseCase(executor=redaction_executor)
+            project_archive_hasher = export_signature_use_case.create_hasher()
+            with (
+                wrapper_zip_archive.open_project_archive() as project_archive_stream,
+                ProjectZipArchive(
+                    zip_file_path=HashingWriter(stream=project_archive_stream, hasher=project_archive_hasher)
+                ) as zip_archive,
+            ):
+                # List the collections and the binary objects first, so that the progress can be reported
+                collection_names = document_repo.get_collection_names()
+                objects_to_export = [
+                    (object_type, remote_path, size)
+                    for object_type in binary_storage_repo.get_object_types()
+                    for remote_path, size in binary_storage_repo.list_objects_by_type(object_type=object_type)
+                ]
+                progress_reporter = ExportProgressReporter(
+                    progress_callback=progress_callback,
+                    num_collections=len(collection_names),
+                    total_object_bytes=sum(size for _, _, size in objects_to_export),
                 )
-                redacted_docs = multi_map(
-                    db_raw_documents,
-                    data_redaction_use_case.remove_container_info_in_mongodb_doc,
-                    data_redaction_use_case.remove_job_id_in_mongodb_doc,
-                    *lock_redaction,
-                    *media_based_id_redaction,
-                    partial(dumps, json_options=json_options),
-                    data_redaction_use_case.replace_objectid_in_mongodb_doc,
-                    data_redaction_use_case.replace_objectid_based_binary_filename_in_mongodb_doc,
-                    data_redaction_use_case.mask_user_info_in_mongodb_doc,
+                progress_reporter.advance(message="Exporting project database")
+
+                # Two pools of workers fetch and redact the MongoDB collections and the S3 binary objects in the
+                # background, then they are added to the zip archive in order as they become ready. Only a few
+                # collections are serialized ahead of the zip writer, since a collection may be large.
+                logger.info(
+                    "Exporting the documents from DB collections and the binary objects from S3 storage "
+                    "for project '%s'",
+                    project_id,
                 )
-                # Note: 'db_raw_documents' and 'redacted_docs' are generators, piped and lazily evaluated,
-                # so any error raised while fetching/redacting documents is actually thrown in the next write stage
-                try:
-                    zip_archive.add_collection_with_documents(collection_name=collection_name, documents=redacted_docs)
-                except Exception:  # log the collection name before re-raising the exception
-                    logger.error(
-                        "Error occurred while exporting collection '%s'",
-                        collection_name,
+                collection_fetch_tasks: list[Callable[[], FetchedCollection]] = [
+                    partial(
+                        cls._fetch_collection,
+                        collection_name=collection_name,
+                        document_repo=document_repo,
+                        data_redaction_use_case=data_redaction_use_case,
+                        tmp_folder=tmp_folder,
                     )
-                    raise
-
-            progress_callback(50, "Exporting project binary files")
-            # Fetch binary objects from S3, adjust their paths and finally add them to the zip archive
-            logger.info("Exporting binary objects from S3 storage for project '%s'", project_id)
-            for object_type in binary_storage_repo.get_object_types():
-                objects_local_and_remote_paths = binary_storage_repo.get_all_objects_by_type(
-                    object_type=object_type, target_folder=tmp_folder
-                )
-                redacted_objects_paths = (
-                    (
-                        data_redaction_use_case.replace_objectid_in_file(lp),  # redact the file
-                        data_redaction_use_case.replace_objectid_in_url(rp),  # redact the path
+                    for collection_name in collection_names
+                ]
+                object_fetch_tasks: list[Callable[[], FetchedObject]] = [
+                    partial(
+                        cls._fetch_object,
+                        object_type=object_type,
+                        remote_path=remote_path,
+                        size=size,
+                        binary_storage_repo=binary_storage_repo,
+                        data_redaction_use_case=data_redaction_use_case,
+                        tmp_folder=tmp_folder,
                     )
-                    for lp, rp in objects_local_and_remote_paths
-                )
-                zip_archive.add_objects_by_type(
-                    object_type=object_type,
-                    local_and_remote_paths=redacted_objects_paths,
-                )
+                    for object_type, remote_path, size in objects_to_export
+                ]
+                with (
+                    ordered_parallel_map(
+                        lambda fetch_task: fetch_task(),
+                        collection_fetch_tasks,
+                        max_workers=EXPORT_COLLECTION_CONCURRENCY,
+                        max_pending=EXPORT_COLLECTION_CONCURRENCY,
+                        discard=FetchedCollection.close,
+                    ) as fetched_collections,
+                    ordered_parallel_map(
+                        lambda fetch_task: fetch_task(),
+                        object_fetch_tasks,
+                        max_workers=EXPORT_FETCH_CONCURRENCY,
+                        discard=FetchedObject.close,
+                    ) as fetched_objects,
+                ):
+                    for fetched_collection in fetched_collections:
+                        with fetched_collection.data:
+                            zip_archive.add_collection_from_stream(
+                                collection_name=fetched_collection.collection_name,
+                                stream=fetched_collection.data,  # type: ignore[arg-type]
+                            )
+                        progress_reporter.advance(num_collections=1, message="Exporting project database")
+                    for fetched_object in fetched_objects:
+                        cls._add_object_to_archive(
+                            fetched_object=fetched_object,
+                            binary_storage_repo=binary_storage_repo,
+                            zip_archive=zip_archive,
+                        )
+                        progress_reporter.advance(
+                            num_object_bytes=fetched_object.size, message="Exporting project binary files"
+                        )
 
-            # Add the manifest
-            logger.info("Adding manifest to the archive of exported project '%s'", project_id)
-            zip_archive.add_manifest(
-                version=DataVersion.get_current().version_string,
-                min_id=data_redaction_use_case.objectid_replacement_min_id,
-            )
-
-        # Generate digital signature
-        export_signature_use_case = SignatureUseCaseHelper.get_signature_use_case()
-        project_zip_data = read_file_in_chunks(filename=project_archive_path)
-        signature = export_signature_use_case.generate_signature(data=project_zip_data)
+                # Add the manifest
+                logger.info("Adding manifest to the archive of exported project '%s'", project_id)
+                zip_archive.add_manifest(
+                    version=DataVersion.get_current().version_string,
+                    min_id=data_redaction_use_case.objectid_replacement_min_id,
+                )
 
-        # Pack up the project data (zip), public key and signature
-        zip_file_path = os.path.join(tmp_folder, f"{str(uuid.uuid4())}.zip")
-        with ProjectZipArchiveWrapper(zip_file_path=zip_file_path) as wrapper_zip_archive:
-            wrapper_zip_archive.add_project_archive(project_archive_path=project_archive_path)
+            # Generate the digital signature of the project archive, then pack it up with the public key
+            progress_reporter.advance(message="Preparing zip archive")
+            signature = export_signature_use_case.sign_digest(digest=project_archive_hasher.finalize())
             wrapper_zip_archive.add_signature(signature=signature)
             wrapper_zip_archive.add_public_key(public_key=export_signature_use_case.public_key_bytes)
 
-        # Upload the archive to S3 for later download
-        progress_callback(75.0, "Preparing zip archive")
-        export_operation_id = SessionBasedRepo.generate_id()
-        zip_storage_repo.upload_downloadable_archive(operation_id=export_operation_id, zip_local_path=zip_file_path)
-
         download_url = cls._get_download_url(
             organization_id=session.organization_id,
             project_identifier=project_identifier,
@@ -175,6 +271,140 @@ class ProjectExportUseCase:
         publish_metadata_update(metadata=metadata)
         logger.info("Project '%s' has been successfully exported", project_id)
 
+    @classmethod
+    def _fetch_collection(
+        cls,
+        collection_name: str,
+        document_repo: DocumentRepo,
+        data_redaction_use_case: ExportDataRedactionUseCase,
+        tmp_folder: str,
+    ) -> FetchedCollection:
+        """
+        Fetch the documents of a collection from the DB, redact them and serialize them in JSON Lines format
+
+        :param collection_name: Name of the collection to fetch
+        :param document_repo: Repo to read the documents of the project
+        :param data_redaction_use_case: Use case to redact the documents
+        :param tmp_folder: Temporary local folder that can be used to store files
+        :return: The serialized collection
+        """
+        db_raw_documents = document_repo.get_all_documents_from_db_for_collection(collection_name=collection_name)
+        lock_redaction: list[Callable] = (
+            [data_redaction_use_case.remove_lock_in_mongodb_doc]
+            if collection_name in cls.COLLECTIONS_WITH_LOCKS
+            else []
+        )
+        media_based_id_redaction: list[Callable] = (
+            [data_redaction_use_case.replace_media_based_objectid_in_mongodb_doc]
+            if collection_name in cls.COLLECTIONS_WITH_MEDIA_BASED_ID
+            else []
+        )
+        redacted_docs = data_redaction_use_case.redact_mongodb_docs(
+            multi_map(
+                db_raw_documents,
+                data_redaction_use_case.remove_container_info_in_mongodb_doc,
+                data_redaction_use_case.remove_job_id_in_mongodb_doc,
+                *lock_redaction,
+                *media_based_id_redaction,
+            )
+        )
+        # Note: 'db_raw_documents' and 'redacted_docs' are generators, piped and lazily evaluated,
+        # so any error raised while fetching/redacting documents is actually thrown in the write stage
+        data = tempfile.SpooledTemporaryFile(max_size=COLLECTION_SPOOL_MAX_SIZE, dir=tmp_folder)  # noqa: SIM115
+        try:
+            for doc in redacted_docs:
+                data.write(bytes(f"{doc}\n", "utf-8"))
+        except Exception:  # log the collection name before re-raising the exception
+            data.close()
+            logger.error(
+                "Error occurred while exporting collection '%s'",
+                collection_name,
+            )
+            raise
+        data.seek(0)
+        return FetchedCollection(collection_name=collection_name, data=data)
+
+    @staticmethod
+    def _fetch_object(
+        object_type: BinaryObjectType,
+        remote_path: str,
+        size: int,
+        binary_storage_repo: BinaryStorageRepo,
+        data_redaction_use_case: ExportDataRedactionUseCase,
+        tmp_folder: str,
+    ) -> FetchedObject:
+        """
+        Prepare a binary object to be added to the project archive, redacting its path and content.
+
+        Small objects are read in memory, so that the latency of the requests is overlapped across the workers,
+        while large objects are left to be streamed from S3 by the zip writer. Model-related files which may embed
+        ObjectIds are downloaded to the temporary folder, because they are redacted in place.
+
+        :param object_type: Type of the binary object
+        :param remote_path: Path of the object from the project root in the S3 storage
+        :param size: Size of the object in bytes
+        :param binary_storage_repo: Repo to read the binary objects of the project
+        :param data_redaction_use_case: Use case to redact the objects
+        :param tmp_folder: Temporary local folder that can be used to store files
+        :return: The object ready to be added to the archive
+        """
+        redacted_remote_path = data_redaction_use_case.replace_objectid_in_url(remote_path)
+        data: IO[bytes] | None = None
+        if data_redaction_use_case.is_file_redactable(remote_path):
+            local_path = os.path.join(tmp_folder, remote_path)
+            os.makedirs(os.path.dirname(local_path), exist_ok=True)
+            with (
+                binary_storage_repo.open_object(
+                    object_type=object_type, object_name_from_project_root=remote_path
+                ) as object_stream,
+                open(local_path, "wb") as local_fp,
+            ):
+                shutil.copyfileobj(object_stream, local_fp)
+            local_path = data_redaction_use_case.replace_objectid_in_file(local_path)
+            data = open(local_path, "rb")  # noqa: SIM115
+            os.remove(local_path)  # the opened file remains readable until it is closed by the zip writer
+            size = os.fstat(data.fileno()).st_size
+        elif size <= PREFETCH_MAX_OBJECT_SIZE:
+            with binary_storage_repo.open_object(
+                object_type=object_type, object_name_from_project_root=remote_path
+            ) as object_stream:
+                data = io.BytesIO(object_stream.read())
+        return FetchedObject(
+            object_type=object_type,
+            remote_path=remote_path,
+            redacted_remote_path=redacted_remote_path,
+            data=data,
+            size=size,
+        )
+
+    @staticmethod
+    def _add_object_to_archive(
+        fetched_object: FetchedObject,
+        binary_storage_repo: BinaryStorageRepo,
+        zip_archive: ProjectZipArchive,
+    ) -> None:
+        """
+        Add a binary object to the project archive, streaming it from S3 if it was not prefetched
+
+        :param fetched_object: Object to add
+        :param binary_storage_repo: Repo to read the binary objects of the project
+        :param zip_archive: Project archive to add the object to
+        """
+        with (
+            fetched_object.data
+            if fetched_object.data is not None
+            else binary_storage_repo.open_object(
+                object_type=fetched_object.object_type,
+                object_name_from_project_root=fetched_object.remote_path,
+            )
+        ) as object_stream:
+            zip_archive.add_object_from_stream(
+                object_type=fetched_object.object_type,
+                remote_object_path_from_project_root=fetched_object.redacted_remote_path,
+                stream=object_stream,  # type: ignore[arg-type]
+                size=fetched_object.size,
+            )
+
     @staticmethod
     def export_as_zip(project_id: ID, progress_callback: Callable[[float, str], None]) -> None:
         """
@@ -10,19 +10,16 @@ import tempfile
 import uuid
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
-from datetime import timezone
-from functools import partial
 
-from bson.binary import UuidRepresentation
-from bson.json_util import DatetimeRepresentation, JSONOptions, loads
 from geti_spicedb_tools import SpiceDB
-from geti_types import CTX_SESSION_VAR, ID, ProjectIdentifier, Session
+from geti_types import CTX_SESSION_VAR, ID, DatasetStorageIdentifier, ProjectIdentifier, Session
 from grpc_interfaces.model_registration.client import ModelRegistrationClient
 from iai_core.entities.model import NullModel
 from iai_core.repos import ProjectRepo
 from iai_core.repos.mappers import IDToMongo
 from iai_core.repos.storage.storage_client import BinaryObjectType
 from iai_core.services import ModelService
+from iai_core.services.annotation_statistics_service import AnnotationStatisticsService
 from iai_core.utils.iteration import multi_map
 from iai_core.versioning import DataVersion
 from jobs_common.tasks.utils.progress import publish_metadata_update
@@ -36,6 +33,7 @@ from job.entities.exceptions import (
 from job.repos import BinaryStorageRepo, DocumentRepo
 from job.repos.zip_storage_repo import ZipStorageRepo
 from job.usecases import DataMigrationUseCase, ImportDataRedactionUseCase
+from job.usecases.data_redaction_usecase import open_redaction_process_pool
 from job.usecases.signature_usecase import PublicKeyBytes, SignatureUseCaseHelper
 from job.usecases.update_metrics_usecase import UpdateMetricsUseCase
 from job.utils.file_utils import read_file_in_chunks
@@ -98,6 +96,23 @@ class ProjectImportUseCase:
                 f"An error occurred while trying to delete temporary files from the object storage. Reason: {str(exc)}"
             )
 
+    @staticmethod
+    def _build_annotation_statistics(project_identifier: ProjectIdentifier) -> None:
+        """
+        Build the annotation statistics of every dataset storage, since they are not included in the archive
+
+        :param project_identifier: Identifier of the imported project
+        """
+        project = ProjectRepo().get_by_id(project_identifier.project_id)
+        for dataset_storage_id in project.dataset_storage_ids:
+            AnnotationStatisticsService.rebuild_statistics(
+                DatasetStorageIdentifier(
+                    workspace_id=project_identifier.workspace_id,
+                    project_id=project_identifier.project_id,
+                    dataset_storage_id=dataset_storage_id,
+                )
+            )
+
     @staticmethod
     def _register_active_models(project_identifier: ProjectIdentifier) -> None:
         """
@@ -201,27 +216,23 @@ class ProjectImportUseCase:
         self,
         zip_archive: ProjectZipArchive,
         data_redaction_use_case: ImportDataRedactionUseCase,
-        json_options: JSONOptions,
     ) -> dict:
         """
         Extract and redact the project document.
 
         :param zip_archive: the zip archive to extract the project document from
         :param data_redaction_use_case: data redaction to apply to the project document
-        :param json_options: json options for loading documents
         :return: the project document (redacted)
         """
         project_documents_from_zip = zip_archive.get_documents_by_collection(
             collection_name=DocumentRepo.PROJECTS_COLLECTION
         )
-        project_reductions: list[Callable] = [
-            data_redaction_use_case.update_user_info_in_mongodb_doc,
-            data_redaction_use_case.recreate_objectid_in_mongodb_doc,
-            partial(loads, json_options=json_options),
-        ]
+        project_reductions: list[Callable] = []
         if not self.keep_original_dates:
             project_reductions.append(data_redaction_use_case.update_creation_time_in_mongodb_doc)
-        project_restored_docs = multi_map(project_documents_from_zip, *project_reductions)
+        project_restored_docs = multi_map(
+            data_redaction_use_case.restore_mongodb_docs(project_documents_from_zip), *project_reductions
+        )
         try:
             project_document: dict = next(iter(project_restored_docs))
         except StopIteration:
@@ -238,7 +249,6 @@ class ProjectImportUseCase:
         project_document: dict,
         zip_archive: ProjectZipArchive,
         data_redaction_use_case: ImportDataRedactionUseCase,
-        json_options: JSONOptions,
     ) -> None:
         """
         Stores all documents.
@@ -247,7 +257,6 @@ class ProjectImportUseCase:
         :param project_document: the project document to store
         :param zip_archive: the zip archive to extract the documents from
         :param data_redaction_use_case: data redaction to apply to the documents
-        :param json_options: json options for loading documents
         """
         document_repo = DocumentRepo(project_identifier)
         for collection_name in zip_archive.get_collection_names():
@@ -270,15 +279,14 @@ class ProjectImportUseCase:
                 if collection_name in ProjectImportUseCase.COLLECTIONS_WITH_MEDIA_BASED_ID
                 else []
             )
-            document_reductions: list[Callable] = [
-                data_redaction_use_case.update_user_info_in_mongodb_doc,
-                data_redaction_use_case.recreate_objectid_based_binary_filename_in_mongodb_doc,
-                data_redaction_use_case.recreate_objectid_in_mongodb_doc,
-                partial(loads, json_options=json_options),
-            ]
+            document_reductions: list[Callable] = []
             if not self.keep_original_dates:
                 document_reductions.append(data_redaction_use_case.update_creation_time_in_mongodb_doc)
-            restored_docs = multi_map(documents_from_zip, *document_reductions, *media_based_id_redaction)
+            restored_docs = multi_map(
+                data_redaction_use_case.restore_mongodb_docs(documents_from_zip),
+                *document_reductions,
+                *media_based_id_redaction,
+            )
             document_repo.insert_documents_to_db_collection(collection_name=collection_name, documents=restored_docs)
 
     @staticmethod
@@ -343,12 +351,6 @@ class ProjectImportUseCase:
         """
         session: Session = CTX_SESSION_VAR.get()
         local_zip_path = os.path.join(tmp_folder, f"{str(uuid.uuid4())}.zip")
-        json_options = JSONOptions(
-            uuid_representation=UuidRepresentation.STANDARD,
-            datetime_representation=DatetimeRepresentation.ISO8601,
-            tz_aware=True,
-            tzinfo=timezone.utc,
-        )
 
         # Download the zip file to the local filesystem
         logger.info(
@@ -388,7 +390,10 @@ class ProjectImportUseCase:
             public_key=public_key,
         )
 
-        with ProjectZipArchive(zip_file_path=local_project_archive_path) as zip_archive:
+        with (
+            ProjectZipArchive(zip_file_path=local_project_archive_path) as zip_archive,
+            open_redaction_process_pool() as redaction_executor,
+        ):
             # Validate
             zip_archive.validate_against_zip_bomb()
             # Read the manifest
@@ -396,6 +401,7 @@ class ProjectImportUseCase:
             data_redaction_use_case = ImportDataRedactionUseCase(
                 objectid_replacement_min_int=int(manifest.min_id, 16),
                 user_replacement_new_id=uuid.UUID(creator_id),
+                executor=redaction_executor,
             )
             logger.info(
                 "Extracting and processing the main project document (operation '%s')",
@@ -405,7 +411,6 @@ class ProjectImportUseCase:
             project_document = self.__extract_project_document(
                 zip_archive=zip_archive,
                 data_redaction_use_case=data_redaction_use_case,
-                json_options=json_options,
             )
 
             self.project_id = IDToMongo.backward(project_document["_id"])
@@ -426,7 +431,6 @@ class ProjectImportUseCase:
                 project_document=project_document,
                 zip_archive=zip_archive,
                 data_redaction_use_case=data_redaction_use_case,
-                json_options=json_options,
             )
 
             # Store the objects
@@ -472,6 +476,9 @@ class ProjectImportUseCase:
         # Migrate the documents and objects to the latest version
         self._upgrade_project_data(project_archive_version=DataVersion(manifest.version))
 
+        logger.info("Building annotation statistics for project '%s'", project_identifier.project_id)
+        ProjectImportUseCase._build_annotation_statistics(project_identifier=project_identifier)
+
         # Register the last active model(s) to be used for online inference
         logger.info("Registering models for project '%s'", project_identifier.project_id)
         progress_callback(75, "Registering models.")
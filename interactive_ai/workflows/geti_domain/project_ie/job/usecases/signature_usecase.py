@@ -40,6 +40,16 @@ class SignatureUseCase(abc.ABC):
 
     _hashing_algorithm = hashes.SHA384()
 
+    @classmethod
+    def create_hasher(cls) -> hashes.Hash:
+        """
+        Creates a hasher of the algorithm used for the signatures, to compute the digest of data produced
+        incrementally. The finalized digest can be signed with 'sign_digest'.
+
+        :return: the hasher
+        """
+        return hashes.Hash(cls._hashing_algorithm)
+
     @classmethod
     def digest_data(cls, data: bytes | Iterable[bytes]) -> bytes:
         """
@@ -48,7 +58,7 @@ class SignatureUseCase(abc.ABC):
         :param data: the input data to be hashed. This can be either a bytes object or an Iterable of bytes
         :return: the hash digest of the input data
         """
-        hasher = hashes.Hash(cls._hashing_algorithm)
+        hasher = cls.create_hasher()
         if isinstance(data, Iterable) and not isinstance(data, bytes):
             for chunk in data:
                 hasher.update(chunk)
@@ -61,7 +71,6 @@ class SignatureUseCase(abc.ABC):
         """Returns the public key as bytes (DER encoded)."""
         raise NotImplementedError
 
-    @abc.abstractmethod
     def generate_signature(self, data: bytes | Iterable[bytes]) -> SignatureBytes:
         """
         Generates the digital signature for the given binary data.
@@ -69,6 +78,16 @@ class SignatureUseCase(abc.ABC):
         :param data: binary data to sign
         :return: the signature as bytes
         """
+        return self.sign_digest(digest=self.digest_data(data))
+
+    @abc.abstractmethod
+    def sign_digest(self, digest: bytes) -> SignatureBytes:
+        """
+        Generates the digital signature for the given digest of the binary data.
+
+        :param digest: digest of the data to sign, computed with the hashing algorithm of the signatures
+        :return: the signature as bytes
+        """
         raise NotImplementedError
 
     @abc.abstractmethod
@@ -126,8 +145,7 @@ class SignatureUseCaseCertManager(SignatureUseCase):
         logger.info("Loading public key from private key.")
         return self._private_key.public_key()  # type: ignore
 
-    def generate_signature(self, data: bytes | Iterable[bytes]) -> SignatureBytes:
-        digest = self.digest_data(data)
+    def sign_digest(self, digest: bytes) -> SignatureBytes:
         if not isinstance(self._private_key, ec.EllipticCurvePrivateKey):
             raise ValueError(
                 "Invalid private key type. "
@@ -184,8 +202,7 @@ class SignatureUseCaseKMS(SignatureUseCase):
         response = self.client.get_public_key(KeyId=self._public_key_id)
         return PublicKeyBytes(response["PublicKey"])
 
-    def generate_signature(self, data: bytes | Iterable[bytes]) -> SignatureBytes:
-        digest = self.digest_data(data)
+    def sign_digest(self, digest: bytes) -> SignatureBytes:
         response: dict = self.client.sign(
             KeyId=self._private_key_id,
             Message=digest,
@@ -0,0 +1,124 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+import contextvars
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _submit_until_full(
+    executor: Executor,
+    function: Callable[[T], R],
+    items_iter: Iterator[T],
+    pending: deque[Future[R]],
+    max_pending: int,
+) -> None:
+    """Submit the next items to the executor, until 'max_pending' items are pending or the items are exhausted"""
+    for item in islice(items_iter, max(max_pending - len(pending), 0)):
+        pending.append(executor.submit(function, item))
+
+
+def _cancel_pending(pending: deque[Future[R]], discard: Callable[[R], None] | None) -> None:
+    """
+    Cancel the pending items that have not started yet. The results of the other ones, already computed or still
+    being computed, are passed to 'discard' as soon as they are available.
+    """
+
+    def discard_result(future: Future[R]) -> None:
+        if discard is not None and future.exception() is None:
+            discard(future.result())
+
+    for future in pending:
+        if not future.cancel():
+            future.add_done_callback(discard_result)
+    pending.clear()
+
+
+def ordered_executor_map(
+    executor: Executor,
+    function: Callable[[T], R],
+    items: Iterable[T],
+    max_pending: int,
+) -> Iterator[R]:
+    """
+    Applies a function to the items with an executor, yielding the results in the order of the items.
+
+    Unlike Executor.map, the items are submitted lazily: at most 'max_pending' items are processed or waiting
+    to be consumed at any time, which bounds the memory used by the results. If the consumer stops iterating
+    or an exception is raised, the items that have not been processed yet are cancelled.
+
+    :param executor: the executor (thread or process pool) to run the function in
+    :param function: the function to apply to each item
+    :param items: the items to process
+    :param max_pending: maximum number of items processed or waiting to be consumed
+    :return: a generator yielding the results of the function, in the order of the items
+    """
+    pending: deque[Future[R]] = deque()
+    items_iter = iter(items)
+    try:
+        while True:
+            _submit_until_full(executor, function, items_iter, pending, max_pending)
+            if not pending:
+                return
+            yield pending.popleft().result()
+    finally:
+        _cancel_pending(pending, discard=None)
+
+
+@contextmanager
+def ordered_parallel_map(
+    function: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int,
+    max_pending: int | None = None,
+    discard: Callable[[R], None] | None = None,
+) -> Iterator[Iterator[R]]:
+    """
+    Applies a function to the items with a pool of worker threads, yielding the results in the order of the items.
+
+    The first items are submitted as soon as the context is entered, so that they are processed while the caller
+    does other work before consuming the results. The function is run in a copy of the context of the caller,
+    so that context variables such as the session are available to the workers. See 'ordered_executor_map'
+    for the bounding of the pending items.
+
+    When the context is exited, the items that have not been processed yet are cancelled, and the results that
+    were computed but not consumed are passed to 'discard', e.g. to release the resources that they hold.
+
+    :param function: the function to apply to each item
+    :param items: the items to process
+    :param max_workers: maximum number of items processed at the same time
+    :param max_pending: maximum number of items processed or waiting to be consumed. Defaults to twice max_workers.
+    :param discard: function to release a result that is not consumed
+    :return: a generator yielding the results of the function, in the order of the items
+    """
+    context = contextvars.copy_context()
+
+    def run_in_context(item: T) -> R:
+        # A context cannot be entered by several threads at once, each task runs in its own copy
+        return context.copy().run(function, item)
+
+    def yield_in_order() -> Iterator[R]:
+        while True:
+            _submit_until_full(executor, run_in_context, items_iter, pending, max_pending_items)
+            if not pending:
+                return
+            yield pending.popleft().result()
+
+    pending: deque[Future[R]] = deque()
+    items_iter = iter(items)
+    max_pending_items = max_pending if max_pending is not None else 2 * max_workers
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            _submit_until_full(executor, run_in_context, items_iter, pending, max_pending_items)
+            yield yield_in_order()
+        finally:
+            _cancel_pending(pending, discard=discard)
+            # Wait for the items being processed, so that their results are discarded before returning
+            executor.shutdown(wait=True)
@@ -1,7 +1,11 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 
+import io
 from collections.abc import Generator
+from typing import BinaryIO
+
+from cryptography.hazmat.primitives import hashes
 
 
 def read_file_in_chunks(filename: str, buffer_size: int = 2**10 * 8) -> Generator[bytes, None, None]:
@@ -15,3 +19,29 @@ def read_file_in_chunks(filename: str, buffer_size: int = 2**10 * 8) -> Generato
     with open(filename, mode="rb") as f:
         while chunk := f.read(buffer_size):
             yield chunk
+
+
+class HashingWriter(io.RawIOBase):
+    """
+    Non-seekable writable stream that forwards the written bytes to another stream while hashing them.
+
+    :param stream: the stream to write the bytes to
+    :param hasher: the hasher to update with the written bytes
+    """
+
+    def __init__(self, stream: BinaryIO, hasher: hashes.Hash) -> None:
+        self._stream = stream
+        self._hasher = hasher
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def write(self, data) -> int:  # noqa: ANN001
+        self._hasher.update(bytes(data))
+        self._stream.write(data)
+        self._position += len(data)
+        return len(data)
@@ -0,0 +1,137 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+Benchmark of the redaction of the documents on project export and import: regex passes over the serialized
+documents vs. a single traversal of each document tree.
+
+The documents are modelled after annotation documents, with nested shapes and labels:
+
+    PYTHONPATH=. python tests/benchmark/benchmark_document_redaction.py
+
+BENCHMARK_DOCUMENTS sets the number of redacted documents (default: 100 000) and BENCHMARK_SHAPES the number of
+shapes per document (default: 5). PROJECT_IE_REDACTION_PROCESSES additionally benchmarks the redaction in a pool of
+processes of that size.
+"""
+
+import logging
+import os
+import time
+import uuid
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor
+from datetime import datetime, timezone
+
+from bson import ObjectId
+from bson.json_util import dumps, loads
+
+from job.usecases.data_redaction_usecase import (
+    PROJECT_ARCHIVE_JSON_OPTIONS,
+    REDACTION_PROCESSES,
+    ExportDataRedactionUseCase,
+    ImportDataRedactionUseCase,
+    open_redaction_process_pool,
+)
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_DOCUMENTS = int(os.environ.get("BENCHMARK_DOCUMENTS", "100000"))
+BENCHMARK_SHAPES = int(os.environ.get("BENCHMARK_SHAPES", "5"))
+
+
+def _documents() -> list[dict]:
+    user_id = uuid.uuid4()
+    return [
+        {
+            "_id": ObjectId(),
+            "dataset_storage_id": ObjectId(),
+            "media_identifier": {"type": "image", "media_id": ObjectId()},
+            "binary_filename": f"{ObjectId()}.jpg",
+            "creation_date": datetime.now(tz=timezone.utc),
+            "user_id": str(user_id),
+            "editor_uid": user_id,
+            "shapes": [
+                {
+                    "_id": ObjectId(),
+                    "type": "RECTANGLE",
+                    "x": 0.1,
+                    "y": 0.2,
+                    "width": 0.3,
+                    "height": 0.4,
+                    "labels": [
+                        {"label_id": ObjectId(), "probability": 0.9, "user_id": str(user_id)},
+                        {"label_id": ObjectId(), "probability": 0.1, "user_id": str(user_id)},
+                    ],
+                }
+                for _ in range(BENCHMARK_SHAPES)
+            ],
+        }
+        for _ in range(BENCHMARK_DOCUMENTS)
+    ]
+
+
+def _export_with_regexes(use_case: ExportDataRedactionUseCase, docs: Iterable[dict]) -> list[str]:
+    """Former redaction of the exported documents, with regex passes over the serialized documents"""
+    return [
+        use_case.mask_user_info_in_mongodb_doc(
+            use_case.replace_objectid_based_binary_filename_in_mongodb_doc(
+                use_case.replace_objectid_in_mongodb_doc(dumps(doc, json_options=PROJECT_ARCHIVE_JSON_OPTIONS))
+            )
+        )
+        for doc in docs
+    ]
+
+
+def _import_with_regexes(use_case: ImportDataRedactionUseCase, bson_docs: Iterable[str]) -> list[dict]:
+    """Former restoration of the imported documents, with regex passes before parsing the documents"""
+    return [
+        loads(
+            use_case.recreate_objectid_in_mongodb_doc(
+                use_case.recreate_objectid_based_binary_filename_in_mongodb_doc(
+                    use_case.update_user_info_in_mongodb_doc(bson_doc)
+                )
+            ),
+            json_options=PROJECT_ARCHIVE_JSON_OPTIONS,
+        )
+        for bson_doc in bson_docs
+    ]
+
+
+def _run(name: str, function: Callable[[], list]) -> list:
+    start = time.perf_counter()
+    result = function()
+    duration = time.perf_counter() - start
+    logger.info(f"{name}: {BENCHMARK_DOCUMENTS} documents in {duration:.2f} s, {len(result) / duration:.0f} docs/s")
+    return result
+
+
+def _run_all(executor: Executor | None) -> None:
+    suffix = f" ({REDACTION_PROCESSES} processes)" if executor is not None else ""
+    docs = _documents()
+    export_use_case = ExportDataRedactionUseCase(executor=executor)
+    expected_bson_docs = _run("Export, regexes", lambda: _export_with_regexes(export_use_case, docs))
+    # The single-pass redaction modifies the documents in-place, they are only used once
+    bson_docs = _run(f"Export, single pass{suffix}", lambda: list(export_use_case.redact_mongodb_docs(docs)))
+    assert bson_docs == expected_bson_docs
+
+    import_use_case = ImportDataRedactionUseCase(
+        objectid_replacement_min_int=export_use_case.objectid_replacement_min_int,
+        user_replacement_new_id=uuid.uuid4(),
+        executor=executor,
+    )
+    expected_docs = _run("Import, regexes", lambda: _import_with_regexes(import_use_case, bson_docs))
+    restored_docs = _run(f"Import, single pass{suffix}", lambda: list(import_use_case.restore_mongodb_docs(bson_docs)))
+    assert restored_docs == expected_docs
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    logger.info(f"Redacting {BENCHMARK_DOCUMENTS} documents with {BENCHMARK_SHAPES} shapes each")
+    _run_all(executor=None)
+    if REDACTION_PROCESSES > 0:
+        with open_redaction_process_pool() as executor:
+            _run_all(executor=executor)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+import io
 import json
 import os
 import tempfile
@@ -8,15 +9,18 @@ from datetime import datetime
 
 import pytest
 from bson import json_util
+from cryptography.hazmat.primitives import hashes
 from iai_core.repos.storage.storage_client import BinaryObjectType
 
-from job.entities import ProjectZipArchive
+from job.entities import ProjectZipArchive, ProjectZipArchiveWrapper
 from job.entities.exceptions import (
     CollectionAlreadyExistsError,
     CollectionNotFoundError,
     ManifestAlreadyExistsError,
     ManifestNotFoundError,
 )
+from job.entities.zip_archive import PublicKeyBytes, SignatureBytes
+from job.utils.file_utils import HashingWriter
 
 DUMMY_VERSION = "1.5"
 DUMMY_EXPORT_DATE = datetime(2020, 1, 1)
@@ -176,6 +180,19 @@ class TestZipArchive:
             with pytest.raises(CollectionAlreadyExistsError):
                 zip_archive.add_collection_with_documents(collection_name=new_coll_name, documents=new_docs)
 
+    def test_add_collection_from_stream(self, fxt_project_archive_file_path) -> None:
+        new_coll_name = "new_collection"
+        new_docs = [json.dumps({"hello": f"world_{i}"}) for i in range(3)]
+        stream = io.BytesIO("".join(f"{doc}\n" for doc in new_docs).encode())
+        with ProjectZipArchive(zip_file_path=fxt_project_archive_file_path) as zip_archive:
+            zip_archive.add_collection_from_stream(collection_name=new_coll_name, stream=stream)
+
+        with ProjectZipArchive(zip_file_path=fxt_project_archive_file_path) as zip_archive:
+            found_docs = list(zip_archive.get_documents_by_collection(collection_name=new_coll_name))
+            assert found_docs == new_docs
+            with pytest.raises(CollectionAlreadyExistsError):
+                zip_archive.add_collection_from_stream(collection_name=new_coll_name, stream=io.BytesIO(b""))
+
     def test_get_objects_by_type(self, fxt_project_archive_file_path) -> None:
         num_found_objects = 0
         with ProjectZipArchive(zip_file_path=fxt_project_archive_file_path, readonly=True) as zip_archive:
@@ -220,3 +237,68 @@ class TestZipArchive:
                         assert obj_fp.read() == b"video_data"
                     assert obj_remote_rel_path in remote_paths
             assert num_found_objs == len(video_names)
+
+    def test_add_object_from_stream(self, fxt_project_archive_file_path) -> None:
+        remote_video_path = "dataset_storages/123/video.mp4"
+        video_data = os.urandom(1024)
+
+        with ProjectZipArchive(zip_file_path=fxt_project_archive_file_path) as zip_archive:
+            zip_archive.add_object_from_stream(
+                object_type=BinaryObjectType.VIDEOS,
+                remote_object_path_from_project_root=remote_video_path,
+                stream=io.BytesIO(video_data),
+                size=len(video_data),
+            )
+
+        with ProjectZipArchive(zip_file_path=fxt_project_archive_file_path, readonly=True) as zip_archive:
+            num_found_objs = 0
+            for obj_local_path, obj_remote_rel_path in zip_archive.get_objects_by_type(BinaryObjectType.VIDEOS):
+                num_found_objs += 1
+                with open(obj_local_path, "rb") as obj_fp:
+                    assert obj_fp.read() == video_data
+                assert obj_remote_rel_path == remote_video_path
+        assert num_found_objs == 1
+
+
+@pytest.mark.ProjectIEMsComponent
+class TestProjectZipArchiveWrapper:
+    def test_write_to_stream(self) -> None:
+        # The wrapper and the nested project archive are written sequentially to non-seekable streams
+        output = io.BytesIO()
+        project_archive_hasher = hashes.Hash(hashes.SHA384())
+        with ProjectZipArchiveWrapper(
+            zip_file_path=HashingWriter(stream=output, hasher=hashes.Hash(hashes.SHA384()))
+        ) as wrapper_zip_archive:
+            with (
+                wrapper_zip_archive.open_project_archive() as project_archive_fp,
+                ProjectZipArchive(
+                    zip_file_path=HashingWriter(stream=project_archive_fp, hasher=project_archive_hasher)
+                ) as zip_archive,
+            ):
+                zip_archive.add_collection_with_documents(collection_name=DUMMY_COLLECTION_NAME_1, documents=["{}"])
+            wrapper_zip_archive.add_signature(signature=SignatureBytes(b"signature"))
+            wrapper_zip_archive.add_public_key(public_key=PublicKeyBytes(b"public_key"))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            wrapper_path = os.path.join(tmp_dir, "wrapper.zip")
+            with open(wrapper_path, "wb") as wrapper_file:
+                wrapper_file.write(output.getvalue())
+            with ProjectZipArchiveWrapper(zip_file_path=wrapper_path, readonly=True) as wrapper_zip_archive:
+                wrapper_zip_archive.validate_files_structure(
+                    files_whitelist=[
+                        ProjectZipArchiveWrapper.PROJECT_ARCHIVE,
+                        ProjectZipArchiveWrapper.ECDSA_P384_SIGNATURE,
+                        ProjectZipArchiveWrapper.PUBLIC_KEY,
+                    ]
+                )
+                assert wrapper_zip_archive.get_signature() == b"signature"
+                assert wrapper_zip_archive.get_public_key() == b"public_key"
+                project_archive_path = wrapper_zip_archive.extract_project_archive()
+
+            # The digest computed on the fly is the one of the extracted project archive
+            with open(project_archive_path, "rb") as project_archive_file:
+                expected_hasher = hashes.Hash(hashes.SHA384())
+                expected_hasher.update(project_archive_file.read())
+            assert project_archive_hasher.finalize() == expected_hasher.finalize()
+            with ProjectZipArchive(zip_file_path=project_archive_path, readonly=True) as zip_archive:
+                assert zip_archive.get_collection_names() == (DUMMY_COLLECTION_NAME_1,)
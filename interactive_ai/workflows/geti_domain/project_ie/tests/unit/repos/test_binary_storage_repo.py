@@ -104,13 +104,13 @@ class TestBinaryStorageRepo:
 
         assert set(object_types) == expected_object_types
 
-    def test_get_all_objects_by_type(
+    def test_list_and_open_objects_by_type(
         self,
         request: FixtureRequest,
         fxt_mongo_id,
     ):
         """
-        Test the get_all_objects_by_type method.
+        Test the list_objects_by_type and open_object methods.
 
         1. Arrange all variables such as IDs, paths and filenames in the manner that they would be on export
         2. Set environment variables for the repo to be instantiated
@@ -118,10 +118,9 @@ class TestBinaryStorageRepo:
          - The initialization of the minio client will be mocked
          - The bucket_exists method of minio will be mocked to always be true
          - The list_objects method returns a single mock object.
-         - The fget_object method is mocked in such a way that it creates a single file with the name of the object
-            that was requested.
-        4. Call the method
-        5. Assert that all the mocks were called
+         - The get_object method returns a mock response to stream the object from.
+        4. List the objects, then open the listed object
+        5. Assert that all the mocks were called, and that the response is closed once the object is consumed
         """
         # Arrange
         organization_id = ID(fxt_mongo_id(0))
@@ -142,53 +141,43 @@ class TestBinaryStorageRepo:
         )
         object_name = os.path.join(project_root, object_name_from_project_root)
 
-        temp_folder = "/tmp/dummy"
-        local_path = os.path.join(temp_folder, object_name_from_project_root)
-
         self.__set_env_variables(request=request)
 
         mock_object = MagicMock()
         mock_object.object_name = object_name
+        mock_object.size = 123
+        mock_response = MagicMock()
 
         with (
             patch("boto3.client", return_value=None),
-            patch("tempfile.mkdtemp"),
             patch.object(Minio, "list_objects", return_value=[mock_object]) as mock_list_objects,
             patch.object(Minio, "bucket_exists", return_value=True) as mock_bucket_exists,
-            patch.object(Minio, "fget_object", return_value=None) as mock_fget_object,
+            patch.object(Minio, "get_object", return_value=mock_response) as mock_get_object,
         ):
-            # Create the effect of creating a file when fget_object is called, as it would behave on S3 call.
-            mock_fget_object.side_effect = (
-                lambda bucket_name, file_path, object_name: TestBinaryStorageRepo.__create_temporary_file(
-                    request=request, filename=os.path.basename(object_name)
-                )
-            )
-
             # Act
             storage_repo = BinaryStorageRepo(
                 organization_id=organization_id,
                 workspace_id=workspace_id,
                 project_id=project_id,
             )
-            for (
-                local_path_iter,
-                object_name_iter,
-            ) in storage_repo.get_all_objects_by_type(object_type=BinaryObjectType.IMAGES, target_folder=temp_folder):
-                assert local_path_iter == local_path
-                assert object_name_iter == object_name_from_project_root
+            objects = storage_repo.list_objects_by_type(object_type=object_type)
+            with storage_repo.open_object(
+                object_type=object_type, object_name_from_project_root=object_name_from_project_root
+            ) as object_stream:
+                assert object_stream is mock_response
+                mock_response.close.assert_not_called()
 
             # Assert
+            assert objects == [(object_name_from_project_root, 123)]
             mock_list_objects.assert_called_once_with(
                 bucket_name=object_type.bucket_name(),
                 prefix=project_root + "/",
                 recursive=True,
             )
             mock_bucket_exists.assert_called_once_with(bucket_name=object_type.bucket_name())
-            mock_fget_object.assert_called_once_with(
-                bucket_name=object_type.bucket_name(),
-                file_path=local_path,
-                object_name=object_name,
-            )
+            mock_get_object.assert_called_once_with(bucket_name=object_type.bucket_name(), object_name=object_name)
+            mock_response.close.assert_called_once_with()
+            mock_response.release_conn.assert_called_once_with()
 
     def test_store_objects_by_type(
         self,
@@ -1,14 +1,14 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 import os
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from _pytest.fixtures import FixtureRequest
 from geti_types import ID
 from minio import Minio
 
-from job.repos.zip_storage_repo import ZipStorageRepo
+from job.repos.zip_storage_repo import UPLOAD_PART_SIZE, MultipartUploadStream, ZipStorageRepo
 
 
 @pytest.mark.ProjectIEMsComponent
@@ -48,3 +48,70 @@ class TestZipStorageRepo:
             "workspaces",
             str(workspace_id),
         )
+
+    def test_open_downloadable_archive(self, request, fxt_mongo_id) -> None:
+        # Arrange
+        organization_id = ID(fxt_mongo_id(0))
+        workspace_id = ID(fxt_mongo_id(1))
+        operation_id = ID(fxt_mongo_id(2))
+        self.__set_env_variables(request=request)
+        mock_boto_client = MagicMock()
+        mock_boto_client.create_multipart_upload.return_value = {"UploadId": "dummy_upload_id"}
+        mock_boto_client.upload_part.side_effect = lambda **kwargs: {"ETag": f"etag_{kwargs['PartNumber']}"}
+        data = os.urandom(2 * UPLOAD_PART_SIZE + 10)
+
+        # Act
+        with patch.object(Minio, "__init__", return_value=None), patch("boto3.client", return_value=mock_boto_client):
+            zip_storage_repo = ZipStorageRepo(organization_id=organization_id, workspace_id=workspace_id)
+        with zip_storage_repo.open_downloadable_archive(operation_id=operation_id) as upload_stream:
+            upload_stream.write(data[:10])
+            upload_stream.write(data[10:])
+
+        # Assert
+        key = os.path.join(zip_storage_repo.s3_workspace_root, "downloads", operation_id, "project.zip")
+        mock_boto_client.create_multipart_upload.assert_called_once_with(Bucket="temporaryfiles", Key=key)
+        uploaded_parts = sorted(
+            (call.kwargs["PartNumber"], call.kwargs["Body"]) for call in mock_boto_client.upload_part.call_args_list
+        )
+        assert [part_number for part_number, _ in uploaded_parts] == [1, 2, 3]
+        assert b"".join(body for _, body in uploaded_parts) == data
+        mock_boto_client.complete_multipart_upload.assert_called_once_with(
+            Bucket="temporaryfiles",
+            Key=key,
+            UploadId="dummy_upload_id",
+            MultipartUpload={"Parts": [{"ETag": f"etag_{i}", "PartNumber": i} for i in (1, 2, 3)]},
+        )
+        mock_boto_client.abort_multipart_upload.assert_not_called()
+
+    def test_open_downloadable_archive_error(self, request, fxt_mongo_id) -> None:
+        # Arrange
+        organization_id = ID(fxt_mongo_id(0))
+        workspace_id = ID(fxt_mongo_id(1))
+        operation_id = ID(fxt_mongo_id(2))
+        self.__set_env_variables(request=request)
+        mock_boto_client = MagicMock()
+        mock_boto_client.create_multipart_upload.return_value = {"UploadId": "dummy_upload_id"}
+
+        # Act
+        with patch.object(Minio, "__init__", return_value=None), patch("boto3.client", return_value=mock_boto_client):
+            zip_storage_repo = ZipStorageRepo(organization_id=organization_id, workspace_id=workspace_id)
+        with (
+            pytest.raises(ValueError),
+            zip_storage_repo.open_downloadable_archive(operation_id=operation_id) as upload_stream,
+        ):
+            upload_stream.write(b"data")
+            raise ValueError("dummy error")
+
+        # Assert
+        key = os.path.join(zip_storage_repo.s3_workspace_root, "downloads", operation_id, "project.zip")
+        mock_boto_client.complete_multipart_upload.assert_not_called()
+        mock_boto_client.abort_multipart_upload.assert_called_once_with(
+            Bucket="temporaryfiles", Key=key, UploadId="dummy_upload_id"
+        )
+
+
+@pytest.mark.ProjectIEMsComponent
+class TestMultipartUploadStream:
+    def test_part_size_too_small(self) -> None:
+        with pytest.raises(ValueError):
+            MultipartUploadStream(client=MagicMock(), bucket_name="dummy_bucket", key="dummy_key", part_size=1024)
@@ -1,21 +1,54 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+import copy
 import json
 import os
+import pickle
 import re
 import tempfile
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from unittest.mock import patch
 from zipfile import ZipFile
 
 import pytest
-from bson import ObjectId, UuidRepresentation
+from bson import Binary, ObjectId, UuidRepresentation
 from bson.json_util import JSONOptions, dumps, loads
 from iai_core.repos.mappers import MediaIdentifierToMongo
 
+from job.entities.exceptions import ImportDataRedactionFailedException
 from job.usecases import ExportDataRedactionUseCase, ImportDataRedactionUseCase
-from job.usecases.data_redaction_usecase import BaseDataRedactionUseCase, get_random_objectid_between_dates
+from job.usecases.data_redaction_usecase import (
+    PROJECT_ARCHIVE_JSON_OPTIONS,
+    BaseDataRedactionUseCase,
+    ExportDocumentRedactor,
+    get_random_objectid_between_dates,
+)
+
+
+@pytest.fixture
+def fxt_documents_to_redact(fxt_mongo_id):
+    """Documents with ObjectIds, binary filenames and user info at different levels of nesting"""
+    return [
+        {
+            "_id": ObjectId(fxt_mongo_id(10 + i)),
+            "name": f'dummy "name" {i}',
+            "binary_filename": f"{fxt_mongo_id(20 + i)}.jpg",
+            "upload_date": datetime(2024, 1, 1, tzinfo=timezone.utc),
+            "uploader_id": "dummy_user",
+            "author": uuid.uuid4(),
+            "user_uid": Binary(uuid.uuid4().bytes, subtype=4),
+            "editor_id": ObjectId(fxt_mongo_id(30 + i)),
+            "dataset_ids": [ObjectId(fxt_mongo_id(40 + i)), ObjectId(fxt_mongo_id(41 + i))],
+            "annotations": [
+                {"label_id": ObjectId(fxt_mongo_id(50 + i)), "creator_name": "dummy_user", "probability": 0.5},
+                {"binary_filename": "not_an_objectid.jpg", "user": None},
+            ],
+            "empty_id": "",
+        }
+        for i in range(5)
+    ]
 
 
 @pytest.mark.ProjectIEMsComponent
@@ -465,6 +498,38 @@ class TestExportDataRedactionUseCase:
         assert out_doc["_id"] == doc["_id"]
         assert out_doc["some_id"] == doc["some_id"]
 
+    @pytest.mark.parametrize("with_executor", [False, True])
+    def test_redact_mongodb_docs(self, fxt_documents_to_redact, with_executor) -> None:
+        # Arrange: the documents are also redacted with the regex-based methods, as reference
+        data_redaction_use_case = ExportDataRedactionUseCase()
+        expected_bson_docs = [
+            data_redaction_use_case.mask_user_info_in_mongodb_doc(
+                data_redaction_use_case.replace_objectid_based_binary_filename_in_mongodb_doc(
+                    data_redaction_use_case.replace_objectid_in_mongodb_doc(
+                        dumps(doc, json_options=PROJECT_ARCHIVE_JSON_OPTIONS)
+                    )
+                )
+            )
+            for doc in fxt_documents_to_redact
+        ]
+        expected_min_int = data_redaction_use_case.objectid_replacement_min_int
+        data_redaction_use_case.objectid_replacement_min_int = None
+
+        # Act
+        with (
+            ThreadPoolExecutor(max_workers=2) as executor,
+            patch("job.usecases.data_redaction_usecase.REDACTION_BATCH_SIZE", 2),
+        ):
+            data_redaction_use_case.executor = executor if with_executor else None
+            bson_docs = list(data_redaction_use_case.redact_mongodb_docs(copy.deepcopy(fxt_documents_to_redact)))
+
+        # Assert
+        assert bson_docs == expected_bson_docs
+        assert data_redaction_use_case.objectid_replacement_min_int == expected_min_int
+        # The redactor must be picklable to be run in a process pool
+        redactor = ExportDocumentRedactor(objectid_replacement_base_int=1, user_keys=frozenset({"user"}))
+        assert pickle.loads(pickle.dumps(redactor)) == redactor
+
     def test_remove_container_info_in_mongodb_doc(self) -> None:
         data_redaction_use_case = ExportDataRedactionUseCase()
         doc = {
@@ -821,6 +886,41 @@ class TestImportDataRedactionUseCase:
         assert "_id" in out_doc
         assert "some_id" in out_doc
 
+    def test_restore_mongodb_docs(self, fxt_documents_to_redact) -> None:
+        # Arrange: the documents are also restored with the regex-based methods, as reference
+        export_data_redaction_use_case = ExportDataRedactionUseCase()
+        bson_docs = list(export_data_redaction_use_case.redact_mongodb_docs(fxt_documents_to_redact))
+        data_redaction_use_case = ImportDataRedactionUseCase(
+            objectid_replacement_min_int=export_data_redaction_use_case.objectid_replacement_min_int,
+            user_replacement_new_id=uuid.uuid4(),
+        )
+        expected_docs = [
+            loads(
+                data_redaction_use_case.recreate_objectid_in_mongodb_doc(
+                    data_redaction_use_case.recreate_objectid_based_binary_filename_in_mongodb_doc(
+                        data_redaction_use_case.update_user_info_in_mongodb_doc(bson_doc)
+                    )
+                ),
+                json_options=PROJECT_ARCHIVE_JSON_OPTIONS,
+            )
+            for bson_doc in bson_docs
+        ]
+
+        # Act
+        with patch("job.usecases.data_redaction_usecase.REDACTION_BATCH_SIZE", 2):
+            docs = list(data_redaction_use_case.restore_mongodb_docs(bson_docs))
+
+        # Assert
+        assert docs == expected_docs
+        assert docs[0]["author"] == data_redaction_use_case.user_replacement_new_id
+        assert docs[0]["user_uid"] == "$user_id_uuid4"  # the '_uid' keys are not restored
+
+    def test_restore_mongodb_docs_missing_min_id(self) -> None:
+        data_redaction_use_case = ImportDataRedactionUseCase(user_replacement_new_id=uuid.uuid4())
+
+        with pytest.raises(ImportDataRedactionFailedException):
+            data_redaction_use_case.restore_mongodb_docs(['{"_id": {"$sid": "000000000000000000000001"}}'])
+
     def test_update_creation_time_in_mongodb_doc(self) -> None:
         data_redaction_use_case = ImportDataRedactionUseCase()
 
@@ -1,18 +1,20 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 import contextlib
+import io
 import os.path
-import shutil
 from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 from geti_types import CTX_SESSION_VAR, ID, Session
 from iai_core.repos.base import SessionBasedRepo
+from iai_core.repos.storage.storage_client import BinaryObjectType
 from iai_core.versioning import DataVersion
 
 from job.entities.zip_archive import ProjectZipArchive, ProjectZipArchiveWrapper
 from job.repos import BinaryStorageRepo, DocumentRepo, ZipStorageRepo
 from job.usecases import ExportDataRedactionUseCase, ProjectExportUseCase, SignatureUseCaseHelper
+from job.usecases.project_export_usecase import PREFETCH_MAX_OBJECT_SIZE, ExportProgressReporter
 
 
 def do_nothing(*args, **kwargs):
@@ -26,8 +28,10 @@ def identity_map(self, x):
 @pytest.mark.JobsComponent
 class TestProjectExportUseCase:
     def test_export_as_zip(self, request, fxt_ote_id) -> None:
-        def mocked_upload_downloadable_archive(self, operation_id: ID, zip_local_path: str):
-            shutil.move(zip_local_path, exported_zip_path)
+        @contextlib.contextmanager
+        def mocked_open_downloadable_archive(self, operation_id: ID):
+            with open(exported_zip_path, "wb") as upload_stream:
+                yield upload_stream
 
         def mocked_progress_callback(progress: float, message: str) -> None:
             mocked_progress(progress, message)
@@ -35,7 +39,8 @@ class TestProjectExportUseCase:
         dummy_signature_bytes = b"dummy_signature_bytes"
         mocked_signing_use_case = MagicMock()
         mocked_signing_use_case.public_key_bytes = b"dummy_public_key_data"
-        mocked_signing_use_case.generate_signature.return_value = dummy_signature_bytes
+        mocked_signing_use_case.sign_digest.return_value = dummy_signature_bytes
+        mocked_signing_use_case.create_hasher.return_value.finalize.return_value = b"dummy_digest"
         mocked_progress = MagicMock()
         project_id = fxt_ote_id(1)
         export_id = fxt_ote_id(1000)
@@ -50,16 +55,14 @@ class TestProjectExportUseCase:
         mocks = [
             patch.object(SessionBasedRepo, "generate_id", return_value=export_id),
             patch.object(BinaryStorageRepo, "__init__", new=do_nothing),
-            patch.object(
-                BinaryStorageRepo,
-                "get_all_objects_by_type",
-                return_value=[("local_path_1", "remote_path_1")],
-            ),
+            patch.object(BinaryStorageRepo, "get_object_types", return_value=[BinaryObjectType.IMAGES]),
+            patch.object(BinaryStorageRepo, "list_objects_by_type", return_value=[("remote_path_1", 4)]),
+            patch.object(BinaryStorageRepo, "open_object", side_effect=lambda **kwargs: io.BytesIO(b"data")),
             patch.object(ZipStorageRepo, "__init__", new=do_nothing),
             patch.object(
                 ZipStorageRepo,
-                "upload_downloadable_archive",
-                new=mocked_upload_downloadable_archive,
+                "open_downloadable_archive",
+                new=mocked_open_downloadable_archive,
             ),
             patch.object(
                 DocumentRepo,
@@ -82,23 +85,8 @@ class TestProjectExportUseCase:
                 "remove_lock_in_mongodb_doc",
                 new=identity_map,
             ),
-            patch.object(
-                ExportDataRedactionUseCase,
-                "replace_objectid_in_mongodb_doc",
-                new=identity_map,
-            ),
-            patch.object(
-                ExportDataRedactionUseCase,
-                "replace_objectid_based_binary_filename_in_mongodb_doc",
-                new=identity_map,
-            ),
             patch.object(ExportDataRedactionUseCase, "replace_objectid_in_url", new=identity_map),
             patch.object(ExportDataRedactionUseCase, "replace_objectid_in_file", new=identity_map),
-            patch.object(
-                ExportDataRedactionUseCase,
-                "mask_user_info_in_mongodb_doc",
-                new=identity_map,
-            ),
             patch.object(
                 ExportDataRedactionUseCase,
                 "objectid_replacement_min_id",
@@ -112,8 +100,8 @@ class TestProjectExportUseCase:
         ]
         with (
             contextlib.ExitStack() as stack,
-            patch.object(ProjectZipArchive, "add_collection_with_documents") as mock_add_collection,
-            patch.object(ProjectZipArchive, "add_objects_by_type") as mock_add_objects,
+            patch.object(ProjectZipArchive, "add_collection_from_stream") as mock_add_collection,
+            patch.object(ProjectZipArchive, "add_object_from_stream") as mock_add_object_from_stream,
             patch.object(ProjectZipArchive, "add_manifest") as mock_add_manifest,
             patch.object(ProjectZipArchiveWrapper, "add_signature") as mock_add_signature,
             patch.object(ProjectZipArchiveWrapper, "add_public_key") as mock_add_public_key,
@@ -128,12 +116,98 @@ class TestProjectExportUseCase:
             )
 
         request.addfinalizer(lambda: os.remove(exported_zip_path))
-        mock_add_collection.assert_called_once_with(collection_name="collection_1", documents=ANY)
-        mock_add_objects.assert_called()
+        mock_add_collection.assert_called_once_with(collection_name="collection_1", stream=ANY)
+        mock_add_object_from_stream.assert_called_once_with(
+            object_type=BinaryObjectType.IMAGES,
+            remote_object_path_from_project_root="remote_path_1",
+            stream=ANY,
+            size=4,
+        )
         mock_get_version.assert_called_once_with()
         mock_add_manifest.assert_called_once_with(version="1.0", min_id=ANY)
         mocked_progress.assert_called()
         assert os.path.exists(exported_zip_path)
         mock_metadata_update.assert_called_once_with(metadata={"download_url": download_url, "size": 0})
+        mocked_signing_use_case.sign_digest.assert_called_once_with(digest=b"dummy_digest")
         mock_add_signature.assert_called_once_with(signature=dummy_signature_bytes)
         mock_add_public_key.assert_called_once_with(public_key=mocked_signing_use_case.public_key_bytes)
+
+    def test_fetch_object(self, tmpdir) -> None:
+        # Arrange: the model file embeds ObjectIds, so it is redacted on disk; the small image is prefetched
+        # in memory and the large video is left to be streamed by the zip writer
+        objects_data = {
+            "dataset_storages/1/images/image.jpg": b"image_data",
+            "model_storages/2/models/3/openvino.xml": b"model_data",
+        }
+        mock_binary_storage_repo = MagicMock()
+        mock_binary_storage_repo.open_object.side_effect = lambda object_type, object_name_from_project_root: (
+            io.BytesIO(objects_data[object_name_from_project_root])
+        )
+        redacted_files_data: list[bytes] = []
+
+        def mocked_replace_objectid_in_file(self, file_path: str) -> str:
+            with open(file_path, "rb") as fp:
+                redacted_files_data.append(fp.read())
+            with open(file_path, "wb") as fp:
+                fp.write(b"redacted_model_data")
+            return file_path
+
+        # Act
+        with (
+            patch.object(ExportDataRedactionUseCase, "replace_objectid_in_url", new=identity_map),
+            patch.object(ExportDataRedactionUseCase, "replace_objectid_in_file", new=mocked_replace_objectid_in_file),
+        ):
+            fetched_objects = [
+                ProjectExportUseCase._fetch_object(
+                    object_type=object_type,
+                    remote_path=remote_path,
+                    size=size,
+                    binary_storage_repo=mock_binary_storage_repo,
+                    data_redaction_use_case=ExportDataRedactionUseCase(),
+                    tmp_folder=str(tmpdir),
+                )
+                for object_type, remote_path, size in (
+                    (BinaryObjectType.IMAGES, "dataset_storages/1/images/image.jpg", 10),
+                    (BinaryObjectType.VIDEOS, "dataset_storages/1/videos/video.mp4", PREFETCH_MAX_OBJECT_SIZE + 1),
+                    (BinaryObjectType.MODELS, "model_storages/2/models/3/openvino.xml", 10),
+                )
+            ]
+
+        # Assert
+        image, video, model = fetched_objects
+        assert (image.redacted_remote_path, image.size, image.data.read()) == (
+            "dataset_storages/1/images/image.jpg",
+            10,
+            b"image_data",
+        )
+        assert (video.size, video.data) == (PREFETCH_MAX_OBJECT_SIZE + 1, None)
+        assert redacted_files_data == [b"model_data"]
+        with model.data:
+            assert (model.size, model.data.read()) == (19, b"redacted_model_data")
+        assert not os.path.exists(os.path.join(str(tmpdir), "model_storages/2/models/3/openvino.xml"))
+        assert mock_binary_storage_repo.open_object.call_count == 2
+
+    def test_export_progress_reporter(self) -> None:
+        mocked_progress_callback = MagicMock()
+        progress_reporter = ExportProgressReporter(
+            progress_callback=mocked_progress_callback, num_collections=2, total_object_bytes=1000
+        )
+
+        progress_reporter.advance(message="Exporting project database")
+        progress_reporter.advance(num_collections=1, message="Exporting project database")
+        progress_reporter.advance(num_collections=1, message="Exporting project database")
+        progress_reporter.advance(num_object_bytes=500, message="Exporting project binary files")
+        progress_reporter.advance(num_object_bytes=0, message="Exporting project binary files")
+        progress_reporter.advance(num_object_bytes=500, message="Exporting project binary files")
+        progress_reporter.advance(message="Preparing zip archive")
+
+        # The collections account for a fixed share of the progress, the binary objects for the rest by bytes.
+        # The progress is only reported when it changes, and never reaches 100% before the export is complete.
+        assert [call.args for call in mocked_progress_callback.call_args_list] == [
+            (0.0, "Exporting project database"),
+            (5.0, "Exporting project database"),
+            (10.0, "Exporting project database"),
+            (55.0, "Exporting project binary files"),
+            (99.0, "Exporting project binary files"),
+            (99.0, "Preparing zip archive"),
+        ]
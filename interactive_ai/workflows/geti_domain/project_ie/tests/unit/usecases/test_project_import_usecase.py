@@ -85,11 +85,6 @@ class TestProjectImportUseCase:
         # Python has a limit of 20 statically nested blocks ('with' statements); to override this limitation,
         # some of the mocks are applied dynamically with "enter_context()"
         mocks = [
-            patch.object(ImportDataRedactionUseCase, "update_user_info_in_mongodb_doc", new=identity_map),
-            patch.object(
-                ImportDataRedactionUseCase, "recreate_objectid_based_binary_filename_in_mongodb_doc", new=identity_map
-            ),
-            patch.object(ImportDataRedactionUseCase, "recreate_objectid_in_mongodb_doc", new=identity_map),
             patch.object(ImportDataRedactionUseCase, "recreate_objectid_in_file", new=identity_map),
             patch.object(ImportDataRedactionUseCase, "recreate_objectid_in_url", new=identity_map),
             patch.object(ImportDataRedactionUseCase, "update_creation_time_in_mongodb_doc", new=identity_map),
@@ -117,6 +112,7 @@ class TestProjectImportUseCase:
             patch.object(ProjectImportUseCase, "_download_import_zip", new=mocked_download_import_zip),
             patch.object(ProjectImportUseCase, "_delete_import_zip") as mock_delete_import_zip,
             patch.object(ProjectImportUseCase, "_register_active_models") as mock_register_active_models,
+            patch.object(ProjectImportUseCase, "_build_annotation_statistics") as mock_build_annotation_statistics,
             patch.object(ProjectImportUseCase, "_verify_signature") as mock_signature_verification,
             patch("job.usecases.project_import_usecase.publish_metadata_update") as mock_metadata_update,
             patch.object(DataMigrationUseCase, "upgrade_project_to_current_version") as mock_date_upgrade,
@@ -131,6 +127,7 @@ class TestProjectImportUseCase:
         mock_insert_documents.assert_called_with(collection_name=DocumentRepo.PROJECTS_COLLECTION, documents=ANY)
         mock_store_objects.assert_called()
         mock_register_active_models.assert_called_once_with(project_identifier=project_identifier)
+        mock_build_annotation_statistics.assert_called_once_with(project_identifier=project_identifier)
         fxt_mock_progress_callback.assert_called()
         mock_metadata_update.assert_called_once_with(
             {
@@ -371,11 +368,6 @@ class TestProjectImportUseCase:
         # Python has a limit of 20 statically nested blocks ('with' statements); to override this limitation,
         # some of the mocks are applied dynamically with "enter_context()"
         mocks = [
-            patch.object(ImportDataRedactionUseCase, "update_user_info_in_mongodb_doc", new=identity_map),
-            patch.object(
-                ImportDataRedactionUseCase, "recreate_objectid_based_binary_filename_in_mongodb_doc", new=identity_map
-            ),
-            patch.object(ImportDataRedactionUseCase, "recreate_objectid_in_mongodb_doc", new=identity_map),
             patch.object(ImportDataRedactionUseCase, "recreate_objectid_in_file", new=identity_map),
             patch.object(ImportDataRedactionUseCase, "recreate_objectid_in_url", new=identity_map),
             patch.object(ImportDataRedactionUseCase, "update_creation_time_in_mongodb_doc", new=identity_map),
@@ -0,0 +1,75 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+import contextvars
+import random
+import threading
+import time
+
+import pytest
+
+from job.utils.concurrency_utils import ordered_parallel_map
+
+CTX_DUMMY_VAR: contextvars.ContextVar[str] = contextvars.ContextVar("dummy_var")
+
+
+@pytest.mark.JobsComponent
+class TestOrderedParallelMap:
+    def test_ordered_parallel_map(self) -> None:
+        def slow_square(x: int) -> tuple[int, str]:
+            time.sleep(random.uniform(0, 0.01))  # noqa: S311
+            return x * x, CTX_DUMMY_VAR.get()
+
+        CTX_DUMMY_VAR.set("dummy_value")
+
+        with ordered_parallel_map(slow_square, range(50), max_workers=4) as results_iter:
+            results = list(results_iter)
+
+        # The results are in the order of the items, and the workers see the context of the caller
+        assert results == [(x * x, "dummy_value") for x in range(50)]
+
+    def test_ordered_parallel_map_max_pending(self) -> None:
+        lock = threading.Lock()
+        started: list[int] = []
+
+        def record(x: int) -> int:
+            with lock:
+                started.append(x)
+            return x
+
+        with ordered_parallel_map(record, range(20), max_workers=2, max_pending=3) as results:
+            # The first items are processed before the results are consumed
+            time.sleep(0.05)
+            with lock:
+                assert sorted(started) == [0, 1, 2]
+            assert next(results) == 0
+            assert next(results) == 1
+            time.sleep(0.05)
+
+            # Only the items within the pending window have been processed
+            with lock:
+                assert sorted(started) == [0, 1, 2, 3]
+
+    def test_ordered_parallel_map_error(self) -> None:
+        def fail_on_three(x: int) -> int:
+            if x == 3:
+                raise ValueError("dummy error")
+            return x
+
+        results = []
+        with pytest.raises(ValueError), ordered_parallel_map(fail_on_three, range(10), max_workers=2) as results_iter:
+            for result in results_iter:
+                results.append(result)
+
+        assert results == [0, 1, 2]
+
+    def test_ordered_parallel_map_discard(self) -> None:
+        discarded: list[int] = []
+
+        with ordered_parallel_map(
+            lambda x: x, range(20), max_workers=2, max_pending=4, discard=discarded.append
+        ) as results:
+            assert next(results) == 0
+            time.sleep(0.05)
+
+        # The results that were computed but not consumed are discarded, the other items are not processed
+        assert sorted(discarded) == [1, 2, 3]
@@ -7,9 +7,10 @@ import os
 from collections.abc import Callable, Mapping
 from typing import Any
 
-import grpc
 from google.protobuf.json_format import MessageToDict
 
+from grpc_interfaces.channel_pool import get_channel, release_channel
+
 from .enums import UserStatus
 from .pb.organization_pb2 import FindOrganizationRequest, ListOrganizationsResponse, OrganizationData
 from .pb.organization_pb2_grpc import OrganizationStub
@@ -65,7 +66,8 @@ class AccountServiceClient:
         self.metadata_getter = metadata_getter
         self.host = os.environ.get("ACCOUNT_SERVICE_HOST", "impt-account-service")
         self.port = int(os.environ.get("ACCOUNT_SERVICE_PORT", 5001))  # noqa: PLW1508
-        self.channel = grpc.insecure_channel(
+        self._released = False
+        self.channel = get_channel(
             f"{self.host}:{self.port}",
             options=[
                 (
@@ -198,9 +200,12 @@ class AccountServiceClient:
         return UserByIDResponse.from_protobuf(get_by_id_response)
 
     def close(self) -> None:
-        """Close the GRPC channel."""
-        logger.info(f"Closing account service GRPC channel at address {self.host}:{self.port}.")
-        self.channel.close()
+        """Release the GRPC channel to the shared channel pool."""
+        if self._released:
+            return
+        self._released = True
+        logger.info(f"Releasing account service GRPC channel at address {self.host}:{self.port}.")
+        release_channel(self.channel)
 
     def __enter__(self) -> "AccountServiceClient":
         return self
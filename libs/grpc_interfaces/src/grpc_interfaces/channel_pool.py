@@ -0,0 +1,184 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+Process-wide pool of long-lived gRPC channels.
+
+Creating a channel requires resolving the target and establishing a new HTTP/2 connection, which is much more
+expensive than the RPC itself for the short-lived clients used by the services. The clients of this package acquire
+their channel from the pool instead, and release it when they are closed: the channel stays open and is reused by
+the next client with the same target and options.
+"""
+
+import logging
+import os
+import threading
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import grpc
+
+logger = logging.getLogger(__name__)
+
+GRPC_CHANNEL_POOL_ENABLED = os.environ.get("GRPC_CHANNEL_POOL_ENABLED", "true").lower() in {"true", "1", "yes"}
+# Maximum number of channels open at the same time towards the same target (with the same options)
+GRPC_CHANNEL_POOL_MAX_CHANNELS_PER_TARGET = int(os.environ.get("GRPC_CHANNEL_POOL_MAX_CHANNELS_PER_TARGET", "4"))
+# Number of concurrent clients sharing a channel before a new channel is opened (up to the per-target limit)
+GRPC_CHANNEL_POOL_MAX_CLIENTS_PER_CHANNEL = int(os.environ.get("GRPC_CHANNEL_POOL_MAX_CLIENTS_PER_CHANNEL", "16"))
+GRPC_KEEPALIVE_TIME_MS = int(os.environ.get("GRPC_KEEPALIVE_TIME_MS", "30000"))
+GRPC_KEEPALIVE_TIMEOUT_MS = int(os.environ.get("GRPC_KEEPALIVE_TIMEOUT_MS", "10000"))
+
+KEEPALIVE_OPTIONS: tuple[tuple[str, int], ...] = (
+    ("grpc.keepalive_time_ms", GRPC_KEEPALIVE_TIME_MS),
+    ("grpc.keepalive_timeout_ms", GRPC_KEEPALIVE_TIMEOUT_MS),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+)
+
+ChannelOptions = Sequence[tuple[str, str | int]]
+
+
+@dataclass(eq=False)
+class _PooledChannel:
+    channel: grpc.Channel
+    clients: int = 0
+    state: grpc.ChannelConnectivity = grpc.ChannelConnectivity.IDLE
+
+    @property
+    def healthy(self) -> bool:
+        return self.state not in (grpc.ChannelConnectivity.TRANSIENT_FAILURE, grpc.ChannelConnectivity.SHUTDOWN)
+
+    def on_state_change(self, state: grpc.ChannelConnectivity) -> None:
+        self.state = state
+
+
+class ChannelPool:
+    """
+    Pool of long-lived gRPC channels, indexed by target and channel options.
+
+    - Channels are opened with keepalive, so that broken connections are detected even when idle.
+    - The health of each channel is tracked through its connectivity state: a channel in TRANSIENT_FAILURE is
+      not handed out anymore and, once released by all its clients, it is closed and replaced by a new one
+      (which resolves the target again).
+    - Clients are spread over at most `max_channels_per_target` channels per target; a new channel is opened only
+      when all the healthy ones already serve `max_clients_per_channel` clients.
+
+    :param max_channels_per_target: maximum number of channels per target and options
+    :param max_clients_per_channel: number of clients sharing a channel before a new one is opened
+    """
+
+    def __init__(
+        self,
+        max_channels_per_target: int = GRPC_CHANNEL_POOL_MAX_CHANNELS_PER_TARGET,
+        max_clients_per_channel: int = GRPC_CHANNEL_POOL_MAX_CLIENTS_PER_CHANNEL,
+    ) -> None:
+        self.max_channels_per_target = max(1, max_channels_per_target)
+        self.max_clients_per_channel = max(1, max_clients_per_channel)
+        self._lock = threading.Lock()
+        self._channels: dict[tuple, list[_PooledChannel]] = {}
+        self._channel_by_id: dict[int, tuple[tuple, _PooledChannel]] = {}
+
+    @staticmethod
+    def _make_key(target: str, options: ChannelOptions) -> tuple:
+        return target, tuple(sorted((name, str(value)) for name, value in options))
+
+    def _open_channel(self, target: str, options: ChannelOptions) -> _PooledChannel:
+        logger.info("Opening pooled gRPC channel to `%s`", target)
+        option_names = {name for name, _ in options}
+        channel_options = list(options) + [option for option in KEEPALIVE_OPTIONS if option[0] not in option_names]
+        pooled_channel = _PooledChannel(channel=grpc.insecure_channel(target, options=channel_options))
+        pooled_channel.channel.subscribe(pooled_channel.on_state_change, try_to_connect=False)
+        return pooled_channel
+
+    def _close_channel(self, pooled_channel: _PooledChannel) -> None:
+        pooled_channel.channel.unsubscribe(pooled_channel.on_state_change)
+        pooled_channel.channel.close()
+
+    def acquire(self, target: str, options: ChannelOptions = ()) -> grpc.Channel:
+        """
+        Get a channel to the target from the pool, opening a new one if needed.
+        The channel must be given back with `release` instead of being closed.
+
+        :param target: address of the gRPC server
+        :param options: options of the channel
+        :return: gRPC channel
+        """
+        key = self._make_key(target, options)
+        with self._lock:
+            pooled_channels = self._channels.setdefault(key, [])
+            # Replace the unhealthy channels that are not used anymore
+            for pooled_channel in [pc for pc in pooled_channels if not pc.healthy and pc.clients == 0]:
+                logger.warning("Closing unhealthy gRPC channel to `%s` (state: %s)", target, pooled_channel.state)
+                pooled_channels.remove(pooled_channel)
+                self._channel_by_id.pop(id(pooled_channel.channel), None)
+                self._close_channel(pooled_channel)
+
+            healthy_channels = [pc for pc in pooled_channels if pc.healthy]
+            selected = min(healthy_channels, key=lambda pc: pc.clients, default=None)
+            can_open_channel = len(pooled_channels) < self.max_channels_per_target
+            if can_open_channel and (selected is None or selected.clients >= self.max_clients_per_channel):
+                selected = self._open_channel(target, options)
+                pooled_channels.append(selected)
+                self._channel_by_id[id(selected.channel)] = (key, selected)
+            elif selected is None:
+                # All the channels are unhealthy and in use: share the least loaded one, gRPC keeps reconnecting it
+                selected = min(pooled_channels, key=lambda pc: pc.clients)
+            selected.clients += 1
+            return selected.channel
+
+    def release(self, channel: grpc.Channel) -> None:
+        """
+        Give back a channel obtained with `acquire`. The channel is kept open for the next clients.
+
+        :param channel: channel to release
+        """
+        with self._lock:
+            entry = self._channel_by_id.get(id(channel))
+            if entry is None:
+                logger.warning("Attempted to release a gRPC channel that does not belong to the pool")
+                return
+            _, pooled_channel = entry
+            pooled_channel.clients = max(0, pooled_channel.clients - 1)
+
+    def close(self) -> None:
+        """Close all the channels of the pool"""
+        with self._lock:
+            for pooled_channels in self._channels.values():
+                for pooled_channel in pooled_channels:
+                    self._close_channel(pooled_channel)
+            self._channels.clear()
+            self._channel_by_id.clear()
+
+
+_channel_pool = ChannelPool()
+
+
+def get_channel(target: str, options: ChannelOptions = ()) -> grpc.Channel:
+    """
+    Get a channel to the target. If GRPC_CHANNEL_POOL_ENABLED is set (default), the channel is shared
+    through the process-wide pool; otherwise, a new channel is opened.
+
+    :param target: address of the gRPC server
+    :param options: options of the channel
+    :return: gRPC channel, to be given back with `release_channel`
+    """
+    if GRPC_CHANNEL_POOL_ENABLED:
+        return _channel_pool.acquire(target, options)
+    return grpc.insecure_channel(target, options=list(options))
+
+
+def release_channel(channel: grpc.Channel) -> None:
+    """
+    Give back a channel obtained with `get_channel`: it is released to the pool or, if the pool is disabled, closed.
+
+    :param channel: channel to release
+    """
+    if GRPC_CHANNEL_POOL_ENABLED:
+        _channel_pool.release(channel)
+    else:
+        channel.close()
+
+
+def close_channel_pool() -> None:
+    """Close all the channels of the process-wide pool, e.g. at shutdown"""
+    _channel_pool.close()
@@ -10,6 +10,8 @@ from enum import Enum
 
 import grpc
 
+from grpc_interfaces.channel_pool import get_channel, release_channel
+
 from .pb.credit_system_service_pb2 import (
     CancelLeaseRequest,
     EmptyRequest,
@@ -93,7 +95,8 @@ class CreditSystemClient:
 
     def __init__(self, metadata_getter: Callable[[], tuple[tuple[str, str], ...] | None]) -> None:
         self.metadata_getter = metadata_getter
-        self.grpc_channel = grpc.insecure_channel(
+        self._released = False
+        self.grpc_channel = get_channel(
             CREDITS_SERVICE,
             options=[
                 (
@@ -430,9 +433,12 @@ class CreditSystemClient:
             raise
 
     def close(self) -> None:
-        """Close the GRPC channel."""
-        logger.info("Closing GRPC channel at address `%s`.", CREDITS_SERVICE)
-        self.grpc_channel.close()
+        """Release the GRPC channel to the shared channel pool."""
+        if self._released:
+            return
+        self._released = True
+        logger.info("Releasing GRPC channel at address `%s`.", CREDITS_SERVICE)
+        release_channel(self.grpc_channel)
 
     def __enter__(self) -> "CreditSystemClient":
         return self
@@ -11,9 +11,11 @@ from typing import Any, TypeVar, cast
 
 from geti_telemetry_tools import ENABLE_TRACING, GrpcClientTelemetry, get_context_string
 from geti_types import ID
-from grpc import Channel, RpcError, insecure_channel  # type: ignore # grpc types not available in mypy
+from grpc import Channel, RpcError  # type: ignore # grpc types not available in mypy
 from readerwriterlock import rwlock
 
+from grpc_interfaces.channel_pool import get_channel, release_channel
+
 from .pb.job_service_pb2 import (
     CancelJobRequest,
     FindJobsRequest,
@@ -116,7 +118,8 @@ class GRPCJobsClient:
             raise ValueError("GRPC address not set, cannot setup a channel to given microservice")
         self.grpc_address = grpc_address
         logger.info("Initializing GRPCJobsClient on address `%s`.", self.grpc_address)
-        self.grpc_channel = insecure_channel(
+        self._released = False
+        self.grpc_channel = get_channel(
             self.grpc_address,
             options=[
                 ("grpc.service_config", self.grpc_channel_config),
@@ -320,10 +323,13 @@ class GRPCJobsClient:
 
     def close(self) -> None:
         """
-        Close the GRPC channel.
+        Release the GRPC channel to the shared channel pool.
         """
-        logger.info("Closing GRPC channel at address `%s`.", self.grpc_address)
-        self.grpc_channel.close()
+        if self._released:
+            return
+        self._released = True
+        logger.info("Releasing GRPC channel at address `%s`.", self.grpc_address)
+        release_channel(self.grpc_channel)
 
     def __repr__(self) -> str:
         return f"GRPCJobsClient(GRPC=True, {self.grpc_address})"
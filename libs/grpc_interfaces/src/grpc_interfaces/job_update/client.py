@@ -8,7 +8,9 @@ from collections.abc import Callable
 from typing import Any, TypeVar
 
 import grpc
-from grpc import Channel, insecure_channel  # type: ignore # grpc types not available in mypy
+from grpc import Channel  # type: ignore # grpc types not available in mypy
+
+from grpc_interfaces.channel_pool import get_channel, release_channel
 
 from .pb.job_update_service_pb2 import JobUpdateRequest, JobUpdateResponse
 from .pb.job_update_service_pb2_grpc import JobUpdateServiceStub
@@ -66,7 +68,8 @@ class JobUpdateClient:
             raise ValueError("Unable to get session from metadata")
         self.grpc_address = os.getenv("JOBS_SCHEDULER", "localhost:50051")
         logger.info("Initializing JobUpdateClient on address `%s`.", self.grpc_address)
-        self.grpc_channel = insecure_channel(
+        self._released = False
+        self.grpc_channel = get_channel(
             self.grpc_address,
             options=[
                 ("grpc.service_config", self.grpc_channel_config),
@@ -131,10 +134,13 @@ class JobUpdateClient:
 
     def close(self) -> None:
         """
-        Close the GRPC channel.
+        Release the GRPC channel to the shared channel pool.
         """
-        logger.info("Closing GRPC channel at address `%s`.", self.grpc_address)
-        self.grpc_channel.close()
+        if self._released:
+            return
+        self._released = True
+        logger.info("Releasing GRPC channel at address `%s`.", self.grpc_address)
+        release_channel(self.grpc_channel)
 
     def __repr__(self) -> str:
         return f"JobUpdateClient(GRPC=True, {self.grpc_address})"
@@ -10,6 +10,8 @@ from collections.abc import Callable, Iterable
 
 import grpc
 
+from grpc_interfaces.channel_pool import get_channel, release_channel
+
 from .pb.service_pb2 import (
     Chunk,
     DownloadGraphRequest,
@@ -56,7 +58,8 @@ class ModelRegistrationClient:
 
     def __init__(self, metadata_getter: Callable[[], tuple[tuple[str, str], ...] | None]) -> None:
         self.metadata_getter = metadata_getter
-        self.grpc_channel = grpc.insecure_channel(
+        self._released = False
+        self.grpc_channel = get_channel(
             MODEL_REGISTRATION_SERVICE,
             options=[
                 (
@@ -166,9 +169,12 @@ class ModelRegistrationClient:
             raise
 
     def close(self) -> None:
-        """Close the GRPC channel."""
-        logger.info("Closing GRPC channel at address `%s`.", MODEL_REGISTRATION_SERVICE)
-        self.grpc_channel.close()
+        """Release the GRPC channel to the shared channel pool."""
+        if self._released:
+            return
+        self._released = True
+        logger.info("Releasing GRPC channel at address `%s`.", MODEL_REGISTRATION_SERVICE)
+        release_channel(self.grpc_channel)
 
     def __enter__(self) -> "ModelRegistrationClient":
         return self
@@ -0,0 +1,81 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+Benchmark of the latency of a unary RPC with a new channel per call, as the clients used to do,
+versus with a channel from the pool, against a local echo server standing in for the real services:
+
+    PYTHONPATH=src python tests/benchmark/benchmark_channel_pool.py
+
+BENCHMARK_CALLS sets the number of calls measured for each kind of channel (default: 200).
+"""
+
+import logging
+import os
+import statistics
+import time
+from collections.abc import Callable
+from concurrent import futures
+
+import grpc
+from grpc_interfaces.channel_pool import ChannelPool
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_CALLS = int(os.environ.get("BENCHMARK_CALLS", "200"))
+ECHO_METHOD = "/benchmark.Echo/Ping"
+
+
+def _start_echo_server() -> tuple[grpc.Server, str]:
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    handler = grpc.method_handlers_generic_handler(
+        "benchmark.Echo", {"Ping": grpc.unary_unary_rpc_method_handler(lambda request, _context: request)}
+    )
+    server.add_generic_rpc_handlers((handler,))
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    return server, f"localhost:{port}"
+
+
+def _measure(call: Callable[[], None]) -> list[float]:
+    latencies = []
+    for _ in range(BENCHMARK_CALLS):
+        start = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    server, target = _start_echo_server()
+    pool = ChannelPool()
+
+    def call_with_new_channel() -> None:
+        with grpc.insecure_channel(target) as channel:
+            assert channel.unary_unary(ECHO_METHOD)(b"ping", wait_for_ready=True) == b"ping"
+
+    def call_with_pooled_channel() -> None:
+        channel = pool.acquire(target)
+        try:
+            assert channel.unary_unary(ECHO_METHOD)(b"ping", wait_for_ready=True) == b"ping"
+        finally:
+            pool.release(channel)
+
+    try:
+        per_call_latencies = _measure(call_with_new_channel)
+        pooled_latencies = _measure(call_with_pooled_channel)
+    finally:
+        pool.close()
+        server.stop(grace=None)
+
+    logger.info(
+        "Median RPC latency over %d calls: %.3f ms with a new channel per call, %.3f ms with a pooled channel",
+        BENCHMARK_CALLS,
+        statistics.median(per_call_latencies) * 1000,
+        statistics.median(pooled_latencies) * 1000,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -183,3 +183,14 @@ class TestModelRegistrationClient:
             mocked_download_graph.assert_called_once_with(expected_grpc_message, metadata=(("key", "value"),))
             with open(output_path) as output_file:
                 assert output_file.readline() == "test1test2"
+
+    def test_close_releases_channel_once(self) -> None:
+        # Act
+        with (
+            patch("grpc_interfaces.model_registration.client.release_channel") as mock_release_channel,
+            ModelRegistrationClient(metadata_getter=lambda: None) as client,
+        ):
+            client.close()
+
+        # Assert
+        mock_release_channel.assert_called_once_with(client.grpc_channel)
@@ -0,0 +1,69 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+from unittest.mock import MagicMock, patch
+
+import grpc
+import pytest
+from grpc_interfaces.channel_pool import KEEPALIVE_OPTIONS, ChannelPool
+
+
+@pytest.fixture
+def fxt_insecure_channel():
+    with patch.object(grpc, "insecure_channel", side_effect=lambda *args, **kwargs: MagicMock()) as mock:
+        yield mock
+
+
+class TestChannelPool:
+    def test_acquire_reuses_channel(self, fxt_insecure_channel) -> None:
+        # Arrange
+        pool = ChannelPool(max_channels_per_target=2, max_clients_per_channel=1)
+        options = [("grpc.max_send_message_length", 1024)]
+
+        # Act
+        channel_1 = pool.acquire("target:1", options)
+        pool.release(channel_1)
+        channel_2 = pool.acquire("target:1", options)
+        channel_3 = pool.acquire("target:1", options)
+        channel_4 = pool.acquire("target:1", options)  # per-target limit reached, the channels are shared
+        channel_other = pool.acquire("target:2", options)
+
+        # Assert
+        assert channel_2 is channel_1
+        assert channel_3 is not channel_1
+        assert channel_4 in (channel_1, channel_3)
+        assert channel_other not in (channel_1, channel_3)
+        assert fxt_insecure_channel.call_count == 3
+        channel_options = fxt_insecure_channel.call_args_list[0].kwargs["options"]
+        assert set(KEEPALIVE_OPTIONS).issubset(channel_options)
+        channel_1.close.assert_not_called()
+
+    def test_unhealthy_channel_replaced(self, fxt_insecure_channel) -> None:
+        # Arrange
+        pool = ChannelPool(max_channels_per_target=1)
+        channel_1 = pool.acquire("target:1")
+        on_state_change = channel_1.subscribe.call_args.args[0]
+
+        # Act
+        on_state_change(grpc.ChannelConnectivity.TRANSIENT_FAILURE)
+        channel_2 = pool.acquire("target:1")  # still in use by the first client: shared
+        pool.release(channel_1)
+        pool.release(channel_2)
+        channel_3 = pool.acquire("target:1")
+
+        # Assert
+        assert channel_2 is channel_1
+        assert channel_3 is not channel_1
+        channel_1.close.assert_called_once()
+
+    def test_close(self, fxt_insecure_channel) -> None:
+        # Arrange
+        pool = ChannelPool()
+        channel = pool.acquire("target:1")
+
+        # Act
+        pool.close()
+
+        # Assert
+        channel.close.assert_called_once()
+        assert pool.acquire("target:1") is not channel
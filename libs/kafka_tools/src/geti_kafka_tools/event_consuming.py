@@ -14,8 +14,12 @@ import confluent_kafka
 from confluent_kafka import Message
 
 from .exceptions import TopicAlreadySubscribedException, TopicNotSubscribedException
+from .partition_dispatcher import PartitionDispatcher
 from .utils import (
     kafka_bootstrap_endpoints,
+    kafka_consumer_batch_size,
+    kafka_consumer_num_workers,
+    kafka_consumer_revoke_timeout,
     kafka_password,
     kafka_sasl_mechanism,
     kafka_security_enabled,
@@ -64,25 +68,55 @@ def json_deserializer(value: str | bytes | None) -> dict | None:
 
 
 class KafkaEventConsumer:
-    def __init__(self, group_id: str, deserializer: Deserializer = json_deserializer) -> None:
+    def __init__(
+        self,
+        group_id: str,
+        deserializer: Deserializer = json_deserializer,
+        batch_size: int | None = None,
+        num_workers: int | None = None,
+        broadcast: bool = False,
+    ) -> None:
         """
         KafkaEventConsumer is responsible to receive Kafka events on the subscribed
         topics and consume them, calling the appropriate callbacks.
 
+        By default, the events are consumed one at a time by the consumer thread. In batch mode (batch_size > 1),
+        up to batch_size events are consumed at once and handed over to a pool of num_workers threads: the events
+        of the same partition are still handled in order, and the offsets are committed once per batch.
+
+        In broadcast mode, the consumer does not join its group: all the partitions of the subscribed topics are
+        assigned to it and read from their end, and no offset is committed. Every instance then receives all the
+        new events, which is useful to keep some in-memory state of each replica in sync, at the cost of missing
+        the events published while the instance is down.
+
         :param group_id: unique id for the Consumer. Recommended to name it along
         the lines of "{microservice_name}_consumer".
         :param deserializer: function to deserialize Kafka event value, applies by default to all
         subscribed topics if no deserializer defined, by default json_string_deserializer
+        :param batch_size: maximum number of events consumed at once, by default KAFKA_CONSUMER_BATCH_SIZE (1)
+        :param num_workers: number of threads handling the events in batch mode,
+        by default KAFKA_CONSUMER_NUM_WORKERS (4)
+        :param broadcast: whether every instance of the consumer receives all the events, instead of sharing them
+            with the other consumers of the group
         """
         self.group_id = group_id
         self._deserializer = deserializer
+        self._broadcast = broadcast
 
         self._topic_to_callback: dict[str, CallbackT] = {}
         self._topic_to_deserializer: dict[str, Deserializer] = {}
         self._should_stop = False
 
+        self._batch_size = batch_size if batch_size is not None else kafka_consumer_batch_size()
+        self._dispatcher: PartitionDispatcher | None = None
+        if self._batch_size > 1:
+            self._dispatcher = PartitionDispatcher(
+                handler=self._consume_message,
+                num_workers=num_workers if num_workers is not None else kafka_consumer_num_workers(),
+            )
+
         logger.info(f"Creating Kafka consumer ({group_id}).")
-        self._consumer = self._create_consumer(group_id=group_id)
+        self._consumer = self._create_consumer(group_id=group_id, broadcast=broadcast)
 
         self._topic_prefix = kafka_topic_prefix()
 
@@ -92,11 +126,12 @@ class KafkaEventConsumer:
         self._start_consume_thread()
 
     @staticmethod
-    def _create_consumer(group_id: str) -> confluent_kafka.Consumer:
+    def _create_consumer(group_id: str, broadcast: bool = False) -> confluent_kafka.Consumer:
         """
         Create a kafka consumer.
 
         :param group_id: Group id for the Consumer
+        :param broadcast: whether the consumer is used in broadcast mode
         :return: Consumer if succeeded
         """
         config = {
@@ -115,6 +150,9 @@ class KafkaEventConsumer:
                     "sasl.password": kafka_password(),
                 }
             )
+        if broadcast:
+            # The partitions are assigned from the topic metadata, which must exist before the first event is produced
+            config["allow.auto.create.topics"] = True
 
         return confluent_kafka.Consumer(config)
 
@@ -140,7 +178,8 @@ class KafkaEventConsumer:
         Subscribe to topics and install callbacks that will be executed when
         a message is received on that topics.
 
-        Note: a callback is blocking and prevents other events to be processed.
+        Note: a callback is blocking and prevents other events to be processed; in batch mode, it only blocks
+        the other events of the same partition, but it may be called concurrently for different partitions.
 
         :param topics_subscriptions: list of topics to subscribe to with callbacks and custom deserializers
         :param on_assign: a callback function to be invoked when consumer is successfully subscribed to the topics
@@ -167,7 +206,15 @@ class KafkaEventConsumer:
             self.group_id,
             topics_names,
         )
-        self._consumer.subscribe(topics=topics_names, on_assign=lambda consumer, partitions: on_assign())  # noqa: ARG005
+        if self._broadcast:
+            self._assign_all_partitions(topics_names)
+            on_assign()
+            return
+        self._consumer.subscribe(
+            topics=topics_names,
+            on_assign=lambda consumer, partitions: on_assign(),  # noqa: ARG005
+            **self._rebalance_callbacks(),
+        )
 
     def unsubscribe(
         self,
@@ -196,8 +243,75 @@ class KafkaEventConsumer:
         self._topic_to_callback.pop(prefixed_topic, None)
         self._topic_to_deserializer.pop(prefixed_topic, None)
 
+        if self._broadcast:
+            self._consumer.unassign()
+            self._assign_all_partitions(list(self._topic_to_callback.keys()))
+            if on_assign is not None:
+                on_assign()
+            return
         self._consumer.unsubscribe()
-        self._consumer.subscribe(topics=list(self._topic_to_callback.keys()), on_assign=on_assign)
+        self._consumer.subscribe(
+            topics=list(self._topic_to_callback.keys()), on_assign=on_assign, **self._rebalance_callbacks()
+        )
+
+    def _assign_all_partitions(self, topics: list[str]) -> None:
+        """
+        Assigns all the partitions of the given topics to the consumer in broadcast mode, starting from their end.
+
+        :param topics: names of the topics, including the prefix
+        """
+        partitions = []
+        for topic in topics:
+            topic_metadata = self._consumer.list_topics(topic=topic, timeout=10).topics.get(topic)
+            if topic_metadata is None or topic_metadata.error is not None:
+                logger.warning(
+                    "Cannot assign the partitions of Kafka topic `%s` (group_id `%s`): %s",
+                    topic,
+                    self.group_id,
+                    topic_metadata.error if topic_metadata is not None else "topic not found",
+                )
+                continue
+            partitions += [
+                confluent_kafka.TopicPartition(topic, partition, confluent_kafka.OFFSET_END)
+                for partition in topic_metadata.partitions
+            ]
+        logger.info("Kafka event consumer with group ID `%s` assigned to %d partitions", self.group_id, len(partitions))
+        self._consumer.assign(partitions)
+
+    def _rebalance_callbacks(self) -> dict[str, Callable]:
+        """
+        Returns the extra callbacks to register on subscription: in batch mode, the offsets of the events being
+        handled must be committed before the partitions are revoked, to avoid that they are processed twice.
+        """
+        if self._dispatcher is None:
+            return {}
+        return {"on_revoke": self._on_revoke}
+
+    def _on_revoke(self, consumer: confluent_kafka.Consumer, partitions: list) -> None:  # noqa: ARG002
+        """
+        Waits for the consumed events to be handled and commits their offsets, before the partitions are revoked.
+        The wait is bounded, so that a slow handler does not block the rebalance of the group. The revoked partitions
+        are then dropped from the dispatcher, including the offsets that could not be committed and the events not
+        handled yet: the partitions may be assigned to another consumer of the group, which must not see its progress
+        overwritten by older offsets.
+        """
+        logger.info("Kafka partitions revoked (group_id `%s`), committing the handled events", self.group_id)
+        if self._dispatcher is None:
+            return
+        try:
+            timeout = kafka_consumer_revoke_timeout()
+            if not self._dispatcher.wait_until_idle(timeout=timeout):
+                logger.warning(
+                    "Kafka events are still being handled after %s seconds on revoke (group_id `%s`), "
+                    "committing the offsets of the handled ones only",
+                    timeout,
+                    self.group_id,
+                )
+            self._commit_handled_offsets()
+        except Exception:
+            logger.exception("Failed to commit the handled events on revoke (group_id `%s`)", self.group_id)
+        finally:
+            self._dispatcher.revoke_partitions([(partition.topic, partition.partition) for partition in partitions])
 
     def _consume(self) -> None:
         """
@@ -208,7 +322,17 @@ class KafkaEventConsumer:
         while True:
             if self._should_stop:
                 break
-            self._poll_and_consume_message()
+            if self._dispatcher is None:
+                self._poll_and_consume_message()
+            else:
+                self._consume_and_dispatch_batch()
+
+        if self._dispatcher is not None:
+            self._dispatcher.shutdown()
+            try:
+                self._commit_handled_offsets()
+            except Exception:
+                logger.exception("Failed to commit the handled events on stop (group_id `%s`)", self.group_id)
 
     def _poll_and_consume_message(self) -> None:
         """
@@ -228,11 +352,55 @@ class KafkaEventConsumer:
                 return
 
             self._consume_message(message)
-            self._consumer.commit()
+            if not self._broadcast:
+                self._consumer.commit()
 
         except Exception:
             logger.exception("Failed to consume an event (group_id `%s`)", self.group_id)
 
+    def _consume_and_dispatch_batch(self) -> None:
+        """
+        Consumes a batch of messages and dispatches them to the worker threads, then commits the offsets
+        of the messages handled so far. A new batch is consumed only when the workers are done with
+        the previous one, so that at most two batches of events are in memory.
+        """
+        if self._dispatcher is None:
+            return
+        try:
+            if self._dispatcher.wait_until_pending_below(self._batch_size, timeout=1.0):
+                messages: list[Message] = self._consumer.consume(num_messages=self._batch_size, timeout=1.0)
+                for message in messages:
+                    if message.error():
+                        logger.warning(f"Error occurred consuming a message {message.error()}")
+                        continue
+                    self._dispatcher.dispatch(message)
+
+            self._commit_handled_offsets()
+
+        except Exception:
+            logger.exception("Failed to consume a batch of events (group_id `%s`)", self.group_id)
+
+    def _commit_handled_offsets(self) -> None:
+        """
+        Commits, for each partition, the offset following the last event handled in batch mode.
+        """
+        if self._dispatcher is None:
+            return
+        offsets = self._dispatcher.pop_offsets_to_commit()
+        if not offsets or self._broadcast:
+            return
+        try:
+            self._consumer.commit(
+                offsets=[
+                    confluent_kafka.TopicPartition(topic, partition, offset)
+                    for (topic, partition), offset in offsets.items()
+                ],
+                asynchronous=False,
+            )
+        except Exception:
+            self._dispatcher.restore_offsets_to_commit(offsets)
+            raise
+
     def _deserialize_message_value(self, topic: str, value: str | bytes | None) -> Any | None:
         """
         Deserializes event value.
@@ -309,11 +477,22 @@ class BaseKafkaHandler(metaclass=ABCMeta):
     Base class to handle incoming Kafka events for microservices.
 
     :param group_id: The group id of the Kafka consumer
+    :param batch_size: maximum number of events consumed at once, see KafkaEventConsumer
+    :param num_workers: number of threads handling the events in batch mode, see KafkaEventConsumer
+    :param broadcast: whether every instance of the handler receives all the events, see KafkaEventConsumer
     """
 
-    def __init__(self, group_id: str) -> None:
+    def __init__(
+        self,
+        group_id: str,
+        batch_size: int | None = None,
+        num_workers: int | None = None,
+        broadcast: bool = False,
+    ) -> None:
         self.group_id = group_id
-        self.event_consumer = KafkaEventConsumer(group_id=group_id)
+        self.event_consumer = KafkaEventConsumer(
+            group_id=group_id, batch_size=batch_size, num_workers=num_workers, broadcast=broadcast
+        )
         self.subscribed = False
         self.__setup_events()
 
@@ -0,0 +1,155 @@
+"""This module defines the dispatcher handling Kafka events concurrently, in order within each partition"""
+
+import logging
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+
+from confluent_kafka import Message
+
+logger = logging.getLogger(__name__)
+
+# Topic and partition number
+PartitionKey = tuple[str, int]
+
+
+class PartitionDispatcher:
+    """
+    Handles Kafka events with a pool of worker threads. The events of the same partition (hence, with the same key)
+    are handled one at a time in the order of their offsets, while the events of different partitions are handled
+    concurrently.
+
+    The dispatcher keeps track of the offset to commit for each partition, which is the one following the highest
+    offset such that all the events of the partition up to it have been handled. A handler raising an exception
+    counts as handled: the error is logged and the event is not retried, as when consuming one event at a time.
+
+    :param handler: function handling an event
+    :param num_workers: number of worker threads
+    """
+
+    def __init__(self, handler: Callable[[Message], None], num_workers: int) -> None:
+        self._handler = handler
+        self._executor = ThreadPoolExecutor(max_workers=max(1, num_workers), thread_name_prefix="Kafka handler")
+        self._condition = threading.Condition()
+        self._queues: dict[PartitionKey, deque[Message]] = {}
+        self._offsets_to_commit: dict[PartitionKey, int] = {}
+        # Revoked partitions with an event still being handled, whose offset must not be committed
+        self._revoked: set[PartitionKey] = set()
+        self._num_pending = 0
+
+    @property
+    def num_pending(self) -> int:
+        """Number of dispatched events that have not been handled yet"""
+        with self._condition:
+            return self._num_pending
+
+    def dispatch(self, message: Message) -> None:
+        """
+        Schedule the handling of an event, after the events of the same partition dispatched before it.
+
+        :param message: Kafka event
+        """
+        partition_key = (message.topic(), message.partition())
+        with self._condition:
+            self._num_pending += 1
+            self._revoked.discard(partition_key)
+            if partition_key in self._queues:
+                # A worker is already handling this partition, it will pick up the event
+                self._queues[partition_key].append(message)
+                return
+            self._queues[partition_key] = deque([message])
+        self._executor.submit(self._handle_partition, partition_key)
+
+    def _handle_partition(self, partition_key: PartitionKey) -> None:
+        """Handle the queued events of a partition in order, until there are none left"""
+        while True:
+            with self._condition:
+                queue = self._queues[partition_key]
+                if not queue:
+                    del self._queues[partition_key]
+                    self._revoked.discard(partition_key)
+                    return
+                message = queue[0]
+            try:
+                self._handler(message)
+            except Exception:
+                logger.exception(
+                    "Failed to handle Kafka event (topic: `%s`, partition: `%s`, offset: `%s`)",
+                    message.topic(),
+                    message.partition(),
+                    message.offset(),
+                )
+            with self._condition:
+                queue.popleft()
+                if partition_key not in self._revoked:
+                    self._offsets_to_commit[partition_key] = message.offset() + 1
+                self._num_pending -= 1
+                self._condition.notify_all()
+
+    def wait_until_pending_below(self, max_pending: int, timeout: float | None = None) -> bool:
+        """
+        Wait until fewer than `max_pending` dispatched events are still to be handled.
+
+        :param max_pending: threshold on the number of pending events
+        :param timeout: maximum time to wait, in seconds
+        :return: True if the condition is met, False if the timeout expired
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._num_pending < max_pending, timeout=timeout)
+
+    def wait_until_idle(self, timeout: float | None = None) -> bool:
+        """
+        Wait until all the dispatched events have been handled.
+
+        :param timeout: maximum time to wait, in seconds
+        :return: True if all the events have been handled, False if the timeout expired
+        """
+        return self.wait_until_pending_below(1, timeout=timeout)
+
+    def pop_offsets_to_commit(self) -> dict[PartitionKey, int]:
+        """
+        Get the offsets to commit for the partitions with events handled since the previous call.
+
+        :return: dict mapping the partition to the offset to commit
+        """
+        with self._condition:
+            offsets, self._offsets_to_commit = self._offsets_to_commit, {}
+            return offsets
+
+    def restore_offsets_to_commit(self, offsets: dict[PartitionKey, int]) -> None:
+        """
+        Give back offsets obtained with `pop_offsets_to_commit` that could not be committed,
+        unless newer offsets are available for the same partitions.
+
+        :param offsets: dict mapping the partition to the offset to commit
+        """
+        with self._condition:
+            self._offsets_to_commit = offsets | self._offsets_to_commit
+
+    def revoke_partitions(self, partitions: Iterable[PartitionKey]) -> None:
+        """
+        Forget partitions revoked from the consumer, which may now be consumed by another consumer of the group:
+        their offsets to commit and their events not handled yet are dropped, and the offset of the event being
+        handled, if any, will not be committed.
+
+        :param partitions: revoked partitions
+        """
+        with self._condition:
+            for partition_key in partitions:
+                self._offsets_to_commit.pop(partition_key, None)
+                queue = self._queues.get(partition_key)
+                if not queue:
+                    continue
+                # The first event of the queue is being handled, the next ones are dropped
+                num_dropped = len(queue) - 1
+                for _ in range(num_dropped):
+                    queue.pop()
+                self._num_pending -= num_dropped
+                self._revoked.add(partition_key)
+            self._condition.notify_all()
+
+    def shutdown(self) -> None:
+        """Wait for the dispatched events to be handled and stop the worker threads"""
+        self.wait_until_idle()
+        self._executor.shutdown(wait=True)
@@ -57,3 +57,28 @@ def kafka_topic_prefix() -> str:
     """
     default_kafka_topic_prefix = ""
     return os.environ.get("KAFKA_TOPIC_PREFIX", default_kafka_topic_prefix)
+
+
+def kafka_consumer_batch_size() -> int:
+    """
+    Returns the maximum number of Kafka events consumed at once; the default (1) disables the batch consumption
+    """
+    default_kafka_consumer_batch_size = "1"
+    return int(os.environ.get("KAFKA_CONSUMER_BATCH_SIZE", default_kafka_consumer_batch_size))
+
+
+def kafka_consumer_num_workers() -> int:
+    """
+    Returns the number of threads handling the Kafka events consumed in batch mode
+    """
+    default_kafka_consumer_num_workers = "4"
+    return int(os.environ.get("KAFKA_CONSUMER_NUM_WORKERS", default_kafka_consumer_num_workers))
+
+
+def kafka_consumer_revoke_timeout() -> float:
+    """
+    Returns the maximum time, in seconds, to wait for the Kafka events consumed in batch mode to be handled before
+    their partitions are revoked
+    """
+    default_kafka_consumer_revoke_timeout = "30"
+    return float(os.environ.get("KAFKA_CONSUMER_REVOKE_TIMEOUT", default_kafka_consumer_revoke_timeout))
@@ -15,6 +15,7 @@ from geti_kafka_tools import (
     TopicSubscription,
 )
 from geti_kafka_tools.event_consuming import json_deserializer
+from geti_kafka_tools.partition_dispatcher import PartitionDispatcher
 
 
 class TestJsonStringDeserializer:
@@ -434,6 +435,60 @@ class TestKafkaEventConsumer:
         mock_consume_message.assert_called_once_with(message)
         kafka_event_consumer._consumer.commit.assert_called_once_with()
 
+    @patch.object(KafkaEventConsumer, "_start_consume_thread")
+    def test_kafka_event_consumer_subscribe_broadcast(self, mock_start_consume_thread, fxt_consumer) -> None:
+        # Arrange
+        kafka_event_consumer = KafkaEventConsumer("integration-test", broadcast=True)
+        callback = MagicMock()
+        on_assign = MagicMock()
+        cluster_metadata = MagicMock()
+        cluster_metadata.topics = {
+            "topic1": MagicMock(error=None, partitions={0: MagicMock(), 1: MagicMock()}),
+        }
+        kafka_event_consumer._consumer.list_topics.return_value = cluster_metadata
+
+        # Act
+        kafka_event_consumer.subscribe(
+            topics_subscriptions=[
+                TopicSubscription(topic="topic1", callback=callback),
+                TopicSubscription(topic="topic2", callback=callback),
+            ],
+            on_assign=on_assign,
+        )
+
+        # Assert: all the partitions of the existing topics are assigned from their end, without joining the group
+        mock_start_consume_thread.assert_called_once()
+        assert fxt_consumer.call_args.args[0]["allow.auto.create.topics"]
+        kafka_event_consumer._consumer.subscribe.assert_not_called()
+        assigned_partitions = kafka_event_consumer._consumer.assign.call_args.args[0]
+        assert [(tp.topic, tp.partition, tp.offset) for tp in assigned_partitions] == [
+            ("topic1", 0, confluent_kafka.OFFSET_END),
+            ("topic1", 1, confluent_kafka.OFFSET_END),
+        ]
+        on_assign.assert_called_once_with()
+
+    @patch.object(KafkaEventConsumer, "_start_consume_thread")
+    def test_kafka_event_consumer_poll_and_consume_message_broadcast(
+        self, mock_start_consume_thread, fxt_consumer
+    ) -> None:
+        # Arrange
+        kafka_event_consumer = KafkaEventConsumer("integration-test", broadcast=True)
+        kafka_event_consumer._consumer_thread = MagicMock()
+
+        message = MagicMock(spec=Message)
+        message.error.return_value = False
+        kafka_event_consumer._consumer.poll.return_value = message
+
+        # Act
+        with patch.object(kafka_event_consumer, "_consume_message") as mock_consume_message:
+            kafka_event_consumer._poll_and_consume_message()
+
+        # Assert
+        fxt_consumer.assert_called_once()
+        mock_start_consume_thread.assert_called_once()
+        mock_consume_message.assert_called_once_with(message)
+        kafka_event_consumer._consumer.commit.assert_not_called()
+
     @patch.object(KafkaEventConsumer, "_start_consume_thread")
     def test_kafka_event_consumer_stop(self, mock_start_consume_thread, fxt_consumer) -> None:
         # Arrange
@@ -449,3 +504,141 @@ class TestKafkaEventConsumer:
         assert kafka_event_consumer._should_stop
         kafka_event_consumer._consumer_thread.join.assert_called_once_with()
         kafka_event_consumer._consumer.close.assert_called_once_with()
+
+    @pytest.mark.usefixtures("fxt_consumer")
+    @patch.object(KafkaEventConsumer, "_start_consume_thread")
+    def test_kafka_event_consumer_subscribe_batch_mode(self, mock_start_consume_thread) -> None:
+        # Arrange
+        kafka_event_consumer = KafkaEventConsumer("integration-test", batch_size=10, num_workers=2)
+
+        # Act
+        kafka_event_consumer.subscribe(
+            topics_subscriptions=[TopicSubscription(topic="topic1", callback=MagicMock())],
+            on_assign=MagicMock(),
+        )
+
+        # Assert
+        mock_start_consume_thread.assert_called_once()
+        kafka_event_consumer._consumer.subscribe.assert_called_once_with(
+            topics=["topic1"], on_assign=ANY, on_revoke=kafka_event_consumer._on_revoke
+        )
+
+    @pytest.mark.usefixtures("fxt_consumer")
+    @patch.object(KafkaEventConsumer, "_start_consume_thread")
+    def test_kafka_event_consumer_consume_and_dispatch_batch(self, mock_start_consume_thread) -> None:
+        # Arrange
+        kafka_event_consumer = KafkaEventConsumer("integration-test", batch_size=3, num_workers=2)
+        kafka_event_consumer._consumer_thread = MagicMock()
+        dispatcher = MagicMock(spec=PartitionDispatcher)
+        dispatcher.wait_until_pending_below.return_value = True
+        dispatcher.pop_offsets_to_commit.return_value = {("test_topic", 0): 2, ("test_topic", 1): 8}
+        kafka_event_consumer._dispatcher = dispatcher
+
+        messages = [MagicMock(spec=Message) for _ in range(3)]
+        for message, error in zip(messages, (False, True, False)):
+            message.error.return_value = error
+        kafka_event_consumer._consumer.consume.return_value = messages
+
+        # Act
+        kafka_event_consumer._consume_and_dispatch_batch()
+
+        # Assert
+        mock_start_consume_thread.assert_called_once()
+        dispatcher.wait_until_pending_below.assert_called_once_with(3, timeout=1.0)
+        kafka_event_consumer._consumer.consume.assert_called_once_with(num_messages=3, timeout=1.0)
+        assert [call.args[0] for call in dispatcher.dispatch.call_args_list] == [messages[0], messages[2]]
+        kafka_event_consumer._consumer.commit.assert_called_once_with(
+            offsets=[
+                confluent_kafka.TopicPartition("test_topic", 0, 2),
+                confluent_kafka.TopicPartition("test_topic", 1, 8),
+            ],
+            asynchronous=False,
+        )
+
+    @pytest.mark.usefixtures("fxt_consumer")
+    @patch.object(KafkaEventConsumer, "_start_consume_thread")
+    def test_kafka_event_consumer_consume_and_dispatch_batch_backpressure(self, mock_start_consume_thread) -> None:
+        # Arrange
+        kafka_event_consumer = KafkaEventConsumer("integration-test", batch_size=3, num_workers=2)
+        kafka_event_consumer._consumer_thread = MagicMock()
+        dispatcher = MagicMock(spec=PartitionDispatcher)
+        dispatcher.wait_until_pending_below.return_value = False
+        dispatcher.pop_offsets_to_commit.return_value = {}
+        kafka_event_consumer._dispatcher = dispatcher
+
+        # Act
+        kafka_event_consumer._consume_and_dispatch_batch()
+
+        # Assert
+        mock_start_consume_thread.assert_called_once()
+        kafka_event_consumer._consumer.consume.assert_not_called()
+        kafka_event_consumer._consumer.commit.assert_not_called()
+
+    @pytest.mark.usefixtures("fxt_consumer")
+    @patch.object(KafkaEventConsumer, "_start_consume_thread")
+    def test_kafka_event_consumer_commit_failure_restores_offsets(self, mock_start_consume_thread) -> None:
+        # Arrange
+        kafka_event_consumer = KafkaEventConsumer("integration-test", batch_size=3, num_workers=2)
+        kafka_event_consumer._consumer_thread = MagicMock()
+        dispatcher = MagicMock(spec=PartitionDispatcher)
+        offsets = {("test_topic", 0): 2}
+        dispatcher.pop_offsets_to_commit.return_value = offsets
+        kafka_event_consumer._dispatcher = dispatcher
+        kafka_event_consumer._consumer.commit.side_effect = RuntimeError
+
+        # Act
+        with pytest.raises(RuntimeError):
+            kafka_event_consumer._commit_handled_offsets()
+
+        # Assert
+        mock_start_consume_thread.assert_called_once()
+        dispatcher.restore_offsets_to_commit.assert_called_once_with(offsets)
+
+    @pytest.mark.usefixtures("fxt_consumer")
+    @patch.object(KafkaEventConsumer, "_start_consume_thread")
+    def test_kafka_event_consumer_on_revoke_discards_revoked_offsets(self, mock_start_consume_thread) -> None:
+        # Arrange
+        kafka_event_consumer = KafkaEventConsumer("integration-test", batch_size=3, num_workers=2)
+        kafka_event_consumer._consumer_thread = MagicMock()
+        dispatcher = MagicMock(spec=PartitionDispatcher)
+        dispatcher.pop_offsets_to_commit.return_value = {("test_topic", 0): 2}
+        kafka_event_consumer._dispatcher = dispatcher
+        kafka_event_consumer._consumer.commit.side_effect = RuntimeError
+
+        # Act
+        kafka_event_consumer._on_revoke(
+            kafka_event_consumer._consumer,
+            [confluent_kafka.TopicPartition("test_topic", 0), confluent_kafka.TopicPartition("test_topic", 1)],
+        )
+
+        # Assert: the offsets that could not be committed are not kept for the revoked partitions
+        mock_start_consume_thread.assert_called_once()
+        dispatcher.wait_until_idle.assert_called_once_with(timeout=30)
+        dispatcher.revoke_partitions.assert_called_once_with([("test_topic", 0), ("test_topic", 1)])
+
+    @pytest.mark.usefixtures("fxt_consumer")
+    @patch.object(KafkaEventConsumer, "_start_consume_thread")
+    def test_kafka_event_consumer_on_revoke_timeout(self, mock_start_consume_thread) -> None:
+        # Arrange
+        kafka_event_consumer = KafkaEventConsumer("integration-test", batch_size=3, num_workers=2)
+        kafka_event_consumer._consumer_thread = MagicMock()
+        dispatcher = MagicMock(spec=PartitionDispatcher)
+        dispatcher.wait_until_idle.return_value = False
+        dispatcher.pop_offsets_to_commit.return_value = {("test_topic", 1): 4}
+        kafka_event_consumer._dispatcher = dispatcher
+
+        # Act
+        with (
+            patch.dict(os.environ, {"KAFKA_CONSUMER_REVOKE_TIMEOUT": "0.5"}),
+            patch("geti_kafka_tools.event_consuming.logger") as mock_logger,
+        ):
+            kafka_event_consumer._on_revoke(
+                kafka_event_consumer._consumer, [confluent_kafka.TopicPartition("test_topic", 0)]
+            )
+
+        # Assert: the offsets of the handled events are still committed
+        mock_start_consume_thread.assert_called_once()
+        dispatcher.wait_until_idle.assert_called_once_with(timeout=0.5)
+        mock_logger.warning.assert_called_once()
+        kafka_event_consumer._consumer.commit.assert_called_once()
+        dispatcher.revoke_partitions.assert_called_once_with([("test_topic", 0)])
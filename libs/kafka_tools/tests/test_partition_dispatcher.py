@@ -0,0 +1,142 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+from confluent_kafka import Message
+
+from geti_kafka_tools.partition_dispatcher import PartitionDispatcher
+
+
+def make_message(topic: str, partition: int, offset: int) -> MagicMock:
+    message = MagicMock(spec=Message)
+    message.topic.return_value = topic
+    message.partition.return_value = partition
+    message.offset.return_value = offset
+    return message
+
+
+class TestPartitionDispatcher:
+    def test_dispatch_in_order_per_partition(self) -> None:
+        # Arrange
+        handled: list[tuple[int, int]] = []
+        lock = threading.Lock()
+        active_partitions: set[int] = set()
+        concurrent_partitions: list[int] = []
+
+        def handler(message: Message) -> None:
+            with lock:
+                assert message.partition() not in active_partitions, "Events of a partition handled concurrently"
+                active_partitions.add(message.partition())
+                concurrent_partitions.append(len(active_partitions))
+            time.sleep(0.01)
+            with lock:
+                active_partitions.discard(message.partition())
+                handled.append((message.partition(), message.offset()))
+
+        dispatcher = PartitionDispatcher(handler=handler, num_workers=2)
+
+        # Act
+        for offset in range(5):
+            for partition in range(2):
+                dispatcher.dispatch(make_message("test_topic", partition, offset))
+        dispatcher.shutdown()
+
+        # Assert
+        for partition in range(2):
+            assert [offset for p, offset in handled if p == partition] == list(range(5))
+        assert max(concurrent_partitions) == 2
+        assert dispatcher.num_pending == 0
+        assert dispatcher.pop_offsets_to_commit() == {("test_topic", 0): 5, ("test_topic", 1): 5}
+        assert dispatcher.pop_offsets_to_commit() == {}
+
+    def test_dispatch_handler_error(self) -> None:
+        # Arrange
+        handler = MagicMock(side_effect=[RuntimeError, None])
+        dispatcher = PartitionDispatcher(handler=handler, num_workers=1)
+
+        # Act
+        dispatcher.dispatch(make_message("test_topic", 0, 10))
+        dispatcher.dispatch(make_message("test_topic", 0, 11))
+        dispatcher.shutdown()
+
+        # Assert
+        assert handler.call_count == 2
+        assert dispatcher.pop_offsets_to_commit() == {("test_topic", 0): 12}
+
+    def test_wait_until_pending_below(self) -> None:
+        # Arrange
+        release = threading.Event()
+        dispatcher = PartitionDispatcher(handler=lambda message: release.wait(), num_workers=1)  # noqa: ARG005
+        dispatcher.dispatch(make_message("test_topic", 0, 0))
+        dispatcher.dispatch(make_message("test_topic", 0, 1))
+
+        # Act
+        below_before_release = dispatcher.wait_until_pending_below(2, timeout=0.1)
+        release.set()
+        idle_after_release = dispatcher.wait_until_idle(timeout=5)
+
+        # Assert
+        assert not below_before_release
+        assert idle_after_release
+        dispatcher.shutdown()
+
+    def test_restore_offsets_to_commit(self) -> None:
+        # Arrange
+        dispatcher = PartitionDispatcher(handler=MagicMock(), num_workers=1)
+        dispatcher.dispatch(make_message("test_topic", 0, 3))
+        dispatcher.wait_until_idle()
+        offsets = dispatcher.pop_offsets_to_commit()
+        dispatcher.dispatch(make_message("test_topic", 0, 4))
+        dispatcher.wait_until_idle()
+
+        # Act
+        dispatcher.restore_offsets_to_commit(offsets | {("test_topic", 1): 7})
+
+        # Assert
+        assert dispatcher.pop_offsets_to_commit() == {("test_topic", 0): 5, ("test_topic", 1): 7}
+        dispatcher.shutdown()
+
+    def test_revoke_partitions(self) -> None:
+        # Arrange
+        dispatcher = PartitionDispatcher(handler=MagicMock(), num_workers=1)
+        for partition in (0, 1):
+            dispatcher.dispatch(make_message("test_topic", partition, 3))
+        dispatcher.wait_until_idle()
+
+        # Act
+        dispatcher.revoke_partitions([("test_topic", 0), ("test_topic", 2)])
+
+        # Assert
+        assert dispatcher.pop_offsets_to_commit() == {("test_topic", 1): 4}
+        dispatcher.shutdown()
+
+    def test_revoke_partitions_while_handling(self) -> None:
+        # Arrange
+        started = threading.Event()
+        release = threading.Event()
+        handled: list[int] = []
+
+        def handler(message: Message) -> None:
+            started.set()
+            release.wait()
+            handled.append(message.offset())
+
+        dispatcher = PartitionDispatcher(handler=handler, num_workers=1)
+        for offset in range(3):
+            dispatcher.dispatch(make_message("test_topic", 0, offset))
+        started.wait(timeout=5)
+
+        # Act
+        dispatcher.revoke_partitions([("test_topic", 0)])
+        release.set()
+        idle = dispatcher.wait_until_idle(timeout=5)
+
+        # Assert: the event being handled completes, but neither it nor the dropped events are committed
+        assert idle
+        assert handled == [0]
+        assert dispatcher.num_pending == 0
+        assert dispatcher.pop_offsets_to_commit() == {}
+        dispatcher.dispatch(make_message("test_topic", 0, 5))
+        dispatcher.wait_until_idle(timeout=5)
+        assert dispatcher.pop_offsets_to_commit() == {("test_topic", 0): 6}
+        dispatcher.shutdown()
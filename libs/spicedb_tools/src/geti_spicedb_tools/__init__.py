@@ -8,10 +8,12 @@ from .enums import (
     SpiceDBUserRoles,
     UserRoles,
 )
+from .permission_cache import PermissionCacheMetrics
 from .spicedb import SpiceDB
 
 __all__ = [
     "AccessResourceTypes",
+    "PermissionCacheMetrics",
     "Permissions",
     "Relations",
     "RoleMutationOperations",
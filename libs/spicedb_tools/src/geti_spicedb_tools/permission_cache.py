@@ -0,0 +1,167 @@
+"""
+Short-lived cache for the results of the SpiceDB permission lookups.
+
+Permission checks are performed on almost every request, with full consistency, and they are answered with the same
+result most of the time. The cache keeps each result for a few seconds, which bounds how long a permission change made
+by another process may be ignored. The changes made through this process invalidate the whole cache immediately.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from authzed.api.v1 import ZedToken
+
+# Time (in seconds) a permission lookup result is kept in the cache; 0 disables the cache
+SPICEDB_PERMISSION_CACHE_TTL = float(os.environ.get("SPICEDB_PERMISSION_CACHE_TTL", "5"))
+SPICEDB_PERMISSION_CACHE_MAX_SIZE = int(os.environ.get("SPICEDB_PERMISSION_CACHE_MAX_SIZE", "10000"))
+# Number of ZedTokens of the local writes that are remembered to serve `at_least_as_fresh` reads from the cache
+SPICEDB_PERMISSION_CACHE_MAX_TOKENS = int(os.environ.get("SPICEDB_PERMISSION_CACHE_MAX_TOKENS", "1000"))
+
+
+@dataclass
+class PermissionCacheMetrics:
+    """
+    Counters of the permission cache
+
+    :param hits: number of lookups served from the cache
+    :param misses: number of lookups sent to SpiceDB, including the ones that bypassed the cache
+    :param invalidations: number of times the cache has been invalidated by a write
+    :param size: number of entries currently in the cache
+    """
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of the lookups served from the cache"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    value: Any
+    expires_at: float
+
+
+class PermissionCache:
+    """
+    Thread-safe LRU cache with a time-to-live for the permission lookups, keyed by subject, permission and resource.
+
+    Every local write invalidates the whole cache and increments its generation. A lookup result is stored only if
+    no write happened while it was computed, so that every entry reflects all the writes made by this process.
+    For the same reason, the cache can serve reads that must be at least as fresh as a ZedToken returned by a local
+    write; reads requiring a token that is unknown to this process always bypass the cache.
+
+    :param ttl: time (in seconds) an entry is kept in the cache; 0 disables the cache
+    :param max_size: maximum number of entries, the least recently used ones are evicted first
+    :param max_tokens: number of ZedTokens of the local writes that are remembered
+    """
+
+    def __init__(
+        self,
+        ttl: float = SPICEDB_PERMISSION_CACHE_TTL,
+        max_size: int = SPICEDB_PERMISSION_CACHE_MAX_SIZE,
+        max_tokens: int = SPICEDB_PERMISSION_CACHE_MAX_TOKENS,
+    ) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+        self._known_tokens: deque[str] = deque(maxlen=max(1, max_tokens))
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+        self._mutex = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_size > 0
+
+    @property
+    def generation(self) -> int:
+        """Number of invalidations so far; to be passed to `put` along with the result of the lookup"""
+        return self._generation
+
+    def get(self, key: Hashable, at_least_as_fresh: ZedToken | None = None) -> tuple[bool, Any]:
+        """
+        Get a lookup result from the cache
+
+        :param key: key of the lookup
+        :param at_least_as_fresh: optional ZedToken that the result must be at least as fresh as
+        :return: tuple (found, value)
+        """
+        with self._mutex:
+            entry = self._entries.get(key) if self.enabled else None
+            if entry is not None and entry.expires_at <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if at_least_as_fresh is not None and at_least_as_fresh.token not in self._known_tokens:
+                # The token may come from a write of another process, that the cached entries might not reflect
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return True, entry.value
+
+    def put(self, key: Hashable, value: Any, generation: int) -> None:
+        """
+        Store a lookup result in the cache
+
+        :param key: key of the lookup
+        :param value: result of the lookup
+        :param generation: generation of the cache when the lookup was started, see `generation`
+        """
+        if not self.enabled:
+            return
+        with self._mutex:
+            if generation != self._generation:
+                # A write happened during the lookup, the result may already be outdated
+                return
+            self._entries[key] = _CacheEntry(value=value, expires_at=time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, written_at: ZedToken | None = None) -> None:
+        """
+        Invalidate the whole cache after a write
+
+        :param written_at: ZedToken returned by the write, if any
+        """
+        with self._mutex:
+            self._entries.clear()
+            self._generation += 1
+            self._invalidations += 1
+            if written_at is not None:
+                self._known_tokens.append(written_at.token)
+
+    def clear(self) -> None:
+        """Remove all the entries and reset the metrics"""
+        with self._mutex:
+            self._entries.clear()
+            self._known_tokens.clear()
+            self._generation += 1
+            self._hits = 0
+            self._misses = 0
+            self._invalidations = 0
+
+    @property
+    def metrics(self) -> PermissionCacheMetrics:
+        with self._mutex:
+            return PermissionCacheMetrics(
+                hits=self._hits,
+                misses=self._misses,
+                invalidations=self._invalidations,
+                size=len(self._entries),
+            )
@@ -37,6 +37,7 @@ from grpc import (  # type: ignore # grpc types are not available in mypy
 from grpcutil import insecure_bearer_token_credentials
 
 from geti_spicedb_tools import Permissions, Relations, RoleMutationOperations, SpiceDBResourceTypes, SpiceDBUserRoles
+from geti_spicedb_tools.permission_cache import PermissionCache, PermissionCacheMetrics
 
 logger = logging.getLogger(__name__)
 
@@ -110,6 +111,11 @@ def retry_grpc_call_on_unavailable_response(
 class SpiceDB(metaclass=Singleton):
     """
     SpiceDB client wrapper for high level interactions with DB
+
+    The results of the permission lookups (`check_permission`, `get_user_workspaces`, `get_user_projects`,
+    `get_user_jobs`) are cached for a short time (SPICEDB_PERMISSION_CACHE_TTL seconds), and the cache is invalidated
+    by every write made through this client. These methods accept an optional `at_least_as_fresh` ZedToken: the
+    cached results are used only if they are known to reflect the write that returned that token.
     """
 
     def __init__(self) -> None:
@@ -144,6 +150,7 @@ class SpiceDB(metaclass=Singleton):
             credentials,
             options=[("grpc.service_config", grpc_channel_config)],
         )
+        self.permission_cache = PermissionCache()
 
     def _get_credentials(self, spicedb_credentials: str, spicedb_token: str, certificates_dir: str) -> Any:
         if spicedb_credentials == "token_and_ca":
@@ -183,64 +190,77 @@ class SpiceDB(metaclass=Singleton):
             )
         )
 
-    def get_user_workspaces(self, user_id: str, permission: Permissions) -> tuple[str, ...]:
+    def _lookup_user_resource_ids(
+        self, resource_object_type: str, user_id: str, permission: str, at_least_as_fresh: ZedToken | None
+    ) -> tuple[str, ...]:
+        subject_id = SpiceDB.convert_user_id(user_id)
+        cache_key = ("lookup", SpiceDBResourceTypes.USER.value, subject_id, permission, resource_object_type)
+        found, resource_ids = self.permission_cache.get(cache_key, at_least_as_fresh=at_least_as_fresh)
+        if found:
+            return resource_ids
+        generation = self.permission_cache.generation
+        resp = self._lookup_resources(
+            resource_object_type,
+            permission,
+            SubjectReference(object=ObjectReference(object_type=SpiceDBResourceTypes.USER.value, object_id=subject_id)),
+        )
+        resource_ids = tuple(str(r.resource_object_id) for r in resp)
+        self.permission_cache.put(cache_key, resource_ids, generation=generation)
+        return resource_ids
+
+    def get_user_workspaces(
+        self, user_id: str, permission: Permissions, at_least_as_fresh: ZedToken | None = None
+    ) -> tuple[str, ...]:
         """
         Gets user workspaces list available with certain permission
 
         :param user_id: User ID
         :param permission: permission to check (i.e. can_manage, can_contribute)
+        :param at_least_as_fresh: optional ZedToken of a write that the result must reflect
         :return list of workspaces
         """
-        resp = self._lookup_resources(
-            SpiceDBResourceTypes.WORKSPACE.value,
-            permission.value,
-            SubjectReference(
-                object=ObjectReference(
-                    object_type=SpiceDBResourceTypes.USER.value, object_id=SpiceDB.convert_user_id(user_id)
-                )
-            ),
+        return self._lookup_user_resource_ids(
+            SpiceDBResourceTypes.WORKSPACE.value, user_id, permission.value, at_least_as_fresh
         )
-        return tuple(str(r.resource_object_id) for r in resp)
 
-    def get_user_jobs(self, user_id: str, permission: Permissions) -> tuple[str, ...]:
+    def get_user_jobs(
+        self, user_id: str, permission: Permissions, at_least_as_fresh: ZedToken | None = None
+    ) -> tuple[str, ...]:
         """
         Gets user jobs list available with certain permission
 
         :param user_id: User ID
         :param permission: permission to check (i.e. view_job)
+        :param at_least_as_fresh: optional ZedToken of a write that the result must reflect
         :return list of jobs
         """
-        resp = self._lookup_resources(
-            SpiceDBResourceTypes.JOB.value,
-            permission.value,
-            SubjectReference(
-                object=ObjectReference(
-                    object_type=SpiceDBResourceTypes.USER.value, object_id=SpiceDB.convert_user_id(user_id)
-                )
-            ),
+        return self._lookup_user_resource_ids(
+            SpiceDBResourceTypes.JOB.value, user_id, permission.value, at_least_as_fresh
         )
-        return tuple(str(r.resource_object_id) for r in resp)
 
-    def get_user_projects(self, user_id: str, permission: Permissions) -> tuple[str, ...]:
+    def get_user_projects(
+        self, user_id: str, permission: Permissions, at_least_as_fresh: ZedToken | None = None
+    ) -> tuple[str, ...]:
         """
         Gets user projects list available with certain permission
 
         :param user_id: User ID
         :param permission: permission to check (i.e. can_manage, can_contribute)
+        :param at_least_as_fresh: optional ZedToken of a write that the result must reflect
         :return list of projects
         """
-        resp = self._lookup_resources(
-            SpiceDBResourceTypes.PROJECT.value,
-            permission.value,
-            SubjectReference(
-                object=ObjectReference(
-                    object_type=SpiceDBResourceTypes.USER.value, object_id=SpiceDB.convert_user_id(user_id)
-                )
-            ),
+        project_ids = self._lookup_user_resource_ids(
+            SpiceDBResourceTypes.PROJECT.value, user_id, permission.value, at_least_as_fresh
         )
-        if not resp:
-            raise Exception
-        return tuple(str(r.resource_object_id) for r in resp if r.resource_object_id)
+        return tuple(project_id for project_id in project_ids if project_id)
+
+    def get_permission_cache_metrics(self) -> PermissionCacheMetrics:
+        """
+        Gets the metrics of the permission lookup cache, e.g. to monitor its hit rate
+
+        :return: PermissionCacheMetrics
+        """
+        return self.permission_cache.metrics
 
     @retry_grpc_call_on_unavailable_response
     def get_user_roles(self, resource_type: str, user_id: str, resource_id: str | None = None) -> list[tuple[str, str]]:
@@ -297,14 +317,22 @@ class SpiceDB(metaclass=Singleton):
         resource_type: str,
         resource_id: str,
         permission: str,
+        at_least_as_fresh: ZedToken | None = None,
     ) -> bool:
         """
         Check permission on given resource_type/resource_id for subject_type/subject_id.
         Returns True if User has the permission, returns False otherwise.
+        The result may be served from the permission cache, see `at_least_as_fresh` to read after a write.
         """
-        logger.info(f"Checking {subject_type}/{subject_id} {permission} permission on {resource_type}/{resource_id}")
         if subject_type == SpiceDBResourceTypes.USER.value:
             subject_id = self.convert_user_id(subject_id)
+        cache_key = ("check", subject_type, subject_id, permission, resource_type, resource_id)
+        found, has_permission = self.permission_cache.get(cache_key, at_least_as_fresh=at_least_as_fresh)
+        if found:
+            return has_permission
+
+        logger.info(f"Checking {subject_type}/{subject_id} {permission} permission on {resource_type}/{resource_id}")
+        generation = self.permission_cache.generation
 
         subject = authzed.SubjectReference(
             object=authzed.ObjectReference(
@@ -323,7 +351,9 @@ class SpiceDB(metaclass=Singleton):
                 subject=subject,
             ),
         )
-        return resp.permissionship == authzed.CheckPermissionResponse.PERMISSIONSHIP_HAS_PERMISSION
+        has_permission = resp.permissionship == authzed.CheckPermissionResponse.PERMISSIONSHIP_HAS_PERMISSION
+        self.permission_cache.put(cache_key, has_permission, generation=generation)
+        return has_permission
 
     def link_organization_to_workspace_in_spicedb(self, workspace_id: str, organization_id: str) -> None:
         """
@@ -368,6 +398,7 @@ class SpiceDB(metaclass=Singleton):
             )
         )
         logger.debug(f"WriteRelationship response: {resp}")
+        self.permission_cache.invalidate(resp.written_at)
         return resp
 
     def change_user_relation(
@@ -539,6 +570,7 @@ class SpiceDB(metaclass=Singleton):
                 )
             )
             logger.debug(f"DeleteRelationships response for the {resource_type}: {resp}")
+            self.permission_cache.invalidate(resp.deleted_at)
 
     def delete_job(self, job_id: str) -> ZedToken:
         """
@@ -623,19 +655,21 @@ class SpiceDB(metaclass=Singleton):
 
     @retry_grpc_call_on_unavailable_response
     def delete_relation(self, resource_object_type: str, resource_id: str) -> DeleteRelationshipsResponse:
-        return self._client.DeleteRelationships(
+        resp = self._client.DeleteRelationships(
             DeleteRelationshipsRequest(
                 relationship_filter=RelationshipFilter(
                     resource_type=resource_object_type, optional_resource_id=resource_id
                 )
             )
         )
+        self.permission_cache.invalidate(resp.deleted_at)
+        return resp
 
     @retry_grpc_call_on_unavailable_response
     def delete_subject(
         self, resource_object_type: str, subject_type: str, subject_id: str
     ) -> DeleteRelationshipsResponse:
-        return self._client.DeleteRelationships(
+        resp = self._client.DeleteRelationships(
             DeleteRelationshipsRequest(
                 relationship_filter=RelationshipFilter(
                     resource_type=resource_object_type,
@@ -643,6 +677,8 @@ class SpiceDB(metaclass=Singleton):
                 )
             )
         )
+        self.permission_cache.invalidate(resp.deleted_at)
+        return resp
 
     @staticmethod
     def convert_user_id(user_id: str) -> str:
@@ -23,6 +23,13 @@ from authzed.api.v1 import (
 from geti_spicedb_tools import Permissions, Relations, SpiceDB, SpiceDBResourceTypes
 
 
+@pytest.fixture(autouse=True)
+def clear_permission_cache():
+    """SpiceDB is a singleton: the cached lookups must not leak from one test to the next"""
+    yield
+    SpiceDB().permission_cache.clear()
+
+
 class TestSpiceDB:
     @patch("authzed.api.v1.Client")
     def test_create_workspace(self, mocked_client):
@@ -551,3 +558,62 @@ class TestSpiceDB:
             consistency=Consistency(fully_consistent=True),
         )
         mocked_client.LookupResources.assert_called_once_with(expected_arguments)
+
+    @patch("authzed.api.v1.Client")
+    def test_check_permission_cached(self, mocked_client):
+        # Arrange
+        spicedb = SpiceDB()
+        spicedb._client = mocked_client
+        mocked_client.CheckPermission.return_value = CheckPermissionResponse(
+            checked_at=ZedToken(token="test_token"), permissionship=2
+        )
+        check_args = (
+            SpiceDBResourceTypes.USER.value,
+            "test_user",
+            SpiceDBResourceTypes.PROJECT.value,
+            "test_project",
+            Permissions.VIEW_PROJECT.value,
+        )
+
+        # Act
+        responses = [spicedb.check_permission(*check_args) for _ in range(3)]
+
+        # Assert
+        assert responses == [True, True, True]
+        mocked_client.CheckPermission.assert_called_once()
+        metrics = spicedb.get_permission_cache_metrics()
+        assert (metrics.hits, metrics.misses, metrics.size) == (2, 1, 1)
+        assert metrics.hit_rate == pytest.approx(2 / 3)
+
+    @patch("authzed.api.v1.Client")
+    def test_permission_cache_invalidated_by_write(self, mocked_client):
+        # Arrange
+        spicedb = SpiceDB()
+        spicedb._client = mocked_client
+        mocked_client.LookupResources.return_value = [LookupResourcesResponse(resource_object_id="test_project_1")]
+        mocked_client.WriteRelationships.return_value = WriteRelationshipsResponse(
+            written_at=ZedToken(token="local_write_token")
+        )
+        spicedb.get_user_projects("test_user", Permissions.VIEW_PROJECT)
+
+        # Act
+        written_at = spicedb.add_project_user("test_project_2", "test_user", Relations.PROJECT_CONTRIBUTOR)
+        mocked_client.LookupResources.return_value = [
+            LookupResourcesResponse(resource_object_id="test_project_1"),
+            LookupResourcesResponse(resource_object_id="test_project_2"),
+        ]
+        projects_after_write = spicedb.get_user_projects("test_user", Permissions.VIEW_PROJECT)
+        projects_at_local_token = spicedb.get_user_projects(
+            "test_user", Permissions.VIEW_PROJECT, at_least_as_fresh=written_at
+        )
+        projects_at_unknown_token = spicedb.get_user_projects(
+            "test_user", Permissions.VIEW_PROJECT, at_least_as_fresh=ZedToken(token="remote_write_token")
+        )
+
+        # Assert
+        assert projects_after_write == projects_at_local_token == projects_at_unknown_token
+        assert projects_after_write == ("test_project_1", "test_project_2")
+        # 1 lookup before the write, 1 after it and 1 bypassing the cache for the unknown token
+        assert mocked_client.LookupResources.call_count == 3
+        metrics = spicedb.get_permission_cache_metrics()
+        assert (metrics.hits, metrics.misses, metrics.invalidations) == (1, 3, 1)
@@ -0,0 +1,47 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""Create account balance rollup table
+
+Revision ID: 4bd550bcaa15
+Revises: 2fd431b0d0c9
+Create Date: 2026-10-18 09:00:00.000000+00:00
+
+"""
+
+# DO NOT EDIT MANUALLY EXISTING MIGRATIONS.
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4bd550bcaa15'
+down_revision: str | None = '2fd431b0d0c9'
+branch_labels: str | (Sequence[str] | None) = None
+depends_on: str | (Sequence[str] | None) = None
+
+
+def upgrade() -> None:
+    # The table is filled lazily: the rollups of a subscription are built from the transactions
+    # the first time its balance is requested.
+    op.create_table('AccountBalanceRollup',
+    sa.Column("id", sa.Uuid(), server_default=sa.text("gen_random_uuid()"), nullable=False),
+    sa.Column('account_id', sa.Uuid(), nullable=False),
+    sa.Column('subscription_id', sa.Uuid(), nullable=False),
+    sa.Column('window_start', sa.BigInteger(), nullable=False),
+    sa.Column('incoming_balance', sa.BigInteger(), nullable=False),
+    sa.Column('available_balance', sa.BigInteger(), nullable=False),
+    sa.ForeignKeyConstraint(['account_id'], ['CreditAccount.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['subscription_id'], ['Subscription.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('account_id')
+    )
+    op.create_index('balance_rollup_subsc_id_idx', 'AccountBalanceRollup', ['subscription_id'], unique=False, postgresql_using='btree')
+
+
+def downgrade() -> None:
+    op.drop_index('balance_rollup_subsc_id_idx', table_name='AccountBalanceRollup', postgresql_using='btree')
+    op.drop_table('AccountBalanceRollup')
@@ -0,0 +1,83 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""Create consumption bucket table
+
+Revision ID: 4b18eb6b3ba9
+Revises: 4bd550bcaa15
+Create Date: 2026-10-18 10:00:00.000000+00:00
+
+"""
+
+# DO NOT EDIT MANUALLY EXISTING MIGRATIONS.
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b18eb6b3ba9'
+down_revision: str | None = '4bd550bcaa15'
+branch_labels: str | (Sequence[str] | None) = None
+depends_on: str | (Sequence[str] | None) = None
+
+
+def _populate_table():
+    # Aggregate the consumption of the leases finalized so far: transactions from the lease accounts to the SaaS account
+    op.execute(
+        """
+        INSERT INTO "ConsumptionBucket" (organization_id, project_id, service_name, date, unit, amount)
+        SELECT  subscription.organization_id,
+                saas_tx.project_id,
+                saas_tx.service_name,
+                saas_tx.created - saas_tx.created % (60 * 60 * 24 * 1000),
+                requests_json.key,
+                SUM(requests_json.value :: numeric)
+        FROM "Transactions" saas_tx
+        JOIN "CreditAccount" saas_acc ON saas_acc.id = saas_tx.account_id
+        JOIN "Transactions" lease_tx ON lease_tx.tx_id = saas_tx.tx_id
+        JOIN "CreditAccount" lease_acc ON lease_acc.id = lease_tx.account_id
+        JOIN "Subscription" subscription ON subscription.id = lease_acc.subscription_id
+        JOIN jsonb_each_text(saas_tx.requests) AS requests_json ON TRUE
+        WHERE saas_acc.type = 'SAAS'
+            AND lease_acc.type = 'LEASE'
+            AND saas_tx.tx_group_id IS NOT NULL
+            AND saas_tx.debit > 0
+        GROUP BY 1, 2, 3, 4, 5
+        """
+    )
+
+
+def upgrade() -> None:
+    op.create_table('ConsumptionBucket',
+    sa.Column("id", sa.Uuid(), server_default=sa.text("gen_random_uuid()"), nullable=False),
+    sa.Column('organization_id', sa.String(length=36), nullable=False),
+    sa.Column('project_id', sa.String(length=36), nullable=True),
+    sa.Column('service_name', sa.String(length=36), nullable=True),
+    sa.Column('date', sa.BigInteger(), nullable=False),
+    sa.Column('unit', sa.String(), nullable=False),
+    sa.Column('amount', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'consumption_bucket_org_id_date_idx',
+        'ConsumptionBucket',
+        [
+            'organization_id',
+            'date',
+            sa.text("COALESCE(project_id, '')"),
+            sa.text("COALESCE(service_name, '')"),
+            'unit',
+        ],
+        unique=True,
+        postgresql_using='btree',
+    )
+
+    _populate_table()
+
+
+def downgrade() -> None:
+    op.drop_index('consumption_bucket_org_id_date_idx', table_name='ConsumptionBucket', postgresql_using='btree')
+    op.drop_table('ConsumptionBucket')
@@ -1,8 +1,9 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 
-from .balance import AccountBalance, BalanceSnapshot
+from .balance import AccountBalance, AccountBalanceRollup, BalanceSnapshot
 from .base import Base
+from .consumption import ConsumptionBucket
 from .credit_account import CreditAccount
 from .custom_types import UnixTimestampInMilliseconds
 from .product import Product, ProductPolicy
@@ -11,8 +12,10 @@ from .transaction import Transactions
 
 __all__ = [
     "AccountBalance",
+    "AccountBalanceRollup",
     "BalanceSnapshot",
     "Base",
+    "ConsumptionBucket",
     "CreditAccount",
     "Product",
     "ProductPolicy",
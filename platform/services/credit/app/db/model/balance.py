@@ -28,4 +28,22 @@ class BalanceSnapshot(Base):
     )
 
 
+class AccountBalanceRollup(Base):
+    """
+    Running incoming and available balances of an asset account, accumulated from the start of its balance window
+    (the cycle start date for renewable accounts, the first balance snapshot date for the other ones).
+    """
+
+    __tablename__ = "AccountBalanceRollup"
+    account_id: Mapped[UUID] = mapped_column(
+        ForeignKey("CreditAccount.id", ondelete="CASCADE"), nullable=False, unique=True
+    )
+    subscription_id: Mapped[UUID] = mapped_column(ForeignKey("Subscription.id", ondelete="CASCADE"), nullable=False)
+    # plain BigInteger: the window of the accounts without any balance snapshot starts at 0
+    window_start: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    incoming_balance = mapped_column(BigInteger, nullable=False)
+    available_balance = mapped_column(BigInteger, nullable=False)
+
+
 Index("snapshot_subsc_id_date_idx", BalanceSnapshot.subscription_id, BalanceSnapshot.date, postgresql_using="btree")
+Index("balance_rollup_subsc_id_idx", AccountBalanceRollup.subscription_id, postgresql_using="btree")
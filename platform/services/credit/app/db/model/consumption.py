@@ -0,0 +1,35 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+from sqlalchemy import BigInteger, Index, String, func
+from sqlalchemy.orm import mapped_column
+
+from .base import Base
+
+
+class ConsumptionBucket(Base):
+    """
+    Daily credit consumption of an organization's project and service for a resource unit,
+    accumulated from the finalized leases.
+    """
+
+    __tablename__ = "ConsumptionBucket"
+    organization_id = mapped_column(String(36), nullable=False)
+    project_id = mapped_column(String(36), nullable=True)
+    service_name = mapped_column(String(36), nullable=True)
+    date = mapped_column(BigInteger, nullable=False)  # start of the UTC day, in milliseconds
+    unit = mapped_column(String, nullable=False)
+    amount = mapped_column(BigInteger, nullable=False)
+
+
+# Unique bucket per organization, day, project, service and unit, also used for the date range scans of the reports
+Index(
+    "consumption_bucket_org_id_date_idx",
+    ConsumptionBucket.organization_id,
+    ConsumptionBucket.date,
+    func.coalesce(ConsumptionBucket.project_id, ""),
+    func.coalesce(ConsumptionBucket.service_name, ""),
+    ConsumptionBucket.unit,
+    unique=True,
+    postgresql_using="btree",
+)
@@ -6,16 +6,55 @@ from collections.abc import Sequence
 from dataclasses import dataclass
 from uuid import UUID
 
-from sqlalchemy import Row, text
+from sqlalchemy import Row, delete, select, text, update
 from sqlalchemy.orm import Session
 
-from db.model.balance import AccountBalance, BalanceSnapshot
+from db.model.balance import AccountBalance, AccountBalanceRollup, BalanceSnapshot
 from db.repository.common import BaseRepository
 from utils.time import get_current_milliseconds_timestamp
 
 logger = logging.getLogger(__name__)
 
 
+# Blocked balance for all types of credit accounts: credits leased from the asset accounts by not yet closed leases
+_BLOCKED_BALANCE_QUERY = """
+                SELECT  asset_to_lease_tx.account_id,
+                        0                             AS incoming_balance,
+                        0                             AS available_balance,
+                        SUM(asset_to_lease_tx.credit) AS blocked_balance
+                FROM (
+                        (SELECT * FROM "Transactions" tx JOIN "CreditAccount" acc ON tx.account_id = acc.id
+                            WHERE acc.subscription_id = :subscription_id
+                                AND acc.type = 'ASSET'
+                                AND (acc.expires > :current_date or acc.expires IS NULL)
+                                AND tx.tx_group_id IS NOT NULL  -- lease tx type
+                                AND tx.created >= (
+                                    SELECT CASE
+                                        WHEN (acc.renewable_amount IS NULL OR acc.renewable_amount = 0) THEN 
+                                            (:current_date - 7 * 24 * 60 * 60 * 1000)  -- last 7 days
+                                        ELSE :renewal_date
+                                    END)
+                                AND tx.created <= :current_date
+                                AND tx.credit > 0  -- from asset to lease
+                        ) AS asset_to_lease_tx
+                        LEFT JOIN (
+                            SELECT * FROM "Transactions" tx JOIN "CreditAccount" acc ON tx.account_id = acc.id
+                                WHERE acc.subscription_id = :subscription_id
+                                    AND acc.type = 'LEASE'
+                                    AND tx.created >= (
+                                        SELECT CASE
+                                            WHEN (acc.renewable_amount IS NULL OR acc.renewable_amount = 0) THEN 
+                                                (:current_date - 7 * 24 * 60 * 60 * 1000)  -- last 7 days
+                                            ELSE :renewal_date
+                                        END)
+                                    AND tx.created <= :current_date
+                                    AND tx.credit > 0  -- from lease to saas or back to asset
+                        ) AS closed_lease_tx ON asset_to_lease_tx.tx_group_id = closed_lease_tx.tx_group_id
+                    ) WHERE closed_lease_tx.tx_group_id IS NULL                          
+                GROUP BY asset_to_lease_tx.account_id
+"""
+
+
 @dataclass
 class AccountBalanceData:
     account_id: UUID
@@ -24,6 +63,14 @@ class AccountBalanceData:
     snapshot_id: UUID | None = None
 
 
+@dataclass
+class AccountBalanceRollupData:
+    account_id: UUID
+    window_start: int
+    available_balance: int
+    incoming_balance: int
+
+
 class BalanceRepository(BaseRepository):
     def __init__(self, session: Session):
         self.session = session
@@ -33,8 +80,7 @@ class BalanceRepository(BaseRepository):
         Returns a table with the information about incoming and available balances
         for each asset account from the subscription.
         """
-        query = text(
-            """
+        query_template = """
             SELECT  account_id             AS account_id,
                     SUM(incoming_balance)  AS incoming_balance,
                     SUM(available_balance) AS available_balance,
@@ -117,44 +163,11 @@ class BalanceRepository(BaseRepository):
                 UNION
                 
                 -- Blocked balance for all types of credit accounts
-                SELECT  asset_to_lease_tx.account_id,
-                        0                             AS incoming_balance,
-                        0                             AS available_balance,
-                        SUM(asset_to_lease_tx.credit) AS blocked_balance
-                FROM (
-                        (SELECT * FROM "Transactions" tx JOIN "CreditAccount" acc ON tx.account_id = acc.id
-                            WHERE acc.subscription_id = :subscription_id
-                                AND acc.type = 'ASSET'
-                                AND (acc.expires > :current_date or acc.expires IS NULL)
-                                AND tx.tx_group_id IS NOT NULL  -- lease tx type
-                                AND tx.created >= (
-                                    SELECT CASE
-                                        WHEN (acc.renewable_amount IS NULL OR acc.renewable_amount = 0) THEN 
-                                            (:current_date - 7 * 24 * 60 * 60 * 1000)  -- last 7 days
-                                        ELSE :renewal_date
-                                    END)
-                                AND tx.created <= :current_date
-                                AND tx.credit > 0  -- from asset to lease
-                        ) AS asset_to_lease_tx
-                        LEFT JOIN (
-                            SELECT * FROM "Transactions" tx JOIN "CreditAccount" acc ON tx.account_id = acc.id
-                                WHERE acc.subscription_id = :subscription_id
-                                    AND acc.type = 'LEASE'
-                                    AND tx.created >= (
-                                        SELECT CASE
-                                            WHEN (acc.renewable_amount IS NULL OR acc.renewable_amount = 0) THEN 
-                                                (:current_date - 7 * 24 * 60 * 60 * 1000)  -- last 7 days
-                                            ELSE :renewal_date
-                                        END)
-                                    AND tx.created <= :current_date
-                                    AND tx.credit > 0  -- from lease to saas or back to asset
-                        ) AS closed_lease_tx ON asset_to_lease_tx.tx_group_id = closed_lease_tx.tx_group_id
-                    ) WHERE closed_lease_tx.tx_group_id IS NULL                          
-                GROUP BY asset_to_lease_tx.account_id
+{blocked_balance_query}
                 
             ) AS account_balance GROUP BY account_id;
             """
-        )
+        query = text(query_template.format(blocked_balance_query=_BLOCKED_BALANCE_QUERY))
         return self.session.execute(
             statement=query,
             params={"subscription_id": subscription_id, "current_date": current_date, "renewal_date": cycle_start_date},
@@ -186,3 +199,71 @@ class BalanceRepository(BaseRepository):
         self.session.bulk_save_objects(balance_list)
         self.session.flush()
         return balance_list
+
+    def get_blocked_balance(self, subscription_id: UUID, current_date: int, cycle_start_date: int) -> Sequence[Row]:
+        """
+        Returns a table with the information about blocked balance for each asset account from the subscription.
+        Only the lease transactions from the last 7 days or from the current cycle are taken into account.
+        """
+        query_template = """
+            SELECT account_id, blocked_balance FROM ({blocked_balance_query}) AS blocked;
+            """
+        query = text(query_template.format(blocked_balance_query=_BLOCKED_BALANCE_QUERY))
+        return self.session.execute(
+            statement=query,
+            params={"subscription_id": subscription_id, "current_date": current_date, "renewal_date": cycle_start_date},
+        ).all()
+
+    def get_first_snapshot_date(self, subscription_id: UUID, current_date: int) -> int:
+        """
+        Returns the date of the first balance snapshot of the subscription taken until the current date, or 0 if there
+        is none. Balances of the non-renewable accounts are accumulated from this date.
+        """
+        stmt = (
+            select(BalanceSnapshot.date)
+            .where(BalanceSnapshot.subscription_id == subscription_id, BalanceSnapshot.date <= current_date)
+            .order_by(BalanceSnapshot.date)
+            .limit(1)
+        )
+        return self.session.scalars(stmt).first() or 0
+
+    def get_balance_rollups(self, subscription_id: UUID) -> Sequence[AccountBalanceRollup]:
+        """Returns the running balances of the subscription's asset accounts"""
+        stmt = select(AccountBalanceRollup).where(AccountBalanceRollup.subscription_id == subscription_id)
+        return self.session.scalars(stmt).all()
+
+    def replace_balance_rollups(
+        self, subscription_id: UUID, details: list[AccountBalanceRollupData]
+    ) -> list[AccountBalanceRollup]:
+        """Replaces the running balances of the subscription's asset accounts with the given ones"""
+        stmt = delete(AccountBalanceRollup).where(AccountBalanceRollup.subscription_id == subscription_id)
+        self.session.execute(stmt)
+        rollups = [
+            AccountBalanceRollup(
+                account_id=rollup.account_id,
+                subscription_id=subscription_id,
+                window_start=rollup.window_start,
+                available_balance=rollup.available_balance,
+                incoming_balance=rollup.incoming_balance,
+            )
+            for rollup in details
+        ]
+        self.session.add_all(rollups)
+        self.session.flush()
+        return rollups
+
+    def increment_balance_rollup(self, account_id: UUID, created: int, available: int, incoming: int) -> None:
+        """
+        Adds a transaction of the asset account to its running balances.
+        Transactions created before the start of the balance window (e.g. returns of credits leased in the previous
+        cycle) are not part of the window, so they are ignored, as in the full balance calculation.
+        """
+        stmt = (
+            update(AccountBalanceRollup)
+            .where(AccountBalanceRollup.account_id == account_id, AccountBalanceRollup.window_start <= created)
+            .values(
+                available_balance=AccountBalanceRollup.available_balance + available,
+                incoming_balance=AccountBalanceRollup.incoming_balance + incoming,
+            )
+        )
+        self.session.execute(stmt)
@@ -0,0 +1,232 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+import logging
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import Row, text
+from sqlalchemy.orm import Session
+
+from db.repository.common import BaseRepository
+from utils.enums import AggregatesKey
+
+logger = logging.getLogger(__name__)
+
+DAY_IN_MILLISECONDS = 24 * 60 * 60 * 1000
+
+# Columns of the consumption buckets corresponding to the aggregation keys
+_BUCKET_COLUMNS = {
+    AggregatesKey.PROJECT: "project_id",
+    AggregatesKey.SERVICE_NAME: "service_name",
+    AggregatesKey.DATE: "date",
+}
+
+# Consumption of the leases of an organization finalized in a date range, i.e. of the transactions from its lease
+# account to the SaaS account, grouped like the consumption buckets
+_FINALIZED_LEASES_CONSUMPTION_QUERY = """
+    SELECT  subscription.organization_id,
+            saas_tx.project_id,
+            saas_tx.service_name,
+            saas_tx.created - saas_tx.created % :day AS date,
+            requests_json.key AS unit,
+            SUM(requests_json.value :: numeric) AS amount
+    FROM "Transactions" saas_tx
+    JOIN "CreditAccount" saas_acc ON saas_acc.id = saas_tx.account_id
+    JOIN "Transactions" lease_tx ON lease_tx.tx_id = saas_tx.tx_id
+    JOIN "CreditAccount" lease_acc ON lease_acc.id = lease_tx.account_id
+    JOIN "Subscription" subscription ON subscription.id = lease_acc.subscription_id
+    JOIN jsonb_each_text(saas_tx.requests) AS requests_json ON TRUE
+    WHERE saas_acc.type = 'SAAS'
+        AND lease_acc.type = 'LEASE'
+        AND subscription.organization_id = :org_id
+        AND saas_tx.tx_group_id IS NOT NULL
+        AND saas_tx.debit > 0
+        AND saas_tx.created >= :from_date
+        AND saas_tx.created < :to_date
+    GROUP BY 1, 2, 3, 4, 5
+"""
+
+
+class ConsumptionRepository(BaseRepository):
+    def __init__(self, session: Session):
+        self.session = session
+
+    def increment_consumption(
+        self, organization_id: str, project_id: str | None, service_name: str | None, created: int, requests: dict
+    ) -> None:
+        """
+        Adds the resources consumed by a finalized lease to the organization's daily consumption buckets.
+
+        :param organization_id: the identifier of the organization
+        :param project_id: the identifier of the project the lease belongs to
+        :param service_name: name of the service that consumed the resources
+        :param created: timestamp of the transaction to the SaaS account, in milliseconds
+        :param requests: consumed amount by resource unit
+        """
+        query = text(
+            """
+            INSERT INTO "ConsumptionBucket" (organization_id, project_id, service_name, date, unit, amount)
+            VALUES (:org_id, :project_id, :service_name, :date, :unit, :amount)
+            ON CONFLICT (organization_id, date, COALESCE(project_id, ''), COALESCE(service_name, ''), unit)
+            DO UPDATE SET amount = "ConsumptionBucket".amount + EXCLUDED.amount
+            """
+        )
+        params = [
+            {
+                "org_id": organization_id,
+                "project_id": project_id,
+                "service_name": service_name,
+                "date": created - created % DAY_IN_MILLISECONDS,
+                "unit": unit,
+                "amount": amount,
+            }
+            for unit, amount in requests.items()
+        ]
+        if params:
+            self.session.execute(query, params)
+
+    def get_daily_consumption(self, organization_id: str, from_date: int, to_date: int) -> dict[tuple[int, str], int]:
+        """
+        Sums up the organization's consumption buckets per day and resource unit.
+
+        :param organization_id: the identifier of the organization
+        :param from_date: the start of the date range, inclusive, in milliseconds. Must be a day start.
+        :param to_date: the end of the date range, exclusive, in milliseconds. Must be a day start.
+        :return: consumed amount by day start and resource unit
+        """
+        query = text(
+            """
+            SELECT date, unit, SUM(amount) AS amount
+            FROM "ConsumptionBucket"
+            WHERE organization_id = :org_id AND date >= :from_date AND date < :to_date
+            GROUP BY date, unit
+            """
+        )
+        params = {"org_id": organization_id, "from_date": from_date, "to_date": to_date}
+        return {(row.date, row.unit): int(row.amount) for row in self.session.execute(query, params)}
+
+    def calculate_daily_consumption(
+        self, organization_id: str, from_date: int, to_date: int
+    ) -> dict[tuple[int, str], int]:
+        """
+        Calculates the organization's consumption per day and resource unit from the transactions of its finalized
+        leases, i.e. the amounts the consumption buckets must hold.
+
+        :param organization_id: the identifier of the organization
+        :param from_date: the start of the date range, inclusive, in milliseconds. Must be a day start.
+        :param to_date: the end of the date range, exclusive, in milliseconds. Must be a day start.
+        :return: consumed amount by day start and resource unit
+        """
+        query_template = """
+            SELECT leases.date, leases.unit, SUM(leases.amount) AS amount
+            FROM ({finalized_leases}) AS leases
+            GROUP BY leases.date, leases.unit
+        """
+        query = text(query_template.format(finalized_leases=_FINALIZED_LEASES_CONSUMPTION_QUERY))
+        params = {"org_id": organization_id, "from_date": from_date, "to_date": to_date, "day": DAY_IN_MILLISECONDS}
+        return {(row.date, row.unit): int(row.amount) for row in self.session.execute(query, params)}
+
+    def rebuild_consumption(self, organization_id: str, from_date: int, to_date: int) -> None:
+        """
+        Replaces the organization's consumption buckets of a date range with the consumption calculated from the
+        transactions of its finalized leases.
+
+        :param organization_id: the identifier of the organization
+        :param from_date: the start of the date range, inclusive, in milliseconds. Must be a day start.
+        :param to_date: the end of the date range, exclusive, in milliseconds. Must be a day start.
+        """
+        params = {"org_id": organization_id, "from_date": from_date, "to_date": to_date, "day": DAY_IN_MILLISECONDS}
+        self.session.execute(
+            text(
+                """
+                DELETE FROM "ConsumptionBucket"
+                WHERE organization_id = :org_id AND date >= :from_date AND date < :to_date
+                """
+            ),
+            params,
+        )
+        query_template = """
+            INSERT INTO "ConsumptionBucket" (organization_id, project_id, service_name, date, unit, amount)
+            {finalized_leases}
+        """
+        self.session.execute(text(query_template.format(finalized_leases=_FINALIZED_LEASES_CONSUMPTION_QUERY)), params)
+
+    def aggregate_consumption(
+        self,
+        organization_id: str,
+        aggregates_keys: list[AggregatesKey],
+        from_date: int,
+        to_date: int,
+        projects: list[str] | None = None,
+    ) -> Sequence[Row[Any]]:
+        """
+        Calculates credit and resource consumption for an organization from its daily consumption buckets.
+        Returns rows with the same columns as `TransactionRepository.aggregate_transactions`.
+
+        Args:
+            organization_id (str)
+                the identifier of the organization for which the aggregation will be calculated.
+            aggregates_keys (list[AggregatesKey]):
+                A list of enumeration members representing the grouping keys for aggregation.
+            from_date (int):
+                The start of the date range, inclusive, in milliseconds since the epoch. Must be a day start.
+            to_date (int):
+                The end of the date range, exclusive, in milliseconds since the epoch. Must be a day start.
+            projects (list[str], optional):
+                A list of project ids to filter the consumption. If None, all projects are included.
+
+        Raises:
+            ValueError: If no valid fields are provided for grouping, or if the date range is not aligned to days.
+
+        Like the aggregation over the transactions, the consumption without a project or a service name is left out
+        of the groups by project or service name.
+        """
+        group_by_fields = {field for field in aggregates_keys if field in _BUCKET_COLUMNS}
+        if not group_by_fields:
+            raise ValueError(f"No valid fields provided for grouping. Accepted keys are: {set(_BUCKET_COLUMNS)}")
+        if from_date % DAY_IN_MILLISECONDS or to_date % DAY_IN_MILLISECONDS:
+            raise ValueError(f"Consumption buckets cover whole days, got the range [{from_date}, {to_date})")
+
+        bucket_columns = ", ".join(f"bucket.{_BUCKET_COLUMNS[field]} AS {field.value}" for field in group_by_fields)
+        agg_columns = ", ".join(f"agg.{field.value}" for field in group_by_fields)
+        group_by_columns = ", ".join(str(position) for position in range(1, len(group_by_fields) + 2))
+        not_null_conditions = "".join(
+            f" AND bucket.{_BUCKET_COLUMNS[field]} IS NOT NULL"
+            for field in group_by_fields
+            if field is not AggregatesKey.DATE
+        )
+        query_template = """
+            SELECT
+                {agg_columns},
+                jsonb_object_agg(agg.unit, agg.amount) AS resources,
+                SUM(agg.amount) AS credits
+            FROM (
+                SELECT
+                    {bucket_columns},
+                    bucket.unit,
+                    SUM(bucket.amount) AS amount
+                FROM "ConsumptionBucket" bucket
+                WHERE bucket.organization_id = :org_id
+                    AND bucket.date >= :from_date
+                    AND bucket.date < :to_date
+                    AND (:projects IS NULL OR bucket.project_id = ANY(:projects)){not_null_conditions}
+                GROUP BY {group_by_columns}
+            ) AS agg
+            GROUP BY {agg_columns};
+        """
+        query_text = query_template.format(
+            agg_columns=agg_columns,
+            bucket_columns=bucket_columns,
+            not_null_conditions=not_null_conditions,
+            group_by_columns=group_by_columns,
+        )
+        params = {
+            "org_id": organization_id,
+            "from_date": from_date,
+            "to_date": to_date,
+            "projects": projects if projects else None,
+        }
+        query = text(query_text).bindparams(**params)
+
+        return self.session.execute(query).fetchall()
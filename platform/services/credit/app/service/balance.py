@@ -7,12 +7,16 @@ from uuid import UUID
 
 from sqlalchemy.orm import Session
 
+from db.model.credit_account import CreditAccount
 from db.model.subscription import Subscription
 from db.repository.account import AccountRepository
-from db.repository.balance import AccountBalanceData, BalanceRepository
+from db.repository.balance import AccountBalanceData, AccountBalanceRollupData, BalanceRepository
 from db.repository.common import advisory_lock, transactional
+from db.repository.consumption import DAY_IN_MILLISECONDS, ConsumptionRepository
 from db.repository.subscription import SubscriptionRepository
 from rest.schema.balance import BalanceResponse
+from utils.enums import CreditAccountType
+from utils.env import BALANCE_ROLLUPS_ENABLED, CONSUMPTION_BUCKETS_ENABLED, CONSUMPTION_BUCKETS_RECONCILIATION_DAYS
 from utils.renewal_date_calculation import get_prev_renewal_date
 from utils.time import get_current_milliseconds_timestamp, unix_milliseconds_to_date
 
@@ -25,6 +29,7 @@ class BalanceService:
         self.balance_repository = BalanceRepository(session)
         self.account_repository = AccountRepository(session)
         self.subscription_repository = SubscriptionRepository(session)
+        self.consumption_repository = ConsumptionRepository(session)
 
     @transactional
     @advisory_lock("organization_id")
@@ -35,7 +40,12 @@ class BalanceService:
         _db_session: Session,
         date: int | None = None,
     ) -> Mapping[UUID, BalanceResponse]:
-        """Returns list of credit accounts containing calculated balances that belong to specified organization"""
+        """
+        Returns list of credit accounts containing calculated balances that belong to specified organization.
+        Current balances are read from the running balances of the accounts, unless BALANCE_ROLLUPS_ENABLED is
+        disabled; balances at a given date are always calculated from the transactions.
+        """
+        use_rollups = not date and BALANCE_ROLLUPS_ENABLED
         if not date:
             date = get_current_milliseconds_timestamp()
 
@@ -47,14 +57,18 @@ class BalanceService:
             f"date: {date}, subscription cycle start date: {prev_renewal_date}"
         )
 
-        account_balances = self.balance_repository.get_balance(
-            subscription_id=subscription.id, current_date=date, cycle_start_date=prev_renewal_date
-        )
-
-        result = {
-            acc_id: BalanceResponse(available=available, incoming=incoming, blocked=blocked)
-            for (acc_id, incoming, available, blocked) in account_balances
-        }
+        if use_rollups:
+            result = self._get_balances_from_rollups(
+                subscription=subscription, current_date=date, cycle_start_date=prev_renewal_date
+            )
+        else:
+            account_balances = self.balance_repository.get_balance(
+                subscription_id=subscription.id, current_date=date, cycle_start_date=prev_renewal_date
+            )
+            result = {
+                acc_id: BalanceResponse(available=available, incoming=incoming, blocked=blocked)
+                for (acc_id, incoming, available, blocked) in account_balances
+            }
 
         logger.debug(
             f"Calculated balance for organisation_id:{organization_id}, "
@@ -64,6 +78,196 @@ class BalanceService:
 
         return result
 
+    def _get_balance_windows(
+        self, subscription: Subscription, current_date: int, cycle_start_date: int
+    ) -> dict[UUID, int]:
+        """
+        Returns the start of the balance window of each active asset account of the subscription:
+        the cycle start date for renewable accounts, the first snapshot date (or 0) for the other ones.
+        """
+        first_snapshot_date: int | None = None
+        windows = {}
+        for account in subscription.credit_accounts:
+            if account.type != CreditAccountType.ASSET or (account.expires and account.expires <= current_date):
+                continue
+            if account.renewable_amount:
+                windows[account.id] = cycle_start_date
+                continue
+            if first_snapshot_date is None:
+                first_snapshot_date = self.balance_repository.get_first_snapshot_date(
+                    subscription_id=subscription.id, current_date=current_date
+                )
+            windows[account.id] = first_snapshot_date
+        return windows
+
+    def _rebuild_balance_rollups(
+        self, subscription: Subscription, windows: Mapping[UUID, int], current_date: int, cycle_start_date: int
+    ) -> dict[UUID, AccountBalanceRollupData]:
+        """Recalculates the running balances of the subscription's asset accounts from the transactions"""
+        logger.info(f"Rebuilding balance rollups for organization_id:{subscription.organization_id}")
+        account_balances = {
+            acc_id: (incoming, available)
+            for (acc_id, incoming, available, _) in self.balance_repository.get_balance(
+                subscription_id=subscription.id, current_date=current_date, cycle_start_date=cycle_start_date
+            )
+        }
+        rollups = {
+            acc_id: AccountBalanceRollupData(
+                account_id=acc_id,
+                window_start=window_start,
+                incoming_balance=account_balances.get(acc_id, (0, 0))[0],
+                available_balance=account_balances.get(acc_id, (0, 0))[1],
+            )
+            for acc_id, window_start in windows.items()
+        }
+        self.balance_repository.replace_balance_rollups(subscription_id=subscription.id, details=list(rollups.values()))
+        return rollups
+
+    def _get_balances_from_rollups(
+        self, subscription: Subscription, current_date: int, cycle_start_date: int
+    ) -> dict[UUID, BalanceResponse]:
+        """
+        Returns the current balances of the subscription's active asset accounts from their running balances.
+        The running balances are rebuilt from the transactions when an account has none yet, or when its balance
+        window has moved (new cycle, first snapshot, account type change).
+        Blocked balances are always calculated from the lease transactions of the last 7 days or the current cycle.
+        """
+        windows = self._get_balance_windows(
+            subscription=subscription, current_date=current_date, cycle_start_date=cycle_start_date
+        )
+        rollups: Mapping[UUID, AccountBalanceRollupData] = {
+            rollup.account_id: AccountBalanceRollupData(
+                account_id=rollup.account_id,
+                window_start=rollup.window_start,
+                incoming_balance=rollup.incoming_balance,
+                available_balance=rollup.available_balance,
+            )
+            for rollup in self.balance_repository.get_balance_rollups(subscription_id=subscription.id)
+        }
+        if any(acc_id not in rollups or rollups[acc_id].window_start != start for acc_id, start in windows.items()):
+            rollups = self._rebuild_balance_rollups(
+                subscription=subscription, windows=windows, current_date=current_date, cycle_start_date=cycle_start_date
+            )
+
+        blocked_balances = dict(
+            self.balance_repository.get_blocked_balance(
+                subscription_id=subscription.id, current_date=current_date, cycle_start_date=cycle_start_date
+            )
+        )
+        return {
+            acc_id: BalanceResponse(
+                available=rollups[acc_id].available_balance,
+                incoming=rollups[acc_id].incoming_balance,
+                blocked=blocked_balances.get(acc_id, 0),
+            )
+            for acc_id in windows
+        }
+
+    def update_balance_rollups(
+        self, from_acc: CreditAccount, target_acc: CreditAccount, amount: int, created: int
+    ) -> None:
+        """
+        Adds a transfer between two credit accounts to the running balances of the asset accounts involved.
+        Must be called within the database transaction that creates the corresponding transactions.
+
+        :param from_acc: source credit account
+        :param target_acc: target credit account
+        :param amount: credits transferred to the target account (debit - credit of its transaction)
+        :param created: creation timestamp of the transactions
+        """
+        for account, counterpart, account_amount in ((target_acc, from_acc, amount), (from_acc, target_acc, -amount)):
+            if account.type != CreditAccountType.ASSET:
+                continue
+            self.balance_repository.increment_balance_rollup(
+                account_id=account.id,
+                created=created,
+                available=account_amount,
+                incoming=account_amount if counterpart.type == CreditAccountType.SAAS else 0,
+            )
+
+    @transactional
+    @advisory_lock("organization_id")
+    def reconcile_balance_rollups(
+        self, subscription: Subscription, organization_id: str, _db_session: Session
+    ) -> list[UUID]:
+        """
+        Compares the running balances of the organization's asset accounts with the balances calculated from
+        the transactions. The running balances are rebuilt if any of them differs.
+
+        :param subscription: organization's active subscription
+        :param organization_id: the parameter to use as the advisory lock key
+        :return: ids of the accounts whose running balances were not consistent with the transactions
+        """
+        current_date = get_current_milliseconds_timestamp()
+        cycle_start_date = get_prev_renewal_date(
+            renewal_day=subscription.renewal_day_of_month, current_date=unix_milliseconds_to_date(current_date)
+        )
+        rollup_balances = self._get_balances_from_rollups(
+            subscription=subscription, current_date=current_date, cycle_start_date=cycle_start_date
+        )
+        account_balances = {
+            acc_id: (incoming, available)
+            for (acc_id, incoming, available, _) in self.balance_repository.get_balance(
+                subscription_id=subscription.id, current_date=current_date, cycle_start_date=cycle_start_date
+            )
+        }
+        mismatched_accounts = [
+            acc_id
+            for acc_id, balance in rollup_balances.items()
+            if (balance.incoming, balance.available) != account_balances.get(acc_id, (0, 0))
+        ]
+        if mismatched_accounts:
+            logger.warning(
+                f"Balance rollups of organization_id:{organization_id} are not consistent with the transactions "
+                f"for the accounts {mismatched_accounts}, rebuilding them."
+            )
+            self._rebuild_balance_rollups(
+                subscription=subscription,
+                windows=self._get_balance_windows(
+                    subscription=subscription, current_date=current_date, cycle_start_date=cycle_start_date
+                ),
+                current_date=current_date,
+                cycle_start_date=cycle_start_date,
+            )
+        return mismatched_accounts
+
+    @transactional
+    @advisory_lock("organization_id")
+    def reconcile_consumption_buckets(self, organization_id: str, _db_session: Session) -> list[int]:
+        """
+        Compares the organization's consumption buckets of the last days with the consumption calculated from
+        the transactions of its finalized leases, and rebuilds the days that differ. This catches up with the leases
+        that were finalized without updating the buckets, e.g. by the previous release during a rollout.
+
+        :param organization_id: the identifier of the organization, also used as the advisory lock key
+        :return: start dates of the days whose buckets were not consistent with the transactions
+        """
+        current_date = get_current_milliseconds_timestamp()
+        to_date = current_date - current_date % DAY_IN_MILLISECONDS + DAY_IN_MILLISECONDS
+        from_date = to_date - (CONSUMPTION_BUCKETS_RECONCILIATION_DAYS + 1) * DAY_IN_MILLISECONDS
+        bucket_consumption = self.consumption_repository.get_daily_consumption(
+            organization_id=organization_id, from_date=from_date, to_date=to_date
+        )
+        lease_consumption = self.consumption_repository.calculate_daily_consumption(
+            organization_id=organization_id, from_date=from_date, to_date=to_date
+        )
+        mismatched_days = sorted(
+            {
+                date
+                for (date, unit) in bucket_consumption.keys() | lease_consumption.keys()
+                if bucket_consumption.get((date, unit), 0) != lease_consumption.get((date, unit), 0)
+            }
+        )
+        for date in mismatched_days:
+            logger.warning(
+                f"Consumption buckets of organization_id:{organization_id} are not consistent with the transactions "
+                f"for the day starting at {date}, rebuilding them."
+            )
+            self.consumption_repository.rebuild_consumption(
+                organization_id=organization_id, from_date=date, to_date=date + DAY_IN_MILLISECONDS
+            )
+        return mismatched_days
+
     def get_organization_balance(self, active_subscription: Subscription, date: int | None = None) -> BalanceResponse:
         account_balances = self.get_credit_accounts_balances(
             subscription=active_subscription,
@@ -93,6 +297,12 @@ class BalanceService:
         # todo: pass a date parameter to support time travel requests
 
         logger.debug(f"Creating balance snapshot for organisation_id:{organization_id}")
+        if BALANCE_ROLLUPS_ENABLED:
+            self.reconcile_balance_rollups(
+                subscription=subscription, organization_id=organization_id, _db_session=self.session
+            )
+        if CONSUMPTION_BUCKETS_ENABLED:
+            self.reconcile_consumption_buckets(organization_id=organization_id, _db_session=self.session)
         account_balances = self.get_credit_accounts_balances(
             subscription=subscription, organization_id=organization_id, _db_session=self.session
         )
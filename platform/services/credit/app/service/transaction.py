@@ -3,7 +3,9 @@
 
 import logging
 import sys
-from typing import TYPE_CHECKING, NamedTuple
+from collections.abc import Sequence
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, NamedTuple
 from uuid import UUID, uuid4
 
 from sqlalchemy import Row
@@ -13,6 +15,7 @@ from db.model.credit_account import CreditAccount
 from db.model.subscription import Subscription
 from db.repository.account import AccountRepository
 from db.repository.common import advisory_lock, transactional
+from db.repository.consumption import DAY_IN_MILLISECONDS, ConsumptionRepository
 from db.repository.subscription import SubscriptionRepository
 from db.repository.transaction import TransactionDetails, TransactionRepository
 from exceptions.custom_exceptions import InsufficientBalanceException, NoDatabaseResult
@@ -28,6 +31,7 @@ from rest.schema.transactions import (
 )
 from service.balance import BalanceService
 from utils.enums import AggregatesKey, CreditAccountType
+from utils.env import CONSUMPTION_BUCKETS_ENABLED
 from utils.renewal_date_calculation import get_next_renewal_date
 from utils.time import date_to_unix_milliseconds, get_current_date, get_current_milliseconds_timestamp
 
@@ -99,6 +103,7 @@ class TransactionService:
         self.account_repository = AccountRepository(session)
         self.balance_service = BalanceService(session)
         self.transaction_repository = TransactionRepository(session)
+        self.consumption_repository = ConsumptionRepository(session)
         self.subscription_repository = SubscriptionRepository(session)
 
     def _perform_transaction(
@@ -112,6 +117,7 @@ class TransactionService:
         Transfers credits from one credit account to another.
          `tx_id` is supposed to link direct transaction between credit accounts of different types.
          `tx_group_id` is used as a logical identifier to group lease related transactions.
+         Running balances of the asset accounts involved are updated along with the transactions.
         """
         tx_id = str(uuid4())
         logger.debug(f"Performing transaction with {tx_id=}, {tx_group_id=}")
@@ -119,6 +125,13 @@ class TransactionService:
         if target_details.created is None:
             target_details.created = get_current_milliseconds_timestamp()
 
+        # keep the running balances of the asset accounts in sync, within the same database transaction
+        self.balance_service.update_balance_rollups(
+            from_acc=from_acc,
+            target_acc=target_acc,
+            amount=target_details.debit - target_details.credit,
+            created=target_details.created,
+        )
         self.transaction_repository.create_transaction(
             details=target_details, account=target_acc, tx_id=tx_id, tx_group_id=tx_group_id
         )
@@ -343,7 +356,8 @@ class TransactionService:
     @advisory_lock("organization_id")
     def finalize_lease(self, metering_data: MeteringEvent, organization_id: str, _db_session: Session) -> None:
         """
-        Based on received metering data, makes corresponding transactions:
+        Based on received metering data, makes corresponding transactions and adds the consumption
+        to the organization's daily consumption buckets:
 
         - from organization's lease account to SaaS credit account -
         in case when actual credits consumption is equal to the existing lease;
@@ -362,6 +376,7 @@ class TransactionService:
         saas_acc = self.account_repository.retrieve_saas_account()
         consumed_credits = sum(rec.amount for rec in metering_data.consumption)
         requests = {rec.unit: rec.amount for rec in metering_data.consumption}
+        created = get_current_milliseconds_timestamp()
 
         target_details = TransactionDetails(
             debit=consumed_credits,
@@ -369,6 +384,7 @@ class TransactionService:
             project_id=metering_data.project_id,
             service_name=metering_data.service_name,
             requests=requests,
+            created=created,
         )
         self._perform_transaction(
             from_acc=lease_acc, target_acc=saas_acc, target_details=target_details, tx_group_id=metering_data.lease_id
@@ -377,6 +393,14 @@ class TransactionService:
             f"{consumed_credits} credits has been transferred from {organization_id} "
             f"organization's lease account to the SaaS account."
         )
+        if consumed_credits > 0:
+            self.consumption_repository.increment_consumption(
+                organization_id=subscription.organization_id,
+                project_id=metering_data.project_id,
+                service_name=metering_data.service_name,
+                created=created,
+                requests=requests,
+            )
 
         # get information about lease credits and their source asset accounts
         result: Result = self.transaction_repository.get_lease_transactions_and_accounts_data(metering_data.lease_id)
@@ -521,6 +545,31 @@ class TransactionService:
             return AggregatesResponse(aggregates=aggregate_response)
         return AggregatesResponse(aggregates=[])
 
+    @staticmethod
+    def _merge_aggregation_results(
+        aggregate_keys: list[AggregatesKey], aggregation_results: list[Sequence[Any]]
+    ) -> list[SimpleNamespace]:
+        """
+        Merges aggregation results calculated over adjacent date ranges, summing up the credits and resources
+        of the rows with the same group.
+        """
+        merged: dict[tuple, SimpleNamespace] = {}
+        for aggregation_result in aggregation_results:
+            for row in aggregation_result:
+                group = tuple(getattr(row, a_key.value) for a_key in aggregate_keys)
+                merged_row = merged.get(group)
+                if merged_row is None:
+                    merged[group] = SimpleNamespace(
+                        **dict(zip((a_key.value for a_key in aggregate_keys), group)),
+                        resources=dict(row.resources),
+                        credits=row.credits,
+                    )
+                    continue
+                merged_row.credits += row.credits
+                for unit, amount in row.resources.items():
+                    merged_row.resources[unit] = merged_row.resources.get(unit, 0) + amount
+        return list(merged.values())
+
     def aggregate_transactions(
         self,
         organization_id: str,
@@ -536,13 +585,41 @@ class TransactionService:
         lists the project identifiers for which aggregates are calculated.
         """
 
-        aggregation_result = self.transaction_repository.aggregate_transactions(
-            organization_id=organization_id,
-            aggregates_keys=aggregate_keys,
-            from_date=from_date,
-            to_date=to_date,
-            projects=projects,
-        )
+        # whole days of the range are read from the daily consumption buckets, the rest from the transactions
+        buckets_from_date = from_date + (-from_date % DAY_IN_MILLISECONDS)
+        buckets_to_date = to_date - to_date % DAY_IN_MILLISECONDS
+        if not CONSUMPTION_BUCKETS_ENABLED or buckets_from_date >= buckets_to_date:
+            aggregation_result = self.transaction_repository.aggregate_transactions(
+                organization_id=organization_id,
+                aggregates_keys=aggregate_keys,
+                from_date=from_date,
+                to_date=to_date,
+                projects=projects,
+            )
+        else:
+            partial_results = [
+                self.consumption_repository.aggregate_consumption(
+                    organization_id=organization_id,
+                    aggregates_keys=aggregate_keys,
+                    from_date=buckets_from_date,
+                    to_date=buckets_to_date,
+                    projects=projects,
+                )
+            ]
+            for range_start, range_end in ((from_date, buckets_from_date), (buckets_to_date, to_date)):
+                if range_start < range_end:
+                    partial_results.append(
+                        self.transaction_repository.aggregate_transactions(
+                            organization_id=organization_id,
+                            aggregates_keys=aggregate_keys,
+                            from_date=range_start,
+                            to_date=range_end,
+                            projects=projects,
+                        )
+                    )
+            aggregation_result = self._merge_aggregation_results(
+                aggregate_keys=aggregate_keys, aggregation_results=partial_results
+            )
 
         return self._parse_row_to_aggregate_response(
             aggregate_keys=aggregate_keys, aggregation_result=aggregation_result
@@ -9,3 +9,9 @@ DB_USER = os.environ.get("POSTGRES_USER", "postgres")
 DB_PASSWORD = os.environ.get("POSTGRES_PASSWORD", "postgres")
 DB_PORT = os.environ.get("POSTGRES_PORT", "5432")
 DB_NAME = os.environ.get("POSTGRES_DB_NAME", "creditsystem")
+# Serve the current balances from the running balances maintained along with the transactions
+BALANCE_ROLLUPS_ENABLED = os.environ.get("BALANCE_ROLLUPS_ENABLED", "true").lower() == "true"
+# Serve the credit consumption reports from the daily consumption buckets maintained along with the leases
+CONSUMPTION_BUCKETS_ENABLED = os.environ.get("CONSUMPTION_BUCKETS_ENABLED", "true").lower() == "true"
+# Number of past days whose consumption buckets are reconciled with the transactions by the daily snapshot job
+CONSUMPTION_BUCKETS_RECONCILIATION_DAYS = int(os.environ.get("CONSUMPTION_BUCKETS_RECONCILIATION_DAYS", "7"))
@@ -0,0 +1,163 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+"""
+Benchmark of the credit consumption reports: aggregation over the raw transactions vs. over the daily
+consumption buckets.
+
+The synthetic ledger is created in temporary tables shadowing the real ones, so the benchmark can be run against
+any database with the credit system schema (connection configured through the POSTGRES_* environment variables):
+
+    PYTHONPATH=app python tests/benchmark/benchmark_consumption_aggregates.py
+
+BENCHMARK_TRANSACTIONS sets the number of synthetic transactions (default: 10 000 000).
+"""
+
+import logging
+import os
+import time
+from collections.abc import Callable
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from db.repository.consumption import DAY_IN_MILLISECONDS, ConsumptionRepository
+from db.repository.transaction import TransactionRepository
+from dependencies import engine
+from utils.enums import AggregatesKey
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_TRANSACTIONS = int(os.environ.get("BENCHMARK_TRANSACTIONS", "10000000"))
+ORGANIZATIONS = 100
+PROJECTS_PER_ORGANIZATION = 10
+DAYS = 90
+START_DATE = 1_714_521_600_000  # May 1, 2024 12:00:00 AM (GMT)
+REPETITIONS = 5
+
+_SEED_QUERIES = [
+    """
+    INSERT INTO "Subscription" (id, organization_id, workspace_id, product_id, renewal_day_of_month, status,
+                                created, updated)
+    SELECT md5('subscription' || org)::uuid, 'org-' || org, 'workspace-' || org, gen_random_uuid(), 1, 'ACTIVE',
+           :start_date, :start_date
+    FROM generate_series(0, :organizations - 1) AS org
+    """,
+    """
+    INSERT INTO "CreditAccount" (id, subscription_id, name, type, created, updated)
+    SELECT md5('lease' || org)::uuid, md5('subscription' || org)::uuid, 'lease', 'LEASE', :start_date, :start_date
+    FROM generate_series(0, :organizations - 1) AS org
+    UNION ALL
+    SELECT md5('saas')::uuid, NULL, 'saas', 'SAAS', :start_date, :start_date
+    """,
+    # Each finalized lease is a pair of transactions: from the lease account and to the SaaS account
+    """
+    INSERT INTO "Transactions" (tx_id, tx_group_id, account_id, debit, credit, created, project_id, service_name,
+                                requests)
+    SELECT md5('tx' || lease), md5('lease' || lease), account_id, debit, credit, created,
+           'project-' || (lease % :projects), 'training', jsonb_build_object('images', images, 'frames', frames)
+    FROM (
+        SELECT lease, images, frames,
+               :start_date + (random() * :days * :day)::bigint AS created,
+               md5('lease' || (lease % :organizations))::uuid AS lease_account_id
+        FROM (
+            SELECT lease, (random() * 100)::int + 1 AS images, (random() * 100)::int AS frames
+            FROM generate_series(0, :leases - 1) AS lease
+        ) AS lease_amounts
+    ) AS lease_data
+    CROSS JOIN LATERAL (
+        VALUES (lease_account_id, 0, images + frames),
+               (md5('saas')::uuid, images + frames, 0)
+    ) AS legs(account_id, debit, credit)
+    """,
+    """
+    INSERT INTO "ConsumptionBucket" (organization_id, project_id, service_name, date, unit, amount)
+    SELECT subscription.organization_id, saas_tx.project_id, saas_tx.service_name,
+           saas_tx.created - saas_tx.created % :day, requests_json.key, SUM(requests_json.value :: numeric)
+    FROM "Transactions" saas_tx
+    JOIN "Transactions" lease_tx ON lease_tx.tx_id = saas_tx.tx_id AND lease_tx.credit > 0
+    JOIN "CreditAccount" lease_acc ON lease_acc.id = lease_tx.account_id
+    JOIN "Subscription" subscription ON subscription.id = lease_acc.subscription_id
+    JOIN jsonb_each_text(saas_tx.requests) AS requests_json ON TRUE
+    WHERE saas_tx.debit > 0
+    GROUP BY 1, 2, 3, 4, 5
+    """,
+]
+
+
+def _create_synthetic_ledger(session: Session) -> None:
+    for table in ("Subscription", "CreditAccount", "Transactions", "ConsumptionBucket"):
+        session.execute(
+            text(f'CREATE TEMP TABLE "{table}" (LIKE public."{table}" INCLUDING DEFAULTS INCLUDING INDEXES)')
+        )
+    params = {
+        "start_date": START_DATE,
+        "organizations": ORGANIZATIONS,
+        "projects": PROJECTS_PER_ORGANIZATION,
+        "days": DAYS,
+        "day": DAY_IN_MILLISECONDS,
+        "leases": BENCHMARK_TRANSACTIONS // 2,
+    }
+    for query in _SEED_QUERIES:
+        session.execute(text(query), params)
+    for table in ("Subscription", "CreditAccount", "Transactions", "ConsumptionBucket"):
+        session.execute(text(f'ANALYZE "{table}"'))
+
+
+def _measure(name: str, aggregate: Callable[[], object]) -> None:
+    durations = []
+    for _ in range(REPETITIONS):
+        start = time.perf_counter()
+        aggregate()
+        durations.append(time.perf_counter() - start)
+    logger.info(f"{name}: best {min(durations) * 1000:.1f} ms, worst {max(durations) * 1000:.1f} ms")
+
+
+def _log_query_plan(session: Session, organization_id: str, from_date: int, to_date: int) -> None:
+    plan = session.execute(
+        text(
+            """
+            EXPLAIN (ANALYZE, BUFFERS)
+            SELECT project_id, unit, SUM(amount) FROM "ConsumptionBucket"
+            WHERE organization_id = :org_id AND date >= :from_date AND date < :to_date
+            GROUP BY project_id, unit
+            """
+        ),
+        {"org_id": organization_id, "from_date": from_date, "to_date": to_date},
+    ).scalars()
+    logger.info("Consumption buckets query plan:\n" + "\n".join(plan))
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    organization_id = "org-0"
+    from_date = START_DATE
+    to_date = START_DATE + DAYS * DAY_IN_MILLISECONDS
+    keys = [AggregatesKey.PROJECT, AggregatesKey.DATE]
+
+    with Session(bind=engine) as session:
+        logger.info(f"Creating a synthetic ledger with {BENCHMARK_TRANSACTIONS} transactions")
+        _create_synthetic_ledger(session)
+        transaction_repository = TransactionRepository(session)
+        consumption_repository = ConsumptionRepository(session)
+
+        for days in (1, 30, DAYS):
+            range_to_date = from_date + days * DAY_IN_MILLISECONDS
+            _measure(
+                f"Transactions aggregation over {days} day(s)",
+                lambda range_to_date=range_to_date: transaction_repository.aggregate_transactions(
+                    organization_id=organization_id, aggregates_keys=keys, from_date=from_date, to_date=range_to_date
+                ),
+            )
+            _measure(
+                f"Consumption buckets aggregation over {days} day(s)",
+                lambda range_to_date=range_to_date: consumption_repository.aggregate_consumption(
+                    organization_id=organization_id, aggregates_keys=keys, from_date=from_date, to_date=range_to_date
+                ),
+            )
+        _log_query_plan(session, organization_id=organization_id, from_date=from_date, to_date=to_date)
+        session.rollback()
+
+
+if __name__ == "__main__":
+    main()
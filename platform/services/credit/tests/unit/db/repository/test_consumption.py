@@ -0,0 +1,35 @@
+# Copyright (C) 2022-2025 Intel Corporation
+# LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from db.repository.consumption import DAY_IN_MILLISECONDS, ConsumptionRepository
+from utils.enums import AggregatesKey
+
+
+@pytest.mark.parametrize(
+    "aggregates_keys, expected_not_null_columns",
+    [
+        ([AggregatesKey.PROJECT], {"project_id"}),
+        ([AggregatesKey.SERVICE_NAME, AggregatesKey.DATE], {"service_name"}),
+        ([AggregatesKey.PROJECT, AggregatesKey.SERVICE_NAME, AggregatesKey.DATE], {"project_id", "service_name"}),
+        ([AggregatesKey.DATE], set()),
+    ],
+)
+def test_aggregate_consumption_without_project(aggregates_keys, expected_not_null_columns) -> None:
+    # Arrange
+    session = MagicMock()
+    consumption_repository = ConsumptionRepository(session)
+
+    # Act
+    consumption_repository.aggregate_consumption(
+        organization_id="org-1", aggregates_keys=aggregates_keys, from_date=0, to_date=DAY_IN_MILLISECONDS
+    )
+
+    # Assert: like the aggregation over the transactions, the buckets of leases without project or service name
+    # are left out of the groups by project or service name, instead of making up a group without key
+    query = str(session.execute.call_args.args[0])
+    for column in ("project_id", "service_name", "date"):
+        assert (f"bucket.{column} IS NOT NULL" in query) == (column in expected_not_null_columns)
@@ -2,15 +2,17 @@
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 from uuid import uuid4
 
 import pytest
 from freezegun import freeze_time
 
 from db.model.subscription import Subscription
+from db.repository.balance import AccountBalanceRollupData
 from rest.schema.balance import BalanceResponse
 from service.balance import BalanceService
+from utils.enums import CreditAccountType
 from utils.time import datetime_to_unix_milliseconds
 
 SUBSCRIPTION_ID = uuid4()
@@ -31,6 +33,7 @@ SUBSCRIPTION_ID = uuid4()
         ),
     ],
 )
+@patch("service.balance.BALANCE_ROLLUPS_ENABLED", False)
 @patch("service.balance.BalanceRepository")
 @freeze_time("2024-01-01 12:00:00")
 def test_get_credit_accounts_balances(mock_balance_repo, request_date, current_date, cycle_start_date) -> None:
@@ -105,6 +108,7 @@ def test_get_credit_accounts_balances_for_transactionless_accounts(mock_balance_
         ),
     ],
 )
+@patch("service.balance.BALANCE_ROLLUPS_ENABLED", False)
 @patch("service.balance.BalanceRepository")
 @freeze_time("2024-01-01 12:00:00")
 def test_get_organization_balance(mock_balance_repo, request_date, current_date, cycle_start_date) -> None:
@@ -159,3 +163,206 @@ def test_get_organization_balance_for_transactionless_accounts(mock_balance_repo
     )
 
     assert balance == BalanceResponse(incoming=0, available=0, blocked=0)
+
+
+RENEWABLE_ACC_ID = uuid4()
+NON_RENEWABLE_ACC_ID = uuid4()
+EXPIRED_ACC_ID = uuid4()
+CYCLE_START_DATE = datetime_to_unix_milliseconds(datetime(year=2023, month=12, day=10, hour=0, tzinfo=timezone.utc))
+FIRST_SNAPSHOT_DATE = datetime_to_unix_milliseconds(datetime(year=2023, month=11, day=1, hour=0, tzinfo=timezone.utc))
+
+
+@pytest.fixture
+def fxt_subscription_with_accounts():
+    subscription = MagicMock(id=SUBSCRIPTION_ID, organization_id="org-1", renewal_day_of_month=10)
+    subscription.credit_accounts = [
+        MagicMock(id=RENEWABLE_ACC_ID, type=CreditAccountType.ASSET, renewable_amount=100, expires=None),
+        MagicMock(id=NON_RENEWABLE_ACC_ID, type=CreditAccountType.ASSET, renewable_amount=None, expires=None),
+        MagicMock(id=EXPIRED_ACC_ID, type=CreditAccountType.ASSET, renewable_amount=None, expires=CYCLE_START_DATE),
+        MagicMock(id=uuid4(), type=CreditAccountType.LEASE, renewable_amount=None, expires=None),
+    ]
+    return subscription
+
+
+def _rollup(account_id, window_start, incoming, available) -> MagicMock:
+    return MagicMock(
+        account_id=account_id, window_start=window_start, incoming_balance=incoming, available_balance=available
+    )
+
+
+@patch("service.balance.BalanceRepository")
+@freeze_time("2024-01-01 12:00:00")
+def test_get_credit_accounts_balances_from_rollups(mock_balance_repo, fxt_subscription_with_accounts) -> None:
+    # Arrange
+    balance_repo = MagicMock()
+    mock_balance_repo.return_value = balance_repo
+    balance_repo.get_first_snapshot_date.return_value = FIRST_SNAPSHOT_DATE
+    balance_repo.get_balance_rollups.return_value = [
+        _rollup(RENEWABLE_ACC_ID, CYCLE_START_DATE, incoming=100, available=60),
+        _rollup(NON_RENEWABLE_ACC_ID, FIRST_SNAPSHOT_DATE, incoming=500, available=450),
+    ]
+    balance_repo.get_blocked_balance.return_value = [(RENEWABLE_ACC_ID, 15)]
+    session = MagicMock()
+    balance_service = BalanceService(session=session)
+
+    # Act
+    accounts_balances = balance_service.get_credit_accounts_balances(
+        subscription=fxt_subscription_with_accounts, organization_id="org-1", _db_session=session
+    )
+
+    # Assert
+    balance_repo.get_balance.assert_not_called()
+    balance_repo.replace_balance_rollups.assert_not_called()
+    balance_repo.get_blocked_balance.assert_called_once_with(
+        subscription_id=SUBSCRIPTION_ID,
+        current_date=datetime_to_unix_milliseconds(datetime(year=2024, month=1, day=1, hour=12, tzinfo=timezone.utc)),
+        cycle_start_date=CYCLE_START_DATE,
+    )
+    assert accounts_balances == {
+        RENEWABLE_ACC_ID: BalanceResponse(incoming=100, available=60, blocked=15),
+        NON_RENEWABLE_ACC_ID: BalanceResponse(incoming=500, available=450, blocked=0),
+    }
+
+
+@patch("service.balance.BalanceRepository")
+@freeze_time("2024-01-01 12:00:00")
+def test_get_credit_accounts_balances_rebuilds_outdated_rollups(
+    mock_balance_repo, fxt_subscription_with_accounts
+) -> None:
+    # Arrange
+    balance_repo = MagicMock()
+    mock_balance_repo.return_value = balance_repo
+    balance_repo.get_first_snapshot_date.return_value = FIRST_SNAPSHOT_DATE
+    previous_cycle_start_date = datetime_to_unix_milliseconds(datetime(2023, 11, 10, tzinfo=timezone.utc))
+    balance_repo.get_balance_rollups.return_value = [
+        _rollup(RENEWABLE_ACC_ID, previous_cycle_start_date, incoming=100, available=0),
+        _rollup(NON_RENEWABLE_ACC_ID, FIRST_SNAPSHOT_DATE, incoming=500, available=450),
+    ]
+    balance_repo.get_balance.return_value = [(RENEWABLE_ACC_ID, 100, 100, 0), (NON_RENEWABLE_ACC_ID, 500, 450, 0)]
+    balance_repo.get_blocked_balance.return_value = []
+    session = MagicMock()
+    balance_service = BalanceService(session=session)
+
+    # Act
+    accounts_balances = balance_service.get_credit_accounts_balances(
+        subscription=fxt_subscription_with_accounts, organization_id="org-1", _db_session=session
+    )
+
+    # Assert
+    balance_repo.replace_balance_rollups.assert_called_once_with(
+        subscription_id=SUBSCRIPTION_ID,
+        details=[
+            AccountBalanceRollupData(
+                account_id=RENEWABLE_ACC_ID, window_start=CYCLE_START_DATE, available_balance=100, incoming_balance=100
+            ),
+            AccountBalanceRollupData(
+                account_id=NON_RENEWABLE_ACC_ID,
+                window_start=FIRST_SNAPSHOT_DATE,
+                available_balance=450,
+                incoming_balance=500,
+            ),
+        ],
+    )
+    assert accounts_balances == {
+        RENEWABLE_ACC_ID: BalanceResponse(incoming=100, available=100, blocked=0),
+        NON_RENEWABLE_ACC_ID: BalanceResponse(incoming=500, available=450, blocked=0),
+    }
+
+
+@pytest.mark.parametrize(
+    "full_balances, expected_mismatches",
+    [
+        ([(RENEWABLE_ACC_ID, 100, 60, 0), (NON_RENEWABLE_ACC_ID, 500, 450, 0)], []),
+        ([(RENEWABLE_ACC_ID, 100, 60, 0)], [NON_RENEWABLE_ACC_ID]),
+        ([(RENEWABLE_ACC_ID, 100, 50, 0), (NON_RENEWABLE_ACC_ID, 500, 450, 0)], [RENEWABLE_ACC_ID]),
+    ],
+)
+@patch("service.balance.BalanceRepository")
+@freeze_time("2024-01-01 12:00:00")
+def test_reconcile_balance_rollups(
+    mock_balance_repo, full_balances, expected_mismatches, fxt_subscription_with_accounts
+) -> None:
+    # Arrange
+    balance_repo = MagicMock()
+    mock_balance_repo.return_value = balance_repo
+    balance_repo.get_first_snapshot_date.return_value = FIRST_SNAPSHOT_DATE
+    balance_repo.get_balance_rollups.return_value = [
+        _rollup(RENEWABLE_ACC_ID, CYCLE_START_DATE, incoming=100, available=60),
+        _rollup(NON_RENEWABLE_ACC_ID, FIRST_SNAPSHOT_DATE, incoming=500, available=450),
+    ]
+    balance_repo.get_balance.return_value = full_balances
+    balance_repo.get_blocked_balance.return_value = []
+    session = MagicMock()
+    balance_service = BalanceService(session=session)
+
+    # Act
+    mismatches = balance_service.reconcile_balance_rollups(
+        subscription=fxt_subscription_with_accounts, organization_id="org-1", _db_session=session
+    )
+
+    # Assert
+    assert mismatches == expected_mismatches
+    assert balance_repo.replace_balance_rollups.called == bool(expected_mismatches)
+
+
+@patch("service.balance.BalanceRepository")
+def test_update_balance_rollups(mock_balance_repo) -> None:
+    # Arrange
+    balance_repo = MagicMock()
+    mock_balance_repo.return_value = balance_repo
+    saas_acc = MagicMock(id=uuid4(), type=CreditAccountType.SAAS)
+    asset_acc = MagicMock(id=uuid4(), type=CreditAccountType.ASSET)
+    lease_acc = MagicMock(id=uuid4(), type=CreditAccountType.LEASE)
+    balance_service = BalanceService(session=MagicMock())
+
+    # Act
+    balance_service.update_balance_rollups(from_acc=saas_acc, target_acc=asset_acc, amount=500, created=1)
+    balance_service.update_balance_rollups(from_acc=asset_acc, target_acc=lease_acc, amount=100, created=2)
+    balance_service.update_balance_rollups(from_acc=lease_acc, target_acc=saas_acc, amount=80, created=3)
+
+    # Assert
+    assert balance_repo.increment_balance_rollup.call_args_list == [
+        call(account_id=asset_acc.id, created=1, available=500, incoming=500),
+        call(account_id=asset_acc.id, created=2, available=-100, incoming=0),
+    ]
+
+
+TODAY = datetime_to_unix_milliseconds(datetime(year=2024, month=1, day=1, hour=0, tzinfo=timezone.utc))
+YESTERDAY = datetime_to_unix_milliseconds(datetime(year=2023, month=12, day=31, hour=0, tzinfo=timezone.utc))
+
+
+@pytest.mark.parametrize(
+    "lease_consumption, expected_mismatches",
+    [
+        ({(YESTERDAY, "images"): 10, (TODAY, "images"): 4}, []),
+        ({(YESTERDAY, "images"): 10, (TODAY, "images"): 4, (TODAY, "frames"): 2}, [TODAY]),
+        ({(TODAY, "images"): 4}, [YESTERDAY]),
+    ],
+)
+@patch("service.balance.CONSUMPTION_BUCKETS_RECONCILIATION_DAYS", 7)
+@patch("service.balance.ConsumptionRepository")
+@freeze_time("2024-01-01 12:00:00")
+def test_reconcile_consumption_buckets(mock_consumption_repo, lease_consumption, expected_mismatches) -> None:
+    # Arrange
+    consumption_repo = mock_consumption_repo.return_value
+    consumption_repo.get_daily_consumption.return_value = {(YESTERDAY, "images"): 10, (TODAY, "images"): 4}
+    consumption_repo.calculate_daily_consumption.return_value = lease_consumption
+    session = MagicMock()
+    balance_service = BalanceService(session=session)
+
+    # Act
+    mismatches = balance_service.reconcile_consumption_buckets(organization_id="org-1", _db_session=session)
+
+    # Assert
+    window = {
+        "organization_id": "org-1",
+        "from_date": datetime_to_unix_milliseconds(datetime(year=2023, month=12, day=25, tzinfo=timezone.utc)),
+        "to_date": datetime_to_unix_milliseconds(datetime(year=2024, month=1, day=2, tzinfo=timezone.utc)),
+    }
+    consumption_repo.get_daily_consumption.assert_called_once_with(**window)
+    consumption_repo.calculate_daily_consumption.assert_called_once_with(**window)
+    assert mismatches == expected_mismatches
+    assert consumption_repo.rebuild_consumption.call_args_list == [
+        call(organization_id="org-1", from_date=date, to_date=date + 24 * 60 * 60 * 1000)
+        for date in expected_mismatches
+    ]
@@ -1,9 +1,9 @@
 # Copyright (C) 2022-2025 Intel Corporation
 # LIMITED EDGE SOFTWARE DISTRIBUTION LICENSE
 
-from datetime import datetime
+from datetime import datetime, timezone
 from decimal import Decimal
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 from uuid import uuid4
 
 import pytest
@@ -11,6 +11,7 @@ import pytest
 from db.model.subscription import Subscription
 from db.repository.transaction import TransactionRepository
 from exceptions.custom_exceptions import InsufficientBalanceException
+from kafka_events.message import MeteringEvent, ResourceConsumption
 from rest.schema.balance import BalanceResponse
 from rest.schema.transactions import AggregateItem, AggregatesResponse, AggregatesResult, GroupItem, ResourcesAmount
 from service.transaction import TransactionDetails, TransactionService
@@ -36,6 +37,23 @@ def transaction_service(mock_session, mock_transaction_repository):
         return TransactionService(session=mock_session)
 
 
+def test_perform_transaction_updates_balance_rollups(mock_transaction_repository, transaction_service):
+    # Arrange
+    transaction_service.balance_service = MagicMock()
+    saas_account = MagicMock(type=CreditAccountType.SAAS)
+    asset_account = MagicMock(type=CreditAccountType.ASSET)
+    details = TransactionDetails(debit=500, credit=0, created=1_720_000_000_000)
+
+    # Act
+    transaction_service._perform_transaction(from_acc=saas_account, target_acc=asset_account, target_details=details)
+
+    # Assert
+    transaction_service.balance_service.update_balance_rollups.assert_called_once_with(
+        from_acc=saas_account, target_acc=asset_account, amount=500, created=1_720_000_000_000
+    )
+    assert mock_transaction_repository.create_transaction.call_count == 2
+
+
 @pytest.mark.parametrize(
     "credits_amount, account_type, exc_info",
     [
@@ -285,6 +303,44 @@ def test_cancel_lease_process():
     service._return_unused_credits.assert_called_once()
 
 
+def test_finalize_lease_increments_consumption_buckets():
+    # Arrange
+    session = MagicMock()
+    service = TransactionService(session)
+    service._is_lease_closed = MagicMock(return_value=False)
+    service._perform_transaction = MagicMock()
+    service.consumption_repository = MagicMock()
+    lease_account_mock = MagicMock(type=CreditAccountType.LEASE)
+    service.subscription_repository.get_by_lease_id = MagicMock(
+        return_value=MagicMock(organization_id=ORGANIZATION_ID, credit_accounts=[lease_account_mock])
+    )
+    service.account_repository.retrieve_saas_account = MagicMock()
+    service.transaction_repository.get_lease_transactions_and_accounts_data = MagicMock(
+        return_value=[MagicMock(credit=30, project_id="project_id_123")]
+    )
+    metering_data = MeteringEvent(
+        service_name="training",
+        workspace_id="workspace_id_123",
+        lease_id="lease123",
+        consumption=[ResourceConsumption(unit="images", amount=20), ResourceConsumption(unit="frames", amount=10)],
+        date=None,
+        project_id="project_id_123",
+    )
+
+    # Act
+    service.finalize_lease(metering_data=metering_data, organization_id=ORGANIZATION_ID, _db_session=session)
+
+    # Assert
+    created = service._perform_transaction.call_args.kwargs["target_details"].created
+    service.consumption_repository.increment_consumption.assert_called_once_with(
+        organization_id=ORGANIZATION_ID,
+        project_id="project_id_123",
+        service_name="training",
+        created=created,
+        requests={"images": 20, "frames": 10},
+    )
+
+
 def test_get_transactions_no_filters(mock_transaction_repository, transaction_service):
     # Arrange
     organization_id = ORGANIZATION_ID
@@ -694,6 +750,7 @@ def test_get_transactions_with_date_range(mock_transaction_repository, transacti
         ),
     ],
 )
+@patch("service.transaction.CONSUMPTION_BUCKETS_ENABLED", False)
 @patch("service.transaction.TransactionRepository")
 def test_aggregate_transactions(mock_transaction_repository, aggregate_result_fixture, keys, projects, raw_data):
     # Arrange
@@ -792,3 +849,68 @@ def test_parse_row_to_aggregate_response(aggregate_keys, data, aggregate_result_
     )
 
     assert actual_result == expected_result
+
+
+def test_aggregate_transactions_from_consumption_buckets(aggregate_result_fixture):
+    # Arrange
+    session = MagicMock()
+    keys = [AggregatesKey.PROJECT]
+    from_date = datetime_to_unix_milliseconds(datetime(2024, 5, 1, 8, tzinfo=timezone.utc))
+    to_date = datetime_to_unix_milliseconds(datetime(2024, 5, 21, 12, tzinfo=timezone.utc))
+    transaction_service = TransactionService(session=session)
+    transaction_service.consumption_repository = MagicMock()
+    transaction_service.consumption_repository.aggregate_consumption.return_value = aggregate_result_fixture(
+        [AggregatesKey.PROJECT.value],
+        [("pj0", {"images": 10, "frames": 5}, Decimal("15")), ("pj1", {"images": 1}, Decimal("1"))],
+    )
+    transaction_service.transaction_repository = MagicMock()
+    transaction_service.transaction_repository.aggregate_transactions.side_effect = [
+        aggregate_result_fixture([AggregatesKey.PROJECT.value], [("pj0", {"images": 2}, Decimal("2"))]),
+        aggregate_result_fixture([AggregatesKey.PROJECT.value], [("pj2", {"frames": 3}, Decimal("3"))]),
+    ]
+
+    # Act
+    result = transaction_service.aggregate_transactions(
+        organization_id=ORGANIZATION_ID, aggregate_keys=keys, from_date=from_date, to_date=to_date
+    )
+
+    # Assert
+    transaction_service.consumption_repository.aggregate_consumption.assert_called_once_with(
+        organization_id=ORGANIZATION_ID,
+        aggregates_keys=keys,
+        from_date=datetime_to_unix_milliseconds(datetime(2024, 5, 2, tzinfo=timezone.utc)),
+        to_date=datetime_to_unix_milliseconds(datetime(2024, 5, 21, tzinfo=timezone.utc)),
+        projects=None,
+    )
+    assert transaction_service.transaction_repository.aggregate_transactions.call_args_list == [
+        call(
+            organization_id=ORGANIZATION_ID,
+            aggregates_keys=keys,
+            from_date=from_date,
+            to_date=datetime_to_unix_milliseconds(datetime(2024, 5, 2, tzinfo=timezone.utc)),
+            projects=None,
+        ),
+        call(
+            organization_id=ORGANIZATION_ID,
+            aggregates_keys=keys,
+            from_date=datetime_to_unix_milliseconds(datetime(2024, 5, 21, tzinfo=timezone.utc)),
+            to_date=to_date,
+            projects=None,
+        ),
+    ]
+    assert result == AggregatesResponse(
+        aggregates=[
+            AggregateItem(
+                group=[GroupItem(key="project", value="pj0")],
+                result=AggregatesResult(credits=17, resources=ResourcesAmount(images=12, frames=5)),
+            ),
+            AggregateItem(
+                group=[GroupItem(key="project", value="pj1")],
+                result=AggregatesResult(credits=1, resources=ResourcesAmount(images=1)),
+            ),
+            AggregateItem(
+                group=[GroupItem(key="project", value="pj2")],
+                result=AggregatesResult(credits=3, resources=ResourcesAmount(frames=3)),
+            ),
+        ]
+    )
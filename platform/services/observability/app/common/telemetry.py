@@ -5,11 +5,16 @@
 Platform telemetry handling utilities.
 """
 
+import gzip
 import logging
+import queue
 import re
 import secrets
 import tarfile
-from collections.abc import Iterable, Mapping, Sequence
+import threading
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from contextlib import suppress
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
@@ -59,8 +64,72 @@ class DateError(ValueError):
     """Raised for invalid date ranges."""
 
 
-def get_archive(log_type: LogType | None, start: datetime | None, end: datetime | None) -> Path:
-    """Returns path to generated archive for the provided log type."""
+@dataclass
+class LogArchiveStream:
+    """tar.gz archive generated on the fly while its chunks are consumed.
+
+    :param name: File name of the archive.
+    :param chunks: Iterator over the bytes of the archive.
+    """
+
+    name: str
+    chunks: Iterator[bytes]
+
+
+class _ArchiveStreamClosedError(Exception):
+    """Raised in the archiving thread when the consumer of the archive stream has gone away."""
+
+
+_END_OF_STREAM = object()
+
+
+class _ChunkQueueWriter:
+    """Write-only file-like object handing the written bytes over to another thread, in chunks of fixed size.
+
+    The queue is bounded, so the writer blocks while the consumer is behind: this applies backpressure to the archiving.
+
+    :param chunks: Queue to put the chunks into.
+    :param chunk_size: Size of the chunks, except for the last one.
+    :param closed: Event set when the consumer stops reading the queue.
+    """
+
+    def __init__(self, chunks: queue.Queue, chunk_size: int, closed: threading.Event) -> None:
+        self._chunks = chunks
+        self._chunk_size = chunk_size
+        self._closed = closed
+        self._buffer = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        while len(self._buffer) >= self._chunk_size:
+            self.put(bytes(self._buffer[: self._chunk_size]))
+            del self._buffer[: self._chunk_size]
+        return len(data)
+
+    def flush(self) -> None:
+        """Chunks are only handed over once full, see `close`."""
+
+    def close(self) -> None:
+        """Hands over the last, partial, chunk."""
+        if self._buffer:
+            self.put(bytes(self._buffer))
+            self._buffer.clear()
+
+    def put(self, item: object) -> None:
+        """Puts an item into the queue, waiting for free space as long as the consumer is there."""
+        while not self._closed.is_set():
+            with suppress(queue.Full):
+                self._chunks.put(item, timeout=0.5)
+                return
+        raise _ArchiveStreamClosedError
+
+
+def get_archive(log_type: LogType | None, start: datetime | None, end: datetime | None) -> Path | LogArchiveStream:
+    """Returns the archive for the provided log type.
+
+    The cluster info archive is generated on disk and its path is returned; the other logs are archived on the fly
+    while the returned stream is consumed.
+    """
     if log_type == LogType.CLUSTER:
         logger.debug("Returning cluster logs")
         return Path(prepare_cluster_info_dump())
@@ -84,17 +153,19 @@ def get_archive(log_type: LogType | None, start: datetime | None, end: datetime
     return _archive_logs(telemetry_root=_PATH_TELEMETRY_ROOT, log_types=log_types, start=start, end=end)
 
 
-def _archive_logs(telemetry_root: Path, log_types: Iterable[LogType], start: datetime, end: datetime) -> Path:
+def _archive_logs(
+    telemetry_root: Path, log_types: Iterable[LogType], start: datetime, end: datetime
+) -> LogArchiveStream:
     """Archives logs for the provided log types.
 
     :param telemetry_root: Path to root telemetry backup directory.
     :param log_types: Types of logs to include in the created archive.
     :param start: Start of the datetime range to filter logs against.
     :param end: End of the datetime range to filter logs against.
-    :return Path: Path to the created archive.
+    :return LogArchiveStream: Archive, generated while it is streamed.
     """
     logger.debug(f"Archiving for log types: {log_types}.")
-    path_archive = Path("/tmp") / _gen_archive_name(prefix="-".join(log_types))  # noqa: S108
+    archive_name = _gen_archive_name(prefix="-".join(log_types))
 
     with tracer.start_as_current_span("filter-logs-by-dates"):
         path_src_to_arc: Mapping[Path, Path] = _get_archive_sources(
@@ -102,21 +173,63 @@ def _archive_logs(telemetry_root: Path, log_types: Iterable[LogType], start: dat
         )
 
     logger.debug(f"Source files to be archived: {', '.join(repr(str(src)) for src in path_src_to_arc)}")
-    logger.info(f"Archiving {', '.join(log_types)} at {repr(str(path_archive))}.")
+    logger.info(f"Streaming {', '.join(log_types)} as {repr(archive_name)}.")
+
+    return LogArchiveStream(name=archive_name, chunks=_stream_archive(path_src_to_arc=path_src_to_arc))
+
+
+def _stream_archive(
+    path_src_to_arc: Mapping[Path, Path],
+    chunk_size: int = cfg.LOGS_ARCHIVE_CHUNK_SIZE,
+    max_buffered_chunks: int = cfg.LOGS_ARCHIVE_MAX_BUFFERED_CHUNKS,
+) -> Iterator[bytes]:
+    """Generates tar.gz archive reflecting the provided path mapping, without storing it.
 
-    with tracer.start_as_current_span("make-tar-gz"):
-        _create_archive(path_archive=path_archive, path_src_to_arc=path_src_to_arc)
+    The archive is written and compressed by a background thread, which starts at the first iteration and stays at
+    most `max_buffered_chunks` chunks ahead of the consumer. Closing the iterator early stops the thread.
 
-    return path_archive
+    :param path_src_to_arc: Map of filesystem source paths to their corresponding in-archive relative paths (1:1).
+    :param chunk_size: Size of the yielded chunks, except for the last one.
+    :param max_buffered_chunks: Maximum number of chunks generated ahead of the consumer.
+    :returns Iterator[bytes]: Chunks of the archive.
+    """
+    chunks: queue.Queue = queue.Queue(maxsize=max(1, max_buffered_chunks))
+    closed = threading.Event()
+    writer = _ChunkQueueWriter(chunks=chunks, chunk_size=chunk_size, closed=closed)
+
+    def write_archive() -> None:
+        try:
+            with tracer.start_as_current_span("make-tar-gz"):
+                _write_archive(fileobj=writer, path_src_to_arc=path_src_to_arc)
+            writer.close()
+            writer.put(_END_OF_STREAM)
+        except _ArchiveStreamClosedError:
+            logger.info("Log archive stream closed before the end of the archive.")
+        except Exception as err:
+            logger.exception("Failed to create the log archive.")
+            with suppress(_ArchiveStreamClosedError):
+                writer.put(err)
+
+    threading.Thread(target=write_archive, name="log-archive-writer", daemon=True).start()
+    try:
+        while (item := chunks.get()) is not _END_OF_STREAM:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        closed.set()
 
 
-def _create_archive(path_archive: Path, path_src_to_arc: Mapping[Path, Path]):
-    """Creates tar.gz archive reflecting the provided path mapping.
+def _write_archive(fileobj: _ChunkQueueWriter, path_src_to_arc: Mapping[Path, Path]) -> None:
+    """Writes tar.gz archive reflecting the provided path mapping to a file-like object, sequentially.
 
-    :param path_archive:
+    :param fileobj: File-like object to write the archive to.
     :param path_src_to_arc: Map of filesystem source paths to their corresponding in-archive relative paths (1:1).
     """
-    with tarfile.open(name=path_archive, mode="w:gz", format=tarfile.PAX_FORMAT, compresslevel=1) as tar:
+    with (
+        gzip.GzipFile(fileobj=fileobj, mode="wb", compresslevel=1) as gz,
+        tarfile.open(fileobj=gz, mode="w|", format=tarfile.PAX_FORMAT) as tar,
+    ):
         for path_fs, path_rel in path_src_to_arc.items():
             logger.debug(f"Adding {repr(str(path_fs))} to the archive as {repr(str(path_rel))}")
             tar.add(name=path_fs, arcname=path_rel, recursive=True)
@@ -8,6 +8,9 @@ Configuration file
 import os
 
 LOGS_DIR = os.getenv("LOGS_DIR", "/logs")
+# Size of the chunks of the log archives streamed to the client, and number of chunks buffered ahead of the client
+LOGS_ARCHIVE_CHUNK_SIZE = int(os.getenv("LOGS_ARCHIVE_CHUNK_SIZE", str(1024 * 1024)))
+LOGS_ARCHIVE_MAX_BUFFERED_CHUNKS = int(os.getenv("LOGS_ARCHIVE_MAX_BUFFERED_CHUNKS", "8"))
 IMPT_CONFIGURATION_CM = os.getenv("IMPT_CONFIGURATION_CM", "impt-configuration")
 K8S_CR_NAMESPACE = os.getenv("K8S_CR_NAMESPACE", "default")
 
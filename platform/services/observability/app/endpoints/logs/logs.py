@@ -10,14 +10,14 @@ from datetime import datetime
 from http import HTTPStatus
 
 from fastapi import HTTPException, Query
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from opentelemetry import trace  # type: ignore[attr-defined]
 from starlette.background import BackgroundTask
 
 from endpoints.logs.router import logs_router
 
 from common.endpoint_logger import EndpointLogger
-from common.telemetry import DateError, LogType
+from common.telemetry import DateError, LogArchiveStream, LogType
 from common.telemetry import get_archive as get_telemetry_archive
 
 logger = logging.getLogger(__name__)
@@ -49,14 +49,22 @@ async def logs_endpoint(  # noqa: ANN201
 ):
     """GET logs endpoint."""
     try:
-        path_archive = get_telemetry_archive(log_type=log_type, start=start_date, end=end_date)
+        archive = get_telemetry_archive(log_type=log_type, start=start_date, end=end_date)
     except DateError as err:
         raise HTTPException(status_code=HTTPStatus.UNPROCESSABLE_ENTITY, detail=str(err)) from err
 
+    if isinstance(archive, LogArchiveStream):
+        # The archive is generated while it is sent, with chunked transfer encoding.
+        return StreamingResponse(
+            archive.chunks,
+            media_type="application/octet-stream",
+            headers={"Content-Disposition": f'attachment; filename="{archive.name}"'},
+        )
+
     # Respond with scheduled background archive removal.
     return FileResponse(
-        path_archive,
+        archive,
         media_type="application/octet-stream",
-        filename=path_archive.name,
-        background=BackgroundTask(path_archive.unlink),
+        filename=archive.name,
+        background=BackgroundTask(archive.unlink),
     )
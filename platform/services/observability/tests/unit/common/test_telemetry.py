@@ -5,6 +5,9 @@
 Unit tests for the common.telemetry module.
 """
 
+import io
+import os
+import tarfile
 from collections.abc import Iterable, Mapping, Sequence
 from datetime import date, datetime, time, timedelta, timezone
 from pathlib import Path
@@ -23,6 +26,7 @@ from common.telemetry import _get_archive_sources as get_archive_sources
 from common.telemetry import _get_file_overlapping as get_file_overlapping
 from common.telemetry import _get_rel_source_dirs as get_source_dirs
 from common.telemetry import _sanitize_datetime_range as sanitize_date_range
+from common.telemetry import _stream_archive as stream_archive
 
 _PATCHING_TARGET = "common.telemetry"
 
@@ -134,23 +138,58 @@ def test_get_archive_type_non_cluster(mocker, log_type: LogType, archive_logs_lo
 def test_archive_logs(log_types: tuple[LogType], start: datetime, end: datetime, prefix_expected: str, mocker):
     """Tests the _archive_logs function."""
     archive_name_mock = "archive_name_mock.tar.gz"
-    path_archive_mock = Path(f"/tmp/{archive_name_mock}")
     sources_mock = {"/abs/src_a": "/rel/src_a", "/abs/src_b": "/rel/src_b"}
 
     gen_archive_name_mock = mocker.patch(f"{_PATCHING_TARGET}._gen_archive_name", return_value=archive_name_mock)
     get_archive_sources_mock = mocker.patch(f"{_PATCHING_TARGET}._get_archive_sources", return_value=sources_mock)
-    create_archive_mock = mocker.patch(f"{_PATCHING_TARGET}._create_archive")
+    stream_archive_mock = mocker.patch(f"{_PATCHING_TARGET}._stream_archive")
 
-    path_archive_actual = archive_logs(telemetry_root=PATH_TELEMETRY_ROOT, log_types=log_types, start=start, end=end)
+    archive_actual = archive_logs(telemetry_root=PATH_TELEMETRY_ROOT, log_types=log_types, start=start, end=end)
 
-    assert path_archive_actual == path_archive_mock
+    assert archive_actual.name == archive_name_mock
+    assert archive_actual.chunks == stream_archive_mock.return_value
     gen_archive_name_mock.assert_called_once_with(prefix=prefix_expected)
-    create_archive_mock.assert_called_once_with(path_archive=path_archive_mock, path_src_to_arc=sources_mock)
+    stream_archive_mock.assert_called_once_with(path_src_to_arc=sources_mock)
     get_archive_sources_mock.assert_called_once_with(
         telemetry_root=PATH_TELEMETRY_ROOT, log_types=log_types, start=start, end=end
     )
 
 
+def test_stream_archive(tmp_path: Path):
+    """Tests the _stream_archive function, with an archive spanning many chunks."""
+    contents = {
+        Path("geti/logs/logs.json"): b"log line\n" * 10_000,
+        Path("k8s/metrics/metrics-2023-01-20T15-20-09.412.json"): os.urandom(64 * 1024),
+    }
+    path_src_to_arc = {}
+    for path_rel, content in contents.items():
+        path_fs = tmp_path / path_rel
+        path_fs.parent.mkdir(parents=True, exist_ok=True)
+        path_fs.write_bytes(content)
+        path_src_to_arc[path_fs] = path_rel
+
+    chunks = list(stream_archive(path_src_to_arc=path_src_to_arc, chunk_size=1024, max_buffered_chunks=2))
+
+    assert len(chunks) > 1 and all(len(chunk) == 1024 for chunk in chunks[:-1])
+    with tarfile.open(fileobj=io.BytesIO(b"".join(chunks)), mode="r:gz") as tar:
+        archived = {Path(member.name): tar.extractfile(member).read() for member in tar.getmembers()}  # type: ignore[union-attr]
+    assert archived == contents
+
+
+def test_stream_archive_closed_early(tmp_path: Path):
+    """Tests that closing the _stream_archive iterator early stops the archiving."""
+    path_fs = tmp_path / "logs.json"
+    path_fs.write_bytes(os.urandom(1024 * 1024))
+
+    chunks = stream_archive(path_src_to_arc={path_fs: Path("logs.json")}, chunk_size=1024, max_buffered_chunks=1)
+    first_chunk = next(chunks)
+    chunks.close()
+
+    assert len(first_chunk) == 1024
+    with pytest.raises(StopIteration):
+        next(chunks)
+
+
 @pytest.mark.parametrize(
     "start, end, install_dt",
     [
@@ -14,7 +14,7 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.testclient import TestClient
 
 from common.endpoint_validation import handle_request_validation_error
-from common.telemetry import DateError
+from common.telemetry import DateError, LogArchiveStream
 from common.utils import API_BASE_PATTERN
 
 router = APIRouter(prefix=f"{API_BASE_PATTERN}/logs")
@@ -69,6 +69,26 @@ def test_get_logs(mocker, tmp_path: Path, log_type_expected: LogType, start: dat
     get_archive_mock.assert_called_once_with(log_type=log_type_expected, start=start, end=end)
 
 
+def test_get_logs_streamed(mocker):
+    """Tests the GET /logs method when the archive is generated while it is streamed."""
+    archive_name = "logs-20000102030405_12345.tar.gz"
+    chunks = [b"Nobody expects ", b"the Spanish Inquisition!"]
+    mocker.patch(
+        f"{_PATCHING_TARGET}.get_telemetry_archive",
+        return_value=LogArchiveStream(name=archive_name, chunks=iter(chunks)),
+    )
+
+    response = client.get(f"{API_BASE_PATTERN}/logs?type={LogType.GETI_LOGS.value}")
+
+    assert (
+        response.status_code == HTTPStatus.OK
+        and response.content == b"".join(chunks)
+        and response.headers.get("content-type") == "application/octet-stream"
+        and response.headers.get("content-disposition") == f'attachment; filename="{archive_name}"'
+        and "content-length" not in response.headers
+    )
+
+
 @pytest.mark.parametrize(
     "log_type", (pytest.param("", id="empty-str"), pytest.param("invalid", id="non-empty-invalid"))
 )